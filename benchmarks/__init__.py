@@ -0,0 +1,8 @@
+"""Offline benchmarks for MAHABHARATHA orchestration hot paths.
+
+Run with ``python -m benchmarks``; see benchmarks/README.md.
+"""
+
+from benchmarks.harness import REGISTRY, benchmark
+
+__all__ = ["REGISTRY", "benchmark"]
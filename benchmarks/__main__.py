@@ -0,0 +1,120 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+
+import click
+
+# Importing the modules registers their benchmarks
+from benchmarks import (  # noqa: F401
+    bench_cli,
+    bench_logs,
+    bench_metrics,
+    bench_repo_map,
+    bench_security,
+    bench_state,
+)
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    REGISTRY,
+    Comparison,
+    Result,
+    compare,
+    load_results,
+    run,
+    write_results,
+)
+
+
+def _report(comparisons: list[Comparison], threshold: float) -> int:
+    """Print a comparison table and return the number of regressions."""
+    regressions = 0
+    click.echo(f"\n{'case':<70} {'baseline':>10} {'current':>10} {'change':>8}")
+    for c in comparisons:
+        flag = ""
+        if c.is_regression(threshold):
+            regressions += 1
+            flag = "  REGRESSION"
+        change = f"{(c.ratio - 1) * 100:+.1f}%"
+        click.echo(f"{c.key:<70} {c.baseline_s * 1000:>8.2f}ms {c.current_s * 1000:>8.2f}ms {change:>8}{flag}")
+    click.echo(f"\n{len(comparisons)} cases compared, {regressions} regressed by more than {threshold:.0%}")
+    return regressions
+
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def main(ctx: click.Context) -> None:
+    """Benchmark orchestration hot paths against synthetic fixtures."""
+    # Per-claim INFO lines from bench workers would swamp the results
+    logging.getLogger("mahabharatha").setLevel(logging.WARNING)
+    if ctx.invoked_subcommand is None:
+        ctx.invoke(run_cmd)
+
+
+@main.command("list")
+def list_cmd() -> None:
+    """List registered benchmarks and their parameter grids."""
+    for bench in REGISTRY.values():
+        grid = ", ".join(f"{k}={v}" for k, v in bench.grid.items())
+        click.echo(f"{bench.name:<36} {grid}")
+
+
+@main.command("run")
+@click.option("--only", "-k", multiple=True, help="Benchmark name or prefix (repeatable), e.g. state")
+@click.option("--quick", is_flag=True, help="Reduced parameter grid for a fast smoke run")
+@click.option("--repeat", type=int, default=None, help="Override timed runs per case")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default="benchmark-results.json", show_default=True)
+@click.option("--compare", "baseline", type=click.Path(exists=True, dir_okay=False), help="Baseline results file")
+@click.option("--threshold", type=float, default=DEFAULT_THRESHOLD, show_default=True, help="Allowed slowdown")
+def run_cmd(
+    only: tuple[str, ...] = (),
+    quick: bool = False,
+    repeat: int | None = None,
+    output: str = "benchmark-results.json",
+    baseline: str | None = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> None:
+    """Run benchmarks and write results as JSON.
+
+    With --compare, exits non-zero when a case is slower than the baseline
+    by more than --threshold.
+    """
+
+    def progress(result: Result) -> None:
+        extra = " ".join(f"{k}={v}" for k, v in result.extra.items())
+        median_ms, min_ms = result.median_s * 1000, result.min_s * 1000
+        click.echo(f"{result.key:<70} median {median_ms:>9.2f}ms  min {min_ms:>9.2f}ms  {extra}")
+
+    try:
+        results = run(list(only) or None, quick=quick, repeat=repeat, progress=progress)
+    except KeyError as e:
+        raise click.UsageError(str(e.args[0])) from e
+    write_results(results, output)
+    click.echo(f"\nWrote {len(results)} results to {output}")
+    if baseline:
+        current = {r.key: {"median_s": r.median_s} for r in results}
+        if _report(compare(current, load_results(baseline)), threshold):
+            sys.exit(1)
+
+
+@main.command("compare")
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False))
+@click.argument("current", type=click.Path(exists=True, dir_okay=False))
+@click.option("--threshold", type=float, default=DEFAULT_THRESHOLD, show_default=True, help="Allowed slowdown")
+def compare_cmd(baseline: str, current: str, threshold: float) -> None:
+    """Compare two results files; exits non-zero on regressions."""
+    try:
+        comparisons = compare(load_results(current), load_results(baseline))
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    if not comparisons:
+        raise click.ClickException(f"No cases in common between {Path(baseline).name} and {Path(current).name}")
+    if _report(comparisons, threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
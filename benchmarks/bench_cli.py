@@ -0,0 +1,65 @@
+"""CLI cold start: import cost of lightweight subcommands (``-X importtime``)."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.fixtures import FEATURE, seed_state
+from benchmarks.harness import Case, benchmark
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+INVOCATIONS = {
+    "version": ["--version"],
+    "status": ["status", "--feature", FEATURE, "--json"],
+    "logs": ["logs", "--feature", FEATURE, "--tail", "10"],
+}
+
+
+def parse_importtime(stderr: str) -> tuple[float, int]:
+    """Total import time (seconds) and module count from ``-X importtime`` output.
+
+    Only top-level imports are summed; their cumulative times include nested ones.
+    """
+    total_us = 0
+    modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules += 1
+        if not name.startswith("  "):  # One leading space; nested imports are indented further
+            total_us += int(cumulative)
+    return total_us / 1_000_000, modules
+
+
+@benchmark("cli.import_time", repeat=5, command=list(INVOCATIONS))
+def cli_import_time(case: Case) -> Callable[[], float]:
+    """Import time of one CLI invocation in a fresh interpreter, in a project directory."""
+    (case.workdir / ".mahabharatha").mkdir()
+    (case.workdir / ".mahabharatha" / "config.yaml").write_text("project:\n  name: bench\n")
+    seed_state(case.workdir / ".mahabharatha" / "state", 10)
+    args = INVOCATIONS[case["command"]]
+    code = f"import sys; sys.argv = ['mahabharatha', *{args!r}]; from mahabharatha.cli import cli; cli()"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")]))}
+
+    def run() -> float:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=case.workdir,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if proc.returncode not in (0, 1):
+            raise RuntimeError(f"mahabharatha {' '.join(args)} exited {proc.returncode}: {proc.stderr[-500:]}")
+        seconds, modules = parse_importtime(proc.stderr)
+        case.extra["modules"] = modules
+        return seconds
+
+    return run
@@ -0,0 +1,41 @@
+"""Structured log queries across worker JSONL files."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.fixtures import worker_logs
+from benchmarks.harness import Case, benchmark
+from mahabharatha.log_aggregator import LogAggregator
+
+QUERIES: dict[str, dict[str, Any]] = {
+    "all": {},
+    "filtered": {"level": "error", "phase": "verify"},
+    "search": {"search": "task failed", "limit": 50},
+}
+
+
+@benchmark(
+    "logs.query",
+    quick={"tasks": [100], "workers": [5], "cache": ["cold"]},
+    tasks=[10, 100, 1000],
+    workers=[5, 20, 50],
+    query=list(QUERIES),
+    cache=["cold", "warm"],
+)
+def log_query(case: Case) -> Callable[[], None]:
+    """Query the logs of ``tasks`` tasks (10 entries each) spread over ``workers`` files.
+
+    A cold query builds the per-file indexes; a warm one reuses them.
+    """
+    log_dir = worker_logs(case.workdir / "logs", case["workers"], case["tasks"])
+    filters = QUERIES[case["query"]]
+    warm = LogAggregator(log_dir)
+    warm.query(**filters)
+
+    def run() -> None:
+        aggregator = warm if case["cache"] == "warm" else LogAggregator(log_dir)
+        case.extra["entries"] = len(aggregator.query(**filters))
+
+    return run
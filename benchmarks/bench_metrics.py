@@ -0,0 +1,37 @@
+"""Feature metrics computed from execution state."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from benchmarks.fixtures import FEATURE, seed_state
+from benchmarks.harness import Case, benchmark
+from mahabharatha.metrics import MetricsCollector
+from mahabharatha.state import StateManager
+
+
+@benchmark(
+    "metrics.compute_feature_metrics",
+    quick={"tasks": [100], "workers": [5]},
+    tasks=[10, 100, 1000],
+    workers=[5, 20, 50],
+    collector=["fresh", "reused"],
+)
+def feature_metrics(case: Case) -> Callable[[], None]:
+    """Metrics for a feature with 80% of its tasks complete.
+
+    A fresh collector (new StateManager) folds every task; a reused one only
+    folds the tasks that changed since its last computation.
+    """
+    seed_state(case.workdir, case["tasks"], n_workers=case["workers"], completed=0.8)
+    reused = MetricsCollector(StateManager(FEATURE, state_dir=case.workdir))
+
+    def run() -> None:
+        if case["collector"] == "reused":
+            collector = reused
+        else:
+            collector = MetricsCollector(StateManager(FEATURE, state_dir=case.workdir))
+        metrics = collector.compute_feature_metrics()
+        case.extra["tasks_completed"] = metrics.tasks_completed
+
+    return run
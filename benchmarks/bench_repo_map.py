@@ -0,0 +1,49 @@
+"""Repository symbol map: full builds and incremental re-indexing."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable
+
+from benchmarks.fixtures import source_tree
+from benchmarks.harness import Case, benchmark
+from mahabharatha import repo_map
+from mahabharatha.repo_map import IncrementalIndex
+
+
+@benchmark("repo_map.build_map", repeat=3, quick={"files": [100]}, files=[100, 1000])
+def build_map(case: Case) -> Callable[[], None]:
+    """Cold build of the symbol graph (TTL cache cleared before every run)."""
+    root = source_tree(case.workdir / "repo", case["files"])
+
+    def run() -> None:
+        repo_map.invalidate_cache()
+        graph = repo_map.build_map(root)
+        case.extra["modules"] = len(graph.modules)
+
+    return run
+
+
+@benchmark(
+    "repo_map.update_incremental",
+    repeat=3,
+    quick={"files": [100]},
+    files=[100, 1000],
+    changed=[0, 10],
+)
+def update_incremental(case: Case) -> Callable[[], None]:
+    """Re-index after ``changed`` files were edited against a warm index."""
+    root = source_tree(case.workdir / "repo", case["files"])
+    index = IncrementalIndex(case.workdir / "state")
+    index.update_incremental(root)
+    sources = sorted(root.glob("src/**/*.py"))[: case["changed"]]
+    edits = itertools.count()
+
+    def run() -> None:
+        edit = next(edits)
+        for path in sources:
+            with open(path, "a") as f:
+                f.write(f"\n\ndef edited_{edit}() -> int:\n    return {edit}\n")
+        index.update_incremental(root)
+
+    return run
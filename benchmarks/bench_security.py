@@ -0,0 +1,24 @@
+"""Security pattern scan over a synthetic source tree (no network, no git)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from benchmarks.fixtures import source_tree
+from benchmarks.harness import Case, benchmark
+from mahabharatha.security.patterns import PATTERN_REGISTRY
+from mahabharatha.security.scanner import run_security_scan
+
+
+@benchmark("security.run_security_scan", repeat=3, quick={"files": [100]}, files=[100, 1000])
+def security_scan(case: Case) -> Callable[[], None]:
+    """Scan every pattern category; the CVE (OSV) and git-history scans are excluded."""
+    root = source_tree(case.workdir / "repo", case["files"])
+    categories = list(PATTERN_REGISTRY)
+
+    def run() -> None:
+        result = run_security_scan(root, categories=categories)
+        case.extra["files_scanned"] = result.files_scanned
+        case.extra["findings"] = len(result.findings)
+
+    return run
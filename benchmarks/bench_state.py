@@ -0,0 +1,71 @@
+"""State layer: concurrent claim throughput and atomic_update latency."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import Callable
+
+from benchmarks.fixtures import FEATURE, seed_state
+from benchmarks.harness import Case, benchmark
+from benchmarks.launcher import BenchLauncher
+from mahabharatha.config import StateConfig
+from mahabharatha.constants import TaskStatus
+from mahabharatha.state import StateManager
+
+BACKENDS = ["json", "journal", "sqlite"]
+
+
+@benchmark(
+    "state.claim_throughput",
+    repeat=3,
+    warmup=0,
+    quick={"tasks": [10, 100], "workers": [5], "backend": ["json"]},
+    tasks=[10, 100, 1000],
+    workers=[5, 20, 50],
+    backend=BACKENDS,
+)
+def claim_throughput(case: Case) -> Callable[[], float]:
+    """Workers race to claim and complete every task of a fresh state file."""
+    runs = itertools.count()
+
+    def run() -> float:
+        state_dir = case.workdir / f"run-{next(runs)}"
+        seed_state(state_dir, case["tasks"], backend=case["backend"])
+        launcher = BenchLauncher(state_dir, case["workers"], backend=case["backend"])
+        for worker_id in range(case["workers"]):
+            launcher.spawn(worker_id, FEATURE, state_dir, f"bench/worker-{worker_id}")
+        launcher.start()
+        start = time.perf_counter()
+        launcher.wait_all()
+        elapsed = time.perf_counter() - start
+
+        manager = StateManager(FEATURE, state_dir=state_dir, config=StateConfig(backend=case["backend"]))
+        manager.load()
+        done = len(manager.get_tasks_by_status(TaskStatus.COMPLETE))
+        if done != case["tasks"]:
+            raise RuntimeError(f"Only {done}/{case['tasks']} tasks completed")
+        case.extra["claims_per_s"] = round(case["tasks"] / elapsed, 1)
+        return elapsed
+
+    return run
+
+
+@benchmark(
+    "state.atomic_update",
+    repeat=20,
+    quick={"tasks": [10, 1000]},
+    tasks=[10, 100, 1000],
+    backend=BACKENDS,
+)
+def atomic_update_latency(case: Case) -> Callable[[], None]:
+    """One single-task status change as the state file grows."""
+    manager = seed_state(case.workdir, case["tasks"], backend=case["backend"], n_workers=5, completed=0.5)
+    task_id = manager.get_tasks_by_status(TaskStatus.PENDING)[0]
+    statuses = itertools.cycle([TaskStatus.IN_PROGRESS, TaskStatus.PENDING])
+    case.extra["state_bytes"] = sum(p.stat().st_size for p in case.workdir.glob(f"{FEATURE}*") if p.is_file())
+
+    def run() -> None:
+        manager.set_task_status(task_id, next(statuses), worker_id=0)
+
+    return run
@@ -0,0 +1,212 @@
+"""Deterministic synthetic inputs for the benchmarks.
+
+Everything is generated from a fixed seed so two runs on the same machine
+measure the same work: task graphs and seeded state, a source tree of Python
+and JavaScript modules, and per-worker JSONL logs.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from mahabharatha.config import StateConfig
+from mahabharatha.constants import TaskStatus, WorkerStatus
+from mahabharatha.state import StateManager
+from mahabharatha.types import WorkerState
+
+SEED = 1729
+FEATURE = "bench"
+EPOCH = datetime(2026, 1, 1)  # Naive, like the timestamps the state layer writes
+
+
+def task_graph(n_tasks: int, levels: int = 5) -> dict[str, Any]:
+    """Build a task graph of ``n_tasks`` tasks spread over ``levels`` levels.
+
+    Every task past level 1 depends on up to two tasks of the previous level.
+    """
+    rng = random.Random(SEED)
+    per_level = max(1, n_tasks // levels)
+    tasks: list[dict[str, Any]] = []
+    previous: list[str] = []
+    for i in range(n_tasks):
+        level = min(levels, i // per_level + 1)
+        if tasks and tasks[-1]["level"] != level:
+            previous = [t["id"] for t in tasks if t["level"] == level - 1]
+        task_id = f"BENCH-L{level}-{i:04d}"
+        tasks.append(
+            {
+                "id": task_id,
+                "title": f"Synthetic task {i}",
+                "level": level,
+                "dependencies": rng.sample(previous, min(2, len(previous))) if level > 1 else [],
+                "files": {"create": [f"src/mod_{i}.py"], "modify": [], "read": []},
+                "verification": {"command": "true", "timeout_seconds": 30},
+            }
+        )
+    return {"feature": FEATURE, "version": "2.0", "total_tasks": n_tasks, "tasks": tasks}
+
+
+def seed_state(
+    state_dir: Path,
+    n_tasks: int,
+    backend: str = "json",
+    n_workers: int = 0,
+    completed: float = 0.0,
+) -> StateManager:
+    """Create a state file holding ``n_tasks`` tasks.
+
+    Args:
+        state_dir: Directory for the state backend
+        n_tasks: Number of tasks
+        backend: State backend name (json, journal or sqlite)
+        n_workers: Workers to register; completed tasks are spread over them
+        completed: Fraction of tasks marked complete with synthetic durations
+
+    Returns:
+        A StateManager for the seeded feature
+    """
+    rng = random.Random(SEED)
+    manager = StateManager(FEATURE, state_dir=state_dir, config=StateConfig(backend=backend))
+    graph = task_graph(n_tasks)
+    done = int(n_tasks * completed)
+    with manager._persistence.atomic_update():
+        for worker_id in range(n_workers):
+            manager.set_worker_state(
+                WorkerState(
+                    worker_id=worker_id,
+                    status=WorkerStatus.RUNNING,
+                    started_at=EPOCH,
+                    ready_at=EPOCH + timedelta(seconds=rng.uniform(1, 10)),
+                    tasks_completed=done // n_workers,
+                )
+            )
+        for i, task in enumerate(graph["tasks"]):
+            if i < done:
+                manager.set_task_status(task["id"], TaskStatus.COMPLETE, worker_id=i % max(1, n_workers))
+            else:
+                manager.set_task_status(task["id"], TaskStatus.PENDING)
+            # The orchestrator records levels and timings in the task entry directly
+            entry = manager._persistence.state["tasks"][task["id"]]
+            entry["level"] = task["level"]
+            if i < done:
+                started = EPOCH + timedelta(seconds=i * 7)
+                duration = rng.uniform(5, 600)
+                entry["started_at"] = started.isoformat()
+                entry["completed_at"] = (started + timedelta(seconds=duration)).isoformat()
+                entry["duration_ms"] = int(duration * 1000)
+    return manager
+
+
+def source_tree(root: Path, n_files: int, secrets_every: int = 25) -> Path:
+    """Write a synthetic repository of Python and JavaScript modules.
+
+    Args:
+        root: Directory to populate
+        n_files: Number of source files
+        secrets_every: Every Nth file embeds strings the security scanner flags
+
+    Returns:
+        The populated root
+    """
+    rng = random.Random(SEED)
+    for i in range(n_files):
+        package = root / "src" / f"pkg{i % 10}"
+        package.mkdir(parents=True, exist_ok=True)
+        if i % 4 == 3:
+            body = _js_module(i, rng)
+            path = package / f"mod_{i}.js"
+        else:
+            body = _py_module(i, rng)
+            path = package / f"mod_{i}.py"
+        if secrets_every and i % secrets_every == 0:
+            body += _secret_snippet(i, path.suffix)
+        path.write_text(body)
+    # Directories a real repo carries but scanners and indexers skip
+    for skipped in ("node_modules/dep", ".git/objects", "__pycache__"):
+        (root / skipped).mkdir(parents=True, exist_ok=True)
+        (root / skipped / "ignored.js").write_text("module.exports = {};\n")
+    return root
+
+
+def _py_module(i: int, rng: random.Random) -> str:
+    imports = "".join(
+        f"from src.pkg{rng.randrange(10)}.mod_{rng.randrange(max(1, i))} import helper_{j}\n" for j in range(3)
+    )
+    classes = "".join(
+        f"\n\nclass Model{i}_{c}:\n"
+        f'    """Synthetic model {c}."""\n\n'
+        f"    def __init__(self, value: int) -> None:\n        self.value = value\n\n"
+        f"    def compute(self, other: int) -> int:\n        return helper_0(self.value + other)\n"
+        for c in range(rng.randint(1, 3))
+    )
+    functions = "".join(
+        f"\n\ndef helper_{f}(value: int) -> int:\n"
+        f'    """Synthetic helper {f}."""\n'
+        f"    total = 0\n    for step in range(value):\n        total += step * {f + 1}\n    return total\n"
+        for f in range(rng.randint(3, 8))
+    )
+    return f'"""Synthetic module {i}."""\n\nimport os\nimport subprocess\n{imports}{classes}{functions}'
+
+
+def _js_module(i: int, rng: random.Random) -> str:
+    functions = "".join(
+        f"export function handler{f}(req, res) {{\n  const value = req.query.v{f};\n  return res.send(value);\n}}\n\n"
+        for f in range(rng.randint(2, 6))
+    )
+    header = f"import {{ util }} from './mod_{max(0, i - 1)}';\n\n"
+    return header + f"export class Service{i} {{\n  run() {{ return util(); }}\n}}\n\n{functions}"
+
+
+def _secret_snippet(i: int, suffix: str) -> str:
+    if suffix == ".py":
+        return (
+            f'\n\nAWS_KEY = "AKIA{i:016d}"\n'
+            f'password = "hunter{i}hunter"\n\n\ndef run(cmd: str) -> None:\n'
+            "    subprocess.call(cmd, shell=True)\n    eval(cmd)\n"
+        )
+    return f'\nconst apiKey = "sk_live_{i:024d}";\ndocument.body.innerHTML = location.hash;\n'
+
+
+LOG_EVENTS = ("task_started", "task_completed", "verification_passed", "task_failed")
+LOG_PHASES = ("claim", "execute", "verify", "commit")
+
+
+def worker_logs(log_dir: Path, n_workers: int, n_tasks: int, entries_per_task: int = 10) -> Path:
+    """Write per-worker JSONL logs the way StructuredLogWriter lays them out.
+
+    Args:
+        log_dir: Log directory (the equivalent of ``.mahabharatha/logs``)
+        n_workers: Number of worker log files
+        n_tasks: Tasks whose entries are spread across the workers
+        entries_per_task: Entries logged per task
+
+    Returns:
+        The log directory
+    """
+    rng = random.Random(SEED)
+    workers_dir = log_dir / "workers"
+    workers_dir.mkdir(parents=True, exist_ok=True)
+    lines: dict[int, list[str]] = {w: [] for w in range(n_workers)}
+    for i in range(n_tasks):
+        worker_id = i % n_workers
+        start = EPOCH + timedelta(seconds=i * 3)
+        for e in range(entries_per_task):
+            entry = {
+                "ts": (start + timedelta(milliseconds=e * 250)).isoformat() + "Z",
+                "level": "error" if rng.random() < 0.02 else "info",
+                "worker_id": worker_id,
+                "feature": FEATURE,
+                "message": f"Task BENCH-{i:04d} step {e}: {rng.choice(LOG_EVENTS).replace('_', ' ')}",
+                "task_id": f"BENCH-{i:04d}",
+                "phase": LOG_PHASES[e % len(LOG_PHASES)],
+                "event": rng.choice(LOG_EVENTS),
+                "duration_ms": rng.randint(1, 5000),
+            }
+            lines[worker_id].append(json.dumps(entry))
+    for worker_id, worker_lines in lines.items():
+        (workers_dir / f"worker-{worker_id}.jsonl").write_text("\n".join(worker_lines) + "\n")
+    return log_dir
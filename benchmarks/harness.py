@@ -0,0 +1,240 @@
+"""Benchmark registry, timing, JSON results and baseline comparison.
+
+A benchmark is a function registered with ``@benchmark`` that receives a
+``Case`` (its parameters plus a scratch directory) and returns a callable to
+time; setup happens before the callable is returned, so only the hot path is
+measured. A callable that has per-run setup of its own (forking workers,
+resetting state) returns the seconds it measured itself instead. Each case
+is run ``warmup`` times untimed and ``repeat`` times timed, and results are
+written as JSON so a later run can be compared against a baseline file.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.25  # Relative slowdown reported as a regression
+
+
+@dataclass
+class Case:
+    """One parameter combination of a benchmark."""
+
+    params: dict[str, Any]
+    workdir: Path
+    # Benchmarks may record extra metrics (throughput, sizes) here
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.params[key]
+
+
+Setup = Callable[[Case], Callable[[], Any]]
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark and its parameter grid."""
+
+    name: str
+    setup: Setup
+    grid: dict[str, list[Any]]
+    quick: dict[str, list[Any]]
+    repeat: int = 5
+    warmup: int = 1
+
+    def cases(self, quick: bool = False) -> Iterable[dict[str, Any]]:
+        """Yield every parameter combination (the reduced grid when quick)."""
+        grid = {**self.grid, **self.quick} if quick else self.grid
+        keys = list(grid)
+        for values in itertools.product(*(grid[k] for k in keys)):
+            yield dict(zip(keys, values, strict=True))
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    repeat: int = 5,
+    warmup: int = 1,
+    quick: dict[str, list[Any]] | None = None,
+    **grid: list[Any],
+) -> Callable[[Setup], Setup]:
+    """Register a benchmark.
+
+    Args:
+        name: Unique benchmark name
+        repeat: Timed runs per case
+        warmup: Untimed runs per case
+        quick: Parameter values used with ``--quick`` (defaults to the full grid)
+        **grid: Parameter name -> values; every combination becomes a case
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        if name in REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        REGISTRY[name] = Benchmark(name, setup, dict(grid), dict(quick or {}), repeat, warmup)
+        return setup
+
+    return decorator
+
+
+@dataclass
+class Result:
+    """Timing of one benchmark case."""
+
+    name: str
+    params: dict[str, Any]
+    runs: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    max_s: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to match results across runs."""
+        if not self.params:
+            return self.name
+        return self.name + "[" + ",".join(f"{k}={v}" for k, v in sorted(self.params.items())) + "]"
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int) -> list[float]:
+    """Time ``fn`` ``repeat`` times after ``warmup`` untimed calls.
+
+    If ``fn`` returns a float it is taken as the run's own measurement.
+    """
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - start
+        timings.append(value if isinstance(value, float) else elapsed)
+    return timings
+
+
+def run_case(bench: Benchmark, params: dict[str, Any], repeat: int | None = None) -> Result:
+    """Set up and time one case in a fresh scratch directory."""
+    with tempfile.TemporaryDirectory(prefix=f"bench-{bench.name}-") as tmp:
+        case = Case(params=params, workdir=Path(tmp))
+        fn = bench.setup(case)
+        timings = measure(fn, repeat or bench.repeat, bench.warmup)
+    return Result(
+        name=bench.name,
+        params=params,
+        runs=len(timings),
+        min_s=min(timings),
+        median_s=statistics.median(timings),
+        mean_s=statistics.fmean(timings),
+        max_s=max(timings),
+        extra=case.extra,
+    )
+
+
+def run(
+    names: list[str] | None = None,
+    quick: bool = False,
+    repeat: int | None = None,
+    progress: Callable[[Result], None] | None = None,
+) -> list[Result]:
+    """Run the selected benchmarks (all by default).
+
+    Args:
+        names: Benchmark names or prefixes to run
+        quick: Use each benchmark's reduced parameter grid
+        repeat: Override the timed runs per case
+        progress: Called with each result as it completes
+
+    Raises:
+        KeyError: If a name matches no registered benchmark
+    """
+    selected = list(REGISTRY.values())
+    if names:
+        selected = [b for b in selected if any(b.name == n or b.name.startswith(n + ".") for n in names)]
+        if not selected:
+            raise KeyError(f"No benchmark matches {names}; available: {sorted(REGISTRY)}")
+    results = []
+    for bench in selected:
+        for params in bench.cases(quick):
+            result = run_case(bench, params, repeat)
+            results.append(result)
+            if progress:
+                progress(result)
+    return results
+
+
+def environment() -> dict[str, Any]:
+    """Machine description stored with results (comparisons across machines are noisy)."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def write_results(results: list[Result], path: str | Path) -> None:
+    """Write results to a JSON file."""
+    payload = {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "environment": environment(),
+        "results": [{"key": r.key, **asdict(r)} for r in results],
+    }
+    Path(path).write_text(json.dumps(payload, indent=2, default=str) + "\n")
+
+
+def load_results(path: str | Path) -> dict[str, dict[str, Any]]:
+    """Load a results file keyed by case key.
+
+    Raises:
+        ValueError: If the file is not a benchmark results file
+    """
+    payload = json.loads(Path(path).read_text())
+    if not isinstance(payload, dict) or payload.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path} is not a schema {SCHEMA_VERSION} benchmark results file")
+    return {r["key"]: r for r in payload["results"]}
+
+
+@dataclass
+class Comparison:
+    """Current vs baseline median for one case."""
+
+    key: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        """current / baseline (above 1 is slower)."""
+        return self.current_s / self.baseline_s if self.baseline_s > 0 else float("inf")
+
+    def is_regression(self, threshold: float) -> bool:
+        """True when the current median is more than ``threshold`` slower."""
+        return self.ratio > 1 + threshold
+
+
+def compare(current: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]) -> list[Comparison]:
+    """Pair up cases present in both result sets (by median time)."""
+    return [
+        Comparison(key, baseline[key]["median_s"], current[key]["median_s"])
+        for key in sorted(current)
+        if key in baseline
+    ]
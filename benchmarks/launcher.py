@@ -0,0 +1,131 @@
+"""Mock worker launcher for offline benchmarks.
+
+BenchLauncher implements the WorkerLauncher interface with forked processes
+instead of Claude Code subprocesses or containers. Each worker opens its own
+StateManager on the shared state directory and runs the claim loop a real
+worker runs (scan pending tasks, claim one, mark it complete) with no LLM, git or
+verification work in between, so the measured time is the state layer.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from multiprocessing.synchronize import Barrier
+from pathlib import Path
+
+from mahabharatha.config import StateConfig
+from mahabharatha.constants import TaskStatus, WorkerStatus
+from mahabharatha.launcher_types import LauncherConfig, SpawnResult, WorkerHandle
+from mahabharatha.launchers.base import WorkerLauncher
+from mahabharatha.state import StateManager
+
+# Fork keeps worker start-up cheap and outside the measured region
+_CTX = multiprocessing.get_context("fork")
+
+
+def _claim_loop(feature: str, state_dir: str, backend: str, worker_id: int, start: Barrier) -> None:
+    manager = StateManager(feature, state_dir=state_dir, config=StateConfig(backend=backend))
+    start.wait()
+    # Same scan as WorkerProtocol.claim_next_task_async without a dispatch socket
+    while True:
+        manager.load()
+        pending = manager.get_tasks_by_status(TaskStatus.PENDING)
+        if not pending:
+            return
+        # Start each worker at a different task so they collide the way real workers do
+        offset = worker_id % len(pending)
+        for task_id in pending[offset:] + pending[:offset]:
+            if manager.claim_task(task_id, worker_id):
+                manager.set_task_status(task_id, TaskStatus.COMPLETE, worker_id=worker_id)
+                break
+
+
+class BenchLauncher(WorkerLauncher):
+    """Launch claim-loop workers against a shared state directory."""
+
+    def __init__(
+        self,
+        state_dir: Path,
+        n_workers: int,
+        backend: str = "json",
+        config: LauncherConfig | None = None,
+    ) -> None:
+        """Initialize the launcher.
+
+        Args:
+            state_dir: State directory shared by all workers
+            n_workers: Number of workers that will be spawned
+            backend: State backend name
+            config: Launcher configuration
+        """
+        super().__init__(config)
+        self.state_dir = state_dir
+        self.backend = backend
+        # Workers open their StateManager, then wait here for start()
+        self._barrier = _CTX.Barrier(n_workers + 1)
+        self._processes: dict[int, multiprocessing.process.BaseProcess] = {}
+
+    def spawn(
+        self,
+        worker_id: int,
+        feature: str,
+        worktree_path: Path,
+        branch: str,
+        env: dict[str, str] | None = None,
+    ) -> SpawnResult:
+        """Fork a worker that waits for start() before claiming tasks."""
+        process = _CTX.Process(
+            target=_claim_loop,
+            args=(feature, str(self.state_dir), self.backend, worker_id, self._barrier),
+            daemon=True,
+        )
+        process.start()
+        handle = WorkerHandle(worker_id=worker_id, pid=process.pid, status=WorkerStatus.RUNNING)
+        self._processes[worker_id] = process
+        self._workers[worker_id] = handle
+        return SpawnResult(success=True, worker_id=worker_id, handle=handle)
+
+    def start(self, timeout: float = 60.0) -> None:
+        """Wait until every spawned worker is ready, then release them at once."""
+        self._barrier.wait(timeout)
+
+    def wait_all(self, timeout: float = 600.0) -> None:
+        """Block until every worker has exited.
+
+        Raises:
+            RuntimeError: If a worker fails or does not finish in time
+        """
+        deadline = time.monotonic() + timeout
+        for worker_id, process in self._processes.items():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if self.monitor(worker_id) != WorkerStatus.STOPPED:
+                self.terminate_all(force=True)
+                raise RuntimeError(f"Bench worker {worker_id} did not finish cleanly (exit {process.exitcode})")
+
+    def monitor(self, worker_id: int) -> WorkerStatus:
+        """Report RUNNING while the worker process lives, then STOPPED or CRASHED."""
+        process = self._processes.get(worker_id)
+        handle = self._workers.get(worker_id)
+        if process is None or handle is None:
+            return WorkerStatus.STOPPED
+        if process.is_alive():
+            return WorkerStatus.RUNNING
+        handle.exit_code = process.exitcode
+        handle.status = WorkerStatus.STOPPED if process.exitcode == 0 else WorkerStatus.CRASHED
+        return handle.status
+
+    def terminate(self, worker_id: int, force: bool = False) -> bool:
+        """Stop a worker process."""
+        process = self._processes.get(worker_id)
+        if process is None:
+            return False
+        if process.is_alive():
+            process.kill() if force else process.terminate()
+            process.join(5)
+        self.monitor(worker_id)
+        return not process.is_alive()
+
+    def get_output(self, worker_id: int, tail: int = 100) -> str:
+        """Bench workers produce no output."""
+        return ""
@@ -6,17 +6,36 @@ Overwhelm features with coordinated worker instances.
 __version__ = "0.3.2"
 __author__ = "MAHABHARATHA Team"
 
-from mahabharatha.architecture import ArchitectureChecker, ArchitectureConfig
-from mahabharatha.architecture_gate import ArchitectureGate
+from importlib import import_module
+from typing import Any
+
 from mahabharatha.constants import GateResult, Level, TaskStatus, WorkerStatus
 from mahabharatha.exceptions import MahabharathaError
-from mahabharatha.worker_metrics import (
-    LevelMetrics,
-    TaskExecutionMetrics,
-    WorkerMetrics,
-    WorkerMetricsCollector,
-    estimate_execution_cost,
-)
+
+# Heavier re-exports are imported on first access so that ``import mahabharatha``
+# (and with it every CLI invocation) does not pay for pydantic models it may
+# never use.
+_LAZY_EXPORTS = {
+    "ArchitectureChecker": "mahabharatha.architecture",
+    "ArchitectureConfig": "mahabharatha.architecture",
+    "ArchitectureGate": "mahabharatha.architecture_gate",
+    "LevelMetrics": "mahabharatha.worker_metrics",
+    "TaskExecutionMetrics": "mahabharatha.worker_metrics",
+    "WorkerMetrics": "mahabharatha.worker_metrics",
+    "WorkerMetricsCollector": "mahabharatha.worker_metrics",
+    "estimate_execution_cost": "mahabharatha.worker_metrics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily re-exported names on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "__version__",
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from mahabharatha.parse_cache import get_parse_cache
+
 if TYPE_CHECKING:
     from mahabharatha.ast_cache import ASTCache
 
@@ -517,8 +519,7 @@ class ArchitectureChecker:
         try:
             if self._cache:
                 return self._cache.parse(file_path)
-            source = file_path.read_text(encoding="utf-8")
-            return ast.parse(source, filename=str(file_path))
+            return get_parse_cache().tree(file_path)
         except (SyntaxError, OSError):
             return None
 
@@ -1,37 +1,47 @@
 """AST caching and analysis utilities for cross-file and import-chain checks.
 
-Provides cached AST parsing to avoid double-parsing when multiple checkers
-analyze the same files. Used by CrossFileChecker and ImportChainChecker.
+Provides AST parsing backed by the shared parse cache (``mahabharatha.parse_cache``)
+to avoid double-parsing when multiple checkers analyze the same files. Used by
+the architecture checker and the AST analyzer.
 """
 
 from __future__ import annotations
 
 import ast
+import os
 from pathlib import Path
 
+from mahabharatha.parse_cache import ParseCache, get_parse_cache
+
 
 class ASTCache:
-    """Cache parsed ASTs keyed on (path, mtime) to avoid repeated parsing."""
+    """Parse Python files through the process-wide parse cache.
+
+    Parses go through one shared cache keyed on (path, mtime, size), so
+    checkers holding their own ``ASTCache`` no longer parse the same file
+    separately. The shared tree LRU is small, so each instance also keeps the
+    trees it has returned for its own lifetime; a run over more files than the
+    LRU holds never re-parses a file it has already seen.
+    """
 
-    def __init__(self) -> None:
-        self._cache: dict[tuple[str, float], ast.Module] = {}
+    def __init__(self, parse_cache: ParseCache | None = None) -> None:
+        self._parse_cache = parse_cache
+        self._trees: dict[str, tuple[int, int, ast.Module]] = {}
 
     def parse(self, path: Path) -> ast.Module:
         """Parse a Python file, returning cached result if file hasn't changed."""
-        resolved = str(path.resolve())
-        mtime = path.stat().st_mtime
-        key = (resolved, mtime)
-
-        if key not in self._cache:
-            source = path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=resolved)
-            self._cache[key] = tree
-
-        return self._cache[key]
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        cached = self._trees.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        tree = (self._parse_cache or get_parse_cache()).tree(key)
+        self._trees[key] = (st.st_mtime_ns, st.st_size, tree)
+        return tree
 
     def clear(self) -> None:
-        """Clear the AST cache."""
-        self._cache.clear()
+        """Clear this instance's trees; the shared parse cache is kept."""
+        self._trees.clear()
 
 
 def collect_exports(tree: ast.Module) -> list[str]:
@@ -1,39 +1,68 @@
 """MAHABHARATHA command-line interface."""
 
+from importlib import import_module
+
 import click
-from rich.console import Console
 
 from mahabharatha import __version__
-from mahabharatha.commands import (
-    analyze,
-    build,
-    cleanup,
-    debug,
-    design,
-    document,
-    git_cmd,
-    health,
-    init,
-    install_commands,
-    kurukshetra,
-    logs,
-    merge_cmd,
-    plan,
-    refactor,
-    retry,
-    review,
-    security_rules_group,
-    status,
-    stop,
-    test_cmd,
-    uninstall_commands,
-    wiki,
-)
 
-console = Console()
+# Subcommand name -> "module:attribute". Modules are imported only when their
+# command runs (or for --help), so e.g. `status` in a watch loop does not import
+# the analyzers, git engines and security scanner. Modules are spelled out in
+# full so validate_commands counts these entries as production imports.
+COMMANDS = {
+    "analyze": "mahabharatha.commands.analyze:analyze",
+    "build": "mahabharatha.commands.build:build",
+    "cleanup": "mahabharatha.commands.cleanup:cleanup",
+    "debug": "mahabharatha.commands.debug:debug",
+    "design": "mahabharatha.commands.design:design",
+    "document": "mahabharatha.commands.document:document",
+    "git": "mahabharatha.commands.git_cmd:git_cmd",
+    "health": "mahabharatha.commands.health:health",
+    "init": "mahabharatha.commands.init:init",
+    "install-commands": "mahabharatha.commands.install_commands:install_commands",
+    "kurukshetra": "mahabharatha.commands.kurukshetra:kurukshetra",
+    "logs": "mahabharatha.commands.logs:logs",
+    "merge": "mahabharatha.commands.merge_cmd:merge_cmd",
+    "plan": "mahabharatha.commands.plan:plan",
+    "refactor": "mahabharatha.commands.refactor:refactor",
+    "retry": "mahabharatha.commands.retry:retry",
+    "review": "mahabharatha.commands.review:review",
+    "security-rules": "mahabharatha.commands.security_rules_cmd:security_rules_group",
+    "status": "mahabharatha.commands.status:status",
+    "stop": "mahabharatha.commands.stop:stop",
+    "test": "mahabharatha.commands.test_cmd:test_cmd",
+    "uninstall-commands": "mahabharatha.commands.install_commands:uninstall_commands",
+    "wiki": "mahabharatha.commands.wiki:wiki",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommands when they are first resolved."""
+
+    def __init__(self, *args: object, lazy_commands: dict[str, str] | None = None, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.lazy_commands = dict(lazy_commands or {})
 
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eagerly added and lazy command names."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
 
-@click.group()
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a command, importing its module on first use."""
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+        module_name, attr = self.lazy_commands[cmd_name].split(":")
+        command = getattr(import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attr} is not a click command")
+        # Cache it so later lookups in this process skip the import machinery
+        self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.version_option(version=__version__, prog_name="mahabharatha")
 @click.option("--quick", is_flag=True, help="Quick surface-level analysis")
 @click.option("--think", is_flag=True, help="Structured multi-step analysis")
@@ -94,31 +123,5 @@ def cli(
     ctx.obj["iterations"] = iterations
 
 
-# Register implemented commands
-cli.add_command(analyze)
-cli.add_command(build)
-cli.add_command(cleanup)
-cli.add_command(design)
-cli.add_command(git_cmd, name="git")
-cli.add_command(init)
-cli.add_command(logs)
-cli.add_command(merge_cmd)
-cli.add_command(plan)
-cli.add_command(refactor)
-cli.add_command(retry)
-cli.add_command(review)
-cli.add_command(kurukshetra)
-cli.add_command(security_rules_group)
-cli.add_command(status)
-cli.add_command(stop)
-cli.add_command(test_cmd, name="test")
-cli.add_command(debug)
-cli.add_command(document)
-cli.add_command(wiki)
-cli.add_command(health)
-cli.add_command(install_commands)
-cli.add_command(uninstall_commands)
-
-
 if __name__ == "__main__":
     cli()
@@ -10,7 +10,9 @@ This module provides secure command execution by:
 import os
 import re
 import shlex
+import signal
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -305,6 +307,7 @@ class CommandExecutor:
         cwd: Path | str | None = None,
         capture_output: bool = True,
         check: bool = False,
+        cancel_event: threading.Event | None = None,
     ) -> CommandResult:
         """Execute a command securely.
 
@@ -315,6 +318,8 @@ class CommandExecutor:
             cwd: Working directory (overrides default)
             capture_output: Whether to capture stdout/stderr
             check: Whether to raise on non-zero exit
+            cancel_event: When set while the command runs, its process group is
+                terminated and the result reports ``Command cancelled``
 
         Returns:
             CommandResult with execution details
@@ -352,15 +357,26 @@ class CommandExecutor:
 
         # Execute command
         try:
-            result = subprocess.run(
-                cmd_str_raw if needs_shell else cmd_args,
-                cwd=str(exec_cwd),
-                env=exec_env,
-                capture_output=capture_output,
-                text=True,
-                timeout=timeout or self.timeout,
-                shell=needs_shell,
-            )
+            if cancel_event is not None:
+                result = self._run_cancellable(
+                    cmd_str_raw if needs_shell else cmd_args,
+                    cwd=exec_cwd,
+                    env=exec_env,
+                    capture_output=capture_output,
+                    timeout=timeout or self.timeout,
+                    shell=needs_shell,
+                    cancel_event=cancel_event,
+                )
+            else:
+                result = subprocess.run(
+                    cmd_str_raw if needs_shell else cmd_args,
+                    cwd=str(exec_cwd),
+                    env=exec_env,
+                    capture_output=capture_output,
+                    text=True,
+                    timeout=timeout or self.timeout,
+                    shell=needs_shell,
+                )
 
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -435,6 +451,65 @@ class CommandExecutor:
 
         return cmd_result
 
+    def _run_cancellable(
+        self,
+        args: str | list[str],
+        cwd: Path,
+        env: dict[str, str],
+        capture_output: bool,
+        timeout: int,
+        shell: bool,
+        cancel_event: threading.Event,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a command in its own process group so it can be cancelled.
+
+        Mirrors ``subprocess.run`` (including raising TimeoutExpired) but wakes
+        every 100ms to check ``cancel_event``. On cancellation or timeout the
+        whole process group is terminated, so test runners and other commands
+        that fork children do not leave orphans behind.
+        """
+        import time
+
+        pipe = subprocess.PIPE if capture_output else None
+        proc = subprocess.Popen(
+            args,
+            cwd=str(cwd),
+            env=env,
+            stdout=pipe,
+            stderr=pipe,
+            text=True,
+            shell=shell,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.1)
+                return subprocess.CompletedProcess(args, proc.returncode, stdout or "", stderr or "")
+            except subprocess.TimeoutExpired:
+                cancelled = cancel_event.is_set()
+                if not cancelled and time.monotonic() < deadline:
+                    continue
+                self._terminate_process_group(proc)
+                stdout, stderr = proc.communicate()
+                if cancelled:
+                    return subprocess.CompletedProcess(args, -1, stdout or "", "Command cancelled")
+                raise subprocess.TimeoutExpired(args, timeout, output=stdout, stderr=stderr) from None
+
+    @staticmethod
+    def _terminate_process_group(proc: subprocess.Popen[str], grace_seconds: float = 5.0) -> None:
+        """Send SIGTERM to the process group, escalating to SIGKILL after a grace period."""
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(proc.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                return
+            try:
+                proc.wait(timeout=grace_seconds)
+                return
+            except subprocess.TimeoutExpired:
+                continue
+
     def execute_git(
         self,
         *args: str,
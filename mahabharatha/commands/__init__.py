@@ -1,27 +1,50 @@
 """MAHABHARATHA CLI commands."""
 
-from mahabharatha.commands.analyze import analyze
-from mahabharatha.commands.build import build
-from mahabharatha.commands.cleanup import cleanup
-from mahabharatha.commands.debug import debug
-from mahabharatha.commands.design import design
-from mahabharatha.commands.document import document
-from mahabharatha.commands.git_cmd import git_cmd
-from mahabharatha.commands.health import health
-from mahabharatha.commands.init import init
-from mahabharatha.commands.install_commands import install_commands, uninstall_commands
-from mahabharatha.commands.kurukshetra import kurukshetra
-from mahabharatha.commands.logs import logs
-from mahabharatha.commands.merge_cmd import merge_cmd
-from mahabharatha.commands.plan import plan
-from mahabharatha.commands.refactor import refactor
-from mahabharatha.commands.retry import retry
-from mahabharatha.commands.review import review
-from mahabharatha.commands.security_rules_cmd import security_rules_group
-from mahabharatha.commands.status import status
-from mahabharatha.commands.stop import stop
-from mahabharatha.commands.test_cmd import test_cmd
-from mahabharatha.commands.wiki import wiki
+from importlib import import_module
+from typing import Any
+
+# Command objects are imported on first access; the CLI resolves subcommands
+# lazily too, so running one command never imports the others.
+_COMMAND_MODULES = {
+    "analyze": "analyze",
+    "build": "build",
+    "cleanup": "cleanup",
+    "debug": "debug",
+    "design": "design",
+    "document": "document",
+    "git_cmd": "git_cmd",
+    "health": "health",
+    "init": "init",
+    "install_commands": "install_commands",
+    "kurukshetra": "kurukshetra",
+    "logs": "logs",
+    "merge_cmd": "merge_cmd",
+    "plan": "plan",
+    "refactor": "refactor",
+    "retry": "retry",
+    "review": "review",
+    "security_rules_group": "security_rules_cmd",
+    "status": "status",
+    "stop": "stop",
+    "test_cmd": "test_cmd",
+    "uninstall_commands": "install_commands",
+    "wiki": "wiki",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command object on first access.
+
+    Importing the submodule binds it as a package attribute of the same name;
+    rebind the command over it, as the eager re-exports used to.
+    """
+    module = _COMMAND_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "analyze",
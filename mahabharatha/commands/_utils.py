@@ -105,13 +105,12 @@ def detect_feature() -> str | None:
         if name:
             return name
 
-    # Fallback: most recently modified state file
-    state_dir = Path(STATE_DIR)
-    if state_dir.exists():
-        state_files = list(state_dir.glob("*.json"))
-        if state_files:
-            state_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            return state_files[0].stem
+    # Fallback: most recently modified state (any backend)
+    from mahabharatha.state.backends import discover_state_features
+
+    features = discover_state_features(STATE_DIR)
+    if features:
+        return features[0]
 
     return None
 
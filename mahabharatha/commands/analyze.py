@@ -15,10 +15,10 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 
-from mahabharatha.ast_cache import ASTCache, collect_exports, collect_imports
 from mahabharatha.command_executor import CommandExecutor, CommandValidationError
 from mahabharatha.fs_utils import collect_files
 from mahabharatha.logging import get_logger
+from mahabharatha.parse_cache import FileSummary, get_parse_cache
 
 console = Console()
 logger = get_logger("analyze")
@@ -539,6 +539,23 @@ def _path_to_module(path: Path) -> str:
     return ".".join(parts)
 
 
+def _summaries(py_files: list[Path]) -> dict[Path, FileSummary]:
+    """Parse summaries of *py_files*, skipping unreadable and unparseable files."""
+    cache = get_parse_cache()
+    summaries: dict[Path, FileSummary] = {}
+    for pf in py_files:
+        try:
+            summary = cache.summary(pf)
+        except OSError:
+            logger.debug("Failed to read %s", pf)
+            continue
+        if summary.error:
+            logger.debug("Failed to parse %s: %s", pf, summary.error)
+            continue
+        summaries[pf] = summary
+    return summaries
+
+
 def _max_import_depth(graph: dict[str, set[str]], node: str, seen: set[str]) -> int:
     """Calculate max import chain depth from a node."""
     if node in seen or node not in graph:
@@ -559,7 +576,6 @@ class CrossFileChecker(BaseChecker):
 
     def __init__(self, scope: str = "mahabharatha/") -> None:
         self.scope = scope
-        self._cache = ASTCache()
 
     def check(self, files: list[str]) -> AnalysisResult:
         """Run cross-file export/import analysis."""
@@ -572,27 +588,18 @@ class CrossFileChecker(BaseChecker):
 
         # Phase 1: collect all exports per module
         exports_by_file: dict[str, list[str]] = {}
+        summaries = _summaries(py_files)
         for pf in py_files:
-            if pf.name.startswith("__"):
-                continue
-            try:
-                tree = self._cache.parse(pf)
-                exports_by_file[str(pf)] = collect_exports(tree)
-            except Exception:  # noqa: BLE001 — intentional: best-effort AST parsing; skip unparseable files
-                logger.debug("Failed to parse %s for exports", pf)
+            if pf.name.startswith("__") or pf not in summaries:
                 continue
+            exports_by_file[str(pf)] = summaries[pf].exports()
 
         # Phase 2: collect all imported names across entire scope
         all_imported_names: set[str] = set()
-        for pf in py_files:
-            try:
-                tree = self._cache.parse(pf)
-                for _module_name, name in collect_imports(tree):
-                    if name:
-                        all_imported_names.add(name)
-            except Exception:  # noqa: BLE001 — intentional: best-effort AST parsing; skip unparseable files
-                logger.debug("Failed to parse %s for imports", pf)
-                continue
+        for summary in summaries.values():
+            for _module_name, name in summary.import_pairs():
+                if name:
+                    all_imported_names.add(name)
 
         # Phase 3: diff -- exported but never imported
         for filepath, exports in exports_by_file.items():
@@ -616,7 +623,6 @@ class ImportChainChecker(BaseChecker):
 
     def __init__(self, max_depth: int = 10) -> None:
         self.max_depth = max_depth
-        self._cache = ASTCache()
 
     def check(self, files: list[str]) -> AnalysisResult:
         """Run import chain analysis for cycles and excessive depth."""
@@ -638,17 +644,15 @@ class ImportChainChecker(BaseChecker):
         # Map: module dotted name -> set of imported mahabharatha module names
         graph: dict[str, set[str]] = {}
 
+        summaries = _summaries(py_files)
         for pf in py_files:
             mod_name = _path_to_module(pf)
             graph[mod_name] = set()
-            try:
-                tree = self._cache.parse(pf)
-                for module_name, _name in collect_imports(tree):
-                    if module_name and module_name.startswith("mahabharatha"):
-                        graph[mod_name].add(module_name)
-            except Exception:  # noqa: BLE001 — intentional: best-effort AST parsing; skip unparseable files
-                logger.debug("Failed to parse %s for dependency graph", pf)
+            if pf not in summaries:
                 continue
+            for module_name, _name in summaries[pf].import_pairs():
+                if module_name and module_name.startswith("mahabharatha"):
+                    graph[mod_name].add(module_name)
 
         # Detect cycles via DFS
         visited: set[str] = set()
@@ -11,15 +11,21 @@ from rich.console import Console
 from rich.table import Table
 
 from mahabharatha.config import MahabharathaConfig
-from mahabharatha.constants import GSD_DIR, SPECS_DIR
+from mahabharatha.constants import GSD_DIR, SPECS_DIR, STATE_DIR
 from mahabharatha.containers import ContainerManager
 from mahabharatha.git_ops import GitOps
+from mahabharatha.log_index import INDEX_SUFFIX
 from mahabharatha.logging import get_logger
+from mahabharatha.state.backends import discover_state_features, feature_state_files
+from mahabharatha.state.lock_profile import lock_profile_files
 from mahabharatha.worktree import WorktreeManager
 
 console = Console()
 logger = get_logger("cleanup")
 
+# Worker logs and their rotated copies; ``.idx`` sidecars are removed with their log
+WORKER_LOG_PATTERNS = ("*.jsonl", "*.jsonl.[0-9]")
+
 
 @click.command()
 @click.option("--feature", "-f", help="Feature to clean")
@@ -115,11 +121,8 @@ def discover_features() -> list[str]:
     """
     features = set()
 
-    # Check state files
-    state_dir = Path(".mahabharatha/state")
-    if state_dir.exists():
-        for state_file in state_dir.glob("*.json"):
-            features.add(state_file.stem)
+    # Check state files (any backend: JSON snapshot, journal WAL, SQLite database)
+    features.update(discover_state_features(STATE_DIR))
 
     # Check worktree directories
     worktree_dir = Path(".mahabharatha/worktrees")
@@ -195,10 +198,12 @@ def create_cleanup_plan(
         # Find containers
         plan["containers"].append(f"mahabharatha-worker-{feature}-*")
 
-        # Find state files
-        state_file = Path(f".mahabharatha/state/{feature}.json")
-        if state_file.exists():
+        # Find state files: every backend's files, so no leftover WAL or
+        # database resurrects the feature's state on the next run
+        for state_file in feature_state_files(feature, STATE_DIR):
             plan["state_files"].append(str(state_file))
+        for profile_file in lock_profile_files(STATE_DIR, feature):
+            plan["state_files"].append(str(profile_file))
 
         # Find log files
         if not keep_logs:
@@ -378,6 +383,11 @@ def execute_cleanup(plan: dict[str, Any], config: MahabharathaConfig) -> None:
         console.print(f"\n[yellow]Completed with {len(errors)} error(s)[/yellow]")
 
 
+def _log_index_file(log_file: Path) -> Path:
+    """Path of the LogIndex sidecar kept next to a JSONL log."""
+    return log_file.with_name(log_file.name + INDEX_SUFFIX)
+
+
 def cleanup_structured_logs(config: MahabharathaConfig, dry_run: bool = False) -> None:
     """Clean up structured log artifacts based on retention policy.
 
@@ -431,7 +441,8 @@ def cleanup_structured_logs(config: MahabharathaConfig, dry_run: bool = False) -
         console.print("\n[bold]Worker JSONL files:[/bold]")
         cutoff_time = time.time() - (retain_days * 86400)
 
-        for jsonl_file in sorted(workers_dir.glob("*.jsonl*")):
+        log_files = {p for pattern in WORKER_LOG_PATTERNS for p in workers_dir.glob(pattern)}
+        for jsonl_file in sorted(log_files):
             file_mtime = jsonl_file.stat().st_mtime
 
             should_clean = False
@@ -447,6 +458,7 @@ def cleanup_structured_logs(config: MahabharathaConfig, dry_run: bool = False) -
                 else:
                     try:
                         jsonl_file.unlink()
+                        _log_index_file(jsonl_file).unlink(missing_ok=True)
                         console.print(f"  [green]Removed:[/green] {jsonl_file.name} ({reason})")
                     except OSError as e:
                         logger.warning(f"Worker log removal failed for {jsonl_file.name}: {e}")
@@ -454,6 +466,21 @@ def cleanup_structured_logs(config: MahabharathaConfig, dry_run: bool = False) -
                         errors.append(str(e))
                 cleaned_workers += 1
 
+        # Sidecars whose log is already gone (removed by hand or by an older cleanup)
+        for index_file in sorted(workers_dir.glob(f"*.jsonl{INDEX_SUFFIX}")):
+            if index_file.with_name(index_file.name.removesuffix(INDEX_SUFFIX)).exists():
+                continue
+            if dry_run:
+                console.print(f"  [dim]Would remove:[/dim] {index_file.name} (log removed)")
+            else:
+                try:
+                    index_file.unlink()
+                    console.print(f"  [green]Removed:[/green] {index_file.name} (log removed)")
+                except OSError as e:
+                    logger.warning(f"Log index removal failed for {index_file.name}: {e}")
+                    errors.append(str(e))
+            cleaned_workers += 1
+
         if cleaned_workers == 0:
             console.print("  [dim]No worker logs to clean[/dim]")
 
@@ -467,6 +494,7 @@ def cleanup_structured_logs(config: MahabharathaConfig, dry_run: bool = False) -
             else:
                 try:
                     orchestrator_file.unlink()
+                    _log_index_file(orchestrator_file).unlink(missing_ok=True)
                     console.print("\n  [green]Removed:[/green] orchestrator.jsonl")
                 except OSError as e:
                     logger.warning(f"Orchestrator log removal failed: {e}")
@@ -31,6 +31,9 @@ if TYPE_CHECKING:
 console = Console()
 logger = get_logger("debug")
 
+# p99 state-lock wait that is reported as diagnostic evidence
+LOCK_WAIT_EVIDENCE_MS = 1000.0
+
 
 class DebugPhase(Enum):
     """Phases of debugging process."""
@@ -569,6 +572,11 @@ class DebugCommand:
                 result.evidence.append(f"{len(health.stale_tasks)} stale task(s)")
             if health.global_error:
                 result.evidence.append(f"Global error: {health.global_error}")
+            for site, stats in health.lock_contention.items():
+                if stats["wait_ms"]["p99"] >= LOCK_WAIT_EVIDENCE_MS:
+                    result.evidence.append(
+                        f"State lock contention: {site} waits {stats['wait_ms']['p99']:.0f}ms at p99"
+                    )
 
             # Log analysis
             analyzer = LogAnalyzer()
@@ -723,6 +731,9 @@ class DebugCommand:
                     lines.append(f"  Failed: {len(health.failed_tasks)} task(s)")
                 if health.global_error:
                     lines.append(f"  Error: {health.global_error}")
+                if health.lock_contention:
+                    lines.append("  State lock (by total wait):")
+                    lines.extend(f"    {line}" for line in _lock_contention_lines(health.lock_contention))
                 lines.append("")
             else:
                 failed = len(health.failed_tasks) if health.failed_tasks else 0
@@ -854,6 +865,19 @@ class DebugCommand:
         return lines
 
 
+def _lock_contention_lines(contention: dict[str, dict[str, Any]], limit: int = 5) -> list[str]:
+    """One line per call site: update count, wait/hold percentiles and bytes written."""
+    lines = []
+    for site, stats in list(contention.items())[:limit]:
+        wait, hold = stats["wait_ms"], stats["hold_ms"]
+        lines.append(
+            f"{site}: {stats['count']} updates, wait p50/p99 {wait['p50']:.1f}/{wait['p99']:.1f}ms "
+            f"(total {wait['total'] / 1000:.1f}s), hold p50/p99 {hold['p50']:.1f}/{hold['p99']:.1f}ms, "
+            f"~{stats['bytes_written']['p50']:.0f} B/update"
+        )
+    return lines
+
+
 def _load_stacktrace_file(filepath: str) -> str:
     """Load stack trace from file."""
     try:
@@ -1120,6 +1144,10 @@ def _display_health_sections(result: DiagnosticResult, verbose: bool) -> None:
                 console.print(f"  [red]Failed: {len(health.failed_tasks)}[/red]")
             if health.global_error:
                 console.print(f"  [red]Error: {health.global_error}[/red]")
+            if health.lock_contention:
+                console.print("  State lock (by total wait):")
+                for line in _lock_contention_lines(health.lock_contention):
+                    console.print(f"    [dim]{line}[/dim]")
             console.print()
         else:
             failed = len(health.failed_tasks) if health.failed_tasks else 0
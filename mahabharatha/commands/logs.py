@@ -1,17 +1,21 @@
 """MAHABHARATHA logs command - stream worker logs."""
 
+import heapq
 import json
 import subprocess
-import time
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import click
 from rich.console import Console
+from rich.table import Table
 from rich.text import Text
 
 from mahabharatha.log_aggregator import LogAggregator
+from mahabharatha.log_tail import LogFollower, tail_lines
 from mahabharatha.logging import get_logger
+from mahabharatha.tracing import export_chrome_trace, load_trace_events, summarize_trace, trace_dir
 
 console = Console()
 logger = get_logger("logs")
@@ -65,6 +69,13 @@ LEVEL_COLORS = {
 @click.option("--since", type=str, default=None, help="Only entries after this ISO8601 timestamp")
 @click.option("--until", type=str, default=None, help="Only entries before this ISO8601 timestamp")
 @click.option("--search", type=str, default=None, help="Text search in messages")
+@click.option(
+    "--trace",
+    "trace_output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Export timing spans as Chrome/Perfetto trace JSON and show a per-level breakdown",
+)
 @click.pass_context
 def logs(
     ctx: click.Context,
@@ -82,6 +93,7 @@ def logs(
     since: str | None,
     until: str | None,
     search: str | None,
+    trace_output: Path | None,
 ) -> None:
     """Stream worker logs.
 
@@ -105,6 +117,8 @@ def logs(
         mahabharatha logs --artifacts T1.1
 
         mahabharatha logs --aggregate --phase verify --event verification_failed
+
+        mahabharatha logs --trace trace.json
     """
     try:
         # Auto-detect feature
@@ -118,6 +132,11 @@ def logs(
 
         log_dir = Path(".mahabharatha/logs")
 
+        # Handle --trace mode
+        if trace_output:
+            _export_trace(log_dir, feature, trace_output)
+            return
+
         # Handle --artifacts mode
         if artifacts_task:
             _show_task_artifacts(log_dir, artifacts_task)
@@ -141,9 +160,9 @@ def logs(
             )
             return
 
-        # Check if container mode — try docker logs first
-        launcher_type = _get_launcher_type()
-        if launcher_type == "container" and worker_id is not None:
+        # Check if container mode — try docker logs first (only worker logs
+        # come from containers, so skip loading the config otherwise)
+        if worker_id is not None and _get_launcher_type() == "container":
             container_output = _get_container_logs(worker_id)
             if container_output is not None:
                 if not json_output:
@@ -238,6 +257,36 @@ def _show_aggregated_logs(
             console.print(format_log_entry(entry))
 
 
+def _export_trace(log_dir: Path, feature: str, output: Path) -> None:
+    """Export recorded spans and print where each level's time went.
+
+    Args:
+        log_dir: Base log directory
+        feature: Feature name
+        output: Chrome trace JSON file to write
+    """
+    directory = trace_dir(log_dir, feature)
+    events = load_trace_events(directory)
+    if not any(e.get("ph") == "X" for e in events):
+        console.print(f"[yellow]No trace spans found in {directory}[/yellow]")
+        console.print("Enable tracing with [cyan]logging.tracing: true[/cyan] in .mahabharatha/config.yaml")
+        return
+
+    count = export_chrome_trace(directory, output)
+    console.print(f"Exported {count} spans to [cyan]{output}[/cyan] (open in https://ui.perfetto.dev)\n")
+
+    summary = summarize_trace(events)
+    categories = sorted({cat for cats in summary.values() for cat in cats})
+    table = Table(title="Span time per level (seconds)")
+    table.add_column("Level")
+    for cat in categories:
+        table.add_column(cat, justify="right")
+    for level in sorted(summary, key=lambda lvl: (lvl is None, lvl if lvl is not None else 0)):
+        label = str(level) if level is not None else "-"
+        table.add_row(label, *(f"{summary[level].get(cat, 0.0):.1f}" for cat in categories))
+    console.print(table)
+
+
 def _show_task_artifacts(log_dir: Path, task_id: str) -> None:
     """Show artifact file contents for a task.
 
@@ -431,6 +480,22 @@ def format_log_entry(entry: dict[str, Any]) -> Text:
     return text
 
 
+def _entry_ts(entry: dict[str, Any]) -> str:
+    return str(entry.get("timestamp", ""))
+
+
+def _filter_level(entries: Iterable[dict[str, Any]], level_priority: int) -> list[dict[str, Any]]:
+    return [e for e in entries if get_level_priority(e.get("level", "info").lower()) >= level_priority]
+
+
+def _print_entries(entries: list[dict[str, Any]], json_output: bool) -> None:
+    for entry in entries:
+        if json_output:
+            console.print(json.dumps(entry), soft_wrap=True)
+        else:
+            console.print(format_log_entry(entry))
+
+
 def show_logs(
     log_files: list[Path],
     tail: int,
@@ -439,46 +504,36 @@ def show_logs(
 ) -> None:
     """Show recent logs.
 
+    Reads only the last ``tail`` lines of each file, seeking backwards from
+    the end, and merges the files by timestamp.
+
     Args:
         log_files: Log files to read
         tail: Number of lines
         level_priority: Minimum level priority
         json_output: Whether to output JSON
     """
-    # Collect all entries
-    entries = []
+    per_file: list[list[dict[str, Any]]] = []
 
     for log_file in log_files:
         try:
-            with open(log_file) as f:
-                lines = f.readlines()
-
-            # Take last N lines
-            for line in lines[-tail:]:
-                entry = parse_log_line(line)
-                if entry:
-                    entry["_file"] = log_file.name
-                    entries.append(entry)
+            lines = tail_lines(log_file, tail)
         except OSError as e:
             logger.warning(f"Error reading {log_file}: {e}")
+            continue
 
-    # Sort by timestamp
-    entries.sort(key=lambda e: e.get("timestamp", ""))
+        entries = []
+        for line in lines:
+            entry = parse_log_line(line)
+            if entry:
+                entry["_file"] = log_file.name
+                entries.append(entry)
+        entries.sort(key=_entry_ts)
+        per_file.append(entries)
 
-    # Filter by level
-    filtered = []
-    for entry in entries:
-        entry_level = entry.get("level", "info").lower()
-        entry_priority = get_level_priority(entry_level)
-        if entry_priority >= level_priority:
-            filtered.append(entry)
-
-    # Output
-    for entry in filtered[-tail:]:
-        if json_output:
-            console.print(json.dumps(entry), soft_wrap=True)
-        else:
-            console.print(format_log_entry(entry))
+    # Filter by level, then keep the newest entries
+    filtered = _filter_level(heapq.merge(*per_file, key=_entry_ts), level_priority)
+    _print_entries(filtered[-tail:], json_output)
 
 
 def stream_logs(
@@ -488,53 +543,24 @@ def stream_logs(
 ) -> None:
     """Stream logs continuously.
 
+    Blocks on inotify (or a stat poll where inotify is unavailable) between
+    reads and prints each batch of new lines merged by timestamp.
+
     Args:
         log_files: Log files to stream
         level_priority: Minimum level priority
         json_output: Whether to output JSON
     """
-    # Track file positions
-    positions: dict[Path, int] = {}
-    for log_file in log_files:
-        if log_file.exists():
-            positions[log_file] = log_file.stat().st_size
-
-    console.print("[dim]Streaming logs (Ctrl+C to stop)...[/dim]\n")
-
-    while True:
-        for log_file in log_files:
-            if not log_file.exists():
-                continue
-
-            current_size = log_file.stat().st_size
-            last_pos = positions.get(log_file, 0)
-
-            if current_size > last_pos:
-                # Read new content
-                try:
-                    with open(log_file) as f:
-                        f.seek(last_pos)
-                        new_content = f.read()
-
-                    positions[log_file] = current_size
-
-                    # Process new lines
-                    for line in new_content.splitlines():
-                        entry = parse_log_line(line)
-                        if entry:
-                            entry_level = entry.get("level", "info").lower()
-                            entry_priority = get_level_priority(entry_level)
-
-                            if entry_priority >= level_priority:
-                                if json_output:
-                                    console.print(json.dumps(entry), soft_wrap=True)
-                                else:
-                                    console.print(format_log_entry(entry))
-
-                except OSError as e:
-                    logger.warning(f"Error reading {log_file}: {e}")
-
-        time.sleep(0.5)
+    with LogFollower(log_files) as follower:
+        console.print("[dim]Streaming logs (Ctrl+C to stop)...[/dim]\n")
+
+        while True:
+            batches = []
+            for lines in follower.read_new().values():
+                entries = [e for e in map(parse_log_line, lines) if e]
+                batches.append(entries)
+            _print_entries(_filter_level(heapq.merge(*batches, key=_entry_ts), level_priority), json_output)
+            follower.wait()
 
 
 # Alias for external import
@@ -8,6 +8,7 @@ from rich.table import Table
 
 from mahabharatha.config import MahabharathaConfig
 from mahabharatha.constants import GateResult
+from mahabharatha.gate_cache import GateResultCache, clean_tree_sha
 from mahabharatha.gates import GateRunner
 from mahabharatha.logging import get_logger
 from mahabharatha.merge import MergeCoordinator
@@ -77,7 +78,8 @@ def merge_cmd(
             level = state.get_current_level()
 
         # Create merge coordinator
-        merge_coordinator = MergeCoordinator(feature, config)
+        gate_cache = GateResultCache.from_config(config)
+        merge_coordinator = MergeCoordinator(feature, config, gate_cache=gate_cache)
 
         # Show merge plan
         plan = create_merge_plan(state, feature, level, target, skip_gates)
@@ -90,7 +92,7 @@ def merge_cmd(
         # Run quality gates if not skipped
         if not skip_gates:
             console.print("\n[bold]Running quality gates...[/bold]")
-            gate_result = run_quality_gates(config, feature, level)
+            gate_result = run_quality_gates(config, feature, level, cache=gate_cache)
 
             if gate_result != GateResult.PASS:
                 console.print("\n[red]Quality gates failed[/red]")
@@ -240,18 +242,26 @@ def show_merge_plan(plan: dict[str, Any], dry_run: bool) -> None:
         console.print(f"  {icon} {branch_info['branch']}")
 
 
-def run_quality_gates(config: MahabharathaConfig, feature: str, level: int) -> GateResult:
+def run_quality_gates(
+    config: MahabharathaConfig,
+    feature: str,
+    level: int,
+    cache: GateResultCache | None = None,
+) -> GateResult:
     """Run quality gates.
 
     Args:
         config: Configuration
         feature: Feature name
         level: Level number
+        cache: Optional gate result cache; passing results for an unchanged
+            tree are reused instead of re-running the gate
 
     Returns:
         Gate result
     """
     gate_runner = GateRunner(config)
+    tree_sha = clean_tree_sha() if cache is not None else None
 
     # Get gate commands from config
     gates = config.quality_gates
@@ -264,8 +274,14 @@ def run_quality_gates(config: MahabharathaConfig, feature: str, level: int) -> G
         if not gate.command:
             continue
 
-        console.print(f"  Running {gate.name}...")
-        result = gate_runner.run_gate(gate)
+        result = cache.get(tree_sha, gate) if cache is not None and tree_sha is not None else None
+        if result is not None:
+            console.print(f"  Reusing {gate.name} result for unchanged tree...")
+        else:
+            console.print(f"  Running {gate.name}...")
+            result = gate_runner.run_gate(gate)
+            if cache is not None and tree_sha is not None:
+                cache.put(tree_sha, gate, result)
 
         if result.result == GateResult.PASS:
             console.print(f"    [green]✓[/green] {gate.name}")
@@ -455,7 +455,7 @@ def _watch_loop(tester: Command, framework: Framework | None, path: str) -> None
     def get_file_hashes(target: Path) -> dict[str, str]:
         """Get hashes of test-related files."""
         hashes = {}
-        grouped = collect_files(target, extensions={".py", ".js", ".ts", ".go", ".rs"})
+        grouped = collect_files(target, extensions={".py", ".js", ".ts", ".go", ".rs"}, cache_listings=True)
         for files in grouped.values():
             for f in files:
                 try:
@@ -30,6 +30,7 @@ __all__ = [
     "PlanningConfig",
     "RushConfig",
     "LLMConfig",
+    "StateConfig",
 ]
 
 import logging
@@ -138,6 +139,30 @@ class WorkersConfig(BaseModel):
         description="Maximum respawn attempts per worker before giving up",
     )
 
+    # Event-driven task dispatch over a Unix socket (polling remains the fallback)
+    task_dispatch: bool = Field(
+        default=True,
+        description="Push ready task IDs to idle workers instead of having each worker poll state",
+    )
+
+    # Asyncio orchestrator loop woken by state changes instead of a fixed poll
+    event_loop: bool = Field(
+        default=True,
+        description="Run the orchestrator as an asyncio event loop that reacts to worker state writes",
+    )
+
+    # Persistent workers: stay alive across levels instead of being respawned
+    persistent: bool = Field(
+        default=False,
+        description="Keep workers running between levels and rebase their worktrees in place after each merge",
+    )
+    persistent_idle_timeout_seconds: int = Field(
+        default=3600,
+        ge=60,
+        le=86400,
+        description="How long a persistent worker waits for the next level before exiting",
+    )
+
 
 class PortsConfig(BaseModel):
     """Port allocation configuration."""
@@ -155,6 +180,14 @@ class QualityGate(BaseModel):
     required: bool = False
     timeout: int = Field(default=300, ge=1, le=3600)
     coverage_threshold: int | None = None
+    depends_on: list[str] = Field(
+        default_factory=list,
+        description="Gates that must pass before this one starts (parallel gate mode)",
+    )
+    resource_group: str | None = Field(
+        default=None,
+        description="Gates sharing a resource group never run at the same time",
+    )
 
 
 class ResourcesConfig(BaseModel):
@@ -166,6 +199,16 @@ class ResourcesConfig(BaseModel):
     container_memory_limit: str = Field(default="4g")
     container_cpu_limit: float = Field(default=2.0, ge=0.1, le=32.0)
     gpu_enabled: bool = Field(default=False, description="Enable GPU passthrough for containers")
+    container_event_watch: bool = Field(
+        default=True,
+        description="Track worker containers via one docker events stream and batched inspects",
+    )
+    container_warm_pool: int = Field(
+        default=0,
+        ge=0,
+        le=10,
+        description="Idle pre-started worker containers kept for fast respawns (0 = disabled)",
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -178,6 +221,13 @@ class LoggingConfig(BaseModel):
     ephemeral_retain_on_failure: bool = True
     max_log_size_mb: int = Field(default=50, ge=1, le=1000)
     structured_output: bool = True
+    # Batch structured log writes on a background thread (errors are still written immediately)
+    buffered_output: bool = True
+    flush_interval_ms: int = Field(default=200, ge=10, le=10000)
+    flush_batch_size: int = Field(default=256, ge=1, le=100000)
+    # Record timing spans to <directory>/traces/<feature>/ (see `mahabharatha logs --trace`)
+    tracing: bool = False
+    trace_buffer_size: int = Field(default=4096, ge=1, le=1000000)
 
 
 class SecurityConfig(BaseModel):
@@ -264,6 +314,17 @@ class VerificationConfig(BaseModel):
     staleness_threshold_seconds: int = Field(default=300, ge=10, le=3600)
     store_artifacts: bool = True
     artifact_dir: str = ".mahabharatha/artifacts"
+    max_parallel_gates: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Quality gates run concurrently (1 = sequential)",
+    )
+    gate_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse passing gate results for an identical git tree, gate command and gate config",
+    )
+    gate_cache_max_entries: int = Field(default=256, ge=1, le=10000)
 
 
 class ModeConfig(BaseModel):
@@ -415,6 +476,25 @@ class LLMConfig(BaseModel):
     max_concurrency: int = Field(default=1, ge=1)
 
 
+class StateConfig(BaseModel):
+    """State persistence backend configuration."""
+
+    backend: str = Field(
+        default="json",
+        pattern="^(json|journal|sqlite)$",
+        description=(
+            "State backend: json (rewrite file per update), journal (append-only WAL + snapshots), "
+            "or sqlite (WAL-mode database with indexed task queries)"
+        ),
+    )
+    journal_compact_threshold: int = Field(
+        default=500,
+        ge=10,
+        le=100000,
+        description="WAL records accumulated before the journal is compacted into a snapshot",
+    )
+
+
 class MahabharathaConfig(BaseModel):
     """Complete MAHABHARATHA configuration."""
 
@@ -451,6 +531,7 @@ class MahabharathaConfig(BaseModel):
     planning: PlanningConfig = Field(default_factory=PlanningConfig)
     kurukshetra: RushConfig = Field(default_factory=RushConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
+    state: StateConfig = Field(default_factory=StateConfig)
 
     @classmethod
     def load(cls, config_path: str | Path | None = None, force_reload: bool = False) -> "MahabharathaConfig":
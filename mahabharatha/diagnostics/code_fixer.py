@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import ast
 import re
 import subprocess
 from pathlib import Path
@@ -11,6 +10,7 @@ from typing import Any
 from mahabharatha.diagnostics.recovery import RecoveryStep
 from mahabharatha.diagnostics.types import ErrorCategory, ErrorFingerprint, Evidence
 from mahabharatha.fs_utils import collect_files
+from mahabharatha.parse_cache import get_parse_cache
 
 __all__ = [
     "CodeAwareFixer",
@@ -24,23 +24,23 @@ class DependencyAnalyzer:
     """Analyze Python file imports and dependency chains."""
 
     def analyze_imports(self, file_path: str) -> list[str]:
-        """Parse a Python file using ast and extract all import module names.
+        """Extract all import module names from a Python file's cached parse summary.
 
         Returns empty list on parse failure.
         """
         try:
-            source = Path(file_path).read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=file_path)
-        except (OSError, SyntaxError, ValueError):
+            summary = get_parse_cache().summary(file_path)
+        except OSError:
+            return []
+        if summary.error:
             return []
 
         modules: list[str] = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    modules.append(alias.name)
-            elif isinstance(node, ast.ImportFrom) and node.module:
-                modules.append(node.module)
+        for imp in summary.imports:
+            if not imp.is_from:
+                modules.extend(name for name, _ in imp.names)
+            elif imp.module:
+                modules.append(imp.module)
         return modules
 
     def find_missing_deps(self, error_text: str) -> list[str]:
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from mahabharatha.exceptions import StateError
 from mahabharatha.json_utils import loads as json_loads
 from mahabharatha.logging import get_logger
+from mahabharatha.state.backends import create_persistence, discover_state_features
+from mahabharatha.state.lock_profile import summarize_lock_profile
 
 logger = get_logger("diagnostics.state")
 
@@ -28,6 +32,8 @@ class MahabharathaHealthReport:
     current_level: int = 0
     is_paused: bool = False
     global_error: str | None = None
+    # State-lock wait/hold histograms per call site, most total wait first
+    lock_contention: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -43,6 +49,7 @@ class MahabharathaHealthReport:
             "current_level": self.current_level,
             "is_paused": self.is_paused,
             "global_error": self.global_error,
+            "lock_contention": self.lock_contention,
         }
 
 
@@ -58,40 +65,49 @@ class MahabharathaStateIntrospector:
         self.logs_dir = Path(logs_dir)
 
     def find_latest_feature(self) -> str | None:
-        """Find the most recently modified feature state file."""
-        if not self.state_dir.exists():
-            return None
+        """Find the feature whose state (under any backend) was modified most recently."""
+        features = discover_state_features(self.state_dir)
+        return features[0] if features else None
 
-        state_files = sorted(
-            self.state_dir.glob("*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
-        # Skip backup files
-        state_files = [f for f in state_files if not f.name.endswith(".bak")]
-        if not state_files:
+    def _load_state(self, feature: str) -> dict[str, Any] | None:
+        """Load a feature's state through its backend, or None if it has none.
+
+        Reading through the persistence layer sees journaled WAL records
+        and SQLite rows, not just the JSON snapshot.
+
+        Raises:
+            StateError: If the state exists but cannot be read.
+        """
+        if not self.state_dir.is_dir():
             return None
-        return state_files[0].stem
+        persistence = create_persistence(feature, self.state_dir)
+        try:
+            if not persistence.exists():
+                return None
+            return persistence.load()
+        except (OSError, sqlite3.Error) as e:
+            raise StateError(f"Failed to read state: {e}") from e
 
     def get_health_report(self, feature: str) -> MahabharathaHealthReport:
         """Generate a health report for a feature."""
-        state_file = self.state_dir / f"{feature}.json"
-        if not state_file.exists():
-            return MahabharathaHealthReport(
-                feature=feature,
-                state_exists=False,
-                total_tasks=0,
-            )
-
+        lock_contention = self.get_lock_contention(feature)
         try:
-            state = json_loads(state_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as e:
+            state = self._load_state(feature)
+        except StateError as e:
             logger.warning(f"Failed to read state file: {e}")
             return MahabharathaHealthReport(
                 feature=feature,
                 state_exists=True,
                 total_tasks=0,
                 global_error=f"Corrupt state file: {e}",
+                lock_contention=lock_contention,
+            )
+        if state is None:
+            return MahabharathaHealthReport(
+                feature=feature,
+                state_exists=False,
+                total_tasks=0,
+                lock_contention=lock_contention,
             )
 
         # Extract task summary
@@ -162,8 +178,17 @@ class MahabharathaStateIntrospector:
             current_level=current_level,
             is_paused=is_paused,
             global_error=global_error,
+            lock_contention=lock_contention,
         )
 
+    def get_lock_contention(self, feature: str) -> dict[str, dict[str, Any]]:
+        """Return merged state-lock contention stats per call site."""
+        try:
+            return summarize_lock_profile(self.state_dir, feature)
+        except OSError as e:
+            logger.warning(f"Failed to read lock profiles: {e}")
+            return {}
+
     def get_failed_task_details(self, feature: str) -> list[dict[str, Any]]:
         """Return detailed info for failed tasks."""
         report = self.get_health_report(feature)
@@ -191,16 +216,14 @@ class MahabharathaStateIntrospector:
         """Compare state tasks vs task-graph tasks, find orphans."""
         issues: list[str] = []
 
-        state_file = self.state_dir / f"{feature}.json"
-        if not state_file.exists():
-            issues.append(f"State file not found: {state_file}")
-            return issues
-
         try:
-            state = json_loads(state_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as e:
+            state = self._load_state(feature)
+        except StateError as e:
             issues.append(f"Cannot parse state file: {e}")
             return issues
+        if state is None:
+            issues.append(f"State file not found: {self.state_dir / feature}")
+            return issues
 
         state_tasks = set(state.get("tasks", {}).keys())
 
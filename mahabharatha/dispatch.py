@@ -0,0 +1,331 @@
+"""Event-driven task dispatch between the orchestrator and its workers.
+
+Without dispatch every idle worker polls the state backend on its own: reload
+state, list PENDING tasks, attempt ``claim_task`` on each, back off up to 10s.
+That turns every level transition into a thundering herd on the state lock
+followed by multi-second idle gaps.
+
+The orchestrator instead runs a DispatchServer: a queue of ready task IDs
+served over a Unix domain socket in the feature's state directory. Idle
+workers block on the socket via DispatchClient and are handed a task ID the
+moment the orchestrator publishes it. Handing out an ID is only a hint —
+workers still claim through ``StateManager.claim_task`` — so a lost or stale
+hint costs one failed claim, never a double execution. When the socket is
+unreachable (container runtime without socket passthrough, path too long,
+orchestrator restarting) workers fall back to the original polling loop.
+
+Wire protocol (one JSON object per line)::
+
+    worker -> server  {"worker_id": 2, "timeout": 10.0}
+    server -> worker  {"task_id": "TASK-003"}   or   {"task_id": null}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+from mahabharatha.constants import STATE_DIR
+from mahabharatha.logging import get_logger
+
+logger = get_logger("dispatch")
+
+DISPATCH_SOCKET_SUFFIX = ".dispatch.sock"
+DEFAULT_WAIT_TIMEOUT = 10.0
+
+
+def dispatch_socket_path(feature: str, state_dir: str | Path | None = None) -> Path:
+    """Return the dispatch socket path for a feature.
+
+    Derived from the state directory so workers (which already receive
+    ``MAHABHARATHA_STATE_DIR``, or see it through the container mount) need
+    no extra configuration.
+
+    Args:
+        feature: Feature name
+        state_dir: State directory (defaults to .mahabharatha/state)
+
+    Returns:
+        Path to the Unix domain socket
+    """
+    return Path(state_dir or STATE_DIR) / f"{feature}{DISPATCH_SOCKET_SUFFIX}"
+
+
+class DispatchQueue:
+    """Thread-safe FIFO of ready task IDs with optional worker affinity.
+
+    Entries carry the worker the task was assigned to (``None`` for any
+    worker), mirroring the ``worker_id`` that ``claim_task`` enforces, so a
+    worker is never handed a task it cannot claim.
+    """
+
+    def __init__(self) -> None:
+        self._entries: deque[tuple[str, int | None]] = deque()
+        self._queued: set[str] = set()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._entries)
+
+    def __contains__(self, task_id: object) -> bool:
+        with self._cond:
+            return task_id in self._queued
+
+    def put_many(self, tasks: Iterable[tuple[str, int | None]]) -> int:
+        """Enqueue tasks not already queued and wake waiting workers.
+
+        Args:
+            tasks: (task_id, assigned worker_id or None) pairs
+
+        Returns:
+            Number of newly queued tasks
+        """
+        added = 0
+        with self._cond:
+            for task_id, worker_id in tasks:
+                if task_id in self._queued:
+                    continue
+                self._entries.append((task_id, worker_id))
+                self._queued.add(task_id)
+                added += 1
+            if added:
+                self._cond.notify_all()
+        return added
+
+    def get(self, worker_id: int, timeout: float) -> str | None:
+        """Pop the oldest task this worker may claim, waiting up to ``timeout``.
+
+        Args:
+            worker_id: Requesting worker
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Task ID, or None on timeout or after close()
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._cond:
+            while not self._closed:
+                for entry in self._entries:
+                    if entry[1] is None or entry[1] == worker_id:
+                        self._entries.remove(entry)
+                        self._queued.discard(entry[0])
+                        return entry[0]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            return None
+
+    def retain(self, task_ids: set[str]) -> None:
+        """Drop queued tasks that are no longer ready (claimed, failed, level reset).
+
+        Args:
+            task_ids: Task IDs that may stay queued
+        """
+        with self._cond:
+            if self._queued <= task_ids:
+                return
+            self._entries = deque(e for e in self._entries if e[0] in task_ids)
+            self._queued &= task_ids
+
+    def close(self) -> None:
+        """Release all waiters with no task."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class _DispatchHandler(socketserver.StreamRequestHandler):
+    server: _DispatchSocketServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline() or b"{}")
+            worker_id = int(request["worker_id"])
+            timeout = min(float(request.get("timeout", DEFAULT_WAIT_TIMEOUT)), self.server.max_wait)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring malformed dispatch request: {e}")
+            return
+
+        task_id = self.server.queue.get(worker_id, timeout)
+        try:
+            self.wfile.write(json.dumps({"task_id": task_id}).encode() + b"\n")
+            self.wfile.flush()
+        except OSError:
+            # Worker gave up waiting; keep the task for the next idle worker
+            if task_id is not None:
+                self.server.queue.put_many([(task_id, None)])
+            return
+        if task_id is not None:
+            logger.debug(f"Dispatched {task_id} to worker {worker_id}")
+
+
+class _DispatchSocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, queue: DispatchQueue, max_wait: float) -> None:
+        self.queue = queue
+        self.max_wait = max_wait
+        super().__init__(path, _DispatchHandler)
+
+
+class DispatchServer:
+    """Orchestrator-side dispatch queue served over a Unix domain socket.
+
+    The orchestrator calls ``publish()`` whenever tasks become PENDING (level
+    start, crash reassignment, retry) and ``reconcile()`` from its main loop
+    so the queue converges on the PENDING set even if a hint is lost.
+    """
+
+    def __init__(
+        self,
+        feature: str,
+        state_dir: str | Path | None = None,
+        max_wait: float = 60.0,
+    ) -> None:
+        """Initialize dispatch server.
+
+        Args:
+            feature: Feature name (selects the socket path)
+            state_dir: State directory holding the socket
+            max_wait: Upper bound on how long a worker request may block
+        """
+        self.socket_path = dispatch_socket_path(feature, state_dir)
+        self.queue = DispatchQueue()
+        self._max_wait = max_wait
+        self._server: _DispatchSocketServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the socket is bound and serving."""
+        return self._server is not None
+
+    def start(self) -> bool:
+        """Bind the socket and start serving in a background thread.
+
+        Returns:
+            True if serving; False if Unix sockets are unavailable here
+        """
+        if self._server is not None:
+            return True
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        try:
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()  # Left behind by a crashed orchestrator
+            self._server = _DispatchSocketServer(str(self.socket_path), self.queue, self._max_wait)
+        except OSError as e:
+            logger.warning(f"Task dispatch socket unavailable, workers will poll: {e}")
+            self._server = None
+            return False
+
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.2},
+            name="mahabharatha-dispatch",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Task dispatch listening on {self.socket_path}")
+        return True
+
+    def stop(self) -> None:
+        """Stop serving, release blocked workers and remove the socket."""
+        self.queue.close()
+        self.queue = DispatchQueue()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+    def publish(self, tasks: Iterable[tuple[str, int | None]]) -> int:
+        """Queue ready tasks for idle workers.
+
+        Args:
+            tasks: (task_id, assigned worker_id or None) pairs
+
+        Returns:
+            Number of newly queued tasks
+        """
+        return self.queue.put_many(tasks)
+
+    def reconcile(self, pending: Iterable[tuple[str, int | None]]) -> int:
+        """Make the queue match the current PENDING set.
+
+        Args:
+            pending: All currently PENDING (task_id, worker_id) pairs
+
+        Returns:
+            Number of newly queued tasks
+        """
+        pending = list(pending)
+        self.queue.retain({task_id for task_id, _ in pending})
+        return self.queue.put_many(pending)
+
+
+class DispatchClient:
+    """Worker-side client that waits for the orchestrator to hand out a task."""
+
+    def __init__(self, socket_path: str | Path, worker_id: int) -> None:
+        """Initialize dispatch client.
+
+        Args:
+            socket_path: Path to the orchestrator's dispatch socket
+            worker_id: This worker's ID
+        """
+        self.socket_path = Path(socket_path)
+        self.worker_id = worker_id
+
+    async def next_task(self, timeout: float = DEFAULT_WAIT_TIMEOUT) -> str | None:
+        """Wait up to ``timeout`` seconds for a task ID.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Task ID hint, or None if nothing became ready in time
+
+        Raises:
+            OSError: If the dispatch socket is unreachable (caller should poll)
+        """
+        if not hasattr(socket, "AF_UNIX") or not os.path.exists(self.socket_path):
+            raise FileNotFoundError(f"No dispatch socket at {self.socket_path}")
+
+        reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
+        try:
+            request = {"worker_id": self.worker_id, "timeout": timeout}
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            try:
+                line = await asyncio.wait_for(reader.readline(), timeout + 1.0)
+            except TimeoutError:
+                return None
+            if not line:
+                raise ConnectionResetError("Dispatch server closed the connection")
+            try:
+                task_id = json.loads(line).get("task_id")
+            except ValueError as e:
+                raise ConnectionError(f"Malformed dispatch reply: {e}") from e
+            return str(task_id) if task_id is not None else None
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
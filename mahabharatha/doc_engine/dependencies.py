@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import ast
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from mahabharatha.fs_utils import collect_files
+from mahabharatha.parse_cache import get_parse_cache
 
 logger = logging.getLogger(__name__)
 
@@ -222,35 +222,32 @@ def _path_to_module(py_file: Path, root_dir: Path, package: str) -> str | None:
 
 
 def _extract_imports(py_file: Path, module_name: str, package: str) -> list[str]:
-    """Parse *py_file* with :mod:`ast` and return a list of imported module names.
+    """Return the module names imported by *py_file*, from its cached parse summary.
 
     Relative imports are resolved to absolute names using *module_name* as
     the context.
     """
     try:
-        source = py_file.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as exc:
+        summary = get_parse_cache().summary(py_file)
+    except OSError as exc:
         logger.warning("Cannot read %s: %s", py_file, exc)
         return []
 
-    try:
-        tree = ast.parse(source, filename=str(py_file))
-    except SyntaxError as exc:
-        logger.warning("Syntax error in %s: %s", py_file, exc)
+    if summary.error:
+        logger.warning("Syntax error in %s: %s", py_file, summary.error)
         return []
 
     imports: list[str] = []
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name)
+    for imp in summary.imports:
+        if not imp.is_from:
+            imports.extend(name for name, _ in imp.names)
 
-        elif isinstance(node, ast.ImportFrom):
-            if node.module is None and node.level == 0:
+        else:
+            if imp.module is None and imp.level == 0:
                 continue
 
-            resolved = _resolve_import(module_name, node.module, node.level, package)
+            resolved = _resolve_import(module_name, imp.module, imp.level, package)
             if resolved is not None:
                 imports.append(resolved)
 
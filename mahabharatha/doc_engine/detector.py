@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import ast
 import logging
 from enum import Enum
 from pathlib import Path
 
 from mahabharatha.fs_utils import _DEFAULT_EXCLUDES, collect_files
+from mahabharatha.parse_cache import get_parse_cache
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +38,6 @@ _CONFIG_STEMS = {"config", "configuration", "settings"}
 # Base names that signal a types/constants file
 _TYPES_STEMS = {"types", "constants", "enums"}
 
-# AST node types that dominate a "types" file
-_TYPE_DEF_NODES = (ast.ClassDef,)
-
 
 class ComponentDetector:
     """Detects the logical component type of project files."""
@@ -167,17 +164,14 @@ class ComponentDetector:
     def _ast_dominated_by_type_defs(path: Path) -> bool:
         """Return True if >50% of top-level statements are class defs (TypedDict, dataclass, Enum)."""
         try:
-            source = path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(path))
-        except (OSError, SyntaxError):
+            summary = get_parse_cache().summary(path)
+        except OSError:
             return False
-
-        top_level = [node for node in tree.body if not isinstance(node, ast.Import | ast.ImportFrom)]
-        if not top_level:
+        if summary.error or not summary.statements:
             return False
 
-        type_def_count = sum(1 for node in top_level if isinstance(node, _TYPE_DEF_NODES))
-        return type_def_count / len(top_level) > 0.5
+        type_def_count = sum(1 for d in summary.defs if d.kind == "class")
+        return type_def_count / summary.statements > 0.5
 
     @staticmethod
     def _is_api_file(path: Path) -> bool:
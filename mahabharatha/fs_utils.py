@@ -1,13 +1,25 @@
 """Single-pass filesystem traversal utilities for MAHABHARATHA.
 
 Provides a shared ``collect_files()`` function that walks a directory tree
-exactly once via ``rglob('*')`` and returns files grouped by extension.
-This replaces scattered per-module rglob calls (repo_map, stack_detector,
-etc.) with a single efficient traversal.
+exactly once and returns files grouped by extension.  This replaces
+scattered per-module rglob calls (repo_map, stack_detector, etc.) with a
+single efficient traversal.
+
+The walk uses :func:`os.scandir` and prunes excluded, hidden and
+git-ignored directories *before* descending into them, so trees such as
+``node_modules`` or ``.venv`` cost one directory entry instead of a full
+recursive listing.  Directory listings can optionally be cached keyed on
+the directory's mtime for callers that walk the same tree repeatedly
+(watch loops, incremental indexes).
 """
 
 from __future__ import annotations
 
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 _DEFAULT_EXCLUDES: set[str] = {
@@ -26,18 +38,39 @@ _DEFAULT_EXCLUDES: set[str] = {
     "egg-info",
 }
 
+# (name, is_dir, is_file) for every entry of a directory
+_Listing = tuple[tuple[str, bool, bool], ...]
+
+# (regex, negated, directory-only, anchored) for one .gitignore line
+_Rule = tuple[re.Pattern[str], bool, bool, bool]
+
+# (path prefix relative to the repository top, rules) for one .gitignore file
+_RuleSet = tuple[str, tuple[_Rule, ...]]
+
+_LISTING_CACHE_MAX = 16_384
+# Listings of directories modified this recently are not cached: filesystems
+# with coarse mtime granularity could hide a second change within the same tick
+_RACY_WINDOW_NS = 2_000_000_000
+
+_listing_cache: OrderedDict[str, tuple[int, _Listing]] = OrderedDict()
+_listing_lock = threading.Lock()
+
 
 def collect_files(
     root: Path,
     extensions: set[str] | None = None,
     exclude_dirs: set[str] = _DEFAULT_EXCLUDES,
     names: set[str] | None = None,
+    *,
+    respect_gitignore: bool = True,
+    cache_listings: bool = False,
 ) -> dict[str, list[Path]]:
-    """Single rglob('*') traversal, returns files grouped by extension.
+    """Single pruning traversal, returns files grouped by extension.
 
     Walks *root* exactly once and buckets every regular file by its
     lowercased suffix.  Directories whose name appears in *exclude_dirs*
-    (or starts with ``"."``) are skipped entirely.
+    (or starts with ``"."``) are never descended into.  Symlinked
+    directories are not followed; unreadable directories are skipped.
 
     Args:
         root: Root directory to traverse.
@@ -48,6 +81,12 @@ def collect_files(
         names: If provided, files whose name contains any of these
             strings are collected into a ``"_by_name"`` bucket regardless
             of extension (e.g. ``{"Dockerfile"}``).
+        respect_gitignore: Skip files and directories matched by
+            ``.gitignore`` files inside *root*, by those between *root*
+            and the top of its enclosing git repository, and by the
+            repository's ``.git/info/exclude``.
+        cache_listings: Reuse directory listings from earlier calls while
+            the directory's mtime is unchanged.
 
     Returns:
         Dict mapping extension (e.g. ``".py"``) to a **sorted** list of
@@ -58,40 +97,189 @@ def collect_files(
     if extensions is not None:
         extensions = {ext.lower() for ext in extensions}
 
-    grouped: dict[str, list[Path]] = {}
+    grouped: dict[str, list[str]] = {}
+
+    root_rel, inherited = _inherited_rules(root) if respect_gitignore else ("", ())
+    stack: list[tuple[str, str, tuple[_RuleSet, ...]]] = [(os.fspath(root), root_rel, inherited)]
+
+    while stack:
+        dirpath, rel, rules = stack.pop()
+        listing = _list_dir(dirpath, cache_listings)
+
+        if respect_gitignore and any(name == ".gitignore" and is_file for name, _, is_file in listing):
+            own = _read_rules(os.path.join(dirpath, ".gitignore"))
+            if own:
+                rules = (*rules, (rel, own))
+
+        for name, is_dir, is_file in listing:
+            if is_dir:
+                # Prune before descending
+                if name in exclude_dirs or name.startswith("."):
+                    continue
+                if rules and _is_ignored(rules, f"{rel}{name}", name, True):
+                    continue
+                stack.append((os.path.join(dirpath, name), f"{rel}{name}/", rules))
+                continue
+
+            if not is_file:
+                continue
+            if rules and _is_ignored(rules, f"{rel}{name}", name, False):
+                continue
+
+            # Name-based matching: collect into '_by_name' bucket
+            if names is not None and any(n in name for n in names):
+                grouped.setdefault("_by_name", []).append(os.path.join(dirpath, name))
+
+            # Same rule as Path.suffix: no suffix for ".hidden" or "trailing."
+            dot = name.rfind(".")
+            if not 0 < dot < len(name) - 1:
+                continue
+            suffix = name[dot:].lower()
+
+            if extensions is not None and suffix not in extensions:
+                continue
+
+            grouped.setdefault(suffix, []).append(os.path.join(dirpath, name))
+
+    # Sort each bucket for deterministic output
+    return {ext: sorted(Path(p) for p in paths) for ext, paths in grouped.items()}
+
+
+def clear_listing_cache() -> None:
+    """Drop all cached directory listings."""
+    with _listing_lock:
+        _listing_cache.clear()
 
-    for entry in root.rglob("*"):
-        # Only include regular files
-        if not entry.is_file():
-            continue
 
-        # Skip paths that traverse an excluded (or hidden) directory
+def _list_dir(dirpath: str, use_cache: bool) -> _Listing:
+    """List *dirpath*, optionally through the mtime-keyed listing cache."""
+    mtime_ns = 0
+    if use_cache:
         try:
-            rel_parts = entry.relative_to(root).parts
-        except ValueError:
-            continue
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return ()
+        with _listing_lock:
+            cached = _listing_cache.get(dirpath)
+            if cached is not None and cached[0] == mtime_ns:
+                _listing_cache.move_to_end(dirpath)
+                return cached[1]
 
-        if any(
-            part in exclude_dirs or part.startswith(".")
-            for part in rel_parts[:-1]  # check directory components only
-        ):
-            continue
+    try:
+        with os.scandir(dirpath) as it:
+            listing = tuple((e.name, e.is_dir(follow_symlinks=False), e.is_file()) for e in it)
+    except OSError:
+        return ()
 
-        # Name-based matching: collect into '_by_name' bucket
-        if names is not None and any(n in entry.name for n in names):
-            grouped.setdefault("_by_name", []).append(entry)
+    if use_cache and time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+        with _listing_lock:
+            _listing_cache[dirpath] = (mtime_ns, listing)
+            _listing_cache.move_to_end(dirpath)
+            while len(_listing_cache) > _LISTING_CACHE_MAX:
+                _listing_cache.popitem(last=False)
+    return listing
 
-        suffix = entry.suffix.lower()
-        if not suffix:
-            continue
 
-        if extensions is not None and suffix not in extensions:
+# ---------------------------------------------------------------------------
+# .gitignore matching
+# ---------------------------------------------------------------------------
+
+
+def _inherited_rules(root: Path) -> tuple[str, tuple[_RuleSet, ...]]:
+    """Rules that apply to *root* from its enclosing git repository.
+
+    Returns *root*'s path relative to the repository top (``"a/b/"``, or
+    ``""`` at the top or outside a repository) and the rule sets of
+    ``.git/info/exclude`` and of every ``.gitignore`` above *root*.
+    *root*'s own ``.gitignore`` is picked up by the walk itself.
+    """
+    try:
+        start = root.resolve()
+    except OSError:
+        return "", ()
+
+    top = next((p for p in (start, *start.parents) if (p / ".git").exists()), None)
+    if top is None:
+        return "", ()
+
+    parts = start.relative_to(top).parts
+    rule_sets: list[_RuleSet] = [("", _read_rules(str(top / ".git" / "info" / "exclude")))]
+    for depth in range(len(parts)):
+        prefix = "".join(f"{part}/" for part in parts[:depth])
+        rule_sets.append((prefix, _read_rules(str(top.joinpath(*parts[:depth], ".gitignore")))))
+    return "".join(f"{part}/" for part in parts), tuple(rs for rs in rule_sets if rs[1])
+
+
+def _read_rules(path: str) -> tuple[_Rule, ...]:
+    """Parse one ignore file into match rules; missing files yield none."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return ()
+
+    rules: list[_Rule] = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]  # "\#" and "\!" escape a literal leading character
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
             continue
+        anchored = "/" in line
+        rules.append((re.compile(_glob_to_regex(line.lstrip("/"))), negated, dir_only, anchored))
+    return tuple(rules)
 
-        grouped.setdefault(suffix, []).append(entry)
 
-    # Sort each bucket for deterministic output
-    for ext in grouped:
-        grouped[ext].sort()
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob into a regex (``*``, ``?``, ``[...]``, ``**``)."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")  # zero or more leading directories
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[" and (end := pattern.find("]", i + 2)) != -1:
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+            continue
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
 
-    return grouped
+def _is_ignored(rule_sets: tuple[_RuleSet, ...], rel: str, name: str, is_dir: bool) -> bool:
+    """Apply gitignore precedence: the last matching rule of the deepest file wins."""
+    ignored = False
+    for prefix, rules in rule_sets:
+        sub = rel[len(prefix) :]
+        for regex, negated, dir_only, anchored in rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(sub if anchored else name):
+                ignored = not negated
+    return ignored
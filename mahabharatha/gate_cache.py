@@ -0,0 +1,187 @@
+"""Content-addressed cache of quality-gate results.
+
+GatePipeline's per-level artifacts expire after a staleness timeout and are
+keyed by level number, so a retry, a re-merge or the next level re-runs the
+whole gate suite even when the code under test is byte-for-byte identical.
+
+GateResultCache keys each result on what actually determines it:
+
+* the git tree SHA of the checked-out commit (only when the working tree is
+  clean, ignoring MAHABHARATHA's own ``.mahabharatha/`` bookkeeping),
+* the gate command, and
+* a hash of the gate's configuration (timeout, coverage threshold, ...).
+
+Only passing results are cached, so a flaky failure is always re-run. The
+store is bounded: entries are touched on every hit and the least recently
+used ones are evicted once ``max_entries`` is exceeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from mahabharatha.constants import GateResult
+from mahabharatha.exceptions import GitError
+from mahabharatha.git.base import GitRunner
+from mahabharatha.logging import get_logger
+from mahabharatha.types import GateRunResult
+
+if TYPE_CHECKING:
+    from mahabharatha.config import MahabharathaConfig, QualityGate
+
+logger = get_logger("gate_cache")
+
+DEFAULT_MAX_ENTRIES = 256
+GATE_CACHE_DIRNAME = "gate-cache"
+
+
+def clean_tree_sha(cwd: str | Path | None = None) -> str | None:
+    """Return the tree SHA of HEAD if the working tree matches it.
+
+    Args:
+        cwd: Repository root (defaults to the current directory)
+
+    Returns:
+        Tree SHA, or None if not a git repository or there are uncommitted
+        changes outside ``.mahabharatha/``
+    """
+    try:
+        runner = GitRunner(cwd or Path.cwd())
+        status = runner._run("status", "--porcelain", "--", ".", ":(exclude).mahabharatha")
+        if status.stdout.strip():
+            return None
+        return runner.current_tree()
+    except (GitError, OSError) as e:
+        logger.debug(f"No cacheable tree for gate results: {e}")
+        return None
+
+
+class GateResultCache:
+    """LRU-bounded store of passing gate results keyed on tree + gate config."""
+
+    def __init__(self, cache_dir: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize gate result cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached result
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_entries = max(1, max_entries)
+
+    @classmethod
+    def from_config(cls, config: MahabharathaConfig) -> GateResultCache | None:
+        """Build the cache configured under ``verification``, or None if disabled."""
+        verification = getattr(config, "verification", None)
+        if verification is None or not verification.gate_cache_enabled:
+            return None
+        return cls(
+            Path(verification.artifact_dir) / GATE_CACHE_DIRNAME,
+            max_entries=verification.gate_cache_max_entries,
+        )
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding cached results."""
+        return self._cache_dir
+
+    @staticmethod
+    def key(tree_sha: str, gate: QualityGate) -> str:
+        """Compute the content address for a gate run against a tree.
+
+        Args:
+            tree_sha: Git tree SHA the gate runs against
+            gate: Gate configuration
+
+        Returns:
+            Hex digest identifying the result
+        """
+        config_hash = hashlib.sha256(json.dumps(gate.model_dump(), sort_keys=True, default=str).encode()).hexdigest()
+        material = "\0".join((tree_sha, gate.command, config_hash))
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def get(self, tree_sha: str, gate: QualityGate) -> GateRunResult | None:
+        """Look up a cached result and mark it as recently used.
+
+        Args:
+            tree_sha: Git tree SHA the gate would run against
+            gate: Gate configuration
+
+        Returns:
+            Cached GateRunResult, or None on a miss
+        """
+        path = self._path(self.key(tree_sha, gate))
+        try:
+            with open(path) as f:
+                data: dict[str, Any] = json.load(f)
+            os.utime(path)  # LRU: mtime tracks last use
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Discarding unreadable gate cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        logger.info(f"Gate '{gate.name}' result reused for tree {tree_sha[:12]}")
+        return GateRunResult(
+            gate_name=gate.name,
+            result=GateResult.PASS,
+            command=gate.command,
+            exit_code=data.get("exit_code", 0),
+            stdout=data.get("stdout", ""),
+            stderr=data.get("stderr", ""),
+            duration_ms=data.get("duration_ms", 0),
+        )
+
+    def put(self, tree_sha: str, gate: QualityGate, result: GateRunResult) -> None:
+        """Store a passing result and evict least recently used entries.
+
+        Non-passing results are ignored so failures are always re-run.
+
+        Args:
+            tree_sha: Git tree SHA the gate ran against
+            gate: Gate configuration
+            result: Result of the gate run
+        """
+        if result.result != GateResult.PASS:
+            return
+        data = {
+            "gate_name": gate.name,
+            "tree": tree_sha,
+            "command": gate.command,
+            "exit_code": result.exit_code,
+            "duration_ms": result.duration_ms,
+            "stdout": result.stdout[:500],
+            "stderr": result.stderr[:500],
+        }
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._path(self.key(tree_sha, gate)))
+        except OSError as e:
+            logger.warning(f"Failed to cache result for gate '{gate.name}': {e}")
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        try:
+            entries = [(p.stat().st_mtime_ns, p) for p in self._cache_dir.glob("*.json")]
+        except OSError:
+            return
+        excess = len(entries) - self._max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+        logger.debug(f"Evicted {excess} gate cache entr{'y' if excess == 1 else 'ies'}")
@@ -1,7 +1,10 @@
 """Quality gate execution for MAHABHARATHA."""
 
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Any
 
 from mahabharatha.command_executor import CommandExecutor, CommandValidationError
 from mahabharatha.config import MahabharathaConfig, QualityGate
@@ -9,11 +12,50 @@ from mahabharatha.constants import GateResult
 from mahabharatha.exceptions import GateFailureError, GateTimeoutError
 from mahabharatha.logging import get_logger
 from mahabharatha.plugins import GateContext, PluginRegistry
+from mahabharatha.tracing import CAT_GATE, traced
 from mahabharatha.types import GateRunResult
 
 logger = get_logger("gates")
 
 
+def _gate_span_attrs(runner: "GateRunner", gate: QualityGate, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    return {"gate": gate.name}
+
+
+_PASSING = (GateResult.PASS, GateResult.SKIP)
+
+
+def order_gates(gates: list[QualityGate]) -> list[QualityGate]:
+    """Order gates so every gate follows the gates it depends on.
+
+    Dependencies on gates outside ``gates`` (e.g. filtered out by
+    ``required_only``) are ignored. Ties keep configuration order.
+
+    Args:
+        gates: Gates to order
+
+    Returns:
+        Gates in a dependency-respecting order
+
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    names = {g.name for g in gates}
+    remaining = list(gates)
+    done: set[str] = set()
+    ordered: list[QualityGate] = []
+    while remaining:
+        ready = [g for g in remaining if all(d in done for d in g.depends_on if d in names)]
+        if not ready:
+            cycle = ", ".join(g.name for g in remaining)
+            raise ValueError(f"Quality gate dependency cycle among: {cycle}")
+        for gate in ready:
+            remaining.remove(gate)
+            done.add(gate.name)
+            ordered.append(gate)
+    return ordered
+
+
 class GateRunner:
     """Execute quality gates and capture results."""
 
@@ -40,11 +82,13 @@ class GateRunner:
             timeout=timeout,
         )
 
+    @traced(CAT_GATE, "run_gate", attrs=_gate_span_attrs)
     def run_gate(
         self,
         gate: QualityGate,
         cwd: str | Path | None = None,
         env: dict[str, str] | None = None,
+        cancel_event: threading.Event | None = None,
     ) -> GateRunResult:
         """Run a single quality gate.
 
@@ -52,6 +96,7 @@ class GateRunner:
             gate: Gate configuration
             cwd: Working directory
             env: Environment variables
+            cancel_event: Event that terminates the gate command when set
 
         Returns:
             GateRunResult with execution details
@@ -65,17 +110,23 @@ class GateRunner:
         try:
             # Use secure command executor - no shell=True
             executor = self._get_executor(cwd_path, timeout=gate.timeout)
-            result = executor.execute(
-                gate.command,
-                timeout=gate.timeout,
-                env=env,
-            )
+            if cancel_event is not None:
+                result = executor.execute(gate.command, timeout=gate.timeout, env=env, cancel_event=cancel_event)
+            else:
+                result = executor.execute(
+                    gate.command,
+                    timeout=gate.timeout,
+                    env=env,
+                )
 
             duration_ms = int((time.time() - start_time) * 1000)
 
             if result.success:
                 gate_result = GateResult.PASS
                 logger.info(f"Gate {gate.name} passed ({duration_ms}ms)")
+            elif cancel_event is not None and cancel_event.is_set():
+                gate_result = GateResult.SKIP
+                logger.info(f"Gate {gate.name} cancelled after a required gate failed")
             elif "timed out" in result.stderr.lower():
                 # CommandExecutor returns timeout info in stderr
                 gate_result = GateResult.TIMEOUT
@@ -134,6 +185,8 @@ class GateRunner:
     ) -> tuple[bool, list[GateRunResult]]:
         """Run all quality gates.
 
+        Configured gates run through ``run_gates``; plugin gates follow.
+
         Args:
             gates: List of gates to run (uses config gates if not provided)
             cwd: Working directory
@@ -155,21 +208,7 @@ class GateRunner:
             logger.info("No gates to run")
             return True, []
 
-        results = []
-        all_passed = True
-
-        for gate in gates:
-            result = self.run_gate(gate, cwd=cwd)
-            results.append(result)
-
-            if result.result not in (GateResult.PASS, GateResult.SKIP):
-                if gate.required:
-                    all_passed = False
-                    if stop_on_failure:
-                        logger.error(f"Stopping: required gate {gate.name} failed")
-                        break
-                else:
-                    logger.warning(f"Optional gate {gate.name} failed (continuing)")
+        all_passed, results = self.run_gates(gates, cwd=cwd, stop_on_failure=stop_on_failure)
 
         # Run plugin gates if registry is available
         if self._plugin_registry:
@@ -196,6 +235,159 @@ class GateRunner:
 
         return all_passed, results
 
+    def run_gates(
+        self,
+        gates: list[QualityGate],
+        cwd: str | Path | None = None,
+        stop_on_failure: bool = True,
+        prior: dict[str, GateRunResult] | None = None,
+    ) -> tuple[bool, list[GateRunResult]]:
+        """Run configured gates (not plugin gates) in dependency order.
+
+        Gates run one at a time unless ``verification.max_parallel_gates`` is
+        above 1, in which case independent gates run concurrently (see
+        ``_run_gates_parallel``). In both modes a gate whose dependency did
+        not pass is reported as an ERROR without running.
+
+        Args:
+            gates: Gates to run
+            cwd: Working directory
+            stop_on_failure: Stop on the first required gate failure
+            prior: Results already known for gates not in *gates* (e.g.
+                cached); dependencies on them are honoured but they are not
+                re-run or returned
+
+        Returns:
+            Tuple of (all_passed, results in configuration order)
+        """
+        max_parallel = self._max_parallel_gates()
+        if max_parallel > 1 and len(gates) > 1:
+            return self._run_gates_parallel(gates, cwd, stop_on_failure, max_parallel, prior)
+        return self._run_gates_sequential(gates, cwd, stop_on_failure, prior)
+
+    def _run_gates_sequential(
+        self,
+        gates: list[QualityGate],
+        cwd: str | Path | None,
+        stop_on_failure: bool,
+        prior: dict[str, GateRunResult] | None = None,
+    ) -> tuple[bool, list[GateRunResult]]:
+        """Run gates one at a time in dependency order.
+
+        Returns:
+            Tuple of (all_passed, results in execution order)
+        """
+        finished = dict(prior or {})
+        results: list[GateRunResult] = []
+        all_passed = True
+        for gate in order_gates(gates):
+            blocked = [d for d in gate.depends_on if d in finished and finished[d].result not in _PASSING]
+            result = self._not_run(gate, blocked) if blocked else self.run_gate(gate, cwd=cwd)
+            finished[gate.name] = result
+            results.append(result)
+
+            if result.result not in _PASSING:
+                if gate.required:
+                    all_passed = False
+                    if stop_on_failure:
+                        logger.error(f"Stopping: required gate {gate.name} failed")
+                        break
+                else:
+                    logger.warning(f"Optional gate {gate.name} failed (continuing)")
+        return all_passed, results
+
+    def _not_run(self, gate: QualityGate, blocked: list[str]) -> GateRunResult:
+        """ERROR result for a gate skipped because its dependencies did not pass."""
+        result = GateRunResult(
+            gate_name=gate.name,
+            result=GateResult.ERROR,
+            command=gate.command,
+            exit_code=-1,
+            stderr=f"Not run: dependency {', '.join(blocked)} did not pass",
+        )
+        self._results.append(result)
+        return result
+
+    def _max_parallel_gates(self) -> int:
+        value = getattr(getattr(self.config, "verification", None), "max_parallel_gates", 1)
+        return value if isinstance(value, int) else 1
+
+    def _run_gates_parallel(
+        self,
+        gates: list[QualityGate],
+        cwd: str | Path | None,
+        stop_on_failure: bool,
+        max_parallel: int,
+        prior: dict[str, GateRunResult] | None = None,
+    ) -> tuple[bool, list[GateRunResult]]:
+        """Run gates as a dependency DAG on a bounded thread pool.
+
+        A gate starts once every gate it ``depends_on`` has finished and no
+        other gate in its ``resource_group`` is running. A gate whose
+        dependency did not pass is reported as an ERROR without running. When
+        a required gate fails and ``stop_on_failure`` is set, running gates are
+        terminated (reported as SKIP) and unstarted gates are dropped, matching
+        the sequential mode's early exit.
+
+        Returns:
+            Tuple of (all_passed, results in configuration order)
+        """
+        names = {g.name for g in gates}
+        pending = order_gates(gates)
+        position = {g.name: i for i, g in enumerate(gates)}
+        finished: dict[str, GateRunResult] = dict(prior or {})
+        running: dict[Future[GateRunResult], QualityGate] = {}
+        busy_groups: set[str] = set()
+        cancel = threading.Event()
+        all_passed = True
+
+        def record(gate: QualityGate, result: GateRunResult) -> None:
+            nonlocal all_passed
+            finished[gate.name] = result
+            if result.result in _PASSING:
+                return
+            if not gate.required:
+                logger.warning(f"Optional gate {gate.name} failed (continuing)")
+                return
+            all_passed = False
+            if stop_on_failure and not cancel.is_set():
+                logger.error(f"Stopping: required gate {gate.name} failed, cancelling running gates")
+                cancel.set()
+
+        logger.info(f"Running {len(gates)} gates with up to {max_parallel} in parallel")
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="mahabharatha-gate") as pool:
+            while pending or running:
+                if cancel.is_set():
+                    pending.clear()
+                for gate in list(pending):
+                    if len(running) >= max_parallel:
+                        break
+                    deps = [d for d in gate.depends_on if d in names or d in finished]
+                    if any(d not in finished for d in deps):
+                        continue
+                    if gate.resource_group and gate.resource_group in busy_groups:
+                        continue
+                    pending.remove(gate)
+                    blocked = [d for d in deps if finished[d].result not in _PASSING]
+                    if blocked:
+                        record(gate, self._not_run(gate, blocked))
+                        continue
+                    if gate.resource_group:
+                        busy_groups.add(gate.resource_group)
+                    running[pool.submit(self.run_gate, gate, cwd=cwd, cancel_event=cancel)] = gate
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    gate = running.pop(future)
+                    if gate.resource_group:
+                        busy_groups.discard(gate.resource_group)
+                    record(gate, future.result())
+
+        results = sorted((r for name, r in finished.items() if name in names), key=lambda r: position[r.gate_name])
+        return all_passed, results
+
     def run_plugin_gates(self, ctx: GateContext) -> list[GateRunResult]:
         """Run all registered plugin gates.
 
@@ -105,6 +105,15 @@ class GitRunner:
         result = self._run("rev-parse", "HEAD")
         return result.stdout.strip()
 
+    def current_tree(self) -> str:
+        """Get the tree SHA of the current commit.
+
+        Returns:
+            Full 40-character tree SHA
+        """
+        result = self._run("rev-parse", "HEAD^{tree}")
+        return result.stdout.strip()
+
     def has_changes(self) -> bool:
         """Check if there are uncommitted changes.
 
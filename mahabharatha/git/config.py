@@ -43,6 +43,12 @@ class GitRescueConfig(BaseModel):
     max_snapshots: int = Field(default=20, ge=1, le=100)
 
 
+class GitMergeConfig(BaseModel):
+    """Configuration for merging worker branches into the staging branch."""
+
+    strategy: str = Field(default="in_memory", pattern="^(in_memory|sequential)$")
+
+
 class GitReviewConfig(BaseModel):
     """Configuration for code review analysis."""
 
@@ -56,6 +62,7 @@ class GitConfig(BaseModel):
     commit: GitCommitConfig = Field(default_factory=GitCommitConfig)
     pr: GitPRConfig = Field(default_factory=GitPRConfig)
     release: GitReleaseConfig = Field(default_factory=GitReleaseConfig)
+    merge: GitMergeConfig = Field(default_factory=GitMergeConfig)
     rescue: GitRescueConfig = Field(default_factory=GitRescueConfig)
     review: GitReviewConfig = Field(default_factory=GitReviewConfig)
     context_mode: str = Field(default="auto", pattern="^(solo|team|akshauhini|auto)$")
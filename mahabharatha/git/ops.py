@@ -20,6 +20,19 @@ class BranchInfo:
     upstream: str | None = None
 
 
+@dataclass
+class TreeMerge:
+    """Outcome of an in-memory merge computed by ``git merge-tree``."""
+
+    tree: str
+    conflicting_files: list[str]
+
+    @property
+    def clean(self) -> bool:
+        """Whether the merge produced no conflicts."""
+        return not self.conflicting_files
+
+
 class GitOps(GitRunner):
     """Git operations for branch management, merging, and rebasing.
 
@@ -183,6 +196,67 @@ class GitOps(GitRunner):
         logger.info(f"Merged {branch} into {self.current_branch()}: {commit_sha[:8]}")
         return commit_sha
 
+    def merge_tree(self, ours: str, theirs: str) -> TreeMerge | None:
+        """Merge two commits without touching the index or working tree.
+
+        Uses ``git merge-tree --write-tree`` (git >= 2.38), which runs the same
+        ort merge as ``git merge`` and writes the resulting tree to the object
+        store.
+
+        Args:
+            ours: Commit to merge into
+            theirs: Commit or branch to merge
+
+        Returns:
+            TreeMerge, or None if this git does not support ``--write-tree``
+
+        Raises:
+            GitError: If the merge could not be computed (e.g. unknown ref)
+        """
+        result = self._run("merge-tree", "--write-tree", "--name-only", "--no-messages", ours, theirs, check=False)
+        if result.returncode == 129:  # Usage error: --write-tree unsupported
+            return None
+        if result.returncode not in (0, 1):
+            raise GitError(
+                f"Git command failed: {result.stderr.strip()}",
+                command=f"git merge-tree --write-tree {ours} {theirs}",
+                exit_code=result.returncode,
+            )
+        lines = result.stdout.split("\n")
+        conflicts = [line for line in lines[1:] if line.strip()] if result.returncode == 1 else []
+        return TreeMerge(tree=lines[0].strip(), conflicting_files=conflicts)
+
+    def commit_tree(self, tree: str, parents: list[str], message: str) -> str:
+        """Create a commit object for a tree without moving any ref.
+
+        Args:
+            tree: Tree SHA
+            parents: Parent commits, first parent first
+            message: Commit message
+
+        Returns:
+            New commit SHA
+        """
+        args = ["commit-tree", tree]
+        for parent in parents:
+            args.extend(["-p", parent])
+        args.extend(["-m", message])
+        return self._run(*args).stdout.strip()
+
+    def update_branch(self, branch: str, commit: str, expected: str | None = None) -> None:
+        """Point a branch at a commit.
+
+        Args:
+            branch: Branch name
+            commit: New commit SHA
+            expected: Refuse the update unless the branch is currently here
+        """
+        args = ["update-ref", "-m", "mahabharatha: in-memory merge", f"refs/heads/{branch}", commit]
+        if expected:
+            args.append(expected)
+        self._run(*args)
+        logger.info(f"Updated {branch} to {commit[:8]}")
+
     def abort_merge(self) -> None:
         """Abort an in-progress merge."""
         self._run("merge", "--abort", check=False)
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from mahabharatha.constants import STATE_DIR
+from mahabharatha.heartbeat_table import HeartbeatTable, shared_table
 from mahabharatha.logging import get_logger
 
 if TYPE_CHECKING:
@@ -98,14 +99,43 @@ class Heartbeat:
         except (ValueError, TypeError):
             return True
 
+    def sent_at(self) -> float:
+        """Heartbeat time as epoch seconds (0.0 if the timestamp is unreadable)."""
+        try:
+            ts = datetime.fromisoformat(self.timestamp)
+        except (ValueError, TypeError):
+            return 0.0
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=UTC)
+        return ts.timestamp()
+
+
+def _newer(a: Heartbeat | None, b: Heartbeat | None) -> Heartbeat | None:
+    """The more recent of two heartbeats for the same worker."""
+    if a is None or b is None:
+        return a or b
+    return a if a.sent_at() >= b.sent_at() else b
+
 
 class HeartbeatWriter:
-    """Worker-side heartbeat writer. Writes periodic heartbeat JSON files."""
+    """Worker-side heartbeat writer.
+
+    Writes periodic heartbeat JSON files, or into the shared heartbeat table
+    when the launcher provides one (see mahabharatha.heartbeat_table).
+    """
 
-    def __init__(self, worker_id: int, state_dir: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        worker_id: int,
+        state_dir: str | Path | None = None,
+        table: HeartbeatTable | None = None,
+    ) -> None:
         self._worker_id = worker_id
         self._state_dir = Path(state_dir) if state_dir else Path(STATE_DIR)
         self._state_dir.mkdir(parents=True, exist_ok=True)
+        self._table = table if table is not None else HeartbeatTable.from_env()
+        if self._table is not None and not self._table.has_slot(worker_id):
+            self._table = None
 
     @property
     def heartbeat_path(self) -> Path:
@@ -123,7 +153,7 @@ class HeartbeatWriter:
         total_steps: int | None = None,
         step_states: list[str] | None = None,
     ) -> Heartbeat:
-        """Write a heartbeat file atomically (temp+rename).
+        """Write a heartbeat to the shared table, or to a file atomically (temp+rename).
 
         Args:
             task_id: Current task ID being executed.
@@ -146,6 +176,10 @@ class HeartbeatWriter:
             step_states=step_states,
         )
 
+        if self._table is not None:
+            self._table.write_heartbeat(heartbeat)
+            return heartbeat
+
         target = self.heartbeat_path
         try:
             fd, tmp_path = tempfile.mkstemp(dir=str(self._state_dir), suffix=".tmp")
@@ -161,7 +195,9 @@ class HeartbeatWriter:
         return heartbeat
 
     def cleanup(self) -> None:
-        """Remove heartbeat file on clean shutdown."""
+        """Remove heartbeat file (or clear the table slot) on clean shutdown."""
+        if self._table is not None:
+            self._table.clear_heartbeat(self._worker_id)
         try:
             self.heartbeat_path.unlink(missing_ok=True)
         except OSError:
@@ -222,35 +258,38 @@ class HeartbeatMonitor:
         )
 
     def read(self, worker_id: int) -> Heartbeat | None:
-        """Read heartbeat file for a given worker."""
-        path = self._state_dir / f"heartbeat-{worker_id}.json"
-        if not path.exists():
-            return None
-        try:
-            data = json.loads(path.read_text())
-            return Heartbeat.from_dict(data)
-        except (json.JSONDecodeError, KeyError, OSError):
-            logger.debug(
-                "Failed to read heartbeat for worker %d",
-                worker_id,
-                exc_info=True,
-            )
-            return None
+        """Read a worker's heartbeat from the shared table or its file, whichever is newer."""
+        table = shared_table(self._state_dir)
+        from_table = table.read_heartbeat(worker_id) if table is not None and table.has_slot(worker_id) else None
+        return _newer(from_table, self._read_file(self._state_dir / f"heartbeat-{worker_id}.json"))
 
     def read_all(self) -> dict[int, Heartbeat]:
-        """Read all heartbeat files in the state directory."""
-        result: dict[int, Heartbeat] = {}
+        """Read all heartbeats from the shared table and the heartbeat files.
+
+        A worker may have both, e.g. a stale slot from an earlier subprocess
+        run and the file of a container worker with the same ID; the newer
+        heartbeat wins. Workers without a slot only have files.
+        """
+        table = shared_table(self._state_dir)
+        result = table.read_all_heartbeats() if table is not None else {}
         if not self._state_dir.exists():
             return result
         for path in self._state_dir.glob("heartbeat-*.json"):
-            try:
-                data = json.loads(path.read_text())
-                hb = Heartbeat.from_dict(data)
-                result[hb.worker_id] = hb
-            except (json.JSONDecodeError, KeyError, OSError):
-                continue
+            hb = self._read_file(path)
+            if hb is not None:
+                result[hb.worker_id] = _newer(result.get(hb.worker_id), hb) or hb
         return result
 
+    @staticmethod
+    def _read_file(path: Path) -> Heartbeat | None:
+        try:
+            return Heartbeat.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, OSError):
+            logger.debug("Failed to read heartbeat %s", path, exc_info=True)
+            return None
+
     def check_stale(self, worker_id: int, timeout_seconds: int | None = None) -> bool:
         """Return True if worker's heartbeat is stale or missing.
 
@@ -0,0 +1,375 @@
+"""Memory-mapped heartbeat and progress table for same-host workers.
+
+Without the table every worker rewrites ``heartbeat-{id}.json`` and
+``progress-{id}.json`` through a temp file and ``os.replace``, and every
+orchestrator poll globs the state directory and parses each file. Subprocess
+workers share the orchestrator's filesystem, so they can instead write into
+one fixed-layout file (``heartbeat.table`` in the state directory) that all
+parties ``mmap``. Readers then scan it with no file syscalls and no JSON.
+
+The subprocess launcher opts workers in by setting ``MAHABHARATHA_HEARTBEAT_TABLE``
+to the table path. Container workers never get it and keep writing JSON files;
+``HeartbeatMonitor`` and ``ProgressReporter`` read both the table and the
+files and keep the newer record per worker (heartbeats by their timestamp,
+progress by the slot's write time against the file's mtime), so a stale slot
+cannot hide a file and workers without a slot are still seen.
+
+Layout (little-endian)::
+
+    header   magic "MHBT", version, slot count, slot size
+    slot[i]  heartbeat section | progress section     (slot i = worker i)
+
+Each section starts with its own sequence counter (a seqlock): the writer
+makes it odd, writes the payload, then makes it even again. A reader copies
+the section and retries if the counter was odd or changed meanwhile, so a
+torn write is never returned. Heartbeat and progress sections are separate
+because they have separate writers. Workers whose ID has no slot fall back
+to the JSON files.
+
+String fields are fixed-width UTF-8: task IDs 64 bytes, step and persona
+names 32, the activity narrative 256, the progress ``current_step`` 32 and
+tier names 29. Longer values are cut on a character boundary and a warning
+is logged the first time each field is truncated.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mahabharatha.constants import STATE_DIR
+from mahabharatha.logging import get_logger
+
+if TYPE_CHECKING:
+    from mahabharatha.heartbeat import Heartbeat
+    from mahabharatha.progress_reporter import WorkerProgress
+
+logger = get_logger("heartbeat")
+
+HEARTBEAT_TABLE_ENV = "MAHABHARATHA_HEARTBEAT_TABLE"
+HEARTBEAT_TABLE_NAME = "heartbeat.table"
+DEFAULT_SLOTS = 64
+
+_MAGIC = b"MHBT"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHHI")
+_HEADER_SIZE = 64
+_SEQ = struct.Struct("<I")
+_READ_ATTEMPTS = 100
+
+# Heartbeat section: seq, present, progress_pct, n_states, current_step,
+# total_steps, timestamp, task_id, step, persona_name, activity_narrative,
+# step_states (one code byte per step)
+_HB = struct.Struct("<IBBBxhhd64s32s32s256s64s")
+# Progress section: seq, present, n_tiers, has_task, tasks_completed,
+# tasks_total, written_at (epoch seconds), current_task, current_step, then
+# _MAX_TIERS tier records
+_PROGRESS = struct.Struct("<IBBBxIId64s32s")
+_TIER = struct.Struct("<BBB29s")
+_MAX_TIERS = 16
+_MAX_STEP_STATES = 64
+_PROGRESS_SIZE = _PROGRESS.size + _TIER.size * _MAX_TIERS
+_SLOT_SIZE = _HB.size + _PROGRESS_SIZE
+
+_STEP_STATE_CODES = {"completed": 1, "in_progress": 2, "pending": 3, "failed": 4}
+_STEP_STATE_NAMES = {code: name for name, code in _STEP_STATE_CODES.items()}
+_NO_STATES = 0xFF
+
+
+def heartbeat_table_path(state_dir: str | Path | None = None) -> Path:
+    """Return the heartbeat table path for a state directory."""
+    return Path(state_dir or STATE_DIR) / HEARTBEAT_TABLE_NAME
+
+
+_truncated_fields: set[str] = set()  # Fields already warned about in this process
+
+
+def _encode(value: str | None, width: int, field: str) -> bytes:
+    raw = (value or "").encode()
+    if len(raw) <= width:
+        return raw
+    if field not in _truncated_fields:
+        _truncated_fields.add(field)
+        logger.warning("Heartbeat table truncates %s to %d bytes: %r", field, width, value)
+    # Truncate on a character boundary so the field always decodes
+    return raw[:width].decode(errors="ignore").encode()
+
+
+def _decode(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode(errors="replace")
+
+
+class HeartbeatTable:
+    """Fixed-slot heartbeat/progress table in a memory-mapped file."""
+
+    def __init__(self, path: str | Path, *, create: bool = False, slots: int = DEFAULT_SLOTS) -> None:
+        """Open (and optionally create) a table.
+
+        Creation is safe to race: every creator sizes the file identically
+        and writes the same header bytes if the magic is not there yet.
+
+        Args:
+            path: Table file
+            create: Create the file if missing (writers); readers open existing tables only
+            slots: Slot count for a newly created table
+
+        Raises:
+            OSError: If the file is missing (and create is False) or not a valid table
+        """
+        self.path = Path(path)
+        flags = os.O_RDWR | (os.O_CREAT if create else 0)
+        fd = os.open(self.path, flags, 0o644)
+        try:
+            size = _HEADER_SIZE + slots * _SLOT_SIZE
+            if create:
+                if os.fstat(fd).st_size < size:
+                    os.ftruncate(fd, size)
+                if os.pread(fd, len(_MAGIC), 0) != _MAGIC:
+                    os.pwrite(fd, _HEADER.pack(_MAGIC, _VERSION, slots, _SLOT_SIZE), 0)
+            if os.fstat(fd).st_size < _HEADER_SIZE:
+                raise OSError(f"heartbeat table {self.path} is truncated")
+            self._mm = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        magic, version, slots, slot_size = _HEADER.unpack_from(self._mm, 0)
+        self.slots: int = slots
+        if (magic, version, slot_size) != (_MAGIC, _VERSION, _SLOT_SIZE) or len(self._mm) < (
+            _HEADER_SIZE + self.slots * _SLOT_SIZE
+        ):
+            self._mm.close()
+            raise OSError(f"{self.path} is not a version {_VERSION} heartbeat table")
+
+    @classmethod
+    def open_existing(cls, state_dir: str | Path | None = None) -> HeartbeatTable | None:
+        """Open the state directory's table if a worker has created one."""
+        try:
+            return cls(heartbeat_table_path(state_dir))
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def from_env(cls) -> HeartbeatTable | None:
+        """Open or create the table named by ``MAHABHARATHA_HEARTBEAT_TABLE`` (worker side)."""
+        path = os.environ.get(HEARTBEAT_TABLE_ENV)
+        if not path:
+            return None
+        try:
+            return cls(path, create=True)
+        except (OSError, ValueError):
+            logger.debug("Heartbeat table %s unavailable, using files", path, exc_info=True)
+            return None
+
+    def has_slot(self, worker_id: int) -> bool:
+        """Return True if the worker has a slot in this table."""
+        return 0 <= worker_id < self.slots
+
+    def close(self) -> None:
+        """Unmap the table."""
+        self._mm.close()
+
+    # -- seqlock primitives -------------------------------------------------
+
+    def _offset(self, worker_id: int, progress: bool) -> int:
+        return _HEADER_SIZE + worker_id * _SLOT_SIZE + (_HB.size if progress else 0)
+
+    def _write_section(self, offset: int, payload: bytes) -> None:
+        (seq,) = _SEQ.unpack_from(self._mm, offset)
+        seq |= 1  # Recover from a writer that died mid-update
+        _SEQ.pack_into(self._mm, offset, seq)
+        self._mm[offset + _SEQ.size : offset + len(payload)] = payload[_SEQ.size :]
+        _SEQ.pack_into(self._mm, offset, (seq + 1) & 0xFFFFFFFF)
+
+    def _read_section(self, offset: int, size: int) -> bytes | None:
+        for _ in range(_READ_ATTEMPTS):
+            (before,) = _SEQ.unpack_from(self._mm, offset)
+            if before & 1:
+                time.sleep(0)
+                continue
+            data = self._mm[offset : offset + size]
+            (after,) = _SEQ.unpack_from(self._mm, offset)
+            if before == after:
+                return data
+        return None
+
+    # -- heartbeats ---------------------------------------------------------
+
+    def write_heartbeat(self, heartbeat: Heartbeat) -> None:
+        """Store a heartbeat in its worker's slot (long strings are truncated, see module docs)."""
+        states = heartbeat.step_states
+        ts = datetime.fromisoformat(heartbeat.timestamp)
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=UTC)
+        payload = _HB.pack(
+            0,
+            1,
+            heartbeat.progress_pct,
+            _NO_STATES if states is None else min(len(states), _MAX_STEP_STATES),
+            -1 if heartbeat.current_step is None else heartbeat.current_step,
+            -1 if heartbeat.total_steps is None else heartbeat.total_steps,
+            ts.timestamp(),
+            _encode(heartbeat.task_id, 64, "task_id"),
+            _encode(heartbeat.step, 32, "step"),
+            _encode(heartbeat.persona_name, 32, "persona_name"),
+            _encode(heartbeat.activity_narrative, 256, "activity_narrative"),
+            bytes(_STEP_STATE_CODES.get(s, 0) for s in (states or [])[:_MAX_STEP_STATES]),
+        )
+        self._write_section(self._offset(heartbeat.worker_id, progress=False), payload)
+
+    def read_heartbeat(self, worker_id: int) -> Heartbeat | None:
+        """Return the worker's heartbeat, or None if its slot is empty."""
+        from mahabharatha.heartbeat import Heartbeat
+
+        data = self._read_section(self._offset(worker_id, progress=False), _HB.size)
+        if data is None:
+            return None
+        (_, present, pct, n_states, cur, total, ts, task_id, step, persona, narrative, codes) = _HB.unpack(data)
+        if not present:
+            return None
+        return Heartbeat(
+            worker_id=worker_id,
+            timestamp=datetime.fromtimestamp(ts, UTC).isoformat(),
+            task_id=_decode(task_id) or None,
+            step=_decode(step),
+            progress_pct=pct,
+            activity_narrative=_decode(narrative) or None,
+            persona_name=_decode(persona) or None,
+            current_step=None if cur < 0 else cur,
+            total_steps=None if total < 0 else total,
+            step_states=None
+            if n_states == _NO_STATES
+            else [_STEP_STATE_NAMES.get(c, "pending") for c in codes[:n_states]],
+        )
+
+    def read_all_heartbeats(self) -> dict[int, Heartbeat]:
+        """Return every populated heartbeat slot."""
+        result = {}
+        for wid in range(self.slots):
+            hb = self.read_heartbeat(wid)
+            if hb is not None:
+                result[wid] = hb
+        return result
+
+    def clear_heartbeat(self, worker_id: int) -> None:
+        """Mark the worker's heartbeat slot empty."""
+        self._write_section(self._offset(worker_id, progress=False), bytes(_HB.size))
+
+    # -- progress -----------------------------------------------------------
+
+    def write_progress(self, progress: WorkerProgress) -> None:
+        """Store a worker's progress in its slot (at most 16 tier results, long strings truncated)."""
+        tiers = progress.tier_results[-_MAX_TIERS:]
+        payload = bytearray(_PROGRESS_SIZE)
+        _PROGRESS.pack_into(
+            payload,
+            0,
+            0,
+            1,
+            len(tiers),
+            progress.current_task is not None,
+            progress.tasks_completed,
+            progress.tasks_total,
+            time.time(),
+            _encode(progress.current_task, 64, "current_task"),
+            _encode(progress.current_step, 32, "current_step"),
+        )
+        for i, t in enumerate(tiers):
+            _TIER.pack_into(
+                payload,
+                _PROGRESS.size + i * _TIER.size,
+                t.tier & 0xFF,
+                t.success,
+                min(t.retry, 0xFF),
+                _encode(t.name, 29, "tier name"),
+            )
+        self._write_section(self._offset(progress.worker_id, progress=True), bytes(payload))
+
+    def read_progress(self, worker_id: int) -> WorkerProgress | None:
+        """Return the worker's progress, or None if its slot is empty."""
+        stamped = self.read_progress_stamped(worker_id)
+        return stamped[0] if stamped is not None else None
+
+    def read_progress_stamped(self, worker_id: int) -> tuple[WorkerProgress, float] | None:
+        """Return the worker's progress and its write time (epoch seconds), or None if empty."""
+        from mahabharatha.progress_reporter import TierProgress, WorkerProgress
+
+        data = self._read_section(self._offset(worker_id, progress=True), _PROGRESS_SIZE)
+        if data is None:
+            return None
+        (_, present, n_tiers, has_task, completed, total, written_at, task, step) = _PROGRESS.unpack_from(data)
+        if not present:
+            return None
+        tiers = []
+        for i in range(n_tiers):
+            tier, success, retry, name = _TIER.unpack_from(data, _PROGRESS.size + i * _TIER.size)
+            tiers.append(TierProgress(tier=tier, name=_decode(name), success=bool(success), retry=retry))
+        progress = WorkerProgress(
+            worker_id=worker_id,
+            tasks_completed=completed,
+            tasks_total=total,
+            current_task=_decode(task) if has_task else None,
+            current_step=_decode(step),
+            tier_results=tiers,
+        )
+        return progress, written_at
+
+    def read_all_progress(self) -> dict[int, WorkerProgress]:
+        """Return every populated progress slot."""
+        return {wid: wp for wid, (wp, _) in self.read_all_progress_stamped().items()}
+
+    def read_all_progress_stamped(self) -> dict[int, tuple[WorkerProgress, float]]:
+        """Return every populated progress slot with its write time (epoch seconds)."""
+        result = {}
+        for wid in range(self.slots):
+            stamped = self.read_progress_stamped(wid)
+            if stamped is not None:
+                result[wid] = stamped
+        return result
+
+    def clear_progress(self, worker_id: int) -> None:
+        """Mark the worker's progress slot empty."""
+        self._write_section(self._offset(worker_id, progress=True), bytes(_PROGRESS_SIZE))
+
+
+_shared: dict[Path, HeartbeatTable] = {}
+
+
+def shared_table(state_dir: str | Path | None = None) -> HeartbeatTable | None:
+    """Return a process-wide mapping of the state directory's table (reader side).
+
+    Successful opens are cached so per-poll readers map the table once; while
+    no table exists each call costs one failed ``open``.
+    """
+    path = heartbeat_table_path(state_dir)
+    table = _shared.get(path)
+    if table is None:
+        table = HeartbeatTable.open_existing(state_dir)
+        if table is not None:
+            _shared[path] = table
+    return table
+
+
+def reset_worker_slot(worker_id: int, state_dir: str | Path | None = None) -> None:
+    """Clear a worker's slots before (re)spawning it.
+
+    Slots outlive their workers when a worker crashes, so a new worker with
+    the same ID (or a container worker reporting through files) would
+    otherwise be judged by a previous run's heartbeat.
+
+    Args:
+        worker_id: Worker about to be spawned
+        state_dir: State directory (defaults to .mahabharatha/state)
+    """
+    table = HeartbeatTable.open_existing(state_dir)
+    if table is None:
+        return
+    try:
+        if table.has_slot(worker_id):
+            table.clear_heartbeat(worker_id)
+            table.clear_progress(worker_id)
+    finally:
+        table.close()
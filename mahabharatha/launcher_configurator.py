@@ -96,6 +96,8 @@ class LauncherConfigurator:
                 image_name=self._get_worker_image_name(),
                 memory_limit=self._config.resources.container_memory_limit,
                 cpu_limit=self._config.resources.container_cpu_limit,
+                watch_events=self._config.resources.container_event_watch,
+                warm_pool_size=self._config.resources.container_warm_pool,
             )
             # Ensure network exists
             network_ok = launcher.ensure_network()
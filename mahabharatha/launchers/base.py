@@ -131,6 +131,13 @@ class WorkerLauncher(ABC):
             results[worker_id] = self.terminate(worker_id, force=force)
         return results
 
+    def close(self) -> None:
+        """Release launcher-wide resources once no more workers will be spawned.
+
+        No-op by default; launchers holding background processes or idle
+        containers override this.
+        """
+
     def get_status_summary(self) -> dict[str, Any]:
         """Get summary of all worker statuses.
 
@@ -21,8 +21,16 @@ from mahabharatha.env_validator import (
     CONTAINER_HOME_DIR,
     validate_env_vars,
 )
+from mahabharatha.heartbeat_table import reset_worker_slot
 from mahabharatha.launcher_types import LauncherConfig, SpawnResult, WorkerHandle
 from mahabharatha.launchers.base import WorkerLauncher
+from mahabharatha.launchers.container_pool import (
+    POOL_GIT_DIR,
+    POOL_STATE_DIR,
+    POOL_WORKTREE_ROOT,
+    WarmContainerPool,
+)
+from mahabharatha.launchers.container_watcher import WORKER_LABEL, ContainerState, ContainerWatcher
 from mahabharatha.logging import get_logger
 
 logger = get_logger("launcher")
@@ -42,6 +50,11 @@ class ContainerLauncher(WorkerLauncher):
     WORKER_ENTRY_SCRIPT = ".mahabharatha/worker_entry.sh"
     # Performance: Skip docker calls if status was checked recently (FR-1)
     MONITOR_COOLDOWN_SECONDS = 10
+    # Docker-run liveness probe on the entry script's marker file; the first
+    # check runs after the same 60s grace period the exec probe used
+    HEALTH_INTERVAL = "10s"
+    HEALTH_START_PERIOD = "60s"
+    LIVENESS_GRACE_SECONDS = 60
 
     def __init__(
         self,
@@ -50,6 +63,8 @@ class ContainerLauncher(WorkerLauncher):
         network: str | None = None,
         memory_limit: str = "4g",
         cpu_limit: float = 2.0,
+        watch_events: bool = False,
+        warm_pool_size: int = 0,
     ) -> None:
         """Initialize container launcher.
 
@@ -59,6 +74,10 @@ class ContainerLauncher(WorkerLauncher):
             network: Docker network name (default: mahabharatha-internal)
             memory_limit: Docker --memory limit (e.g., '4g', '512m')
             cpu_limit: Docker --cpus limit (e.g., 2.0)
+            watch_events: Track container status with one docker events
+                stream and batched inspects instead of per-worker polling
+            warm_pool_size: Idle pre-started containers kept for fast spawns
+                (0 disables the pool)
         """
         super().__init__(config)
         self.image_name = image_name
@@ -66,6 +85,14 @@ class ContainerLauncher(WorkerLauncher):
         self.memory_limit = memory_limit
         self.cpu_limit = cpu_limit
         self._container_ids: dict[int, str] = {}
+        self._watcher: ContainerWatcher | None = (
+            ContainerWatcher(refresh_interval=self.MONITOR_COOLDOWN_SECONDS) if watch_events else None
+        )
+        self._pool: WarmContainerPool | None = (
+            WarmContainerPool(warm_pool_size, self._build_warm_container_cmd, self.CONTAINER_PREFIX)
+            if warm_pool_size > 0
+            else None
+        )
 
     def spawn(
         self,
@@ -93,6 +120,8 @@ class ContainerLauncher(WorkerLauncher):
                 raise ValueError(f"Invalid worker_id: {worker_id}")
 
             container_name = f"{self.CONTAINER_PREFIX}-{int(worker_id)}"
+            # Container workers report through files; drop any slot left by a subprocess run
+            reset_worker_slot(worker_id, self._state_dir(worktree_path))
 
             # Remove any existing container with the same name
             subprocess.run(
@@ -136,12 +165,14 @@ class ContainerLauncher(WorkerLauncher):
                 validated = validate_env_vars(env)
                 container_env.update(validated)
 
-            # Start container
-            container_id = self._start_container(
-                container_name=container_name,
-                worktree_path=worktree_path,
-                env=container_env,
-            )
+            # Start container (a warm pool container skips the cold start)
+            container_id = self._start_from_pool(container_name, worktree_path, container_env)
+            if container_id is None:
+                container_id = self._start_container(
+                    container_name=container_name,
+                    worktree_path=worktree_path,
+                    env=container_env,
+                )
 
             if not container_id:
                 return SpawnResult(
@@ -160,6 +191,8 @@ class ContainerLauncher(WorkerLauncher):
             # Store references
             self._workers[worker_id] = handle
             self._container_ids[worker_id] = container_id
+            if self._watcher is not None:
+                self._watcher.track(container_id)
 
             # Wait for container ready
             if not self._wait_ready(container_id, timeout=30):
@@ -182,6 +215,8 @@ class ContainerLauncher(WorkerLauncher):
 
             handle.status = WorkerStatus.RUNNING
             logger.info(f"Spawned container {container_name} ({container_id[:12]})")
+            if self._pool is not None:
+                self._pool.fill(worktree_path.parent)
 
             return SpawnResult(success=True, worker_id=worker_id, handle=handle)
 
@@ -189,6 +224,11 @@ class ContainerLauncher(WorkerLauncher):
             logger.exception(f"Failed to spawn container for worker {worker_id}")
             return SpawnResult(success=False, worker_id=worker_id, error=str(e))
 
+    @staticmethod
+    def _state_dir(worktree_path: Path) -> Path:
+        """The main repo's state directory for a worker worktree (.mahabharatha-worktrees/feature/worker-N)."""
+        return worktree_path.parent.parent.parent / ".mahabharatha" / "state"
+
     def _build_container_cmd(
         self,
         container_name: str,
@@ -210,7 +250,7 @@ class ContainerLauncher(WorkerLauncher):
         """
         # Mount worktree as workspace and share state directory from main repo
         main_repo = worktree_path.parent.parent.parent  # .mahabharatha-worktrees/feature/worker-N -> repo
-        state_dir = main_repo / ".mahabharatha" / "state"
+        state_dir = self._state_dir(worktree_path)
 
         # Git worktrees need access to:
         # 1. The worktree metadata in main repo's .git/worktrees/<name>
@@ -219,23 +259,13 @@ class ContainerLauncher(WorkerLauncher):
         main_git_dir = main_repo / ".git"
         git_worktree_dir = main_git_dir / "worktrees" / worktree_name
 
-        # Mount ~/.claude for OAuth credentials if it exists
-        claude_config_dir = Path.home() / ".claude"
-
-        # Get current user's UID/GID to run container as non-root
-        # This is required because --dangerously-skip-permissions doesn't work as root
-        uid = os.getuid()
-        gid = os.getgid()
-        home_dir = CONTAINER_HOME_DIR
-
         cmd = [
             "docker",
             "run",
             "-d",
             "--name",
             container_name,
-            "--user",
-            f"{uid}:{gid}",
+            *self._identity_args(env.get("MAHABHARATHA_WORKER_ID", container_name)),
             "-v",
             f"{worktree_path.absolute()}:/workspace",
             "-v",
@@ -253,32 +283,8 @@ class ContainerLauncher(WorkerLauncher):
             env["MAHABHARATHA_GIT_WORKTREE_DIR"] = "/workspace/.git-worktree"
             env["MAHABHARATHA_GIT_MAIN_DIR"] = "/repo/.git"
 
-        # Add Claude config mount for OAuth authentication (needs write for debug logs)
-        if claude_config_dir.exists():
-            cmd.extend(["-v", f"{claude_config_dir.absolute()}:{home_dir}/.claude"])
-            cmd.extend(["-e", f"HOME={home_dir}"])
-
-        # Mount ~/.claude.json for OAuth token (separate file from ~/.claude/ directory)
-        claude_config_file = Path.home() / ".claude.json"
-        if claude_config_file.exists():
-            cmd.extend(["-v", f"{claude_config_file.absolute()}:{home_dir}/.claude.json"])
-
-        # Resource limits
-        cmd.extend(["--memory", self.memory_limit])
-        cmd.extend(["--cpus", str(self.cpu_limit)])
-
-        # GPU Passthrough for local LLMs (Ollama)
-        if hasattr(self.config, "gpu_enabled") and self.config.gpu_enabled:
-            cmd.extend(["--gpus", "all"])
-
-        cmd.extend(
-            [
-                "-w",
-                "/workspace",
-                "--network",
-                self.network,
-            ]
-        )
+        cmd.extend(self._runtime_args())
+        cmd.extend(["-w", "/workspace"])
 
         # Add environment variables
         for key, value in env.items():
@@ -299,6 +305,153 @@ class ContainerLauncher(WorkerLauncher):
 
         return cmd
 
+    def _build_warm_container_cmd(self, container_name: str, worktree_root: Path) -> list[str]:
+        """Build the docker run command for an idle warm pool container.
+
+        Args:
+            container_name: Name for the container
+            worktree_root: Host directory holding the feature's worker worktrees
+
+        Returns:
+            Complete docker run command as list of strings
+        """
+        main_repo = worktree_root.parent.parent  # .mahabharatha-worktrees/feature -> repo
+        state_dir = main_repo / ".mahabharatha" / "state"
+        main_git_dir = main_repo / ".git"
+
+        cmd = [
+            "docker",
+            "run",
+            "-d",
+            "--name",
+            container_name,
+            *self._identity_args("warm"),
+            "-v",
+            f"{worktree_root.absolute()}:{POOL_WORKTREE_ROOT}",
+            "-v",
+            f"{state_dir.absolute()}:{POOL_STATE_DIR}",
+        ]
+        if main_git_dir.exists():
+            cmd.extend(["-v", f"{main_git_dir.absolute()}:{POOL_GIT_DIR}"])
+        cmd.extend(self._runtime_args())
+        cmd.extend(["-w", POOL_WORKTREE_ROOT, self.image_name, "sleep", "infinity"])
+        return cmd
+
+    def _start_from_pool(self, container_name: str, worktree_path: Path, env: dict[str, str]) -> str | None:
+        """Start the worker in a warm pool container.
+
+        Args:
+            container_name: Name the container takes over
+            worktree_path: Host path of the worker's worktree
+            env: Worker environment (paths relative to /workspace are remapped)
+
+        Returns:
+            Container ID, or None if no warm container could be used
+        """
+        if self._pool is None:
+            return None
+        container_id = self._pool.acquire(worktree_path.parent)
+        if container_id is None:
+            return None
+
+        workdir = f"{POOL_WORKTREE_ROOT}/{worktree_path.name}"
+        exec_env = {
+            key: workdir + value[len("/workspace") :]
+            if value == "/workspace" or value.startswith("/workspace/")
+            else value
+            for key, value in env.items()
+        }
+        exec_env["MAHABHARATHA_STATE_DIR"] = POOL_STATE_DIR
+        main_git_dir = worktree_path.parent.parent.parent / ".git"
+        if (main_git_dir / "worktrees" / worktree_path.name).exists():
+            exec_env["MAHABHARATHA_GIT_WORKTREE_DIR"] = f"{POOL_GIT_DIR}/worktrees/{worktree_path.name}"
+            exec_env["MAHABHARATHA_GIT_MAIN_DIR"] = POOL_GIT_DIR
+
+        exec_cmd = ["docker", "exec", "-d", "-w", workdir]  # noqa: S607 — docker subcommand, not shell exec
+        for key, value in exec_env.items():
+            exec_cmd.extend(["-e", f"{key}={value}"])
+        # Send worker output to the container log, like a cold-started worker
+        exec_cmd.extend([container_id, "bash", "-c", f"bash {workdir}/{self.WORKER_ENTRY_SCRIPT} >/proc/1/fd/1 2>&1"])
+
+        try:
+            for cmd in (["docker", "rename", container_id, container_name], exec_cmd):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                if result.returncode != 0:
+                    raise RuntimeError(result.stderr.strip())
+        except (subprocess.SubprocessError, OSError, RuntimeError) as e:
+            logger.warning(f"Warm container {container_id[:12]} unusable, cold starting: {e}")
+            subprocess.run(["docker", "rm", "-f", container_id], capture_output=True, timeout=10)
+            return None
+
+        logger.info(f"Started {container_name} from warm pool ({container_id[:12]})")
+        return container_id
+
+    def close(self) -> None:
+        """Remove idle warm pool containers and stop following docker events."""
+        if self._pool is not None:
+            self._pool.drain()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def _identity_args(self, label: str) -> list[str]:
+        """Build the user, label and liveness healthcheck arguments for docker run.
+
+        Args:
+            label: Value of the worker label (worker ID, or "warm" for pool containers)
+
+        Returns:
+            docker run arguments
+        """
+        # Get current user's UID/GID to run container as non-root
+        # This is required because --dangerously-skip-permissions doesn't work as root
+        uid = os.getuid()
+        gid = os.getgid()
+        return [
+            "--user",
+            f"{uid}:{gid}",
+            "--label",
+            f"{WORKER_LABEL}={label}",
+            "--health-cmd",
+            f"test -f {CONTAINER_HEALTH_FILE}",
+            "--health-interval",
+            self.HEALTH_INTERVAL,
+            "--health-start-period",
+            self.HEALTH_START_PERIOD,
+            "--health-retries",
+            "1",
+        ]
+
+    def _runtime_args(self) -> list[str]:
+        """Build credential mounts, resource limits and network arguments for docker run.
+
+        Returns:
+            docker run arguments
+        """
+        home_dir = CONTAINER_HOME_DIR
+        args: list[str] = []
+
+        # Add Claude config mount for OAuth authentication (needs write for debug logs)
+        claude_config_dir = Path.home() / ".claude"
+        if claude_config_dir.exists():
+            args.extend(["-v", f"{claude_config_dir.absolute()}:{home_dir}/.claude"])
+            args.extend(["-e", f"HOME={home_dir}"])
+
+        # Mount ~/.claude.json for OAuth token (separate file from ~/.claude/ directory)
+        claude_config_file = Path.home() / ".claude.json"
+        if claude_config_file.exists():
+            args.extend(["-v", f"{claude_config_file.absolute()}:{home_dir}/.claude.json"])
+
+        # Resource limits
+        args.extend(["--memory", self.memory_limit])
+        args.extend(["--cpus", str(self.cpu_limit)])
+
+        # GPU Passthrough for local LLMs (Ollama)
+        if hasattr(self.config, "gpu_enabled") and self.config.gpu_enabled:
+            args.extend(["--gpus", "all"])
+
+        args.extend(["--network", self.network])
+        return args
+
     async def _start_container_impl(
         self,
         container_name: str,
@@ -487,6 +640,8 @@ class ContainerLauncher(WorkerLauncher):
             logger.warning(f"Failed to clean up container: {e}")
 
         # Remove from tracking
+        if self._watcher is not None:
+            self._watcher.untrack(container_id)
         if worker_id in self._container_ids:
             del self._container_ids[worker_id]
         if worker_id in self._workers:
@@ -507,6 +662,10 @@ class ContainerLauncher(WorkerLauncher):
         if not handle or not container_id:
             return WorkerStatus.STOPPED
 
+        if self._watcher is not None:
+            self._watcher.refresh()
+            return self._status_from_state(worker_id, handle, self._watcher.get(container_id))
+
         # FR-1: Check cooldown - skip docker calls if checked recently
         # This reduces docker subprocess overhead from 120+/min to ~20-30/min
         if handle.health_check_at:
@@ -553,18 +712,7 @@ class ContainerLauncher(WorkerLauncher):
                 return handle.status
             else:
                 # Container has exited
-                handle.exit_code = int(exit_code_str)
-
-                if exit_code_str == "0":
-                    handle.status = WorkerStatus.STOPPED
-                elif exit_code_str == "2":
-                    handle.status = WorkerStatus.CHECKPOINTING
-                elif exit_code_str == "3":
-                    handle.status = WorkerStatus.BLOCKED
-                else:
-                    handle.status = WorkerStatus.CRASHED
-
-                return handle.status
+                return self._exited_status(handle, int(exit_code_str))
 
         except (subprocess.SubprocessError, OSError, ValueError) as e:
             logger.error(f"Failed to monitor container: {e}")
@@ -574,6 +722,52 @@ class ContainerLauncher(WorkerLauncher):
             if handle:
                 handle.health_check_at = datetime.now()
 
+    def _status_from_state(self, worker_id: int, handle: WorkerHandle, state: ContainerState | None) -> WorkerStatus:
+        """Map the watcher's view of a container onto the worker handle.
+
+        Args:
+            worker_id: Worker being monitored
+            handle: Worker handle to update
+            state: Watcher state for the worker's container
+
+        Returns:
+            Current worker status
+        """
+        if state is None or state.removed:
+            handle.status = WorkerStatus.STOPPED
+        elif not state.running:
+            self._exited_status(handle, state.exit_code if state.exit_code is not None else 1)
+        elif state.health == "unhealthy" and self._past_liveness_grace(handle):
+            # Container stays up (CMD sleeps) after the worker exits; the
+            # healthcheck fails once the entry script removes its marker file
+            if handle.status != WorkerStatus.STOPPED:
+                logger.info(f"Worker {worker_id} process exited (marker file absent)")
+            handle.status = WorkerStatus.STOPPED
+        elif handle.status == WorkerStatus.INITIALIZING:
+            handle.status = WorkerStatus.RUNNING
+        handle.health_check_at = datetime.now()
+        return handle.status
+
+    def _past_liveness_grace(self, handle: WorkerHandle) -> bool:
+        """Whether the worker has had time to create its liveness marker."""
+        return (datetime.now() - handle.started_at).total_seconds() > self.LIVENESS_GRACE_SECONDS
+
+    @staticmethod
+    def _exited_status(handle: WorkerHandle, exit_code: int) -> WorkerStatus:
+        """Record a container exit code and derive the worker status."""
+        handle.exit_code = exit_code
+
+        if exit_code == 0:
+            handle.status = WorkerStatus.STOPPED
+        elif exit_code == 2:
+            handle.status = WorkerStatus.CHECKPOINTING
+        elif exit_code == 3:
+            handle.status = WorkerStatus.BLOCKED
+        else:
+            handle.status = WorkerStatus.CRASHED
+
+        return handle.status
+
     async def _terminate_impl(
         self,
         worker_id: int,
@@ -633,6 +827,8 @@ class ContainerLauncher(WorkerLauncher):
 
         finally:
             # Clean up references
+            if self._watcher is not None:
+                self._watcher.untrack(container_id)
             if worker_id in self._container_ids:
                 del self._container_ids[worker_id]
             # Also remove from worker handles to prevent stale state
@@ -780,6 +976,8 @@ class ContainerLauncher(WorkerLauncher):
                 raise ValueError(f"Invalid worker_id: {worker_id}")
 
             container_name = f"{self.CONTAINER_PREFIX}-{int(worker_id)}"
+            # Container workers report through files; drop any slot left by a subprocess run
+            reset_worker_slot(worker_id, self._state_dir(worktree_path))
 
             # Remove any existing container with the same name
             proc = await asyncio.create_subprocess_exec(
@@ -828,12 +1026,18 @@ class ContainerLauncher(WorkerLauncher):
                 validated = validate_env_vars(env)
                 container_env.update(validated)
 
-            # Start container asynchronously
-            container_id = await self._start_container_async(
-                container_name=container_name,
-                worktree_path=worktree_path,
-                env=container_env,
-            )
+            # Start container asynchronously (a warm pool container skips the cold start)
+            container_id = None
+            if self._pool is not None:
+                container_id = await asyncio.to_thread(
+                    self._start_from_pool, container_name, worktree_path, container_env
+                )
+            if container_id is None:
+                container_id = await self._start_container_async(
+                    container_name=container_name,
+                    worktree_path=worktree_path,
+                    env=container_env,
+                )
 
             if not container_id:
                 return SpawnResult(
@@ -852,6 +1056,8 @@ class ContainerLauncher(WorkerLauncher):
             # Store references
             self._workers[worker_id] = handle
             self._container_ids[worker_id] = container_id
+            if self._watcher is not None:
+                self._watcher.track(container_id)
 
             # Wait for container ready (fall back to sync for complex checks)
             ready = await asyncio.to_thread(self._wait_ready, container_id, 30)
@@ -875,6 +1081,8 @@ class ContainerLauncher(WorkerLauncher):
 
             handle.status = WorkerStatus.RUNNING
             logger.info(f"Spawned async container {container_name} ({container_id[:12]})")
+            if self._pool is not None:
+                self._pool.fill(worktree_path.parent)
 
             return SpawnResult(success=True, worker_id=worker_id, handle=handle)
 
@@ -0,0 +1,147 @@
+"""WarmContainerPool — idle, already-started worker containers.
+
+A cold ``ContainerLauncher.spawn`` removes the old container, runs a new one
+and polls until it is up, which dominates respawn latency between levels.
+The pool keeps up to ``size`` containers running ``sleep infinity`` with the
+image, network, limits and credentials already in place. A spawn takes one,
+renames it to the worker's container name and starts the entry script with
+``docker exec``; a background thread then tops the pool back up.
+
+Worktrees are deleted and re-created on every respawn, so a pool container
+cannot bind-mount a single worktree. It mounts only paths that outlive a
+level instead:
+
+* ``.mahabharatha-worktrees/<feature>`` at ``/worktrees`` (the worker runs in
+  ``/worktrees/worker-N``),
+* the main repository's ``.git`` at ``/repo/.git``, and
+* ``.mahabharatha/state`` at ``/mahabharatha-state``, passed to the worker as
+  ``MAHABHARATHA_STATE_DIR``.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+from mahabharatha.logging import get_logger
+
+logger = get_logger("launcher")
+
+POOL_WORKTREE_ROOT = "/worktrees"
+POOL_STATE_DIR = "/mahabharatha-state"
+POOL_GIT_DIR = "/repo/.git"
+
+
+class WarmContainerPool:
+    """Keep a bounded number of idle worker containers running."""
+
+    def __init__(self, size: int, build_cmd: Callable[[str, Path], list[str]], prefix: str) -> None:
+        """Initialize warm pool.
+
+        Args:
+            size: Number of idle containers to keep
+            build_cmd: Builds the docker run command for (container_name, worktree_root)
+            prefix: Container name prefix
+        """
+        self.size = size
+        self._build_cmd = build_cmd
+        self._prefix = prefix
+        self._idle: list[str] = []
+        self._root: Path | None = None
+        self._lock = threading.Lock()
+        self._filler: threading.Thread | None = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def acquire(self, worktree_root: Path) -> str | None:
+        """Take an idle container prepared for ``worktree_root``.
+
+        Args:
+            worktree_root: Directory holding the feature's worker worktrees
+
+        Returns:
+            Container ID, or None if the pool is empty or was built for
+            another worktree root
+        """
+        with self._lock:
+            if self._root != worktree_root.absolute() or not self._idle:
+                return None
+            return self._idle.pop(0)
+
+    def fill(self, worktree_root: Path) -> None:
+        """Top the pool up to ``size`` in a background thread.
+
+        Switching to a different worktree root drains the old containers.
+
+        Args:
+            worktree_root: Directory holding the feature's worker worktrees
+        """
+        root = worktree_root.absolute()
+        with self._lock:
+            if self._closed:
+                return
+            stale = self._idle if self._root not in (None, root) else []
+            if stale:
+                self._idle = []
+            self._root = root
+            if self._filler is not None and self._filler.is_alive():
+                return
+            self._filler = threading.Thread(target=self._fill, name="mahabharatha-warm-pool", daemon=True)
+            self._filler.start()
+        self._remove(stale)
+
+    def drain(self) -> None:
+        """Remove all idle containers and stop refilling."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            filler = self._filler
+        if filler is not None:
+            filler.join(timeout=60)
+        with self._lock:
+            idle.extend(self._idle)  # Started while we were waiting
+            self._idle = []
+        self._remove(idle)
+
+    def _fill(self) -> None:
+        while True:
+            with self._lock:
+                root = self._root
+                if self._closed or root is None or len(self._idle) >= self.size:
+                    return
+            name = f"{self._prefix}-warm-{uuid.uuid4().hex[:8]}"
+            try:
+                result = subprocess.run(
+                    self._build_cmd(name, root),
+                    capture_output=True,
+                    text=True,
+                    timeout=120,
+                )
+            except (subprocess.SubprocessError, OSError) as e:
+                logger.warning(f"Failed to start warm container: {e}")
+                return
+            if result.returncode != 0:
+                logger.warning(f"Failed to start warm container: {result.stderr.strip()}")
+                return
+            container_id = result.stdout.strip()
+            with self._lock:
+                if self._root == root and not self._closed:
+                    self._idle.append(container_id)
+                    logger.debug(f"Warm container {container_id[:12]} ready ({len(self._idle)}/{self.size})")
+                    continue
+            self._remove([container_id])  # Root changed or pool drained meanwhile
+
+    @staticmethod
+    def _remove(container_ids: list[str]) -> None:
+        if not container_ids:
+            return
+        try:
+            subprocess.run(["docker", "rm", "-f", *container_ids], capture_output=True, timeout=30)
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning(f"Failed to remove warm containers: {e}")
@@ -0,0 +1,248 @@
+"""ContainerWatcher — shared status table for worker containers.
+
+Polling each worker with its own ``docker inspect`` (plus a ``docker exec``
+liveness probe) costs one or two docker subprocesses per worker per poll.
+ContainerWatcher replaces that with:
+
+* one long-lived ``docker events`` subprocess filtered on the worker label,
+  which updates the table the moment a container starts, dies or changes
+  health, and
+* one batched ``docker inspect`` over every tracked container, run at most
+  once per ``refresh_interval`` to reconcile anything the stream missed.
+
+``ContainerLauncher.monitor()`` then only reads the table, so the number of
+docker subprocesses per poll no longer depends on the worker count.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from mahabharatha.logging import get_logger
+
+logger = get_logger("launcher")
+
+WORKER_LABEL = "mahabharatha.worker"
+HEALTH_STATUS_PREFIX = "health_status: "
+
+_INSPECT_FORMAT = "{{.Id}} {{.State.Running}} {{.State.ExitCode}} {{if .State.Health}}{{.State.Health.Status}}{{end}}"
+
+
+@dataclass
+class ContainerState:
+    """Last known state of a worker container."""
+
+    running: bool
+    exit_code: int | None = None
+    health: str | None = None  # starting / healthy / unhealthy, None without a healthcheck
+    removed: bool = False
+
+
+class ContainerWatcher:
+    """Follow docker events and batch inspects for a set of containers."""
+
+    def __init__(self, label: str = WORKER_LABEL, refresh_interval: float = 10.0) -> None:
+        """Initialize container watcher.
+
+        Args:
+            label: Container label the events stream is filtered on
+            refresh_interval: Minimum seconds between batched inspects
+        """
+        self.label = label
+        self.refresh_interval = refresh_interval
+        self._states: dict[str, ContainerState] = {}
+        self._lock = threading.Lock()
+        self._events_proc: subprocess.Popen[str] | None = None
+        self._events_thread: threading.Thread | None = None
+        self._last_refresh = 0.0
+        self._events_unavailable = False
+
+    @property
+    def following(self) -> bool:
+        """Whether the docker events stream is running."""
+        return self._events_proc is not None and self._events_proc.poll() is None
+
+    def track(self, container_id: str) -> None:
+        """Start watching a container and make sure the events stream runs.
+
+        Args:
+            container_id: Full container ID as returned by ``docker run -d``
+        """
+        with self._lock:
+            self._states.setdefault(container_id, ContainerState(running=True))
+        self._last_refresh = 0.0  # Include the new container in the next inspect
+        if not self.following:
+            self._start_events()
+
+    def untrack(self, container_id: str) -> None:
+        """Stop watching a container; stops the stream when none are left.
+
+        Args:
+            container_id: Container to forget
+        """
+        with self._lock:
+            self._states.pop(container_id, None)
+            empty = not self._states
+        if empty:
+            self.stop()
+
+    def get(self, container_id: str) -> ContainerState | None:
+        """Return the last known state of a tracked container.
+
+        Args:
+            container_id: Container to look up
+
+        Returns:
+            ContainerState, or None if the container is not tracked
+        """
+        with self._lock:
+            return self._states.get(container_id)
+
+    def refresh(self, force: bool = False) -> None:
+        """Reconcile the table with one ``docker inspect`` for all containers.
+
+        No-op if the last refresh was less than ``refresh_interval`` ago.
+        Also restarts the events stream if it has died.
+
+        Args:
+            force: Refresh regardless of the interval
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.refresh_interval:
+            return
+        self._last_refresh = now
+
+        with self._lock:
+            ids = list(self._states)
+        if not ids:
+            return
+        if not self.following:
+            self._start_events()
+
+        try:
+            result = subprocess.run(
+                ["docker", "inspect", "-f", _INSPECT_FORMAT, *ids],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.error(f"Failed to inspect worker containers: {e}")
+            return
+
+        # docker inspect exits 1 if any ID is unknown but still prints the rest
+        seen: dict[str, ContainerState] = {}
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+            try:
+                seen[parts[0]] = ContainerState(
+                    running=parts[1] == "true",
+                    exit_code=int(parts[2]),
+                    health=parts[3] if len(parts) > 3 else None,
+                )
+            except ValueError:
+                continue
+
+        with self._lock:
+            for container_id in ids:
+                if container_id not in self._states:
+                    continue  # Untracked while inspecting
+                self._states[container_id] = seen.get(
+                    container_id, ContainerState(running=False, exit_code=None, removed=True)
+                )
+
+    def stop(self) -> None:
+        """Stop the events stream."""
+        proc, self._events_proc = self._events_proc, None
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        if self._events_thread is not None:
+            self._events_thread.join(timeout=5)
+            self._events_thread = None
+
+    def _start_events(self) -> None:
+        if self._events_unavailable:
+            return
+        cmd = [
+            "docker",
+            "events",
+            "--filter",
+            "type=container",
+            "--filter",
+            f"label={self.label}",
+            "--format",
+            "{{json .}}",
+        ]
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError as e:
+            logger.warning(f"docker events unavailable, relying on batched inspect: {e}")
+            self._events_unavailable = True
+            return
+        self._events_proc = proc
+        self._events_thread = threading.Thread(
+            target=self._follow,
+            args=(proc,),
+            name="mahabharatha-container-events",
+            daemon=True,
+        )
+        self._events_thread.start()
+        logger.debug("Following docker events for worker containers")
+
+    def _follow(self, proc: subprocess.Popen[str]) -> None:
+        if proc.stdout is None:
+            return
+        for line in proc.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict):
+                self.apply_event(event)
+        proc.stdout.close()
+
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """Update the table from one ``docker events`` JSON record.
+
+        Args:
+            event: Decoded event (``Action``, ``Actor.ID``, ``Actor.Attributes``)
+        """
+        actor = event.get("Actor") or {}
+        container_id = str(actor.get("ID") or event.get("id") or "")
+        action = str(event.get("Action") or event.get("status") or "")
+        attributes = actor.get("Attributes") or {}
+
+        with self._lock:
+            state = self._states.get(container_id)
+            if state is None:
+                return
+            if action == "start":
+                self._states[container_id] = ContainerState(running=True)
+            elif action == "die":
+                state.running = False
+                try:
+                    state.exit_code = int(attributes.get("exitCode", ""))
+                except ValueError:
+                    state.exit_code = None
+                logger.debug(f"Container {container_id[:12]} died (exit {state.exit_code})")
+            elif action == "destroy":
+                state.running = False
+                state.removed = True
+            elif action.startswith(HEALTH_STATUS_PREFIX):
+                state.health = action[len(HEALTH_STATUS_PREFIX) :].strip()
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
 
 from mahabharatha.constants import LOGS_TASKS_DIR, LOGS_WORKERS_DIR, WorkerStatus
 from mahabharatha.env_validator import validate_env_vars
+from mahabharatha.heartbeat_table import HEARTBEAT_TABLE_ENV, heartbeat_table_path, reset_worker_slot
 from mahabharatha.launcher_types import LauncherConfig, SpawnResult, WorkerHandle
 from mahabharatha.launchers.base import WorkerLauncher
 from mahabharatha.logging import get_logger
@@ -90,8 +91,11 @@ class SubprocessLauncher(WorkerLauncher):
                     "MAHABHARATHA_STATE_DIR": str(repo_path / ".mahabharatha" / "state"),
                     "MAHABHARATHA_REPO_PATH": str(repo_path),
                     "MAHABHARATHA_LOG_DIR": str(log_dir),
+                    # Same host: report heartbeats/progress through the shared table
+                    HEARTBEAT_TABLE_ENV: str(heartbeat_table_path(repo_path / ".mahabharatha" / "state")),
                 }
             )
+            reset_worker_slot(worker_id, repo_path / ".mahabharatha" / "state")
 
             # Cross-session task list coordination
             task_list_id = os.environ.get("CLAUDE_CODE_TASK_LIST_ID")
@@ -373,8 +377,11 @@ class SubprocessLauncher(WorkerLauncher):
                     "MAHABHARATHA_STATE_DIR": str(repo_path / ".mahabharatha" / "state"),
                     "MAHABHARATHA_REPO_PATH": str(repo_path),
                     "MAHABHARATHA_LOG_DIR": str(log_dir),
+                    # Same host: report heartbeats/progress through the shared table
+                    HEARTBEAT_TABLE_ENV: str(heartbeat_table_path(repo_path / ".mahabharatha" / "state")),
                 }
             )
+            reset_worker_slot(worker_id, repo_path / ".mahabharatha" / "state")
 
             # Cross-session task list coordination
             task_list_id = os.environ.get("CLAUDE_CODE_TASK_LIST_ID")
@@ -25,8 +25,12 @@ from mahabharatha.constants import (
     LogEvent,
     PluginHookEvent,
     TaskStatus,
+    WorkerStatus,
 )
+from mahabharatha.exceptions import GitError
+from mahabharatha.gate_cache import GateResultCache, clean_tree_sha
 from mahabharatha.gates import GateRunner
+from mahabharatha.git_ops import GitOps
 from mahabharatha.levels import LevelController
 from mahabharatha.log_writer import StructuredLogWriter
 from mahabharatha.logging import get_logger
@@ -45,6 +49,8 @@ if TYPE_CHECKING:
 
 logger = get_logger("level_coordinator")
 
+_ENDED_STATUSES = (WorkerStatus.STOPPED, WorkerStatus.CRASHED)
+
 
 class LevelCoordinator:
     """Coordinate level lifecycle: start, complete, and merge workflows.
@@ -69,6 +75,7 @@ class LevelCoordinator:
         assigner: WorkerAssignment | None = None,
         structured_writer: StructuredLogWriter | None = None,
         backpressure: BackpressureController | None = None,
+        recycle_worker: Callable[[int], None] | None = None,
     ) -> None:
         """Initialize level coordinator.
 
@@ -86,6 +93,7 @@ class LevelCoordinator:
             assigner: Optional worker assignment instance
             structured_writer: Optional structured log writer
             backpressure: Optional backpressure controller for level failure management
+            recycle_worker: Terminates a persistent worker whose worktree could not be rebased
         """
         self.feature = feature
         self.config = config
@@ -100,6 +108,7 @@ class LevelCoordinator:
         self.assigner = assigner
         self._structured_writer = structured_writer
         self._backpressure = backpressure
+        self._recycle_worker = recycle_worker
         self._paused = False
         self.last_merge_result: MergeFlowResult | None = None
 
@@ -395,6 +404,12 @@ class LevelCoordinator:
     def rebase_all_workers(self, level: int) -> None:
         """Rebase all worker branches onto merged base.
 
+        With persistent workers (``workers.persistent``) the worktree of every
+        live worker is rebased in place onto the merge target, so the same
+        worker process carries on with the next level. A worker whose
+        worktree cannot be rebased is passed to ``recycle_worker`` and gets
+        respawned from scratch instead.
+
         Args:
             level: Level that was just merged
         """
@@ -402,16 +417,27 @@ class LevelCoordinator:
 
         self.state.set_level_merge_status(level, LevelMergeStatus.REBASING)
 
-        for worker_id, worker in self._workers.items():
+        persistent = getattr(getattr(self.config, "workers", None), "persistent", False) is True
+        target = self.last_merge_result.target_branch if self.last_merge_result else "main"
+
+        for worker_id, worker in list(self._workers.items()):
             if not worker.branch:
                 continue
 
-            try:
+            if not persistent or not worker.worktree_path or worker.status in _ENDED_STATUSES:
                 # Workers will need to pull the merged changes
                 # This is handled when they start their next task
                 logger.debug(f"Worker {worker_id} branch {worker.branch} marked for rebase")
-            except Exception as e:  # noqa: BLE001 — intentional: rebase tracking is best-effort; never block level advance
-                logger.warning(f"Failed to track rebase for worker {worker_id}: {e}")
+                continue
+
+            try:
+                GitOps(worker.worktree_path).rebase(target)
+                logger.info(f"Worker {worker_id} worktree rebased onto {target}")
+            except (GitError, OSError) as e:
+                logger.warning(f"Failed to rebase worker {worker_id} onto {target}, recycling it: {e}")
+                self.state.append_event("worker_rebase_failed", {"worker_id": worker_id, "level": level})
+                if self._recycle_worker is not None:
+                    self._recycle_worker(worker_id)
 
     def pause_for_intervention(self, reason: str) -> None:
         """Pause execution for manual intervention.
@@ -450,6 +476,8 @@ class GatePipeline:
     Delegates gate execution to GateRunner, but adds:
     - Artifact storage: gate results saved to .mahabharatha/artifacts/{level}/
     - Staleness check: skip re-running gates if results are fresh and code unchanged
+    - Content-addressed reuse (optional): passing results keyed on the git tree
+      SHA, gate command and gate config are shared across levels and retries
     """
 
     def __init__(
@@ -457,6 +485,7 @@ class GatePipeline:
         gate_runner: GateRunner,
         artifacts_dir: Path | None = None,
         staleness_threshold_seconds: int = 300,
+        result_cache: GateResultCache | None = None,
     ) -> None:
         """Initialize GatePipeline.
 
@@ -466,10 +495,13 @@ class GatePipeline:
             staleness_threshold_seconds: Seconds before a cached result is
                 considered stale (default 300, configurable via
                 verification.staleness_threshold_seconds)
+            result_cache: Optional content-addressed cache consulted before
+                the per-level artifacts when the working tree is clean
         """
         self._runner = gate_runner
         self._artifacts_dir = artifacts_dir or Path(".mahabharatha/artifacts")
         self._staleness_threshold = staleness_threshold_seconds
+        self._result_cache = result_cache
 
     def run_gates_for_level(
         self,
@@ -481,9 +513,15 @@ class GatePipeline:
 
         For each gate, checks whether a cached result exists and is still
         fresh (younger than staleness_threshold_seconds). If so, the cached
-        result is returned without re-executing. Otherwise, the gate is
-        delegated to the underlying GateRunner, and the result is persisted
-        as a JSON artifact under .mahabharatha/artifacts/{level}/.
+        result is returned without re-executing. The remaining gates are run
+        together through ``GateRunner.run_gates``, so they follow the same
+        dependency DAG (and parallelism) as a direct run, with cached results
+        satisfying their dependencies. Each fresh result is persisted as a
+        JSON artifact under .mahabharatha/artifacts/{level}/.
+
+        With a result cache and a clean working tree, a passing result for the
+        same tree SHA, command and gate config is reused regardless of level
+        or age, and fresh passing results are added to the cache.
 
         Args:
             level: Level number
@@ -496,20 +534,35 @@ class GatePipeline:
         level_dir = self._artifacts_dir / str(level)
         level_dir.mkdir(parents=True, exist_ok=True)
 
-        results: list[GateRunResult] = []
+        tree_sha = clean_tree_sha(cwd) if self._result_cache is not None else None
+
+        results: dict[str, GateRunResult] = {}
+        misses: list[QualityGate] = []
         for gate in gates:
+            if tree_sha is not None and self._result_cache is not None:
+                hit = self._result_cache.get(tree_sha, gate)
+                if hit is not None:
+                    results[gate.name] = hit
+                    continue
+
             cached = self._load_cached_result(level_dir, gate.name)
             if cached is not None and not self._is_stale(cached):
                 logger.info("Gate '%s' result still fresh, skipping", gate.name)
-                restored = self._restore_result(cached, gate)
-                results.append(restored)
+                results[gate.name] = self._restore_result(cached, gate)
                 continue
 
-            result = self._runner.run_gate(gate, cwd=cwd)
-            results.append(result)
-            self._store_result(level_dir, gate.name, result)
+            misses.append(gate)
+
+        if misses:
+            _all_passed, fresh = self._runner.run_gates(misses, cwd=cwd, stop_on_failure=False, prior=results)
+            by_name = {gate.name: gate for gate in misses}
+            for result in fresh:
+                results[result.gate_name] = result
+                self._store_result(level_dir, result.gate_name, result)
+                if tree_sha is not None and self._result_cache is not None:
+                    self._result_cache.put(tree_sha, by_name[result.gate_name], result)
 
-        return results
+        return [results[gate.name] for gate in gates]
 
     # ------------------------------------------------------------------
     # Private helpers
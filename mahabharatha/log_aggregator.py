@@ -1,10 +1,10 @@
 """Read-side log aggregation for Mahabharatha structured logs.
 
 Merges all worker JSONL files by timestamp at read time.
-No aggregated file on disk - purely read-side merging.
+No aggregated file on disk - purely read-side merging over per-file
+sidecar indexes (see ``mahabharatha.log_index``).
 """
 
-import json
 import logging
 import threading
 from collections import OrderedDict
@@ -13,7 +13,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from mahabharatha.json_utils import loads as json_loads
+from mahabharatha.log_index import LogIndex
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +40,9 @@ class LogAggregator:
     Reads workers/*.jsonl and orchestrator.jsonl, merges by timestamp.
     Supports filtering by worker, task, phase, event, time range, and text search.
 
-    Uses per-file caching with mtime-based invalidation for performance.
-    Cache is bounded by MAX_CACHED_FILES with LRU eviction.
+    Each file is covered by a sidecar ``LogIndex`` that is extended by byte
+    offset as the file grows, so queries only parse the records they return.
+    Open indexes are bounded by MAX_CACHED_FILES with LRU eviction.
     """
 
     MAX_CACHED_FILES = 100  # LRU limit
@@ -56,8 +57,8 @@ class LogAggregator:
         self.workers_dir = self.log_dir / "workers"
         self.tasks_dir = self.log_dir / "tasks"
 
-        # Per-file cache: {path: {"mtime": float, "entries": list}}
-        self._file_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Per-file index: {path: LogIndex}
+        self._file_cache: OrderedDict[str, LogIndex] = OrderedDict()
         self._cache_lock = threading.Lock()
 
     def query(
@@ -92,62 +93,62 @@ class LogAggregator:
         Returns:
             List of log entry dicts sorted by timestamp
         """
-        entries = self._read_all_entries()
-
-        # Apply filters
-        filtered = []
-        for entry in entries:
-            if worker_id is not None and entry.get("worker_id") != worker_id:
-                continue
-            if task_id is not None and entry.get("task_id") != task_id:
-                continue
-            if level is not None and entry.get("level") != level:
-                continue
-            if phase is not None and entry.get("phase") != phase:
-                continue
-            if event is not None and entry.get("event") != event:
-                continue
-            if level_filter is not None:
-                entry_data = entry.get("data", {})
-                if isinstance(entry_data, dict):
-                    if entry_data.get("level") != level_filter:
-                        continue
-                else:
+        fields = {
+            "worker_id": worker_id,
+            "task_id": task_id,
+            "level": level,
+            "phase": phase,
+            "event": event,
+            "data_level": level_filter,
+        }
+        filters = {name: value for name, value in fields.items() if value is not None}
+        since_str = since.isoformat() if isinstance(since, datetime) else since
+        until_str = until.isoformat() if isinstance(until, datetime) else until
+        needle = search.lower() if search is not None else None
+
+        # (ts, file order, row) keeps the previous stable sort: by timestamp, then file, then line
+        indexes = self._refresh_indexes()
+        hits: list[tuple[str, int, int]] = []
+        for i, index in enumerate(indexes):
+            ts = index.ts
+            hits.extend((ts[row], i, row) for row in index.select(filters, since_str, until_str))
+        hits.sort()
+
+        results: list[dict[str, Any]] = []
+        batch = len(hits) if limit is None or needle is not None else limit
+        pos = 0
+        while pos < len(hits) and (limit is None or len(results) < limit):
+            chunk = hits[pos : pos + max(batch, 1)]
+            pos += len(chunk)
+            for entry in self._read_rows(indexes, chunk):
+                if needle is not None and needle not in str(entry.get("message", "")).lower():
                     continue
-            if since is not None:
-                since_str = since.isoformat() if isinstance(since, datetime) else since
-                if entry.get("ts", "") < since_str:
-                    continue
-            if until is not None:
-                until_str = until.isoformat() if isinstance(until, datetime) else until
-                if entry.get("ts", "") > until_str:
-                    continue
-            if search is not None:
-                msg = entry.get("message", "")
-                if search.lower() not in msg.lower():
-                    continue
-
-            filtered.append(entry)
-
-        # Sort by timestamp
-        filtered.sort(key=lambda e: e.get("ts", ""))
-
-        # Apply limit
-        if limit is not None:
-            filtered = filtered[:limit]
-
-        return filtered
-
-    def _read_all_entries(self) -> list[dict[str, Any]]:
-        """Read all log entries with per-file caching.
-
-        Uses mtime-based invalidation to only re-read files that changed.
-        Cache is bounded by MAX_CACHED_FILES with LRU eviction.
+                results.append(entry)
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
+
+    def _read_rows(self, indexes: list[LogIndex], hits: list[tuple[str, int, int]]) -> list[dict[str, Any]]:
+        """Parse the records behind ``hits``, preserving their order."""
+        by_file: dict[int, list[int]] = {}
+        for _, i, row in hits:
+            by_file.setdefault(i, []).append(row)
+        parsed: dict[tuple[int, int], dict[str, Any]] = {}
+        for i, rows in by_file.items():
+            rows.sort()  # Read each file front to back
+            for row, entry in indexes[i].read(rows):
+                parsed[(i, row)] = entry
+        return [parsed[(i, row)] for _, i, row in hits if (i, row) in parsed]
+
+    def _refresh_indexes(self) -> list[LogIndex]:
+        """Bring the index of every log file up to date.
+
+        Indexes are extended from their last indexed byte offset; only
+        rotated or rewritten files are indexed again from the start.
 
         Returns:
-            Unsorted list of all log entries
+            Indexes in file order (workers, then orchestrator)
         """
-        entries: list[dict[str, Any]] = []
         files_to_read: list[Path] = []
 
         # Collect all JSONL files
@@ -157,60 +158,26 @@ class LogAggregator:
         if orchestrator_file.exists():
             files_to_read.append(orchestrator_file)
 
+        indexes: list[LogIndex] = []
         with self._cache_lock:
             for jsonl_file in files_to_read:
                 key = str(jsonl_file)
-                try:
-                    current_mtime = jsonl_file.stat().st_mtime
-                except FileNotFoundError:
+                index = self._file_cache.get(key)
+                if index is None:
+                    index = LogIndex(jsonl_file)
+                    self._file_cache[key] = index
+                self._file_cache.move_to_end(key)
+                if not index.refresh():
+                    del self._file_cache[key]
                     continue
+                indexes.append(index)
 
-                cached = self._file_cache.get(key)
-                if cached and cached["mtime"] == current_mtime:
-                    # Cache hit - move to end for LRU
-                    self._file_cache.move_to_end(key)
-                    entries.extend(cached["entries"])
-                    logger.debug("Cache hit for log file %s", jsonl_file.name)
-                else:
-                    # Cache miss - read file
-                    logger.debug("Cache miss for log file %s", jsonl_file.name)
-                    file_entries = self._read_jsonl(jsonl_file)
-                    entries.extend(file_entries)
+            # Evict least recently used indexes if over limit
+            while len(self._file_cache) > self.MAX_CACHED_FILES:
+                oldest_key, _ = self._file_cache.popitem(last=False)
+                logger.debug("Evicting log index %s", oldest_key)
 
-                    # Update cache with LRU eviction
-                    self._file_cache[key] = {"mtime": current_mtime, "entries": file_entries}
-                    self._file_cache.move_to_end(key)
-
-                    # Evict oldest if over limit
-                    while len(self._file_cache) > self.MAX_CACHED_FILES:
-                        oldest_key, _ = self._file_cache.popitem(last=False)
-                        logger.debug("Evicting cached log file %s", oldest_key)
-
-        return entries
-
-    def _read_jsonl(self, path: Path) -> list[dict[str, Any]]:
-        """Read entries from a JSONL file.
-
-        Args:
-            path: Path to JSONL file
-
-        Returns:
-            List of parsed entries
-        """
-        entries = []
-        try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entries.append(json_loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        except OSError:
-            pass  # Best-effort file read
-        return entries
+        return indexes
 
     def get_task_artifacts(self, task_id: str) -> dict[str, Path]:
         """Get artifact file paths for a task.
@@ -246,11 +213,8 @@ class LogAggregator:
         task_ids: set[str] = set()
 
         # From log entries
-        entries = self._read_all_entries()
-        for entry in entries:
-            tid = entry.get("task_id")
-            if tid:
-                task_ids.add(tid)
+        for index in self._refresh_indexes():
+            task_ids.update(tid for tid in index.values("task_id") if tid)
 
         # From task artifact directories
         if self.tasks_dir.exists():
@@ -0,0 +1,307 @@
+"""Sidecar index for structured JSONL log files.
+
+Each ``worker-N.jsonl`` gets a ``worker-N.jsonl.idx`` next to it holding one
+row per record: its byte offset and length plus the fields queries filter
+on (ts, worker_id, task_id, level, phase, event and ``data.level``). The
+index is append-only and extended from the last indexed byte offset, so a
+growing log is never re-parsed. Queries intersect per-field posting lists,
+bisect the timestamp column for ``since``/``until`` and then seek straight to
+the matching records.
+
+Sidecar layout (JSON lines)::
+
+    {"v": 1, "ino": ..., "plen": ..., "pcrc": ...}   header: file identity
+    [offset, length, ts, worker_id, task_id, level, phase, event, data_level]
+    ...
+    [end_offset]                                     batch terminator
+
+Rows after the last terminator belong to an interrupted write and are
+ignored. A log that was rotated, truncated or rewritten (different inode,
+smaller size or changed leading bytes) is re-indexed from scratch. If the
+sidecar cannot be written the index is kept in memory only.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import zlib
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from mahabharatha.json_utils import dumps as json_dumps
+from mahabharatha.json_utils import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+# Indexed fields, in sidecar row order after offset, length and ts
+INDEXED_FIELDS = ("worker_id", "task_id", "level", "phase", "event", "data_level")
+
+_PREFIX_BYTES = 4096  # Leading bytes checksummed to detect a rewritten log
+_READ_BLOCK = 1 << 20  # Unindexed log bytes read per block, so a large first index stays bounded
+
+
+def _field_values(entry: dict[str, Any]) -> list[Any]:
+    data = entry.get("data")
+    values = [entry.get(name) for name in INDEXED_FIELDS[:-1]]
+    values.append(data.get("level") if isinstance(data, dict) else None)
+    return [v if isinstance(v, Hashable) else None for v in values]
+
+
+class LogIndex:
+    """Offset index over one JSONL log file."""
+
+    def __init__(self, path: Path, persist: bool = True) -> None:
+        """Initialize index; call ``refresh()`` to load or build it.
+
+        Args:
+            path: JSONL log file
+            persist: Keep the index in a sidecar file next to the log
+        """
+        self.path = path
+        self.index_path = path.with_name(path.name + INDEX_SUFFIX)
+        self.persist = persist
+        self._stat: tuple[int, int, int] | None = None  # (ino, size, mtime_ns) at last refresh
+        self._loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self.indexed_bytes = 0
+        self.offsets = array("q")
+        self.lengths = array("q")
+        self.ts: list[str] = []
+        self.ts_sorted = True
+        self.postings: dict[str, dict[Any, array[int]]] = {name: {} for name in INDEXED_FIELDS}
+        self._ino = 0
+        self._prefix: tuple[int, int] | None = None  # (length, crc32)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def values(self, field: str) -> list[Any]:
+        """Distinct non-null values of an indexed field."""
+        return [v for v in self.postings[field] if v is not None]
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the log file.
+
+        Returns:
+            False if the log file no longer exists
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._stat = None
+            return False
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if key == self._stat:
+            return True
+
+        if not self._loaded:
+            self._loaded = True
+            if self.persist:
+                self._load_sidecar()
+        if self.indexed_bytes and (
+            st.st_ino != self._ino or st.st_size < self.indexed_bytes or not self._prefix_matches()
+        ):
+            logger.debug("Log %s was rotated or rewritten, re-indexing", self.path.name)
+            self._reset()
+            if self.persist:
+                self._remove_sidecar()
+        self._ino = st.st_ino
+        if st.st_size > self.indexed_bytes:
+            self._index_tail(st.st_size)
+        self._stat = key
+        return True
+
+    def select(self, filters: dict[str, Any], since: str | None = None, until: str | None = None) -> list[int]:
+        """Row numbers matching all equality filters and the time range.
+
+        Args:
+            filters: Indexed field name to required value
+            since: Inclusive lower bound on ``ts``
+            until: Inclusive upper bound on ``ts``
+
+        Returns:
+            Ascending row numbers
+        """
+        rows: Iterable[int] | None = None
+        if filters:
+            lists = sorted((self.postings[name].get(value, array("q")) for name, value in filters.items()), key=len)
+            rows = lists[0]
+            for other in lists[1:]:
+                if not rows:
+                    break
+                members = set(other)
+                rows = [r for r in rows if r in members]
+
+        if since is None and until is None:
+            return list(rows) if rows is not None else list(range(len(self)))
+
+        if self.ts_sorted:
+            lo = bisect.bisect_left(self.ts, since) if since is not None else 0
+            hi = bisect.bisect_right(self.ts, until) if until is not None else len(self.ts)
+            if rows is None:
+                return list(range(lo, hi))
+            return [r for r in rows if lo <= r < hi]
+
+        ts = self.ts
+        return [
+            r
+            for r in (rows if rows is not None else range(len(self)))
+            if (since is None or ts[r] >= since) and (until is None or ts[r] <= until)
+        ]
+
+    def read(self, rows: Iterable[int]) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Seek to and parse the given rows.
+
+        Args:
+            rows: Row numbers from ``select()``
+
+        Yields:
+            (row, entry) for every row that still parses
+        """
+        try:
+            with open(self.path, "rb") as f:
+                for row in rows:
+                    f.seek(self.offsets[row])
+                    try:
+                        entry = json_loads(f.read(self.lengths[row]))
+                    except ValueError:
+                        continue  # Rewritten since the last refresh
+                    if isinstance(entry, dict):
+                        yield row, entry
+        except OSError:
+            return  # Best-effort read
+
+    # -- building ---------------------------------------------------------
+
+    def _add_row(self, offset: int, length: int, ts: str, values: list[Any]) -> None:
+        row = len(self.offsets)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        if self.ts and ts < self.ts[-1]:
+            self.ts_sorted = False
+        self.ts.append(ts)
+        for name, value in zip(INDEXED_FIELDS, values, strict=True):
+            self.postings[name].setdefault(value, array("q")).append(row)
+
+    def _index_tail(self, size: int) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                if not self._prefix:
+                    head = f.read(_PREFIX_BYTES)
+                    self._prefix = (len(head), zlib.crc32(head))
+                f.seek(self.indexed_bytes)
+                remaining = size - self.indexed_bytes
+                carry = b""
+                while remaining > 0:
+                    block = f.read(min(_READ_BLOCK, remaining))
+                    if not block:
+                        break
+                    remaining -= len(block)
+                    chunk = carry + block
+                    end = chunk.rfind(b"\n") + 1  # Carry a partial last line into the next block
+                    carry = chunk[end:]
+                    if end:
+                        self._index_lines(chunk, end)
+        except OSError:
+            return
+
+    def _index_lines(self, chunk: bytes, end: int) -> None:
+        """Index the complete lines in ``chunk[:end]``, which starts at ``indexed_bytes``."""
+        start = self.indexed_bytes
+        new_rows: list[list[Any]] = []
+        pos = 0
+        while pos < end:
+            nl = chunk.index(b"\n", pos)
+            line = chunk[pos:nl]
+            if line.strip():
+                try:
+                    entry = json_loads(line)
+                except ValueError:
+                    entry = None
+                if isinstance(entry, dict):
+                    ts = entry.get("ts", "")
+                    ts = ts if isinstance(ts, str) else ""
+                    values = _field_values(entry)
+                    self._add_row(start + pos, len(line), ts, values)
+                    new_rows.append([start + pos, len(line), ts, *values])
+            pos = nl + 1
+        self.indexed_bytes = start + end
+        if self.persist:
+            self._append_sidecar(new_rows)
+
+    # -- sidecar ----------------------------------------------------------
+
+    def _header(self) -> str:
+        length, crc = self._prefix or (0, 0)
+        return json_dumps({"v": INDEX_VERSION, "ino": self._ino, "plen": length, "pcrc": crc})
+
+    def _append_sidecar(self, rows: list[list[Any]]) -> None:
+        lines = [json_dumps(r) for r in rows]
+        lines.append(json_dumps([self.indexed_bytes]))
+        try:
+            if not self.index_path.exists():
+                lines.insert(0, self._header())
+            with open(self.index_path, "a") as f:
+                f.write("\n".join(lines) + "\n")
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Keeping log index for %s in memory: %s", self.path.name, e)
+            self.persist = False
+
+    def _remove_sidecar(self) -> None:
+        try:
+            self.index_path.unlink(missing_ok=True)
+        except OSError:
+            self.persist = False
+
+    def _load_sidecar(self) -> None:
+        try:
+            with open(self.index_path, "rb") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        try:
+            header = json_loads(lines[0]) if lines else None
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("v") != INDEX_VERSION:
+            self._remove_sidecar()
+            return
+        self._ino = header.get("ino", 0)
+        self._prefix = (header.get("plen", 0), header.get("pcrc", 0))
+
+        pending: list[list[Any]] = []
+        for raw in lines[1:]:
+            try:
+                rec = json_loads(raw)
+            except ValueError:
+                break  # Torn write; everything after it is re-indexed
+            if not isinstance(rec, list):
+                break
+            if len(rec) == 1:
+                if rec[0] > self.indexed_bytes:  # Skip batches a concurrent reader also wrote
+                    for r in pending:
+                        self._add_row(r[0], r[1], r[2], r[3:])
+                    self.indexed_bytes = rec[0]
+                pending = []
+            elif len(rec) == 3 + len(INDEXED_FIELDS) and rec[0] >= self.indexed_bytes:
+                pending.append(rec)
+
+    def _prefix_matches(self) -> bool:
+        if not self._prefix:
+            return True
+        length, crc = self._prefix
+        try:
+            with open(self.path, "rb") as f:
+                head = f.read(length)
+        except OSError:
+            return False
+        return len(head) == length and zlib.crc32(head) == crc
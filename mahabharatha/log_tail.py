@@ -0,0 +1,214 @@
+"""Tail and follow primitives for log files.
+
+``tail_lines`` reads fixed-size blocks backwards from the end of a file until
+it has the last N lines, so its cost depends on N rather than on the file
+size. ``LogFollower`` tracks read offsets for a set of files and blocks in
+``wait()`` until one of them may have changed: through inotify on Linux
+(watching the parent directories, so created and rotated files are seen) and
+by sleeping ``poll_interval`` elsewhere.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from pathlib import Path
+from types import TracebackType
+
+from mahabharatha.logging import get_logger
+
+logger = get_logger("logs")
+
+TAIL_BLOCK_SIZE = 64 * 1024
+FOLLOW_POLL_INTERVAL = 0.5
+FOLLOW_WAKE_INTERVAL = 5.0  # Re-check files at least this often even without inotify events
+
+# inotify(7) event masks
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+
+def tail_lines(path: Path, n: int, block_size: int = TAIL_BLOCK_SIZE) -> list[str]:
+    """Return the last ``n`` lines of a file without reading all of it.
+
+    Matches ``f.readlines()[-n:]`` with line endings stripped: a final line
+    without a trailing newline counts as a line, and ``n <= 0`` returns
+    every line.
+
+    Args:
+        path: File to read
+        n: Number of lines
+        block_size: Bytes read per backwards step
+
+    Returns:
+        Up to ``n`` lines, oldest first
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        if n <= 0:
+            f.seek(0)
+            data = f.read()
+        else:
+            data = b""
+            pos = end
+            # n lines need n newlines in front of them (plus a possible trailing one)
+            while pos > 0 and data.count(b"\n") <= n:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").split("\n")
+    if lines[-1] == "":
+        lines.pop()  # Trailing newline
+    return lines if n <= 0 else lines[-n:]
+
+
+class PollingWatcher:
+    """Fallback watcher: wakes after a fixed interval."""
+
+    def __init__(self, poll_interval: float = FOLLOW_POLL_INTERVAL) -> None:
+        self.poll_interval = poll_interval
+
+    def wait(self) -> None:
+        """Sleep one poll interval."""
+        time.sleep(self.poll_interval)
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InotifyWatcher:
+    """Wake on inotify events for a set of directories (Linux only)."""
+
+    def __init__(self, directories: list[Path], timeout: float = FOLLOW_WAKE_INTERVAL) -> None:
+        """Initialize inotify watcher.
+
+        Args:
+            directories: Directories whose files are followed
+            timeout: Maximum seconds ``wait()`` blocks without an event
+
+        Raises:
+            OSError: If inotify is unavailable
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify requires Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.timeout = timeout
+        try:
+            for directory in directories:
+                if libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK) < 0:
+                    raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def wait(self) -> None:
+        """Block until a watched directory changes or the timeout passes."""
+        readable, _, _ = select.select([self._fd], [], [], self.timeout)
+        if not readable:
+            return
+        # Only the wakeup matters; the follower re-checks its files itself
+        try:
+            while os.read(self._fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(directories: list[Path]) -> InotifyWatcher | PollingWatcher:
+    """Return an inotify watcher, or a polling one where inotify is unavailable."""
+    try:
+        return InotifyWatcher(directories)
+    except (OSError, AttributeError) as e:  # AttributeError: libc without inotify symbols
+        logger.debug(f"inotify unavailable, polling log files: {e}")
+        return PollingWatcher()
+
+
+class LogFollower:
+    """Read lines appended to a set of files as they arrive."""
+
+    def __init__(self, files: list[Path]) -> None:
+        """Initialize follower positioned at the current end of each file.
+
+        Args:
+            files: Files to follow; missing files are picked up once created
+        """
+        self.files = files
+        self._positions: dict[Path, int] = {}
+        self._partial: dict[Path, bytes] = {}
+        for path in files:
+            try:
+                self._positions[path] = path.stat().st_size
+            except OSError:
+                self._positions[path] = 0
+        self._watcher = create_watcher(sorted({p.parent for p in files if p.parent.exists()}))
+
+    def __enter__(self) -> LogFollower:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def read_new(self) -> dict[Path, list[str]]:
+        """Return complete lines appended since the last call, per file.
+
+        A file that shrank (rotated or truncated) is read again from the start.
+        """
+        new: dict[Path, list[str]] = {}
+        for path in self.files:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            pos = self._positions.get(path, 0)
+            if size < pos:
+                pos = 0
+                self._partial.pop(path, None)
+            if size == pos:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    f.seek(pos)
+                    chunk = self._partial.pop(path, b"") + f.read(size - pos)
+            except OSError as e:
+                logger.warning(f"Error reading {path}: {e}")
+                continue
+            self._positions[path] = size
+            complete, _, rest = chunk.rpartition(b"\n")
+            if rest:
+                self._partial[path] = rest  # Line still being written
+            if complete:
+                new[path] = complete.decode("utf-8", errors="replace").split("\n")
+        return new
+
+    def wait(self) -> None:
+        """Block until the followed files may have changed."""
+        self._watcher.wait()
+
+    def close(self) -> None:
+        """Stop watching."""
+        self._watcher.close()
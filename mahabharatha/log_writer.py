@@ -2,8 +2,15 @@
 
 Each worker writes to its own worker-{id}.jsonl file.
 Thread-safe via threading.Lock on write operations.
+
+In buffered mode ``emit`` only serializes the entry and appends it to a
+bounded in-memory buffer; a background thread writes the buffer out every
+``flush_interval_ms`` or once ``flush_batch_size`` records are pending, so
+many records share one write and flush. Error-level entries, a full buffer
+and ``close()`` (also registered with ``atexit``) flush synchronously.
 """
 
+import atexit
 import json
 import threading
 from datetime import UTC, datetime
@@ -11,6 +18,10 @@ from pathlib import Path
 from typing import Any
 
 from mahabharatha.constants import LogEvent, LogPhase
+from mahabharatha.json_utils import dumps as json_dumps
+
+# Levels written out before emit() returns, even in buffered mode
+SYNC_FLUSH_LEVELS = frozenset({"error", "critical"})
 
 
 class StructuredLogWriter:
@@ -25,6 +36,10 @@ class StructuredLogWriter:
         worker_id: int | str,
         feature: str,
         max_size_mb: int = 50,
+        buffered: bool = False,
+        flush_interval_ms: int = 200,
+        flush_batch_size: int = 256,
+        buffer_capacity: int = 10000,
     ) -> None:
         """Initialize writer.
 
@@ -33,12 +48,16 @@ class StructuredLogWriter:
             worker_id: Worker identifier (int or "orchestrator")
             feature: Feature name
             max_size_mb: Max file size in MB before rotation
+            buffered: Write entries from a background thread in batches
+            flush_interval_ms: Max time a buffered entry waits before being written
+            flush_batch_size: Pending entries that trigger an early flush
+            buffer_capacity: Pending entries at which emit() flushes inline
         """
         self.log_dir = Path(log_dir)
         self.worker_id = worker_id
         self.feature = feature
         self.max_size_bytes = max_size_mb * 1024 * 1024
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()  # Reentrant: flush() holds it around _write()
 
         # Create workers directory
         workers_dir = self.log_dir / "workers"
@@ -48,6 +67,18 @@ class StructuredLogWriter:
         self._file_path = workers_dir / f"worker-{worker_id}.jsonl"
         self._file = open(self._file_path, "a")  # noqa: SIM115
 
+        # Buffered mode: _lock guards the file, _pending_lock the buffer.
+        # Lock order is _lock before _pending_lock.
+        self.buffered = buffered
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.buffer_capacity = max(self.flush_batch_size, buffer_capacity)
+        self._pending: list[str] = []
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._pending_lock)
+        self._closed = False
+        self._flusher: threading.Thread | None = None  # Started by the first buffered emit()
+
     def emit(
         self,
         level: str,
@@ -88,11 +119,67 @@ class StructuredLogWriter:
         if duration_ms is not None:
             entry["duration_ms"] = duration_ms
 
-        line = json.dumps(entry) + "\n"
-
+        try:
+            line = json_dumps(entry) + "\n"
+        except TypeError:
+            line = json.dumps(entry) + "\n"  # orjson rejects e.g. non-str dict keys
+
+        if not self.buffered:
+            self._write([line])
+            return
+
+        with self._wakeup:
+            if self._closed:
+                pending = None
+            else:
+                if self._flusher is None:
+                    self._start_flusher()
+                self._pending.append(line)
+                pending = len(self._pending)
+                if pending in (1, self.flush_batch_size):
+                    self._wakeup.notify()
+        if pending is None:
+            self._write([line])  # Emitted after close(), e.g. during interpreter shutdown
+        elif level in SYNC_FLUSH_LEVELS or pending >= self.buffer_capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered entries to the file now.
+
+        The buffer is swapped out and written under the file lock, so
+        concurrent flushes (the background thread, an error-level emit,
+        close) write their batches in the order they took them.
+        """
+        with self._lock:
+            with self._wakeup:
+                lines, self._pending = self._pending, []
+            if lines:
+                self._write(lines)
+
+    def _start_flusher(self) -> None:
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name=f"mahabharatha-log-writer-{self.worker_id}", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._closed and not self._pending:
+                    self._wakeup.wait()  # Idle until the first entry of a batch
+                if not self._closed and len(self._pending) < self.flush_batch_size:
+                    self._wakeup.wait(self.flush_interval)
+                if self._closed:
+                    return
+            self.flush()
+
+    def _write(self, lines: list[str]) -> None:
         with self._lock:
+            if self._file.closed:
+                return
             self._rotate_if_needed()
-            self._file.write(line)
+            self._file.write("".join(lines))
             self._file.flush()
 
     def _rotate_if_needed(self) -> None:
@@ -110,7 +197,17 @@ class StructuredLogWriter:
 
     def close(self) -> None:
         """Flush and close the log file."""
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+            self._flusher = None
+            atexit.unregister(self.close)
+        self.flush()
         with self._lock:
+            if self._file.closed:
+                return
             self._file.flush()
             self._file.close()
 
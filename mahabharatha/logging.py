@@ -276,6 +276,9 @@ def setup_structured_logging(
     feature: str,
     level: str = "info",
     max_size_mb: int = 50,
+    buffered: bool = False,
+    flush_interval_ms: int = 200,
+    flush_batch_size: int = 256,
 ) -> StructuredLogWriter:
     """Set up structured JSONL logging for a worker.
 
@@ -288,6 +291,9 @@ def setup_structured_logging(
         feature: Feature name
         level: Log level
         max_size_mb: Max file size before rotation
+        buffered: Batch writes on a background flush thread
+        flush_interval_ms: Max delay before a buffered entry is written
+        flush_batch_size: Pending entries that trigger an early flush
 
     Returns:
         The StructuredLogWriter instance (caller should close on shutdown)
@@ -299,6 +305,9 @@ def setup_structured_logging(
         worker_id=worker_id,
         feature=feature,
         max_size_mb=max_size_mb,
+        buffered=buffered,
+        flush_interval_ms=flush_interval_ms,
+        flush_batch_size=flush_batch_size,
     )
 
     log_level = getattr(logging, level.upper(), logging.INFO)
@@ -7,12 +7,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from mahabharatha.config import MahabharathaConfig
+from mahabharatha.config import MahabharathaConfig, QualityGate
 from mahabharatha.constants import GateResult, MergeStatus
 from mahabharatha.exceptions import MergeConflictError
+from mahabharatha.gate_cache import GateResultCache, clean_tree_sha
 from mahabharatha.gates import GateRunner
 from mahabharatha.git_ops import GitOps
 from mahabharatha.logging import get_logger
+from mahabharatha.tracing import CAT_GATE, CAT_GIT, CAT_MERGE, traced
 from mahabharatha.types import GateRunResult, MergeResult
 
 if TYPE_CHECKING:
@@ -58,6 +60,7 @@ class MergeCoordinator:
         config: MahabharathaConfig | None = None,
         repo_path: str | Path = ".",
         gate_pipeline: GatePipeline | None = None,
+        gate_cache: GateResultCache | None = None,
     ) -> None:
         """Initialize merge coordinator.
 
@@ -66,6 +69,8 @@ class MergeCoordinator:
             config: Mahabharatha configuration
             repo_path: Path to git repository
             gate_pipeline: Optional GatePipeline for cached gate execution
+            gate_cache: Optional content-addressed gate result cache used when
+                no GatePipeline is set
         """
         self.feature = feature
         self.config = config or MahabharathaConfig.load()
@@ -73,8 +78,10 @@ class MergeCoordinator:
         self.git = GitOps(repo_path)
         self.gates = GateRunner(self.config)
         self._gate_pipeline = gate_pipeline
+        self._gate_cache = gate_cache
         self._current_level: int = 0  # Track level for cache key
 
+    @traced(CAT_GIT, "merge.prepare", record=("level",))
     def prepare_merge(self, level: int, target_branch: str = "main") -> str:
         """Prepare for merge by creating staging branch.
 
@@ -89,6 +96,7 @@ class MergeCoordinator:
         logger.info(f"Created staging branch {staging_branch} from {target_branch}")
         return staging_branch
 
+    @traced(CAT_GATE, "merge.pre_merge_gates")
     def run_pre_merge_gates(
         self,
         cwd: str | Path | None = None,
@@ -130,18 +138,47 @@ class MergeCoordinator:
             logger.info(f"Pre-merge gates: {passed_count} passed, {failed_count} failed")
             return all_passed, results
 
-        # Fallback to uncached execution
-        all_passed, results = self.gates.run_all_gates(
-            gates=required_gates,
-            cwd=cwd,
-            required_only=True,
-        )
+        # Fallback to direct execution (reusing content-addressed results if enabled)
+        all_passed, results = self._run_required_gates(required_gates, cwd)
 
         summary = self.gates.get_summary()
         logger.info(f"Pre-merge gates: {summary['passed']} passed, {summary['failed']} failed")
 
         return all_passed, results
 
+    def _run_required_gates(
+        self,
+        gates: list[QualityGate],
+        cwd: str | Path | None,
+    ) -> tuple[bool, list[GateRunResult]]:
+        """Run required gates, reusing cached passes for an unchanged tree."""
+        tree_sha = clean_tree_sha(cwd or self.repo_path) if self._gate_cache is not None else None
+        if tree_sha is None or self._gate_cache is None:
+            return self.gates.run_all_gates(gates=gates, cwd=cwd, required_only=True)
+
+        cache = self._gate_cache
+        by_name: dict[str, GateRunResult] = {}
+        for gate in gates:
+            hit = cache.get(tree_sha, gate)
+            if hit is not None:
+                by_name[gate.name] = hit
+        misses = [g for g in gates if g.name not in by_name]
+
+        all_passed = True
+        fresh: list[GateRunResult] = []
+        if misses:
+            all_passed, fresh = self.gates.run_all_gates(gates=misses, cwd=cwd, required_only=True)
+        for gate in misses:
+            for result in fresh:
+                if result.gate_name == gate.name:
+                    cache.put(tree_sha, gate, result)
+                    by_name[gate.name] = result
+
+        ordered = [by_name[g.name] for g in gates if g.name in by_name]
+        extra = [r for r in fresh if r not in ordered]  # Plugin gates
+        return all_passed, ordered + extra
+
+    @traced(CAT_GIT, "merge.execute")
     def execute_merge(
         self,
         source_branches: list[str],
@@ -149,6 +186,14 @@ class MergeCoordinator:
     ) -> list[MergeResult]:
         """Merge source branches into staging branch.
 
+        With the ``in_memory`` strategy (default) each branch is merged with
+        ``git merge-tree`` and committed straight into the object store, so
+        the working tree is only checked out once, at the final result.
+        Branches that conflict in memory are then retried with a regular
+        ``git merge`` on top of everything that merged cleanly. The
+        ``sequential`` strategy, or a git without ``merge-tree --write-tree``,
+        merges every branch through the working tree.
+
         Args:
             source_branches: Worker branches to merge
             staging_branch: Target staging branch
@@ -159,6 +204,63 @@ class MergeCoordinator:
         Raises:
             MergeConflictError: If any merge has conflicts
         """
+        if self.config.git.merge.strategy == "in_memory":
+            results = self._merge_in_memory(source_branches, staging_branch)
+            if results is not None:
+                return results
+        return self._merge_sequential(source_branches, staging_branch)
+
+    def _merge_in_memory(
+        self,
+        source_branches: list[str],
+        staging_branch: str,
+    ) -> list[MergeResult] | None:
+        """Merge branches without the working tree; None if unsupported here."""
+        if self.git.current_branch() == staging_branch:
+            return None  # Moving a checked-out ref would desync the working tree
+
+        start = self.git.get_commit(staging_branch)
+        tip = start
+        results: list[MergeResult] = []
+        conflicted: list[str] = []
+
+        for branch in source_branches:
+            merged = self.git.merge_tree(tip, branch)
+            if merged is None:
+                logger.info("git merge-tree --write-tree unavailable, merging sequentially")
+                return None  # Only possible on the first call; nothing written yet
+            if not merged.clean:
+                logger.info(f"{branch} conflicts in memory ({len(merged.conflicting_files)} files), deferring")
+                conflicted.append(branch)
+                continue
+            tip = self.git.commit_tree(
+                merged.tree,
+                [tip, self.git.get_commit(branch)],
+                f"Merge {branch} into {staging_branch}",
+            )
+            results.append(
+                MergeResult(
+                    source_branch=branch,
+                    target_branch=staging_branch,
+                    status=MergeStatus.MERGED,
+                    commit_sha=tip,
+                )
+            )
+            logger.info(f"Merged {branch} in memory: {tip[:8]}")
+
+        if tip != start:
+            self.git.update_branch(staging_branch, tip, expected=start)
+
+        # Leave staging checked out for post-merge gates (and for the fallback)
+        results.extend(self._merge_sequential(conflicted, staging_branch))
+        return results
+
+    def _merge_sequential(
+        self,
+        source_branches: list[str],
+        staging_branch: str,
+    ) -> list[MergeResult]:
+        """Merge branches one at a time through the working tree."""
         results = []
 
         # Checkout staging branch
@@ -196,6 +298,7 @@ class MergeCoordinator:
 
         return results
 
+    @traced(CAT_GATE, "merge.post_merge_gates")
     def run_post_merge_gates(
         self,
         cwd: str | Path | None = None,
@@ -239,18 +342,15 @@ class MergeCoordinator:
             logger.info(f"Post-merge gates: {passed_count} passed, {failed_count} failed")
             return all_passed, results
 
-        # Fallback to uncached execution
-        all_passed, results = self.gates.run_all_gates(
-            gates=required_gates,
-            cwd=cwd,
-            required_only=True,
-        )
+        # Fallback to direct execution (reusing content-addressed results if enabled)
+        all_passed, results = self._run_required_gates(required_gates, cwd)
 
         summary = self.gates.get_summary()
         logger.info(f"Post-merge gates: {summary['passed']} passed, {summary['failed']} failed")
 
         return all_passed, results
 
+    @traced(CAT_GIT, "merge.finalize")
     def finalize(
         self,
         staging_branch: str,
@@ -306,6 +406,7 @@ class MergeCoordinator:
             self.git.checkout("main")  # Switch to main first
             self.git.delete_branch(staging_branch, force=True)
 
+    @traced(CAT_MERGE, "full_merge_flow", record=("level",))
     def full_merge_flow(
         self,
         level: int,
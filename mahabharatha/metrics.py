@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Sequence
+import threading
+import weakref
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from mahabharatha.constants import TaskStatus
 from mahabharatha.logging import get_logger
+from mahabharatha.quantile_sketch import DDSketch
 from mahabharatha.types import (
     FeatureMetrics,
     LevelMetrics,
@@ -85,8 +89,127 @@ def calculate_percentile(values: Sequence[int | float], percentile: float) -> in
     return int(lower_val + fraction * (upper_val - lower_val))
 
 
+# Fields of a task that feed the aggregates: (status, worker_id, level, duration_ms)
+_TaskKey = tuple[Any, Any, Any, Any]
+
+
+@dataclass
+class _Counts:
+    """Running counters for one worker or level."""
+
+    task_count: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_duration_ms: int = 0
+    durations: DDSketch = field(default_factory=DDSketch)  # Completed task durations
+
+
+class MetricsAggregator:
+    """Running task counters folded from state snapshots.
+
+    Each fold compares every task's (status, worker, level, duration) with
+    what was folded last time and applies only the differences, so counts,
+    sums and duration sketches are never rebuilt and every metric read
+    afterwards is O(1) per worker or level. Percentiles come from bounded
+    DDSketch histograms rather than lists of every duration.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, _TaskKey] = {}
+        self._workers: dict[Any, _Counts] = {}
+        self._levels: dict[Any, _Counts] = {}
+        self.tasks_completed = 0
+        self.tasks_failed = 0
+        self.durations = DDSketch()  # Feature-wide completed task durations
+        self._lock = threading.Lock()
+
+    @property
+    def tasks_total(self) -> int:
+        return len(self._tasks)
+
+    def fold(self, tasks: Mapping[str, dict[str, Any]]) -> None:
+        """Bring the counters in line with the current task states.
+
+        Args:
+            tasks: The state's ``tasks`` mapping
+        """
+        with self._lock:
+            for task_id, task_data in tasks.items():
+                key = (
+                    task_data.get("status"),
+                    task_data.get("worker_id"),
+                    task_data.get("level"),
+                    task_data.get("duration_ms"),
+                )
+                old = self._tasks.get(task_id)
+                if old == key:
+                    continue
+                if old is not None:
+                    self._apply(old, -1)
+                self._apply(key, 1)
+                self._tasks[task_id] = key
+            if len(self._tasks) > len(tasks):
+                for task_id in [t for t in self._tasks if t not in tasks]:
+                    self._apply(self._tasks.pop(task_id), -1)
+
+    def _apply(self, key: _TaskKey, sign: int) -> None:
+        status, worker_id, level, duration = key
+        completed = status == TaskStatus.COMPLETE.value
+        failed = status == TaskStatus.FAILED.value
+        self.tasks_completed += sign * completed
+        self.tasks_failed += sign * failed
+        if completed and duration:
+            if sign > 0:
+                self.durations.add(duration)
+            else:
+                self.durations.remove(duration)
+        for group, group_key in ((self._workers, worker_id), (self._levels, level)):
+            if group_key is None:
+                continue
+            counts = group.setdefault(group_key, _Counts())
+            counts.task_count += sign
+            counts.completed += sign * completed
+            counts.failed += sign * failed
+            if completed and duration:
+                counts.total_duration_ms += sign * duration
+                if sign > 0:
+                    counts.durations.add(duration)
+                else:
+                    counts.durations.remove(duration)
+
+    def worker(self, worker_id: int) -> _Counts:
+        """Return the counters for a worker (zeros if it has no tasks)."""
+        return self._workers.get(worker_id) or _Counts()
+
+    def level(self, level: int) -> _Counts:
+        """Return the counters for a level (zeros if it has no tasks)."""
+        return self._levels.get(level) or _Counts()
+
+
+# One aggregator per StateManager, so collectors created per call (status
+# dashboard refreshes, orchestrator status) keep folding incrementally
+_aggregators: weakref.WeakKeyDictionary[Any, MetricsAggregator] = weakref.WeakKeyDictionary()
+_aggregators_lock = threading.Lock()
+
+
+def _aggregator_for(state: Any) -> MetricsAggregator:
+    with _aggregators_lock:
+        try:
+            aggregator = _aggregators.get(state)
+            if aggregator is None:
+                aggregator = _aggregators[state] = MetricsAggregator()
+        except TypeError:  # Not weak-referenceable
+            aggregator = MetricsAggregator()
+    return aggregator
+
+
 class MetricsCollector:
-    """Collect and compute metrics from Mahabharatha execution state."""
+    """Collect and compute metrics from Mahabharatha execution state.
+
+    Task counts, durations and percentiles come from a MetricsAggregator
+    shared by all collectors of the same StateManager, so each computation
+    loads state once and folds only the tasks that changed.
+    """
 
     def __init__(self, state: StateManager) -> None:
         """Initialize metrics collector.
@@ -96,10 +219,12 @@ class MetricsCollector:
         """
         self.state = state
         self._state_data: dict[str, Any] = {}
+        self._aggregator = _aggregator_for(state)
 
     def _refresh_state(self) -> None:
-        """Refresh internal state data from StateManager."""
+        """Refresh internal state data from StateManager and fold task changes."""
         self._state_data = self.state.load()
+        self._aggregator.fold(self._state_data.get("tasks", {}))
 
     def compute_worker_metrics(self, worker_id: int) -> WorkerMetrics:
         """Compute metrics for a single worker.
@@ -111,7 +236,9 @@ class MetricsCollector:
             WorkerMetrics for the worker
         """
         self._refresh_state()
+        return self._worker_metrics(worker_id)
 
+    def _worker_metrics(self, worker_id: int) -> WorkerMetrics:
         worker_data = self._state_data.get("workers", {}).get(str(worker_id), {})
 
         # Calculate initialization time (ready_at - started_at)
@@ -124,40 +251,23 @@ class MetricsCollector:
         if started_at:
             uptime_ms = duration_ms(started_at, datetime.now()) or 0
 
-        # Count completed and failed tasks for this worker
-        tasks_completed = 0
-        tasks_failed = 0
-        total_task_duration_ms = 0
-        task_durations: list[int] = []
-
-        for _task_id, task_data in self._state_data.get("tasks", {}).items():
-            if task_data.get("worker_id") != worker_id:
-                continue
-
-            status = task_data.get("status")
-            if status == TaskStatus.COMPLETE.value:
-                tasks_completed += 1
-                # Get task duration
-                task_duration = task_data.get("duration_ms")
-                if task_duration:
-                    task_durations.append(task_duration)
-                    total_task_duration_ms += task_duration
-            elif status == TaskStatus.FAILED.value:
-                tasks_failed += 1
-
-        # Calculate average
+        counts = self._aggregator.worker(worker_id)
         avg_task_duration_ms = 0.0
-        if task_durations:
-            avg_task_duration_ms = total_task_duration_ms / len(task_durations)
+        if counts.durations.count:
+            avg_task_duration_ms = counts.total_duration_ms / counts.durations.count
 
         return WorkerMetrics(
             worker_id=worker_id,
             initialization_ms=initialization_ms,
             uptime_ms=uptime_ms,
-            tasks_completed=tasks_completed,
-            tasks_failed=tasks_failed,
-            total_task_duration_ms=total_task_duration_ms,
+            tasks_completed=counts.completed,
+            tasks_failed=counts.failed,
+            total_task_duration_ms=counts.total_duration_ms,
             avg_task_duration_ms=avg_task_duration_ms,
+            p50_duration_ms=counts.durations.percentile(50),
+            p90_duration_ms=counts.durations.percentile(90),
+            p99_duration_ms=counts.durations.percentile(99),
+            duration_sketch=counts.durations.to_dict(),
         )
 
     def compute_task_metrics(self, task_id: str) -> TaskMetrics:
@@ -209,7 +319,9 @@ class MetricsCollector:
             LevelMetrics for the level
         """
         self._refresh_state()
+        return self._level_metrics(level)
 
+    def _level_metrics(self, level: int) -> LevelMetrics:
         level_data = self._state_data.get("levels", {}).get(str(level), {})
 
         # Level duration (completed_at - started_at)
@@ -217,46 +329,23 @@ class MetricsCollector:
         completed_at = level_data.get("completed_at")
         level_duration_ms = duration_ms(started_at, completed_at)
 
-        # Count tasks and gather durations for this level
-        task_count = 0
-        completed_count = 0
-        failed_count = 0
-        task_durations: list[int] = []
-
-        # Find tasks for this level by checking task data
-        for _task_id, task_data in self._state_data.get("tasks", {}).items():
-            task_level = task_data.get("level")
-            if task_level != level:
-                continue
-
-            task_count += 1
-            status = task_data.get("status")
-
-            if status == TaskStatus.COMPLETE.value:
-                completed_count += 1
-                duration = task_data.get("duration_ms")
-                if duration:
-                    task_durations.append(duration)
-            elif status == TaskStatus.FAILED.value:
-                failed_count += 1
-
-        # Calculate statistics
+        counts = self._aggregator.level(level)
         avg_task_duration_ms = 0.0
-        if task_durations:
-            avg_task_duration_ms = sum(task_durations) / len(task_durations)
-
-        p50_duration_ms = calculate_percentile(task_durations, 50)
-        p95_duration_ms = calculate_percentile(task_durations, 95)
+        if counts.durations.count:
+            avg_task_duration_ms = counts.total_duration_ms / counts.durations.count
 
         return LevelMetrics(
             level=level,
             duration_ms=level_duration_ms,
-            task_count=task_count,
-            completed_count=completed_count,
-            failed_count=failed_count,
+            task_count=counts.task_count,
+            completed_count=counts.completed,
+            failed_count=counts.failed,
             avg_task_duration_ms=avg_task_duration_ms,
-            p50_duration_ms=p50_duration_ms,
-            p95_duration_ms=p95_duration_ms,
+            p50_duration_ms=counts.durations.percentile(50),
+            p90_duration_ms=counts.durations.percentile(90),
+            p95_duration_ms=counts.durations.percentile(95),
+            p99_duration_ms=counts.durations.percentile(99),
+            duration_sketch=counts.durations.to_dict(),
         )
 
     def compute_feature_metrics(self) -> FeatureMetrics:
@@ -287,20 +376,17 @@ class MetricsCollector:
         workers_data = self._state_data.get("workers", {})
         workers_used = len(workers_data)
 
-        # Count tasks
-        tasks_data = self._state_data.get("tasks", {})
-        tasks_total = len(tasks_data)
-        tasks_completed = sum(1 for t in tasks_data.values() if t.get("status") == TaskStatus.COMPLETE.value)
-        tasks_failed = sum(1 for t in tasks_data.values() if t.get("status") == TaskStatus.FAILED.value)
+        # Task counts (folded by _refresh_state)
+        tasks_total = self._aggregator.tasks_total
+        tasks_completed = self._aggregator.tasks_completed
+        tasks_failed = self._aggregator.tasks_failed
 
         # Count completed levels
         levels_completed = sum(1 for lvl in all_levels.values() if lvl.get("status") == "complete")
 
-        # Compute per-worker metrics
-        worker_metrics = [self.compute_worker_metrics(int(wid)) for wid in workers_data]
-
-        # Compute per-level metrics
-        level_metrics = [self.compute_level_metrics(int(lvl)) for lvl in all_levels]
+        # Per-worker and per-level metrics from the same snapshot
+        worker_metrics = [self._worker_metrics(int(wid)) for wid in workers_data]
+        level_metrics = [self._level_metrics(int(lvl)) for lvl in all_levels]
 
         return FeatureMetrics(
             computed_at=now,
@@ -312,6 +398,10 @@ class MetricsCollector:
             levels_completed=levels_completed,
             worker_metrics=worker_metrics,
             level_metrics=level_metrics,
+            p50_duration_ms=self._aggregator.durations.percentile(50),
+            p90_duration_ms=self._aggregator.durations.percentile(90),
+            p99_duration_ms=self._aggregator.durations.percentile(99),
+            duration_sketch=self._aggregator.durations.to_dict(),
         )
 
     def export_json(self, path: str | Path) -> None:
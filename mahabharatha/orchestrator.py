@@ -24,7 +24,9 @@ from mahabharatha.constants import (
 )
 from mahabharatha.containers import ContainerManager
 from mahabharatha.context_plugin import ContextEngineeringPlugin
+from mahabharatha.dispatch import DispatchServer
 from mahabharatha.event_emitter import EventEmitter
+from mahabharatha.gate_cache import GateResultCache
 from mahabharatha.gates import GateRunner
 from mahabharatha.governance import GovernanceService
 from mahabharatha.knowledge import KnowledgeService
@@ -49,9 +51,12 @@ from mahabharatha.plugin_config import ContextEngineeringConfig
 from mahabharatha.plugins import LifecycleEvent, PluginRegistry
 from mahabharatha.ports import PortAllocator
 from mahabharatha.state import StateManager
+from mahabharatha.state.backends import pin_backend
+from mahabharatha.state.lock_profile import reset_lock_profile
 from mahabharatha.state_sync_service import StateSyncService
 from mahabharatha.task_retry_manager import TaskRetryManager
 from mahabharatha.task_sync import TaskSyncBridge
+from mahabharatha.tracing import configure_tracing
 from mahabharatha.types import WorkerAssignments, WorkerState
 from mahabharatha.worker_manager import WorkerManager
 from mahabharatha.worker_registry import WorkerRegistry
@@ -59,6 +64,14 @@ from mahabharatha.worktree import WorktreeManager
 
 logger = get_logger("orchestrator")
 
+# How often the event loop checks the state files for worker writes
+STATE_WATCH_INTERVAL = 0.25
+
+# State files workers write under each backend (JSON snapshot, journal WAL,
+# SQLite database and its WAL). The feature's ``.lock`` file is left out:
+# every state read touches it, so watching it would wake the loop on reads.
+_WATCHED_STATE_SUFFIXES = (".json", ".wal", ".db", ".db-wal")
+
 
 def _now() -> datetime:
     return datetime.now()
@@ -92,6 +105,9 @@ class Orchestrator:
             if ctx_cfg.enabled:
                 self._plugin_registry.register_context_plugin(ContextEngineeringPlugin(ctx_cfg))
 
+        if hasattr(self.config, "state"):
+            # Workers may read a different (committed) config: pin the backend for them
+            pin_backend(feature, None, self.config.state.backend)
         self.state = StateManager(feature)
         self.event_emitter = EventEmitter(feature, state_dir=self.repo_path / ".mahabharatha" / "state")
         self.levels = LevelController()
@@ -104,7 +120,8 @@ class Orchestrator:
         self.knowledge = KnowledgeService(self.repo_path)
         self.governance = GovernanceService(self.state)
         self.assigner: WorkerAssignment | None = None
-        self.merger = MergeCoordinator(feature, self.config, self.repo_path)
+        self._gate_cache = GateResultCache.from_config(self.config)
+        self.merger = MergeCoordinator(feature, self.config, self.repo_path, gate_cache=self._gate_cache)
         tl_id = os.environ.get("CLAUDE_CODE_TASK_LIST_ID", feature)
         self.task_sync = TaskSyncBridge(feature, self.state, task_list_id=tl_id)
         self._launcher_config = LauncherConfigurator(self.config, self.repo_path, self._plugin_registry)
@@ -125,7 +142,13 @@ class Orchestrator:
             self._structured_writer = setup_structured_logging(
                 log_dir=self.repo_path / Path(lc.directory), worker_id="orchestrator",
                 feature=feature, level=lc.level, max_size_mb=lc.max_log_size_mb,
+                buffered=lc.buffered_output, flush_interval_ms=lc.flush_interval_ms,
+                flush_batch_size=lc.flush_batch_size,
             )
+            if lc.tracing:
+                configure_tracing(
+                    self.repo_path / Path(lc.directory), feature, "orchestrator", buffer_size=lc.trace_buffer_size
+                )
         except Exception:  # noqa: BLE001 — intentional: structured logging setup is non-critical
             pass  # Structured logging setup non-critical
 
@@ -137,6 +160,9 @@ class Orchestrator:
         self._on_level_complete: list[Callable[[int], None]] = [
             lambda lvl: self.event_emitter.emit("level_complete", {"level": lvl})]
         self._poll_interval = 15
+        self._monitor_interval = 2.0
+        self._wake = asyncio.Event()
+        self._state_signature: tuple[tuple[str, int, int], ...] = ()
         self._max_retry_attempts = self.config.workers.retry_attempts
         self._restart_counts: dict[int, int] = {}
         self._respawn_counts: dict[int, int] = {}
@@ -146,6 +172,9 @@ class Orchestrator:
             repo_path=self.repo_path, structured_writer=self._structured_writer,
         )
         self._state_sync = StateSyncService(state=self.state, levels=self.levels)
+        self._dispatch: DispatchServer | None = None
+        if getattr(self.config.workers, "task_dispatch", False):
+            self._dispatch = DispatchServer(feature, state_dir=self.repo_path / ".mahabharatha" / "state")
         er = self.config.error_recovery
         self._circuit_breaker = CircuitBreaker(
             failure_threshold=er.circuit_breaker.failure_threshold,
@@ -169,6 +198,7 @@ class Orchestrator:
             plugin_registry=self._plugin_registry, workers=self.registry,
             on_level_complete_callbacks=self._on_level_complete, assigner=self.assigner,
             structured_writer=self._structured_writer, backpressure=self._backpressure,
+            recycle_worker=self._worker_manager.terminate_worker,
         )
 
         self._loop_controller: LoopController | None = None
@@ -183,6 +213,7 @@ class Orchestrator:
             self._gate_pipeline = GatePipeline(
                 gate_runner=self.gates, artifacts_dir=Path(self.config.verification.artifact_dir),
                 staleness_threshold_seconds=self._capabilities.staleness_threshold,
+                result_cache=self._gate_cache,
             )
             self.merger._gate_pipeline = self._gate_pipeline
         self._mode_context: ModeContext | None = None
@@ -223,6 +254,8 @@ class Orchestrator:
                 config=cfg, image_name=self._launcher_config._get_worker_image_name(),
                 memory_limit=self.config.resources.container_memory_limit,
                 cpu_limit=self.config.resources.container_cpu_limit,
+                watch_events=self.config.resources.container_event_watch,
+                warm_pool_size=self.config.resources.container_warm_pool,
             )
             if not launcher.ensure_network():
                 if mode == "container":
@@ -257,24 +290,30 @@ class Orchestrator:
         )
         self.levels.reset_task(task_id)
         self.state.set_task_status(task_id, TaskStatus.PENDING)
+        self._publish_ready_tasks()
 
     def _auto_respawn_workers(self, level: int, remaining: int) -> None:
-        max_r = getattr(self.config.workers, "max_respawn_attempts", 5)
         if not getattr(self.config.workers, "auto_respawn", True):
             return
         spawned = 0
-        for wid in range(min(remaining, self._target_worker_count or 1)):
-            rc = self._respawn_counts.get(wid, 0)
-            if rc >= max_r:
-                continue
+        for wid in self._auto_respawn_ids(remaining):
             with contextlib.suppress(Exception):
-                self._respawn_counts[wid] = rc + 1
                 self._worker_manager.spawn_worker(wid)
                 spawned += 1
                 self.state.append_event("worker_auto_respawn", {"worker_id": wid, "level": level})
         if spawned == 0 and remaining > 0:
             self.state.append_event("auto_respawn_exhausted", {"level": level})
 
+    def _auto_respawn_ids(self, remaining: int) -> list[int]:
+        max_r = getattr(self.config.workers, "max_respawn_attempts", 5)
+        ids = []
+        for wid in range(min(remaining, self._target_worker_count or 1)):
+            rc = self._respawn_counts.get(wid, 0)
+            if rc < max_r:
+                self._respawn_counts[wid] = rc + 1
+                ids.append(wid)
+        return ids
+
     def _reassign_stranded_tasks(self) -> None:
         active = {int(k) for k, v in self.state._state.get("workers", {}).items()
                   if v.get("status") not in ("stopped", "crashed")}
@@ -295,8 +334,18 @@ class Orchestrator:
 
         self._level_coord.assigner = self.assigner
         self._level_coord.start_level(level)
+        self._publish_ready_tasks()
         self.event_emitter.emit("level_start", {"level": level})
 
+    def _publish_ready_tasks(self) -> None:
+        """Sync the dispatch queue with PENDING tasks so idle workers wake immediately."""
+        if self._dispatch is None or not self._dispatch.running:
+            return
+        tasks = self.state._state.get("tasks", {})
+        self._dispatch.reconcile(
+            (tid, t.get("worker_id")) for tid, t in tasks.items() if t.get("status") == TaskStatus.PENDING.value
+        )
+
     def _on_level_complete_handler(self, level: int) -> bool:
         # 1. Charter Enforcement Audit
         if not self._run_charter_audit(level):
@@ -397,6 +446,10 @@ class Orchestrator:
     def _spawn_and_begin(self, worker_count: int, start_level: int | None) -> None:
         self._running = self._worker_manager.running = True
         self._target_worker_count = worker_count
+        # Lock contention is reported per run: drop profiles left by earlier runs
+        reset_lock_profile(self.repo_path / ".mahabharatha" / "state", self.feature)
+        if self._dispatch is not None:
+            self._dispatch.start()
         spawned = self._worker_manager.spawn_workers(worker_count)
         if spawned == 0:
             self.state.append_event("rush_failed", {
@@ -404,6 +457,7 @@ class Orchestrator:
                 "requested": worker_count, "mode": self._launcher_mode,
             })
             self.state.save()
+            self._stop_dispatch()
             msg = f"All {worker_count} workers failed to spawn (mode={self._launcher_mode})."
             raise RuntimeError(msg)
         self._worker_manager.wait_for_initialization(timeout=600)
@@ -429,16 +483,31 @@ class Orchestrator:
             self._print_plan(assignments)
             return
         self._spawn_and_begin(worker_count, start_level)
-        self._main_loop()
+        self._run_main_loop()
 
     def _do_stop(self, force: bool = False) -> None:
         self._running = False
         self._worker_manager.running = False
         for wid in list(self._workers.keys()):
             self._worker_manager.terminate_worker(wid, force=force)
+        self.launcher.close()
+        self._stop_dispatch()
         self.ports.release_all()
         self.state.append_event("rush_stopped", {"force": force})
 
+    def _live_workers(self) -> list[int]:
+        """Workers still running once the feature is done (idle persistent workers)."""
+        ended = (WorkerStatus.STOPPED, WorkerStatus.CRASHED)
+        return [wid for wid, w in self._workers.items() if w.status not in ended]
+
+    def _stop_live_workers(self) -> None:
+        for wid in self._live_workers():
+            self._worker_manager.terminate_worker(wid)
+
+    def _stop_dispatch(self) -> None:
+        if self._dispatch is not None:
+            self._dispatch.stop()
+
     def stop(self, force: bool = False) -> None:
         self._do_stop(force)
         self.state.save()
@@ -480,6 +549,7 @@ class Orchestrator:
             try:
                 self._poll_workers()
                 self._retry_manager.check_retry_ready_tasks()
+                self._publish_ready_tasks()
                 cur = self.levels.current_level
                 if cur > 0 and cur not in handled and self.levels.is_level_resolved(cur):
                     handled.add(cur)
@@ -492,6 +562,7 @@ class Orchestrator:
                             self._worker_manager.respawn_workers_for_level(nxt)
                     elif self.levels.get_status()["is_complete"]:
                         self._running = False
+                        self._stop_live_workers()
                         break
                 ended = (WorkerStatus.STOPPED, WorkerStatus.CRASHED)
                 active = [w for _, w in self.registry.items()
@@ -508,18 +579,31 @@ class Orchestrator:
                 self.state.set_error(str(e))
                 self.stop(force=True)
                 raise
+        self._stop_dispatch()
         with contextlib.suppress(Exception):
             self._plugin_registry.emit_event(
                 LifecycleEvent(event_type=PluginHookEvent.RUSH_FINISHED.value, data={"feature": self.feature}))
 
     def _poll_workers(self) -> None:
+        self._refresh_state()
+        self.launcher.sync_state()
+        self._check_worker_health()
+        done = (WorkerStatus.STOPPED, WorkerStatus.CRASHED)
+        for wid, worker in list(self._workers.items()):
+            if worker.status in done:
+                continue
+            if self._apply_worker_status(wid, worker, self.launcher.monitor(wid)):
+                self._worker_manager.handle_worker_exit(wid)
+            worker.health_check_at = _now()
+
+    def _refresh_state(self) -> None:
         self.state.load()
         self._state_sync.sync_from_disk()
         self._reassign_stranded_tasks()
         self._check_container_health()
         self.task_sync.sync_state()
-        self.launcher.sync_state()
 
+    def _check_worker_health(self) -> None:
         # Governance Pulse Check (Peer Monitoring)
         stalled = self.governance.run_pulse_check(list(self._workers.keys()))
         for wid in stalled:
@@ -542,27 +626,23 @@ class Orchestrator:
                   for wid, wp in ProgressReporter.read_all().items()}
             self.state._state.setdefault("worker_progress", {}).update(ps)
         self._check_stale_tasks()
-        done = (WorkerStatus.STOPPED, WorkerStatus.CRASHED)
-        for wid, worker in list(self._workers.items()):
-            if worker.status in done:
-                continue
-            st = self.launcher.monitor(wid)
-            need_exit = st in (WorkerStatus.STALLED, WorkerStatus.CRASHED,
-                               WorkerStatus.CHECKPOINTING, WorkerStatus.STOPPED)
-            if need_exit:
-                worker.status = st
-                self.state.set_worker_state(worker)
-            if st == WorkerStatus.STALLED:
-                rc = self._restart_counts.get(wid, 0)
-                if rc < self.config.heartbeat.max_restarts:
-                    self._restart_counts[wid] = rc + 1
-                elif worker.current_task:
-                    self._handle_task_failure(worker.current_task, wid, "Worker stalled repeatedly")
-            elif st == WorkerStatus.CRASHED and worker.current_task:
-                self._handle_worker_crash(worker.current_task, wid)
-            if need_exit:
-                self._worker_manager.handle_worker_exit(wid)
-            worker.health_check_at = _now()
+
+    def _apply_worker_status(self, wid: int, worker: WorkerState, st: WorkerStatus) -> bool:
+        """Record a monitored status; returns True when the worker has exited."""
+        need_exit = st in (WorkerStatus.STALLED, WorkerStatus.CRASHED,
+                           WorkerStatus.CHECKPOINTING, WorkerStatus.STOPPED)
+        if need_exit:
+            worker.status = st
+            self.state.set_worker_state(worker)
+        if st == WorkerStatus.STALLED:
+            rc = self._restart_counts.get(wid, 0)
+            if rc < self.config.heartbeat.max_restarts:
+                self._restart_counts[wid] = rc + 1
+            elif worker.current_task:
+                self._handle_task_failure(worker.current_task, wid, "Worker stalled repeatedly")
+        elif st == WorkerStatus.CRASHED and worker.current_task:
+            self._handle_worker_crash(worker.current_task, wid)
+        return need_exit
 
     _poll_workers_sync = _poll_workers
 
@@ -577,7 +657,10 @@ class Orchestrator:
             self._print_plan(assignments)
             return
         self._spawn_and_begin(worker_count, start_level)
-        await asyncio.to_thread(self._main_loop)
+        if self.config.workers.event_loop:
+            await self._run_event_loop()
+        else:
+            await asyncio.to_thread(self._main_loop)
 
     def start_sync(
         self, task_graph_path: str | Path, worker_count: int = 5,
@@ -597,6 +680,135 @@ class Orchestrator:
     async def _main_loop_as_async(self) -> None:
         await asyncio.to_thread(self._main_loop)
 
+    def _run_main_loop(self) -> None:
+        if not self.config.workers.event_loop:
+            self._main_loop()
+            return
+        try:
+            asyncio.run(self._run_event_loop())
+        except KeyboardInterrupt:
+            self.stop()
+
+    async def _run_event_loop(self) -> None:
+        """Event-driven main loop; the asyncio counterpart of ``_main_loop``.
+
+        Worker monitoring, health checks and state watching run as separate
+        tasks. Level bookkeeping runs whenever one of them wakes the loop
+        (a worker wrote state, a worker exited) and at least every
+        ``_poll_interval`` seconds, so finished tasks are picked up within
+        ``STATE_WATCH_INTERVAL`` instead of the next poll.
+        """
+        self._wake = asyncio.Event()
+        concerns = [asyncio.create_task(c) for c in
+                    (self._watch_state_files(), self._watch_workers(), self._watch_health())]
+        handled: set[int] = set()
+        try:
+            while self._running:
+                self._refresh_state()
+                self._retry_manager.check_retry_ready_tasks()
+                self._publish_ready_tasks()
+                self._state_signature = self._read_state_signature()
+                if not await self._advance_level_async(handled):
+                    break
+                await self._wait_for_wake(self._poll_interval)
+        except Exception as e:  # noqa: BLE001 — intentional: main loop fatal; records error and force-stops
+            self.state.set_error(str(e))
+            self.stop(force=True)
+            raise
+        finally:
+            for task in concerns:
+                task.cancel()
+            await asyncio.gather(*concerns, return_exceptions=True)
+        self._stop_dispatch()
+        with contextlib.suppress(Exception):
+            self._plugin_registry.emit_event(
+                LifecycleEvent(event_type=PluginHookEvent.RUSH_FINISHED.value, data={"feature": self.feature}))
+
+    async def _advance_level_async(self, handled: set[int]) -> bool:
+        """Merge a resolved level and start the next; returns False once everything is done."""
+        cur = self.levels.current_level
+        if cur > 0 and cur not in handled and self.levels.is_level_resolved(cur):
+            handled.add(cur)
+            # Merge and quality gates block; keep the watchers and worker I/O running meanwhile
+            if not await asyncio.to_thread(self._on_level_complete_handler, cur):
+                return True
+            if self.levels.can_advance():
+                nxt = self.levels.advance_level()
+                if nxt:
+                    self._start_level(nxt)
+                    await self._worker_manager.respawn_workers_for_level_async(nxt)
+            elif self.levels.get_status()["is_complete"]:
+                self._running = False
+                wm = self._worker_manager
+                await asyncio.gather(*(wm.terminate_worker_async(wid) for wid in self._live_workers()))
+                return False
+        ended = (WorkerStatus.STOPPED, WorkerStatus.CRASHED)
+        if self._running and not [w for _, w in self.registry.items() if w.status not in ended]:
+            rem = self.levels.get_pending_tasks_for_level(cur)
+            if rem:
+                await self._auto_respawn_workers_async(cur, len(rem))
+        return True
+
+    async def _wait_for_wake(self, timeout: float) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        self._wake.clear()
+
+    async def _watch_state_files(self) -> None:
+        """Wake the loop when a worker writes the feature's state files."""
+        while self._running:
+            await asyncio.sleep(STATE_WATCH_INTERVAL)
+            if self._read_state_signature() != self._state_signature:
+                self._wake.set()
+
+    def _read_state_signature(self) -> tuple[tuple[str, int, int], ...]:
+        state_dir = self.repo_path / ".mahabharatha" / "state"
+        signature = []
+        for suffix in _WATCHED_STATE_SUFFIXES:
+            name = f"{self.feature}{suffix}"
+            try:
+                st = os.stat(state_dir / name)
+            except OSError:
+                continue
+            signature.append((name, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    async def _watch_workers(self) -> None:
+        """Monitor all workers concurrently and handle exits as they happen."""
+        done = (WorkerStatus.STOPPED, WorkerStatus.CRASHED)
+        while self._running:
+            ids = [wid for wid, w in self._workers.items() if w.status not in done]
+            statuses = await asyncio.gather(*(asyncio.to_thread(self.launcher.monitor, wid) for wid in ids))
+            for wid, st in zip(ids, statuses, strict=True):
+                worker = self._workers.get(wid)
+                if worker is None:
+                    continue
+                if st in (WorkerStatus.RUNNING, WorkerStatus.READY, WorkerStatus.IDLE):
+                    self._worker_manager.mark_ready(wid, worker, st)
+                elif self._apply_worker_status(wid, worker, st):
+                    await self._worker_manager.handle_worker_exit_async(wid)
+                    self._wake.set()
+                worker.health_check_at = _now()
+            await asyncio.sleep(self._monitor_interval)
+
+    async def _watch_health(self) -> None:
+        """Heartbeats, escalations, progress and stale tasks on the poll interval."""
+        while self._running:
+            await asyncio.sleep(self._poll_interval)
+            self._check_worker_health()
+
+    async def _auto_respawn_workers_async(self, level: int, remaining: int) -> None:
+        if not getattr(self.config.workers, "auto_respawn", True):
+            return
+        spawned = 0
+        for wid in self._auto_respawn_ids(remaining):
+            with contextlib.suppress(Exception):
+                await self._worker_manager.spawn_worker_async(wid)
+                spawned += 1
+                self.state.append_event("worker_auto_respawn", {"worker_id": wid, "level": level})
+        if spawned == 0 and remaining > 0:
+            self.state.append_event("auto_respawn_exhausted", {"level": level})
+
     def on_task_complete(self, cb: Callable[[str], None]) -> None:
         self._on_task_complete.append(cb)
 
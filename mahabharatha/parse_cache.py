@@ -0,0 +1,533 @@
+"""Process-wide parse cache shared by every consumer of Python source structure.
+
+Each file is parsed at most once per content. A parse keeps the tree in a small
+in-memory LRU for consumers that need the full AST, and derives a compact
+:class:`FileSummary` (imports, top-level definitions with signatures and
+docstrings, module-level assignments) that most consumers work from instead.
+
+Summaries live in a larger in-memory LRU and, inside an initialised project,
+in ``.mahabharatha/state/parse-cache.db`` keyed on (path, mtime, size, content
+hash). Later processes are served from there without reading the file at all
+while its stat is unchanged, and without re-parsing while its content is.
+
+Consumers: repo_map, ASTCache (analyze checkers, architecture gate), doc_engine
+(extractor, detector, dependencies), test_scope and diagnostics.code_fixer.
+"""
+
+from __future__ import annotations
+
+import ast
+import atexit
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mahabharatha.constants import STATE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever FileSummary's layout changes; rows of other versions are ignored
+SCHEMA_VERSION = 1
+
+DB_NAME = "parse-cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    written REAL NOT NULL,
+    summary TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class ParamRecord:
+    """A function parameter."""
+
+    name: str
+    kind: str  # "posonly", "arg", "vararg", "kwonly", "kwarg"
+    annotation: str | None = None
+
+
+@dataclass
+class DefRecord:
+    """A module-level function or class, or a method of a module-level class."""
+
+    kind: str  # "function" or "class"
+    name: str
+    line: int
+    docstring: str | None  # raw, as written in the source
+    decorators: list[str] = field(default_factory=list)
+    is_async: bool = False
+    params: list[ParamRecord] = field(default_factory=list)  # source order
+    returns: str | None = None
+    bases: list[str] = field(default_factory=list)
+    methods: list[DefRecord] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DefRecord:
+        return cls(
+            **{
+                **data,
+                "params": [ParamRecord(**p) for p in data["params"]],
+                "methods": [cls.from_dict(m) for m in data["methods"]],
+            }
+        )
+
+
+@dataclass
+class ImportRecord:
+    """An ``import`` or ``from ... import`` statement anywhere in the file."""
+
+    is_from: bool
+    module: str | None  # ``from`` statements only; None for ``from . import x``
+    names: list[tuple[str, str | None]]  # (name, asname)
+    level: int
+    line: int
+    top_level: bool
+
+
+@dataclass
+class AssignRecord:
+    """A module-level assignment to a plain name."""
+
+    name: str
+    line: int
+    annotation: str | None = None  # set for annotated assignments only
+
+
+@dataclass
+class FileSummary:
+    """Compact structure of one Python file, as served by :class:`ParseCache`."""
+
+    path: str
+    docstring: str | None = None
+    imports: list[ImportRecord] = field(default_factory=list)  # ast.walk order
+    defs: list[DefRecord] = field(default_factory=list)  # source order
+    assigns: list[AssignRecord] = field(default_factory=list)  # source order
+    statements: int = 0  # top-level statements other than imports
+    error: str | None = None  # set when the file does not parse
+
+    def exports(self) -> list[str]:
+        """Public module-level function and class names (as ``ast_cache.collect_exports``)."""
+        return [d.name for d in self.defs if not d.name.startswith("_")]
+
+    def import_pairs(self) -> list[tuple[str, str | None]]:
+        """``(module, name)`` per imported name (as ``ast_cache.collect_imports``)."""
+        pairs: list[tuple[str, str | None]] = []
+        for imp in self.imports:
+            if imp.is_from:
+                pairs.extend((imp.module or "", name) for name, _ in imp.names)
+            else:
+                pairs.extend((name, None) for name, _ in imp.names)
+        return pairs
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FileSummary:
+        return cls(
+            path=data["path"],
+            docstring=data["docstring"],
+            imports=[ImportRecord(**{**i, "names": [tuple(n) for n in i["names"]]}) for i in data["imports"]],
+            defs=[DefRecord.from_dict(d) for d in data["defs"]],
+            assigns=[AssignRecord(**a) for a in data["assigns"]],
+            statements=data["statements"],
+            error=data["error"],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Summarising
+# ---------------------------------------------------------------------------
+
+
+def _unparse(node: ast.AST) -> str:
+    """Source text of an AST node."""
+    try:
+        return ast.unparse(node)
+    except Exception:  # noqa: BLE001 — intentional: best-effort AST unparse; returns placeholder on failure
+        return "<unknown>"
+
+
+def _raw_docstring(node: ast.Module | ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef) -> str | None:
+    """Docstring of a node exactly as written (not cleaned)."""
+    if node.body and isinstance(node.body[0], ast.Expr):
+        value = node.body[0].value
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return value.value
+    return None
+
+
+def _params(args: ast.arguments) -> list[ParamRecord]:
+    """Parameters of a function in source order."""
+
+    def param(arg: ast.arg, kind: str) -> ParamRecord:
+        return ParamRecord(arg.arg, kind, _unparse(arg.annotation) if arg.annotation else None)
+
+    params = [param(a, "posonly") for a in args.posonlyargs]
+    params.extend(param(a, "arg") for a in args.args)
+    if args.vararg:
+        params.append(param(args.vararg, "vararg"))
+    params.extend(param(a, "kwonly") for a in args.kwonlyargs)
+    if args.kwarg:
+        params.append(param(args.kwarg, "kwarg"))
+    return params
+
+
+def _function(node: ast.FunctionDef | ast.AsyncFunctionDef) -> DefRecord:
+    return DefRecord(
+        kind="function",
+        name=node.name,
+        line=node.lineno,
+        docstring=_raw_docstring(node),
+        decorators=[_unparse(d) for d in node.decorator_list],
+        is_async=isinstance(node, ast.AsyncFunctionDef),
+        params=_params(node.args),
+        returns=_unparse(node.returns) if node.returns else None,
+    )
+
+
+def summarize(tree: ast.Module, path: str) -> FileSummary:
+    """Build the :class:`FileSummary` of a parsed module."""
+    summary = FileSummary(path=path, docstring=_raw_docstring(tree))
+    top_level_imports: set[int] = set()
+
+    for node in tree.body:
+        if isinstance(node, ast.Import | ast.ImportFrom):
+            top_level_imports.add(id(node))
+            continue
+        summary.statements += 1
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            summary.defs.append(_function(node))
+        elif isinstance(node, ast.ClassDef):
+            summary.defs.append(
+                DefRecord(
+                    kind="class",
+                    name=node.name,
+                    line=node.lineno,
+                    docstring=_raw_docstring(node),
+                    decorators=[_unparse(d) for d in node.decorator_list],
+                    bases=[_unparse(b) for b in node.bases],
+                    methods=[_function(c) for c in node.body if isinstance(c, ast.FunctionDef | ast.AsyncFunctionDef)],
+                )
+            )
+        elif isinstance(node, ast.Assign):
+            summary.assigns.extend(
+                AssignRecord(target.id, node.lineno) for target in node.targets if isinstance(target, ast.Name)
+            )
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            summary.assigns.append(AssignRecord(node.target.id, node.lineno, _unparse(node.annotation)))
+
+    for child in ast.walk(tree):
+        if isinstance(child, ast.Import | ast.ImportFrom):
+            is_from = isinstance(child, ast.ImportFrom)
+            summary.imports.append(
+                ImportRecord(
+                    is_from=is_from,
+                    module=child.module if isinstance(child, ast.ImportFrom) else None,
+                    names=[(alias.name, alias.asname) for alias in child.names],
+                    level=child.level if isinstance(child, ast.ImportFrom) else 0,
+                    line=child.lineno,
+                    top_level=id(child) in top_level_imports,
+                )
+            )
+
+    return summary
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()  # noqa: S324 — used for change detection, not security
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class ParseCache:
+    """Two-tier cache of parsed Python files.
+
+    Args:
+        state_dir: Directory holding the persistent tier (``parse-cache.db``).
+            ``None`` keeps everything in memory.
+        max_summaries: Size of the in-memory summary LRU.
+        max_trees: Size of the in-memory AST LRU; trees are large, so it is
+            kept small.
+    """
+
+    MAX_PERSISTED = 50_000  # rows kept in the persistent tier, oldest written first out
+    FLUSH_EVERY = 256  # pending rows that trigger a write
+
+    def __init__(
+        self,
+        state_dir: str | Path | None = None,
+        max_summaries: int = 4096,
+        max_trees: int = 128,
+    ) -> None:
+        self._db_path = Path(state_dir).resolve() / DB_NAME if state_dir is not None else None
+        self._max_summaries = max_summaries
+        self._max_trees = max_trees
+        self._summaries: OrderedDict[str, tuple[int, int, str, FileSummary]] = OrderedDict()
+        self._trees: OrderedDict[str, tuple[int, int, ast.Module]] = OrderedDict()
+        self._pending: dict[str, tuple[Any, ...]] = {}
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._parses = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+
+    # -- public API ----------------------------------------------------------
+
+    def summary(self, path: str | Path) -> FileSummary:
+        """Return the summary of a Python file, parsing it only if its content changed.
+
+        A file that does not parse yields a summary with ``error`` set.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        with self._lock:
+            cached = self._summaries.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                self._summaries.move_to_end(key)
+                self._memory_hits += 1
+                return cached[3]
+
+        row = self._load_row(key)
+        if row is not None and tuple(row[:2]) == (st.st_mtime_ns, st.st_size):
+            return self._from_row(key, st, row, refresh=False)
+
+        data = Path(key).read_bytes()
+        digest = _digest(data)
+        if cached is not None and cached[2] == digest:
+            # Touched but unchanged — keep the summary under the new stat
+            self._remember(key, st, digest, cached[3])
+            self._queue(key, st, digest, cached[3])
+            return cached[3]
+        if row is not None and row[2] == digest:
+            return self._from_row(key, st, row, refresh=True)
+
+        _tree, summary, _error = self._parse(key, st, data, digest)
+        return summary
+
+    def tree(self, path: str | Path) -> ast.Module:
+        """Return the AST of a Python file; parsing also refreshes its summary.
+
+        Raises:
+            OSError: If the file cannot be read.
+            SyntaxError: If the file does not parse.
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        with self._lock:
+            cached = self._trees.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                self._trees.move_to_end(key)
+                self._memory_hits += 1
+                return cached[2]
+
+        data = Path(key).read_bytes()
+        tree, _summary, error = self._parse(key, st, data, _digest(data))
+        if tree is None:
+            raise error or SyntaxError(f"cannot parse {key}")
+        return tree
+
+    def flush(self) -> None:
+        """Write pending summaries to the persistent tier."""
+        with self._lock:
+            if not self._pending:
+                return
+            rows = list(self._pending.values())
+            self._pending.clear()
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                (count,) = conn.execute("SELECT COUNT(*) FROM summaries").fetchone()
+                if count > self.MAX_PERSISTED:
+                    conn.execute(
+                        "DELETE FROM summaries WHERE path IN (SELECT path FROM summaries ORDER BY written LIMIT ?)",
+                        (count - self.MAX_PERSISTED,),
+                    )
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                logger.debug("Failed to persist %d parse summaries: %s", len(rows), e)
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass  # No transaction was open
+
+    def clear(self) -> None:
+        """Drop the in-memory tiers (the persistent tier is kept)."""
+        with self._lock:
+            self._summaries.clear()
+            self._trees.clear()
+
+    def close(self) -> None:
+        """Flush pending summaries and close the database connection."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    def stats(self) -> dict[str, int]:
+        """Parses performed and summaries served from memory or disk."""
+        with self._lock:
+            return {
+                "parses": self._parses,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "summaries": len(self._summaries),
+                "trees": len(self._trees),
+            }
+
+    # -- internals -----------------------------------------------------------
+
+    def _parse(
+        self, key: str, st: os.stat_result, data: bytes, digest: str
+    ) -> tuple[ast.Module | None, FileSummary, Exception | None]:
+        """Parse *data* once, caching both the tree and its summary."""
+        try:
+            tree = ast.parse(data, filename=key)
+        except (SyntaxError, ValueError) as e:
+            summary = FileSummary(path=key, error=f"{type(e).__name__}: {e}")
+            self._remember(key, st, digest, summary)
+            self._queue(key, st, digest, summary)
+            with self._lock:
+                self._parses += 1
+            return None, summary, e
+
+        summary = summarize(tree, key)
+        self._remember(key, st, digest, summary)
+        self._queue(key, st, digest, summary)
+        with self._lock:
+            self._parses += 1
+            self._trees[key] = (st.st_mtime_ns, st.st_size, tree)
+            self._trees.move_to_end(key)
+            while len(self._trees) > self._max_trees:
+                self._trees.popitem(last=False)
+        return tree, summary, None
+
+    def _remember(self, key: str, st: os.stat_result, digest: str, summary: FileSummary) -> None:
+        with self._lock:
+            self._summaries[key] = (st.st_mtime_ns, st.st_size, digest, summary)
+            self._summaries.move_to_end(key)
+            while len(self._summaries) > self._max_summaries:
+                self._summaries.popitem(last=False)
+
+    def _from_row(self, key: str, st: os.stat_result, row: tuple[Any, ...], refresh: bool) -> FileSummary:
+        summary = FileSummary.from_dict(json.loads(row[3]))
+        self._remember(key, st, row[2], summary)
+        if refresh:
+            self._queue(key, st, row[2], summary)
+        with self._lock:
+            self._disk_hits += 1
+        return summary
+
+    def _queue(self, key: str, st: os.stat_result, digest: str, summary: FileSummary) -> None:
+        """Stage a row for the persistent tier; written in batches."""
+        if self._db_path is None:
+            return
+        row = (
+            key,
+            st.st_mtime_ns,
+            st.st_size,
+            digest,
+            SCHEMA_VERSION,
+            time.time(),
+            json.dumps(summary.to_dict(), separators=(",", ":")),
+        )
+        with self._lock:
+            self._pending[key] = row
+            full = len(self._pending) >= self.FLUSH_EVERY
+        if full:
+            self.flush()
+
+    def _load_row(self, key: str) -> tuple[Any, ...] | None:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row: tuple[Any, ...] | None = conn.execute(
+                    "SELECT mtime_ns, size, hash, summary FROM summaries WHERE path = ? AND version = ?",
+                    (key, SCHEMA_VERSION),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug("Parse cache lookup failed for %s: %s", key, e)
+                return None
+            return row
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """Per-process connection to the persistent tier, or None when it is disabled. Caller holds the lock."""
+        if self._db_path is None:
+            return None
+        if self._conn is None or self._conn_pid != os.getpid():
+            try:
+                conn = sqlite3.connect(self._db_path, timeout=5.0, isolation_level=None, check_same_thread=False)
+                conn.execute("PRAGMA synchronous=NORMAL")
+                if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'summaries'").fetchone() is None:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+            except sqlite3.Error as e:
+                logger.debug("Parse cache persistence disabled for %s: %s", self._db_path, e)
+                self._db_path = None
+                return None
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+_instance: ParseCache | None = None
+_instance_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the process-wide parse cache.
+
+    It persists under ``.mahabharatha/state`` when that directory exists in the
+    working directory at first use, and stays in memory otherwise.
+    """
+    global _instance
+
+    with _instance_lock:
+        if _instance is None:
+            state_dir = Path(STATE_DIR)
+            _instance = ParseCache(state_dir if state_dir.is_dir() else None)
+            atexit.register(_instance.close)
+        return _instance
+
+
+def reset_parse_cache() -> None:
+    """Flush and drop the process-wide parse cache."""
+    global _instance
+
+    with _instance_lock:
+        if _instance is not None:
+            atexit.unregister(_instance.close)
+            _instance.close()
+            _instance = None
@@ -0,0 +1,58 @@
+"""Process-pool sizing and start-method selection for sharded file work.
+
+Shared by the repo map's symbol extraction and the security scanner, which
+both shard a file list across a ``ProcessPoolExecutor`` and fall back to
+in-process work for small inputs.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import multiprocessing.context
+import os
+import threading
+
+_preload: set[str] = set()
+_preload_lock = threading.Lock()
+
+
+def pool_size(n_files: int, jobs: int | None, *, min_files: int, files_per_process: int) -> int:
+    """Number of processes for *n_files*; 1 means work in-process.
+
+    Args:
+        n_files: Files to process.
+        jobs: Requested processes. ``None`` uses one per CPU once there are
+            at least *min_files* files.
+        min_files: Below this many files, ``jobs=None`` works in-process.
+        files_per_process: Each process gets at least this many files.
+    """
+    if jobs is None:
+        if n_files < min_files:
+            return 1
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, -(-n_files // files_per_process)))
+
+
+def pool_context(preload: str, *, allow_fork: bool = False) -> multiprocessing.context.BaseContext:
+    """Start method for a pool whose worker function lives in module *preload*.
+
+    Forkserver is the default: forking a process that has threads (the
+    orchestrator, or any library that started one natively) can deadlock, and
+    whether that is the case cannot be told reliably from here. Callers that
+    know they are single-threaded may pass ``allow_fork=True``.
+
+    The forkserver preload list is process-wide and only read when the server
+    starts, so every module requested so far is preloaded, not just *preload*;
+    a module first requested after the server started is imported by each
+    pool process instead.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if allow_fork and "fork" in methods:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        ctx = multiprocessing.context.ForkServerContext()
+        with _preload_lock:
+            _preload.add(preload)
+            ctx.set_forkserver_preload(sorted(_preload))
+        return ctx
+    return multiprocessing.get_context("spawn")
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from mahabharatha.constants import STATE_DIR
+from mahabharatha.heartbeat_table import HeartbeatTable, shared_table
 from mahabharatha.logging import get_logger
 
 logger = get_logger("progress")
@@ -65,11 +66,20 @@ class WorkerProgress:
 class ProgressReporter:
     """Worker-side progress writer and orchestrator-side reader."""
 
-    def __init__(self, worker_id: int, state_dir: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        worker_id: int,
+        state_dir: str | Path | None = None,
+        table: HeartbeatTable | None = None,
+    ) -> None:
         self._worker_id = worker_id
         self._state_dir = Path(state_dir) if state_dir else Path(STATE_DIR)
         self._state_dir.mkdir(parents=True, exist_ok=True)
         self._progress = WorkerProgress(worker_id=worker_id)
+        # Shared heartbeat table slot, when the launcher provides one
+        self._table = table if table is not None else HeartbeatTable.from_env()
+        if self._table is not None and not self._table.has_slot(worker_id):
+            self._table = None
 
     @property
     def progress_path(self) -> Path:
@@ -107,7 +117,10 @@ class ProgressReporter:
         self._progress.tier_results.clear()
 
     def _write(self) -> None:
-        """Write progress file atomically."""
+        """Write progress to the shared table, or to a file atomically."""
+        if self._table is not None:
+            self._table.write_progress(self._progress)
+            return
         target = self.progress_path
         try:
             fd, tmp_path = tempfile.mkstemp(dir=str(self._state_dir), suffix=".tmp")
@@ -122,7 +135,9 @@ class ProgressReporter:
             )
 
     def cleanup(self) -> None:
-        """Remove progress file on clean shutdown."""
+        """Remove progress file (or clear the table slot) on clean shutdown."""
+        if self._table is not None:
+            self._table.clear_progress(self._worker_id)
         try:
             self.progress_path.unlink(missing_ok=True)
         except OSError:
@@ -130,29 +145,41 @@ class ProgressReporter:
 
     @staticmethod
     def read(worker_id: int, state_dir: str | Path | None = None) -> WorkerProgress | None:
-        """Read progress file for a worker (orchestrator-side)."""
+        """Read a worker's progress from the shared table or its file, whichever is newer (orchestrator-side)."""
         sd = Path(state_dir) if state_dir else Path(STATE_DIR)
-        path = sd / f"progress-{worker_id}.json"
-        if not path.exists():
-            return None
-        try:
-            data = json.loads(path.read_text())
-            return WorkerProgress.from_dict(data)
-        except (json.JSONDecodeError, KeyError, OSError):
-            return None
+        table = shared_table(sd)
+        from_table = table.read_progress_stamped(worker_id) if table is not None and table.has_slot(worker_id) else None
+        newest = _newer(from_table, ProgressReporter._read_file(sd / f"progress-{worker_id}.json"))
+        return newest[0] if newest is not None else None
 
     @staticmethod
     def read_all(state_dir: str | Path | None = None) -> dict[int, WorkerProgress]:
-        """Read all progress files (orchestrator-side)."""
+        """Read all progress from the shared table and the files, newest per worker (orchestrator-side)."""
         sd = Path(state_dir) if state_dir else Path(STATE_DIR)
-        result: dict[int, WorkerProgress] = {}
-        if not sd.exists():
-            return result
-        for path in sd.glob("progress-*.json"):
-            try:
-                data = json.loads(path.read_text())
-                wp = WorkerProgress.from_dict(data)
-                result[wp.worker_id] = wp
-            except (json.JSONDecodeError, KeyError, OSError):
-                continue
-        return result
+        table = shared_table(sd)
+        stamped = table.read_all_progress_stamped() if table is not None else {}
+        if sd.exists():
+            for path in sd.glob("progress-*.json"):
+                from_file = ProgressReporter._read_file(path)
+                if from_file is not None:
+                    wid = from_file[0].worker_id
+                    stamped[wid] = _newer(stamped.get(wid), from_file) or from_file
+        return {wid: wp for wid, (wp, _) in stamped.items()}
+
+    @staticmethod
+    def _read_file(path: Path) -> tuple[WorkerProgress, float] | None:
+        """Parse a progress file, stamped with its mtime."""
+        try:
+            written_at = path.stat().st_mtime
+            return WorkerProgress.from_dict(json.loads(path.read_text())), written_at
+        except (json.JSONDecodeError, KeyError, OSError):
+            return None
+
+
+def _newer(
+    a: tuple[WorkerProgress, float] | None, b: tuple[WorkerProgress, float] | None
+) -> tuple[WorkerProgress, float] | None:
+    """The more recently written of two stamped progress records."""
+    if a is None or b is None:
+        return a or b
+    return a if a[1] >= b[1] else b
@@ -26,6 +26,7 @@ from mahabharatha.log_writer import TaskArtifactCapture
 from mahabharatha.logging import get_logger
 from mahabharatha.plugins import LifecycleEvent
 from mahabharatha.protocol_types import CLAUDE_CLI_DEFAULT_TIMEOUT
+from mahabharatha.tracing import CAT_GIT, CAT_LLM, CAT_LOCK, CAT_TASK, CAT_VERIFY, span, traced
 from mahabharatha.types import Task
 
 if TYPE_CHECKING:
@@ -40,6 +41,10 @@ if TYPE_CHECKING:
 logger = get_logger("protocol_handler")
 
 
+def _task_span_attrs(handler: ProtocolHandler, task: Task, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    return {"task_id": task["id"], "level": task.get("level"), "worker_id": handler.worker_id}
+
+
 class ProtocolHandler:
     """Task execution pipeline handler for Mahabharatha workers.
 
@@ -107,6 +112,7 @@ class ProtocolHandler:
         else:
             self.llm_provider = ClaudeProvider(worktree_path=self.worktree_path, worker_id=self.worker_id)
 
+    @traced(CAT_TASK, "execute_task", attrs=_task_span_attrs)
     def execute_task(
         self,
         task: Task,
@@ -302,6 +308,7 @@ class ProtocolHandler:
         """Invoke Claude Code CLI (legacy name for backward compatibility)."""
         return self.invoke_llm(task, timeout)
 
+    @traced(CAT_LLM, "invoke_llm")
     def invoke_llm(
         self,
         task: Task,
@@ -331,9 +338,10 @@ class ProtocolHandler:
         # Critical Path Prioritization: reserved for future integration with task graph
         priority = 1
 
-        acquired = self.state.acquire_resource_slot(
-            resource_id, max_slots, self.worker_id, priority=priority, timeout=timeout or 600
-        )
+        with span("llm.slot_wait", CAT_LOCK, resource=resource_id):
+            acquired = self.state.acquire_resource_slot(
+                resource_id, max_slots, self.worker_id, priority=priority, timeout=timeout or 600
+            )
 
         if not acquired:
             return LLMResponse(
@@ -404,6 +412,7 @@ class ProtocolHandler:
 
         return "\n".join(parts)
 
+    @traced(CAT_VERIFY, "run_verification")
     def run_verification(
         self,
         task: Task,
@@ -482,6 +491,7 @@ class ProtocolHandler:
             )
             return False
 
+    @traced(CAT_GIT, "commit_task_changes")
     def commit_task_changes(
         self,
         task: Task,
@@ -23,6 +23,7 @@ from mahabharatha.constants import (
 )
 from mahabharatha.context_tracker import ContextTracker
 from mahabharatha.dependency_checker import DependencyChecker
+from mahabharatha.dispatch import DispatchClient, dispatch_socket_path
 from mahabharatha.git_ops import GitOps
 from mahabharatha.logging import get_logger, set_worker_context, setup_structured_logging
 from mahabharatha.parser import TaskParser
@@ -31,6 +32,7 @@ from mahabharatha.protocol_handler import ProtocolHandler
 from mahabharatha.protocol_types import _SENTINEL, WorkerContext
 from mahabharatha.spec_loader import SpecLoader
 from mahabharatha.state import StateManager
+from mahabharatha.tracing import configure_tracing
 from mahabharatha.types import Task, WorkerState
 from mahabharatha.verify import VerificationExecutor
 
@@ -95,6 +97,11 @@ class WorkerProtocol:
         self.git = GitOps(self.worktree_path)
         self.context_tracker = ContextTracker(threshold_percent=self.context_threshold * 100)
 
+        # Event-driven dispatch: block on the orchestrator's socket instead of polling
+        self._dispatch: DispatchClient | None = None
+        if self.config.workers.task_dispatch:
+            self._dispatch = DispatchClient(dispatch_socket_path(self.feature, state_dir), self.worker_id)
+
         # Task parser for loading task details
         self.task_parser: TaskParser | None = None
         if self.task_graph_path and self.task_graph_path.exists():
@@ -146,9 +153,19 @@ class WorkerProtocol:
                 feature=self.feature,
                 level=self.config.logging.level,
                 max_size_mb=self.config.logging.max_log_size_mb,
+                buffered=self.config.logging.buffered_output,
+                flush_interval_ms=self.config.logging.flush_interval_ms,
+                flush_batch_size=self.config.logging.flush_batch_size,
             )
         except Exception as e:  # noqa: BLE001 — intentional: structured logging is optional, must not block worker
             logger.warning(f"Failed to set up structured logging: {e}")
+        if self.config.logging.tracing:
+            try:
+                configure_tracing(
+                    log_dir, self.feature, f"worker-{self.worker_id}", buffer_size=self.config.logging.trace_buffer_size
+                )
+            except Exception as e:  # noqa: BLE001 — intentional: tracing is optional, must not block worker
+                logger.warning(f"Failed to set up tracing: {e}")
 
         # Plugin registry (optional, for lifecycle hooks)
         self._plugin_registry = plugin_registry
@@ -238,6 +255,8 @@ class WorkerProtocol:
 
                 # Claim next task
                 task = self.claim_next_task()
+                if not task and self.config.workers.persistent:
+                    task = self.wait_for_next_level()
                 if not task:
                     logger.info("No more tasks available")
                     break
@@ -340,13 +359,16 @@ class WorkerProtocol:
         max_wait: float = 120.0,
         poll_interval: float = 2.0,
     ) -> Task | None:
-        """Claim the next available task, polling if none are ready yet.
+        """Claim the next available task, waiting if none are ready yet.
 
         Single source of truth for claim_next_task logic.
 
         Workers may start before the orchestrator assigns tasks via _start_level().
-        This method polls with backoff to handle the timing gap between worker
-        readiness and task assignment.
+        When the orchestrator's dispatch socket is reachable the worker blocks on
+        it and claims the task it is handed as soon as it becomes ready; a full
+        scan of PENDING tasks still runs on each wake-up that yields nothing, so
+        hints are never required for correctness. Without a dispatch socket this
+        falls back to polling with backoff.
 
         Args:
             max_wait: Maximum seconds to wait for tasks to appear (default: 120s)
@@ -358,34 +380,37 @@ class WorkerProtocol:
         start_time = time.time()
         interval = poll_interval
         attempt = 0
+        dispatched: str | None = None
 
         while True:
-            # Reload state from disk to pick up orchestrator writes
+            # Reload state from disk to pick up orchestrator writes, including
+            # the level advance that made a dispatched task ready
             self.state.load()
 
-            # Get pending tasks for this worker
-            pending = self.state.get_tasks_by_status(TaskStatus.PENDING)
-
-            for task_id in pending:
-                # Try to claim this task with dependency enforcement
-                if self.state.claim_task(
-                    task_id,
-                    self.worker_id,
-                    current_level=self.state.get_current_level(),
-                    dependency_checker=self.dependency_checker,
-                ):
-                    # Load full task from task graph if available
-                    task = self._load_task_details(task_id)
-                    self.current_task = task
-                    logger.info(f"Claimed task {task_id}: {task.get('title', 'untitled')}")
-                    return task
+            if dispatched is not None:
+                # Orchestrator handed us a ready task; claim it without scanning
+                if self._try_claim(dispatched):
+                    return self._claimed(dispatched)
+                dispatched = None
+            else:
+                # Get pending tasks for this worker
+                for task_id in self.state.get_tasks_by_status(TaskStatus.PENDING):
+                    if self._try_claim(task_id):
+                        return self._claimed(task_id)
 
             # Check if we've waited long enough
             elapsed = time.time() - start_time
             if elapsed >= max_wait:
-                logger.info(f"No tasks found after {elapsed:.1f}s of polling")
+                logger.info(f"No tasks found after {elapsed:.1f}s of waiting")
                 return None
 
+            if self._dispatch is not None:
+                try:
+                    dispatched = await self._dispatch.next_task(timeout=min(max_wait - elapsed, 10.0))
+                    continue
+                except OSError as e:
+                    logger.debug(f"Task dispatch unavailable, polling instead: {e}")
+
             attempt += 1
             if attempt == 1:
                 logger.info(f"No tasks available yet, polling (max {max_wait}s)...")
@@ -393,6 +418,62 @@ class WorkerProtocol:
             await asyncio.sleep(interval)
             interval = min(interval * 1.5, 10.0)  # backoff, cap at 10s
 
+    def wait_for_next_level(self) -> Task | None:
+        """Stay alive between levels until a task of the next level can be claimed.
+
+        Used by persistent workers (``workers.persistent``). The orchestrator
+        rebases this worker's worktree in place after the level merge, so the
+        process only has to keep claiming. Gives up once every task in the
+        graph is complete or permanently failed, or after ``workers.persistent_idle_timeout_seconds``.
+
+        Returns:
+            Claimed task, or None if the worker should exit
+        """
+        self._update_worker_state(WorkerStatus.IDLE, current_task=None)
+        deadline = time.monotonic() + self.config.workers.persistent_idle_timeout_seconds
+        logger.info(f"Worker {self.worker_id} idle, waiting for the next level")
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            if self._feature_complete():
+                logger.info("All tasks finished")
+                return None
+            task = self.claim_next_task(max_wait=min(remaining, 60.0))
+            if task:
+                self._update_worker_state(WorkerStatus.RUNNING)
+                return task
+
+        logger.info(f"No new level after {self.config.workers.persistent_idle_timeout_seconds}s")
+        return None
+
+    def _feature_complete(self) -> bool:
+        """Whether every task in the task graph is complete or permanently failed.
+
+        A retryable failure is moved to ``waiting_retry`` by the orchestrator,
+        so FAILED here is terminal and no further level will be started for it.
+        """
+        if self.task_parser is None:
+            return False
+        self.state.load()
+        done = set(self.state.get_tasks_by_status(TaskStatus.COMPLETE))
+        done.update(self.state.get_tasks_by_status(TaskStatus.FAILED))
+        return all(task["id"] in done for task in self.task_parser.get_all_tasks())
+
+    def _try_claim(self, task_id: str) -> bool:
+        """Claim a task with level and dependency enforcement."""
+        return self.state.claim_task(
+            task_id,
+            self.worker_id,
+            current_level=self.state.get_current_level(),
+            dependency_checker=self.dependency_checker,
+        )
+
+    def _claimed(self, task_id: str) -> Task:
+        """Load full task details for a freshly claimed task and make it current."""
+        task = self._load_task_details(task_id)
+        self.current_task = task
+        logger.info(f"Claimed task {task_id}: {task.get('title', 'untitled')}")
+        return task
+
     def _load_task_details(self, task_id: str) -> Task:
         """Load full task details from task graph.
 
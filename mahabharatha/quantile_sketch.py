@@ -0,0 +1,196 @@
+"""Mergeable quantile sketch for task durations.
+
+A DDSketch-style histogram: values are counted in logarithmic buckets whose
+width grows with the value, so every quantile estimate is within
+``relative_accuracy`` of the true value while memory depends only on the
+spread of the values (a few hundred buckets span milliseconds to days), not
+on how many were added. Because the sketch is just bucket counts it can be
+merged across workers, levels and processes, serialized into the state file,
+and values can be removed again when a task's recorded duration changes.
+
+When more than ``max_buckets`` buckets are in use the lowest ones are
+collapsed together, which only degrades accuracy for the smallest values.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+# Values at or below this are counted in a dedicated zero bucket
+_MIN_INDEXABLE = 1e-9
+
+
+class DDSketch:
+    """Relative-error quantile sketch over non-negative values."""
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates (0-1)
+            max_buckets: Bucket budget before the lowest buckets are collapsed
+
+        Raises:
+            ValueError: If relative_accuracy is not in (0, 1)
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max(1, max_buckets)
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DDSketch):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def _key(self, value: float) -> int:
+        key = math.ceil(math.log(value) / self._log_gamma)
+        if self._bins and len(self._bins) >= self.max_buckets:
+            key = max(key, min(self._bins))  # Below the collapsed floor
+        return key
+
+    def _value(self, key: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(key-1), gamma^key]
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value ``count`` times.
+
+        Args:
+            value: Non-negative value (negative values are counted as zero)
+            count: Number of occurrences
+        """
+        if count <= 0:
+            return
+        self.count += count
+        self.sum += value * count
+        if value <= _MIN_INDEXABLE:
+            self.zero_count += count
+            return
+        key = self._key(value)
+        self._bins[key] = self._bins.get(key, 0) + count
+        if len(self._bins) > self.max_buckets:
+            self._collapse()
+
+    def remove(self, value: float, count: int = 1) -> None:
+        """Forget a previously added value (no-op for values never added).
+
+        Args:
+            value: Value passed to add()
+            count: Number of occurrences to remove
+        """
+        if value <= _MIN_INDEXABLE:
+            removed = min(count, self.zero_count)
+            self.zero_count -= removed
+        else:
+            key = self._key(value)
+            if key not in self._bins and self._bins and key < min(self._bins):
+                key = min(self._bins)  # Value was collapsed into the floor bucket
+            removed = min(count, self._bins.get(key, 0))
+            if removed:
+                self._bins[key] -= removed
+                if not self._bins[key]:
+                    del self._bins[key]
+        self.count -= removed
+        self.sum -= value * removed
+        if not self.count:
+            self.sum = 0.0
+
+    def _collapse(self) -> None:
+        keys = sorted(self._bins)
+        excess = keys[: len(keys) - self.max_buckets + 1]
+        floor = excess[-1]
+        self._bins[floor] += sum(self._bins.pop(k) for k in excess[:-1])
+
+    def merge(self, other: DDSketch) -> None:
+        """Add every value counted by another sketch.
+
+        Args:
+            other: Sketch with the same relative accuracy
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies
+        """
+        if not math.isclose(other._gamma, self._gamma):
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        for key, n in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        while len(self._bins) > self.max_buckets:
+            self._collapse()
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values (exact)."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile.
+
+        Uses the same rank convention as ``metrics.calculate_percentile``
+        (rank ``q * (count - 1)``), without interpolation.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or 0.0 for an empty sketch
+        """
+        if not self.count:
+            return 0.0
+        rank = min(max(q, 0.0), 1.0) * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if rank < seen:
+                return self._value(key)
+        return self._value(max(self._bins))
+
+    def percentile(self, percentile: float) -> int:
+        """Estimate a percentile (0-100) as an integer, like calculate_percentile."""
+        return int(round(self.quantile(percentile / 100)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "bins": {str(k): n for k, n in sorted(self._bins.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DDSketch:
+        """Restore a sketch serialized with to_dict()."""
+        sketch = cls(
+            relative_accuracy=data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY),
+            max_buckets=data.get("max_buckets", DEFAULT_MAX_BUCKETS),
+        )
+        sketch._bins = {int(k): int(n) for k, n in data.get("bins", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        return sketch
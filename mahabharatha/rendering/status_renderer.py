@@ -31,6 +31,7 @@ from rich.text import Text
 from mahabharatha.constants import STATE_DIR, TaskStatus, WorkerStatus
 from mahabharatha.heartbeat import HeartbeatMonitor
 from mahabharatha.metrics import MetricsCollector
+from mahabharatha.state.lock_profile import summarize_lock_profile
 
 if TYPE_CHECKING:
     from mahabharatha.state import StateManager
@@ -1242,6 +1243,7 @@ def show_json_status(
         "levels": state._state.get("levels", {}),
         "events": state.get_events(limit=10),
         "metrics": get_metrics_dict(state),
+        "lock_contention": get_lock_contention_dict(state),
     }
 
     c.print(json.dumps(output, indent=2, default=str))
@@ -1267,3 +1269,21 @@ def get_metrics_dict(state: StateManager) -> dict[str, Any] | None:
     except Exception as e:  # noqa: BLE001 -- best-effort metrics
         logger.debug(f"Could not compute metrics: {e}")
         return None
+
+
+def get_lock_contention_dict(state: StateManager) -> dict[str, Any]:
+    """Get state-lock wait/hold histograms per call site for JSON output.
+
+    Args:
+        state: State manager
+
+    Returns:
+        Per-site summary merged across all processes (empty if unavailable)
+    """
+    from mahabharatha.logging import get_logger
+
+    try:
+        return summarize_lock_profile(state.state_dir, state.feature)
+    except Exception as e:  # noqa: BLE001 -- best-effort profiling data
+        get_logger("status").debug(f"Could not load lock profile: {e}")
+        return {}
@@ -1,25 +1,29 @@
 """Repository symbol map for Mahabharatha — injects relevant code context into worker prompts.
 
-Uses Python ast module for .py files and regex-based extraction (repo_map_js)
-for .js/.ts/.jsx/.tsx files. Zero new dependencies.
+Uses the shared parse cache (ast-based summaries) for .py files and regex-based
+extraction (repo_map_js) for .js/.ts/.jsx/.tsx files. Zero new dependencies.
 """
 
 from __future__ import annotations
 
-import ast
 import hashlib
+import inspect
 import json
 import logging
 import os
 import tempfile
 import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from mahabharatha.fs_utils import collect_files
+from mahabharatha.parse_cache import DefRecord, get_parse_cache
+from mahabharatha.pool_utils import pool_context, pool_size
 from mahabharatha.repo_map_js import JSSymbol, extract_js_file
 
 logger = logging.getLogger(__name__)
@@ -159,167 +163,115 @@ def _path_to_module(filepath: Path, root: Path) -> str:
 
 
 def _extract_python_symbols(filepath: Path, module_name: str) -> tuple[list[Symbol], list[SymbolEdge]]:
-    """Extract symbols from a Python file using the ast module."""
-    symbols: list[Symbol] = []
-    edges: list[SymbolEdge] = []
-
+    """Extract symbols from a Python file via the shared parse cache."""
     try:
-        source = filepath.read_text(errors="replace")
-        tree = ast.parse(source, str(filepath))
-    except (SyntaxError, OSError):
-        return symbols, edges
-
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            sig = _format_func_signature(node)
-            doc = ast.get_docstring(node)
-            symbols.append(
+        summary = get_parse_cache().summary(filepath)
+    except OSError:
+        return [], []
+    if summary.error:
+        return [], []
+
+    # (line, symbols, edges) per statement, merged back into source order below
+    items: list[tuple[int, list[Symbol], list[SymbolEdge]]] = []
+
+    for d in summary.defs:
+        syms = [
+            Symbol(
+                name=d.name,
+                kind=d.kind,
+                signature=_format_signature(d),
+                docstring=_first_line(d.docstring),
+                line=d.line,
+                module=module_name,
+            )
+        ]
+        # Record inheritance edges
+        edgs = [
+            SymbolEdge(source=f"{module_name}.{d.name}", target=base, kind="inherits")
+            for base in d.bases
+            if base and base not in ("object", "ABC")
+        ]
+        # Methods follow their class
+        syms.extend(
+            Symbol(
+                name=f"{d.name}.{m.name}",
+                kind="method",
+                signature=_format_signature(m),
+                docstring=_first_line(m.docstring),
+                line=m.line,
+                module=module_name,
+            )
+            for m in d.methods
+        )
+        items.append((d.line, syms, edgs))
+
+    for imp in summary.imports:
+        if not imp.top_level:
+            continue
+        if imp.is_from:
+            from_mod = imp.module or ""
+            syms = [
                 Symbol(
-                    name=node.name,
-                    kind="function",
-                    signature=sig,
-                    docstring=doc.split("\n")[0] if doc else None,
-                    line=node.lineno,
+                    name=asname or name,
+                    kind="import",
+                    signature=f"from {from_mod} import {name}",
+                    docstring=None,
+                    line=imp.line,
                     module=module_name,
                 )
-            )
-
-        elif isinstance(node, ast.ClassDef):
-            bases = [_format_expr(b) for b in node.bases]
-            sig = f"class {node.name}"
-            if bases:
-                sig += f"({', '.join(bases)})"
-            doc = ast.get_docstring(node)
-            symbols.append(
+                for name, asname in imp.names
+            ]
+            edgs = [SymbolEdge(source=module_name, target=from_mod, kind="imports")] if from_mod else []
+        else:
+            syms = [
                 Symbol(
-                    name=node.name,
-                    kind="class",
-                    signature=sig,
-                    docstring=doc.split("\n")[0] if doc else None,
-                    line=node.lineno,
+                    name=asname or name,
+                    kind="import",
+                    signature=f"import {name}",
+                    docstring=None,
+                    line=imp.line,
                     module=module_name,
                 )
-            )
-
-            # Record inheritance edges
-            for base_name in bases:
-                if base_name and base_name not in ("object", "ABC"):
-                    edges.append(
-                        SymbolEdge(
-                            source=f"{module_name}.{node.name}",
-                            target=base_name,
-                            kind="inherits",
-                        )
-                    )
-
-            # Extract methods
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
-                    msig = _format_func_signature(item)
-                    mdoc = ast.get_docstring(item)
-                    symbols.append(
-                        Symbol(
-                            name=f"{node.name}.{item.name}",
-                            kind="method",
-                            signature=msig,
-                            docstring=mdoc.split("\n")[0] if mdoc else None,
-                            line=item.lineno,
-                            module=module_name,
-                        )
-                    )
-
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                symbols.append(
-                    Symbol(
-                        name=alias.asname or alias.name,
-                        kind="import",
-                        signature=f"import {alias.name}",
-                        docstring=None,
-                        line=node.lineno,
-                        module=module_name,
-                    )
-                )
-                edges.append(
-                    SymbolEdge(
-                        source=module_name,
-                        target=alias.name,
-                        kind="imports",
-                    )
-                )
-
-        elif isinstance(node, ast.ImportFrom):
-            from_mod = node.module or ""
-            for alias in node.names:
-                symbols.append(
-                    Symbol(
-                        name=alias.asname or alias.name,
-                        kind="import",
-                        signature=f"from {from_mod} import {alias.name}",
-                        docstring=None,
-                        line=node.lineno,
-                        module=module_name,
-                    )
-                )
-            if from_mod:
-                edges.append(
-                    SymbolEdge(
-                        source=module_name,
-                        target=from_mod,
-                        kind="imports",
-                    )
+                for name, asname in imp.names
+            ]
+            edgs = [SymbolEdge(source=module_name, target=name, kind="imports") for name, _ in imp.names]
+        items.append((imp.line, syms, edgs))
+
+    for assign in summary.assigns:
+        if assign.annotation is None and assign.name.isupper():
+            syms = [
+                Symbol(
+                    name=assign.name,
+                    kind="variable",
+                    signature=f"{assign.name} = ...",
+                    docstring=None,
+                    line=assign.line,
+                    module=module_name,
                 )
+            ]
+            items.append((assign.line, syms, []))
 
-        elif isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id.isupper():
-                    symbols.append(
-                        Symbol(
-                            name=target.id,
-                            kind="variable",
-                            signature=f"{target.id} = ...",
-                            docstring=None,
-                            line=node.lineno,
-                            module=module_name,
-                        )
-                    )
-
+    items.sort(key=lambda item: item[0])
+    symbols = [sym for _, syms, _ in items for sym in syms]
+    edges = [edge for _, _, edgs in items for edge in edgs]
     return symbols, edges
 
 
-def _format_func_signature(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
-    """Format a function/method signature from AST node."""
-    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
-    args_parts: list[str] = []
+def _format_signature(d: DefRecord) -> str:
+    """Compact one-line signature: positional-or-keyword parameters only."""
+    if d.kind == "class":
+        return f"class {d.name}({', '.join(d.bases)})" if d.bases else f"class {d.name}"
+    prefix = "async def" if d.is_async else "def"
+    args = ", ".join(f"{p.name}: {p.annotation}" if p.annotation else p.name for p in d.params if p.kind == "arg")
+    ret = f" -> {d.returns}" if d.returns else ""
+    return f"{prefix} {d.name}({args}){ret}"
 
-    for arg in node.args.args:
-        name = arg.arg
-        if arg.annotation:
-            name += f": {_format_expr(arg.annotation)}"
-        args_parts.append(name)
 
-    ret = ""
-    if node.returns:
-        ret = f" -> {_format_expr(node.returns)}"
-
-    return f"{prefix} {node.name}({', '.join(args_parts)}){ret}"
-
-
-def _format_expr(node: ast.expr) -> str:
-    """Format an AST expression to a readable string."""
-    if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        return f"{_format_expr(node.value)}.{node.attr}"
-    if isinstance(node, ast.Constant):
-        return repr(node.value)
-    if isinstance(node, ast.Subscript):
-        return f"{_format_expr(node.value)}[{_format_expr(node.slice)}]"
-    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
-        return f"{_format_expr(node.left)} | {_format_expr(node.right)}"
-    if isinstance(node, ast.Tuple):
-        return ", ".join(_format_expr(e) for e in node.elts)
-    return "..."
+def _first_line(docstring: str | None) -> str | None:
+    """First line of a cleaned docstring (as ``ast.get_docstring``), or None."""
+    if not docstring:
+        return None
+    return inspect.cleandoc(docstring).split("\n")[0] or None
 
 
 def _convert_js_symbol(js_sym: JSSymbol, module_name: str) -> Symbol:
@@ -334,6 +286,13 @@ def _convert_js_symbol(js_sym: JSSymbol, module_name: str) -> Symbol:
     )
 
 
+def _extract_file(filepath: Path, module_name: str) -> tuple[list[Symbol], list[SymbolEdge]]:
+    """Extract symbols and edges from a single Python or JS/TS source file."""
+    if filepath.suffix == ".py":
+        return _extract_python_symbols(filepath, module_name)
+    return [_convert_js_symbol(s, module_name) for s in extract_js_file(filepath)], []
+
+
 # ---------------------------------------------------------------------------
 # TTL-based caching for build_map() — module-level cache
 # ---------------------------------------------------------------------------
@@ -348,6 +307,7 @@ _CACHE_TTL_SECONDS = 30
 def build_map(
     root: str | Path,
     languages: list[str] | None = None,
+    jobs: int | None = None,
 ) -> SymbolGraph:
     """Build a symbol graph with TTL-based caching.
 
@@ -358,6 +318,8 @@ def build_map(
     Args:
         root: Repository root path.
         languages: Languages to include. Default: ["python", "javascript", "typescript"].
+        jobs: Extraction processes on a cache miss. Default: one per CPU for
+            large repositories, in-process below ``_PARALLEL_MIN_FILES`` files.
 
     Returns:
         SymbolGraph with extracted symbols and edges (cached if valid).
@@ -384,7 +346,7 @@ def build_map(
 
         # Cache miss - build fresh
         logger.debug("Cache miss for RepoMap, building from %s", root)
-        graph = _build_map_impl(root, languages)
+        graph = _build_map_impl(root, languages, jobs)
 
         # Update cache
         _cached_graph = graph
@@ -419,7 +381,7 @@ _SKIP_DIRS = frozenset(
     }
 )
 
-# Language extension mapping (mirrors build_map logic)
+# Language extension mapping used by build_map and the incremental index
 _LANG_EXTENSIONS: dict[str, list[str]] = {
     "python": [".py"],
     "javascript": [".js", ".jsx"],
@@ -427,57 +389,109 @@ _LANG_EXTENSIONS: dict[str, list[str]] = {
 }
 
 
-def _build_map_impl(root: Path, languages: list[str]) -> SymbolGraph:
+def _build_map_impl(root: Path, languages: list[str], jobs: int | None = None) -> SymbolGraph:
     """Internal implementation of build_map (without caching).
 
     Args:
         root: Repository root path (already resolved).
         languages: Languages to include.
+        jobs: Extraction processes (see ``_extract_many``).
 
     Returns:
         SymbolGraph with extracted symbols and edges.
     """
     graph = SymbolGraph()
 
-    # Build the set of desired extensions and a mapping back to language type
-    desired_exts: set[str] = set()
-    ext_to_lang: dict[str, str] = {}
-    if "python" in languages:
-        desired_exts.add(".py")
-        ext_to_lang[".py"] = "python"
-    if "javascript" in languages:
-        desired_exts.update({".js", ".jsx"})
-        ext_to_lang[".js"] = "javascript"
-        ext_to_lang[".jsx"] = "javascript"
-    if "typescript" in languages:
-        desired_exts.update({".ts", ".tsx"})
-        ext_to_lang[".ts"] = "typescript"
-        ext_to_lang[".tsx"] = "typescript"
-
-    # Single traversal via collect_files instead of per-extension rglob calls
-    grouped = collect_files(root, extensions=desired_exts, exclude_dirs=set(_SKIP_DIRS))
-
-    for ext, file_list in grouped.items():
-        for filepath in file_list:
-            module_name = _path_to_module(filepath, root)
-
-            if ext == ".py":
-                syms, edgs = _extract_python_symbols(filepath, module_name)
-                if syms:
-                    graph.modules[module_name] = syms
-                graph.edges.extend(edgs)
-            else:
-                js_syms = extract_js_file(filepath)
-                if js_syms:
-                    graph.modules[module_name] = [_convert_js_symbol(s, module_name) for s in js_syms]
+    # Single traversal via collect_files; sorted so the merge order is deterministic
+    for module_name, syms, edgs in _extract_many(_collect_files(root, languages), root, jobs):
+        if syms:
+            graph.modules[module_name] = syms
+        graph.edges.extend(edgs)
 
     return graph
 
 
 # ---------------------------------------------------------------------------
-# Incremental indexing — MD5-based staleness detection
+# Parallel extraction — shards files across a process pool
+# ---------------------------------------------------------------------------
+
+# Below this many files, process start-up costs more than parallelism saves
+_PARALLEL_MIN_FILES = 300
+
+# Upper bound on processes: at least this many files per process
+_FILES_PER_PROCESS = 100
+
+# Compact picklable per-file record: (module, [(name, kind, signature, docstring, line)], [(source, target, kind)])
+_CompactRecord = tuple[str, list[tuple[str, str, str, str | None, int]], list[tuple[str, str, str]]]
+_FileRecord = tuple[str, list[Symbol], list[SymbolEdge]]
+
+
+def _extract_shard(paths: list[str], root: str) -> list[_CompactRecord]:
+    """Pool worker: extract a shard of files into compact records, in input order."""
+    root_path = Path(root)
+    records: list[_CompactRecord] = []
+    for path in paths:
+        filepath = Path(path)
+        module_name = _path_to_module(filepath, root_path)
+        syms, edgs = _extract_file(filepath, module_name)
+        records.append(
+            (
+                module_name,
+                [(s.name, s.kind, s.signature, s.docstring, s.line) for s in syms],
+                [(e.source, e.target, e.kind) for e in edgs],
+            )
+        )
+    # Pool processes exit without running atexit hooks
+    get_parse_cache().flush()
+    return records
+
+
+def _extract_many(files: list[Path], root: Path, jobs: int | None = None) -> list[_FileRecord]:
+    """Extract ``(module, symbols, edges)`` for each of *files*, in the same order.
+
+    Args:
+        files: Source files to extract.
+        root: Repository root that module names are relative to.
+        jobs: Extraction processes. ``None`` uses one per CPU once there are
+            at least ``_PARALLEL_MIN_FILES`` files; ``1`` always extracts
+            in-process.
+
+    Returns:
+        One record per file. Contiguous shards are mapped in order, so the
+        result is identical to a serial extraction.
+    """
+    procs = pool_size(len(files), jobs, min_files=_PARALLEL_MIN_FILES, files_per_process=_FILES_PER_PROCESS)
+    if procs > 1:
+        # A few shards per process evens out files of very different sizes
+        size = -(-len(files) // (procs * 4))
+        shards = [[str(fp) for fp in files[i : i + size]] for i in range(0, len(files), size)]
+        try:
+            with ProcessPoolExecutor(max_workers=procs, mp_context=pool_context(__name__)) as pool:
+                results = list(pool.map(_extract_shard, shards, [str(root)] * len(shards)))
+        except (OSError, BrokenProcessPool) as e:
+            logger.debug("Parallel symbol extraction unavailable (%s); extracting serially", e)
+        else:
+            return [
+                (module_name, [Symbol(*s, module_name) for s in syms], [SymbolEdge(*e) for e in edgs])
+                for shard in results
+                for module_name, syms, edgs in shard
+            ]
+
+    records: list[_FileRecord] = []
+    for filepath in files:
+        module_name = _path_to_module(filepath, root)
+        syms, edgs = _extract_file(filepath, module_name)
+        records.append((module_name, syms, edgs))
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Incremental indexing — stat/MD5 staleness detection, per-file graph patching
 # ---------------------------------------------------------------------------
 
+# Bumped whenever the per-file entry layout changes; older indexes are rebuilt
+_INDEX_VERSION = 2
+
 
 def _md5_file(filepath: Path) -> str:
     """Return hex MD5 digest of a file's contents."""
@@ -492,14 +506,15 @@ def _collect_files(root: Path, languages: list[str]) -> list[Path]:
     """Collect source files matching *languages* under *root*.
 
     Uses ``collect_files()`` from ``mahabharatha.fs_utils`` for a single-pass
-    directory traversal instead of a manual rglob.
+    directory traversal instead of a manual rglob.  Directory listings are
+    cached by mtime, since incremental updates re-walk the same tree.
     """
     exts: set[str] = set()
     for lang in languages:
         exts.update(_LANG_EXTENSIONS.get(lang, []))
 
     # Single traversal via fs_utils
-    grouped = collect_files(root, extensions=exts, exclude_dirs=set(_SKIP_DIRS))
+    grouped = collect_files(root, extensions=exts, exclude_dirs=set(_SKIP_DIRS), cache_listings=True)
 
     # Flatten the grouped dict into a single sorted list
     result: list[Path] = []
@@ -509,29 +524,29 @@ def _collect_files(root: Path, languages: list[str]) -> list[Path]:
     return result
 
 
-def _extract_symbol_names(filepath: Path, root: Path) -> list[str]:
-    """Extract symbol names from a single source file.
-
-    Returns a flat list of symbol name strings (used for the index cache).
-    """
-    module_name = _path_to_module(filepath, root)
-    ext = filepath.suffix
-
-    if ext == ".py":
-        syms, _edges = _extract_python_symbols(filepath, module_name)
-        return [s.name for s in syms]
+def _publish_graph(root: Path, languages: list[str], graph: SymbolGraph) -> None:
+    """Install *graph* as the current ``build_map()`` result for *root*."""
+    global _cached_graph, _cache_time, _cache_root, _cache_languages
 
-    # JS/TS
-    js_syms = extract_js_file(filepath)
-    return [s.name for s in js_syms]
+    with _cache_lock:
+        _cached_graph = graph
+        _cache_time = time.time()
+        _cache_root = root
+        _cache_languages = list(languages)
 
 
 class IncrementalIndex:
-    """File-level incremental index with MD5 staleness detection.
+    """File-level incremental index with stat + MD5 staleness detection.
+
+    Stores ``{file_path: {mtime_ns, size, hash, module, symbols, edges}}`` in
+    ``.mahabharatha/state/repo-index.json``, where *symbols* and *edges* are the
+    full :class:`Symbol` / :class:`SymbolEdge` records of that file. A file
+    whose mtime and size match its entry is trusted without being read; any
+    other file is hashed and only re-extracted when its content changed.
 
-    Stores ``{file_path: {hash: md5hex, symbols: [...]}}`` in
-    ``.mahabharatha/state/repo-index.json`` and only re-extracts symbols for files
-    whose content hash has changed.
+    The :class:`SymbolGraph` is kept in memory and patched for changed files
+    only, so an update costs in proportion to what changed rather than to the
+    size of the repository.
     """
 
     def __init__(self, state_dir: str | Path | None = None) -> None:
@@ -540,22 +555,36 @@ class IncrementalIndex:
         self._state_dir = Path(state_dir) if state_dir else Path(STATE_DIR)
         self._index_path = self._state_dir / "repo-index.json"
         self._data: dict[str, dict[str, Any]] = {}
+        self._root: str | None = None
+        self._loaded = False
         self._last_updated: str | None = None
         self._stale_count: int = 0
 
+        # In-memory graph for the last (root, languages) and the per-file
+        # pieces needed to patch it
+        self._graph: SymbolGraph | None = None
+        self._graph_key: tuple[Path, tuple[str, ...]] | None = None
+        self._file_modules: dict[str, str] = {}
+        self._file_edges: dict[str, list[SymbolEdge]] = {}
+
     # -- persistence ---------------------------------------------------------
 
     def _load(self) -> dict[str, dict[str, Any]]:
-        """Load the on-disk index (returns empty dict on missing/corrupt)."""
+        """Load the on-disk index (returns empty dict on missing/corrupt/outdated)."""
         if not self._index_path.exists():
             return {}
         try:
             raw = self._index_path.read_text(encoding="utf-8")
             payload = json.loads(raw)
-            self._last_updated = payload.get("_meta", {}).get("last_updated")
+            meta = payload.get("_meta", {})
+            if meta.get("version") != _INDEX_VERSION:
+                logger.debug("Repo index at %s has an outdated format — rebuilding", self._index_path)
+                return {}
+            self._last_updated = meta.get("last_updated")
+            self._root = meta.get("root")
             files: dict[str, dict[str, Any]] = payload.get("files", {})
             return files
-        except (json.JSONDecodeError, OSError, KeyError):
+        except (json.JSONDecodeError, OSError, KeyError, AttributeError):
             logger.warning("Corrupt repo index at %s — rebuilding", self._index_path)
             return {}
 
@@ -564,7 +593,7 @@ class IncrementalIndex:
         self._state_dir.mkdir(parents=True, exist_ok=True)
         now = datetime.now(UTC).isoformat()
         payload = {
-            "_meta": {"last_updated": now},
+            "_meta": {"version": _INDEX_VERSION, "root": self._root, "last_updated": now},
             "files": data,
         }
         fd, tmp_path = tempfile.mkstemp(
@@ -573,7 +602,8 @@ class IncrementalIndex:
         )
         try:
             with os.fdopen(fd, "w") as f:
-                json.dump(payload, f, indent=1)
+                # dumps() uses the C encoder; streaming dump() does not
+                f.write(json.dumps(payload, separators=(",", ":")))
             os.replace(tmp_path, str(self._index_path))
         except OSError:
             logger.warning("Failed to write repo index to %s", self._index_path)
@@ -584,18 +614,75 @@ class IncrementalIndex:
                 pass  # Best-effort file cleanup
         self._last_updated = now
 
+    # -- graph maintenance ---------------------------------------------------
+
+    def _patch_graph(
+        self,
+        files: list[str],
+        changed: dict[str, _FileRecord],
+        removed: list[str],
+    ) -> SymbolGraph:
+        """Apply per-file changes to the in-memory graph and return the result.
+
+        A new :class:`SymbolGraph` is returned whenever something changed, so
+        graphs handed out earlier (and the ``build_map()`` cache) are never
+        mutated underneath their readers.
+        """
+        base = self._graph or SymbolGraph()
+        if not changed and not removed:
+            return base
+
+        modules = dict(base.modules)
+        for key in [*removed, *changed]:
+            module = self._file_modules.pop(key, None)
+            if module is not None:
+                modules.pop(module, None)
+            self._file_edges.pop(key, None)
+
+        for key, (module, symbols, edges) in changed.items():
+            if symbols:
+                modules[module] = symbols
+                self._file_modules[key] = module
+            self._file_edges[key] = edges
+
+        # *files* is sorted, which keeps edge order identical to a full build
+        edges = [edge for key in files for edge in self._file_edges.get(key, ())]
+        self._graph = SymbolGraph(modules=modules, edges=edges)
+        return self._graph
+
+    def _rebuild_graph(
+        self,
+        changed: dict[str, _FileRecord],
+    ) -> None:
+        """Start a fresh in-memory graph; unchanged files come from stored records, not re-parsing."""
+        self._graph = SymbolGraph()
+        self._file_modules = {}
+        self._file_edges = {}
+        for key, entry in self._data.items():
+            if key not in changed:
+                changed[key] = (
+                    entry["module"],
+                    [Symbol(**s) for s in entry["symbols"]],
+                    [SymbolEdge(**e) for e in entry["edges"]],
+                )
+
     # -- public API ----------------------------------------------------------
 
     def update_incremental(
         self,
         root: str | Path,
         languages: list[str] | None = None,
+        jobs: int | None = None,
     ) -> SymbolGraph:
         """Re-index only changed files and return a full SymbolGraph.
 
+        The returned graph also becomes the cached ``build_map()`` result for
+        *root*, so callers within the cache TTL share it without a rebuild.
+
         Args:
             root: Repository root path.
             languages: Languages to include (default: python, javascript, typescript).
+            jobs: Processes for re-extracting stale files (see ``build_map``).
 
         Returns:
             SymbolGraph reflecting the current state of all tracked files.
@@ -603,37 +690,75 @@ class IncrementalIndex:
         root = Path(root).resolve()
         languages = languages or ["python", "javascript", "typescript"]
 
-        existing = self._load()
-        files = _collect_files(root, languages)
-        {str(fp) for fp in files}
+        if not self._loaded:
+            self._data = self._load()
+            self._loaded = True
+        if self._root != str(root):
+            # Module names are relative to the root, so no stored entry carries over
+            self._data = {}
+            self._root = str(root)
+
+        current = {str(fp): fp for fp in _collect_files(root, languages)}
+        removed = [key for key in self._data if key not in current]
+        stale: list[tuple[str, Path, os.stat_result, str]] = []
+        dirty = bool(removed)
+
+        for key, fp in current.items():
+            prev = self._data.get(key)
+            try:
+                st = fp.stat()
+                if prev is not None:
+                    if prev.get("mtime_ns") == st.st_mtime_ns and prev.get("size") == st.st_size:
+                        continue
+                    file_hash = _md5_file(fp)
+                    if prev.get("hash") == file_hash:
+                        # Touched but unchanged — refresh the stat so the next check skips the hash
+                        prev["mtime_ns"], prev["size"] = st.st_mtime_ns, st.st_size
+                        dirty = True
+                        continue
+                else:
+                    file_hash = _md5_file(fp)
+            except OSError:
+                # Vanished (or unreadable) since collection — drop it like a deleted file
+                if prev is not None:
+                    removed.append(key)
+                    dirty = True
+                continue
 
-        updated: dict[str, dict[str, Any]] = {}
-        self._stale_count = 0
+            stale.append((key, fp, st, file_hash))
 
-        for fp in files:
-            key = str(fp)
-            file_hash = _md5_file(fp)
+        # New or changed — re-extract, in parallel when there are many
+        records = _extract_many([fp for _, fp, _, _ in stale], root, jobs)
+        changed: dict[str, _FileRecord] = {}
+        for (key, _fp, st, file_hash), (module_name, symbols, edges) in zip(stale, records, strict=True):
+            changed[key] = (module_name, symbols, edges)
+            self._data[key] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "hash": file_hash,
+                "module": module_name,
+                "symbols": [asdict(s) for s in symbols],
+                "edges": [asdict(e) for e in edges],
+            }
 
-            prev = existing.get(key)
-            if prev and prev.get("hash") == file_hash:
-                # Unchanged — carry forward
-                updated[key] = prev
-            else:
-                # New or changed — re-extract
-                self._stale_count += 1
-                symbol_names = _extract_symbol_names(fp, root)
-                updated[key] = {"hash": file_hash, "symbols": symbol_names}
+        self._stale_count = len(stale)
 
         # Drop entries for files that no longer exist
-        self._data = updated
-        self._save(updated)
+        for key in removed:
+            self._data.pop(key, None)
+
+        if changed or dirty:
+            self._save(self._data)
 
-        # Invalidate build_map cache before rebuilding — incremental update
-        # explicitly requests fresh data, so bypass TTL cache
-        invalidate_cache()
+        graph_key = (root, tuple(languages))
+        if self._graph is None or self._graph_key != graph_key:
+            self._graph_key = graph_key
+            self._rebuild_graph(changed)
+            removed = []
 
-        # Build a full SymbolGraph from the current file set
-        return build_map(root, languages)
+        graph = self._patch_graph(list(current), changed, removed)
+        _publish_graph(root, languages, graph)
+        return graph
 
     def get_stats(self) -> dict[str, Any]:
         """Return index statistics.
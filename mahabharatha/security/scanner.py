@@ -7,16 +7,29 @@ SecurityResult with structured findings.
 
 from __future__ import annotations
 
+import functools
+import importlib
 import os
 import re
 import subprocess
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from mahabharatha.logging import get_logger
+from mahabharatha.pool_utils import pool_context, pool_size
 from mahabharatha.security.patterns import PATTERN_REGISTRY, SecurityPattern
 
+# The regex parser is private to CPython; without it every pattern is tried on every line
+_parser: Any
+try:
+    _parser = importlib.import_module("re._parser")
+except ImportError:  # pragma: no cover - other interpreters
+    _parser = None
+
 logger = get_logger("security")
 
 # ---------------------------------------------------------------------------
@@ -396,21 +409,233 @@ def _collect_files(
 # Pattern-based content scanning
 # ---------------------------------------------------------------------------
 
+# Single characters occur on too many lines to be worth prefiltering
+_MIN_LITERAL_LEN = 2
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters; mapping them
+# before str.lower() lets ASCII literals be found in folded content with str.find
+_FOLD_MAP = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"), ("\u212a", "k"))
+
+# Zero-width assertions that behave the same at a line edge inside the file
+# content as at the edge of the line on its own (``^``/``$`` under MULTILINE)
+_LINE_SAFE_ANCHORS = (
+    {
+        _parser.AT_BEGINNING,
+        _parser.AT_BEGINNING_LINE,
+        _parser.AT_END,
+        _parser.AT_END_LINE,
+        _parser.AT_BOUNDARY,
+        _parser.AT_NON_BOUNDARY,
+    }
+    if _parser is not None
+    else set()
+)
+
+
+@dataclass(frozen=True)
+class _Locator:
+    """Finds, over a whole file's content, every line a pattern can match on."""
+
+    regex: re.Pattern[str]
+    literals: tuple[str, ...] = ()  # one occurs in every match; found with str.find
+    ignorecase: bool = False  # literals are lowercase and searched in folded content
+
+
+@dataclass(frozen=True)
+class _PlannedPattern:
+    """A registry pattern prepared for scanning one file."""
+
+    pattern: SecurityPattern
+    on_path: bool  # match the file path instead of content ("sensitive_files")
+    locator: _Locator | None  # None = try the pattern on every line
+
+
+@functools.lru_cache(maxsize=1024)
+def _locator(regex: re.Pattern[str]) -> _Locator | None:
+    """Locator for *regex*, or None when every line must be tried.
+
+    Prefers the literals of which every match must contain one; they are
+    also compiled into a regex with the pattern's case sensitivity for
+    content that cannot be folded.  Without such literals the pattern
+    itself is used with ``re.MULTILINE``, provided it has no assertion that
+    could tell a line edge inside the content from the end of a lone line.
+    """
+    if _parser is None:
+        return None
+    try:
+        parsed = list(_parser.parse(regex.pattern, regex.flags))
+    except (re.error, TypeError, ValueError):
+        return None
+    literals = _sequence_literals(parsed)
+    if literals is not None:
+        ignorecase = bool(regex.flags & re.IGNORECASE)
+        literal_regex = re.compile("|".join(map(re.escape, literals)), regex.flags & re.IGNORECASE)
+        if ignorecase and not all(lit.isascii() for lit in literals):
+            return _Locator(literal_regex)
+        if ignorecase:
+            literals = tuple(lit.lower() for lit in literals)
+        return _Locator(literal_regex, literals, ignorecase)
+    if _line_safe(parsed):
+        return _Locator(re.compile(regex.pattern, regex.flags | re.MULTILINE))
+    return None
+
+
+def _fold(content: str) -> str | None:
+    """Lowercase *content* for case-insensitive ``str.find``, or None if offsets would shift."""
+    if not content.isascii():
+        for char, ascii_char in _FOLD_MAP:
+            content = content.replace(char, ascii_char)
+    folded = content.lower()
+    # str.lower() never shortens a character, so equal length means aligned offsets
+    return folded if len(folded) == len(content) else None
+
+
+def _line_safe(items: list[tuple[Any, Any]]) -> bool:
+    """True if a parsed regex has no lookaround, group reference or string anchor."""
+    for op, arg in items:
+        if op is _parser.AT:
+            if arg not in _LINE_SAFE_ANCHORS:
+                return False
+        elif op in (_parser.ASSERT, _parser.ASSERT_NOT, _parser.GROUPREF, _parser.GROUPREF_EXISTS):
+            return False
+        elif op is _parser.SUBPATTERN:
+            if not _line_safe(list(arg[3])):
+                return False
+        elif op in (_parser.MAX_REPEAT, _parser.MIN_REPEAT, _parser.POSSESSIVE_REPEAT):
+            if not _line_safe(list(arg[2])):
+                return False
+        elif op is _parser.ATOMIC_GROUP:
+            if not _line_safe(list(arg)):
+                return False
+        elif op is _parser.BRANCH:
+            if not all(_line_safe(list(b)) for b in arg[1]):
+                return False
+    return True
+
+
+def _sequence_literals(items: list[tuple[Any, Any]]) -> tuple[str, ...] | None:
+    """Literals of which every match of a parsed regex sequence contains one, or None.
+
+    Only mandatory parts are considered: literal runs, groups, repeats with
+    a minimum of one, and alternations whose every branch has a requirement.
+    Anything else ends the current literal run.
+    """
+    candidates: list[tuple[str, ...]] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            candidates.append(("".join(run),))
+            run.clear()
+
+    for op, arg in items:
+        if op is _parser.LITERAL:
+            run.append(chr(arg))
+            continue
+        if op is _parser.AT:
+            continue  # zero-width anchors keep the surrounding literals adjacent
+        flush()
+        if op is _parser.SUBPATTERN:
+            _group, add_flags, del_flags, sub = arg
+            if not add_flags and not del_flags:
+                req = _sequence_literals(list(sub))
+                if req is not None:
+                    candidates.append(req)
+        elif op in (_parser.MAX_REPEAT, _parser.MIN_REPEAT):
+            low, _high, sub = arg
+            if low >= 1:
+                req = _sequence_literals(list(sub))
+                if req is not None:
+                    candidates.append(req)
+        elif op is _parser.BRANCH:
+            branches = [_sequence_literals(list(b)) for b in arg[1]]
+            if all(b is not None for b in branches):
+                candidates.append(tuple(dict.fromkeys(lit for b in branches for lit in b)))  # type: ignore[union-attr]
+    flush()
+
+    useful = [c for c in candidates if min(map(len, c)) >= _MIN_LITERAL_LEN]
+    if not useful:
+        return None
+    # Prefer the requirement whose shortest literal is longest: it hits the fewest lines
+    return max(useful, key=lambda c: (min(map(len, c)), -len(c)))
+
+
+def _plan_patterns(
+    ext: str,
+    categories: list[str],
+    registry: dict[str, list[SecurityPattern]],
+) -> list[_PlannedPattern]:
+    """Patterns applicable to files with extension *ext*, in category then registry order."""
+    planned: list[_PlannedPattern] = []
+    for cat_name in categories:
+        for pattern in registry.get(cat_name, []):
+            # Skip if pattern is extension-specific and file doesn't match
+            if pattern.file_extensions is not None and ext not in pattern.file_extensions:
+                continue
+            # The "sensitive_files" category matches against file paths, not content
+            if cat_name == "sensitive_files":
+                planned.append(_PlannedPattern(pattern, True, None))
+                continue
+            planned.append(_PlannedPattern(pattern, False, _locator(pattern.regex)))
+    return planned
+
+
+def _literal_lines(haystack: str, literals: tuple[str, ...]) -> list[int]:
+    """Ascending 0-based indexes of the lines of *haystack* containing any of *literals*."""
+    found: set[int] = set()
+    for lit in literals:
+        line = counted = 0
+        pos = haystack.find(lit)
+        while pos != -1:
+            line += haystack.count("\n", counted, pos)
+            found.add(line)
+            counted = haystack.find("\n", pos)
+            if counted == -1:
+                break
+            # Resume at the next line: one hit is enough to try the pattern on this one
+            pos = haystack.find(lit, counted + 1)
+    return sorted(found)
+
+
+def _regex_lines(content: str, regex: re.Pattern[str]) -> list[int]:
+    """Ascending 0-based indexes of the lines of *content* where *regex* matches."""
+    found: list[int] = []
+    line = counted = 0
+    match = regex.search(content)
+    while match is not None:
+        line += content.count("\n", counted, match.start())
+        found.append(line)
+        counted = content.find("\n", match.start())
+        if counted == -1:
+            break
+        match = regex.search(content, counted + 1)
+    return found
+
 
 def _scan_file_with_patterns(
     filepath: str,
     categories: list[str] | None,
     registry: dict[str, list[SecurityPattern]],
+    plans: dict[str, list[_PlannedPattern]] | None = None,
 ) -> list[Any]:
     """Scan a single file against pattern registry categories.
 
+    The content is read once.  Each pattern's locator (see ``_locator``)
+    is searched over the whole content, and the pattern itself is then
+    tried only on the lines the locator hit — none at all for most
+    patterns in most files.  Findings are identical to trying every
+    pattern on every line.
+
     Args:
         filepath: Absolute path to the file to scan.
         categories: Categories to scan (None = all).
         registry: The PATTERN_REGISTRY dict.
+        plans: Per-extension pattern plans to reuse across calls with the
+            same *categories* and *registry*; filled in as needed.
 
     Returns:
-        List of SecurityFinding objects for matches found.
+        List of SecurityFinding objects for matches found, ordered by
+        category, pattern and line.
     """
     # Lazy import to avoid circular import (scanner.py is imported by __init__.py
     # before SecurityFinding is fully available in the mahabharatha.security namespace)
@@ -425,53 +650,116 @@ def _scan_file_with_patterns(
         return findings
 
     lines = content.split("\n")
-    cats_to_scan = categories if categories is not None else list(registry.keys())
 
-    for cat_name in cats_to_scan:
-        patterns = registry.get(cat_name, [])
-        for pattern in patterns:
-            # Skip if pattern is extension-specific and file doesn't match
-            if pattern.file_extensions is not None and ext not in pattern.file_extensions:
-                continue
+    folded: str | None = None
+    fold_tried = False
 
-            # The "sensitive_files" category matches against file paths, not content
-            if cat_name == "sensitive_files":
-                if pattern.regex.search(filepath):
-                    findings.append(
-                        SecurityFinding(
-                            category=pattern.category,
-                            severity=pattern.severity,
-                            file=filepath,
-                            line=0,
-                            message=pattern.message,
-                            cwe=pattern.cwe,
-                            remediation=pattern.remediation,
-                            pattern_name=pattern.name,
-                        )
+    if plans is None:
+        plans = {}
+    if ext not in plans:
+        cats_to_scan = categories if categories is not None else list(registry.keys())
+        plans[ext] = _plan_patterns(ext, cats_to_scan, registry)
+
+    for planned in plans[ext]:
+        pattern = planned.pattern
+        if planned.on_path:
+            if pattern.regex.search(filepath):
+                findings.append(
+                    SecurityFinding(
+                        category=pattern.category,
+                        severity=pattern.severity,
+                        file=filepath,
+                        line=0,
+                        message=pattern.message,
+                        cwe=pattern.cwe,
+                        remediation=pattern.remediation,
+                        pattern_name=pattern.name,
                     )
-                continue
+                )
+            continue
 
-            # Content-based scanning: check each line
-            for line_num, line in enumerate(lines, start=1):
-                if pattern.regex.search(line):
-                    # Mask sensitive content in the message
-                    masked_line = line.strip()[:80]
-                    findings.append(
-                        SecurityFinding(
-                            category=pattern.category,
-                            severity=pattern.severity,
-                            file=filepath,
-                            line=line_num,
-                            message=f"{pattern.message} [{masked_line}]",
-                            cwe=pattern.cwe,
-                            remediation=pattern.remediation,
-                            pattern_name=pattern.name,
-                        )
+        locator = planned.locator
+        candidates: list[int] | range
+        if locator is None:
+            candidates = range(len(lines))
+        elif not locator.literals:
+            candidates = _regex_lines(content, locator.regex)
+        elif not locator.ignorecase:
+            candidates = _literal_lines(content, locator.literals)
+        else:
+            if not fold_tried:
+                folded, fold_tried = _fold(content), True
+            if folded is None:
+                candidates = _regex_lines(content, locator.regex)
+            else:
+                candidates = _literal_lines(folded, locator.literals)
+
+        for idx in candidates:
+            line = lines[idx]
+            if pattern.regex.search(line):
+                # Mask sensitive content in the message
+                masked_line = line.strip()[:80]
+                findings.append(
+                    SecurityFinding(
+                        category=pattern.category,
+                        severity=pattern.severity,
+                        file=filepath,
+                        line=idx + 1,
+                        message=f"{pattern.message} [{masked_line}]",
+                        cwe=pattern.cwe,
+                        remediation=pattern.remediation,
+                        pattern_name=pattern.name,
                     )
+                )
 
     return findings
 
 
+# Below this many files the scan runs in-process; pool start-up would dominate
+_PARALLEL_MIN_FILES = 500
+
+# Each scan process gets at least this many files
+_FILES_PER_PROCESS = 200
+
+
+def _scan_shard(paths: list[str], categories: list[str]) -> list[Any]:
+    """Pool worker: pattern-scan a shard of files, findings in input order."""
+    findings: list[Any] = []
+    plans: dict[str, list[_PlannedPattern]] = {}
+    for filepath in paths:
+        findings.extend(_scan_file_with_patterns(filepath, categories, PATTERN_REGISTRY, plans))
+    return findings
+
+
+def _scan_files(files: list[str], categories: list[str], jobs: int | None = None) -> list[Any]:
+    """Pattern-scan *files* against *categories* of ``PATTERN_REGISTRY``.
+
+    Args:
+        files: Files to scan.
+        categories: Registry categories to apply.
+        jobs: Scan processes. ``None`` uses one per CPU once there are at
+            least ``_PARALLEL_MIN_FILES`` files; ``1`` always scans in-process.
+
+    Returns:
+        Findings in file order. Contiguous shards are mapped in order, so
+        the result is identical to a serial scan.
+    """
+    procs = pool_size(len(files), jobs, min_files=_PARALLEL_MIN_FILES, files_per_process=_FILES_PER_PROCESS)
+    if procs > 1:
+        # A few shards per process evens out files of very different sizes
+        size = -(-len(files) // (procs * 4))
+        shards = [files[i : i + size] for i in range(0, len(files), size)]
+        try:
+            with ProcessPoolExecutor(max_workers=procs, mp_context=pool_context(__name__)) as pool:
+                results = list(pool.map(_scan_shard, shards, [categories] * len(shards)))
+        except (OSError, BrokenProcessPool) as e:
+            logger.debug("Parallel security scan unavailable (%s); scanning serially", e)
+        else:
+            return [finding for shard in results for finding in shard]
+
+    return _scan_shard(files, categories)
+
+
 # ---------------------------------------------------------------------------
 # Git history scanning
 # ---------------------------------------------------------------------------
@@ -569,6 +857,7 @@ def run_security_scan(
     categories: list[str] | None = None,
     files: list[str] | None = None,
     git_history_depth: int = 100,
+    jobs: int | None = None,
 ) -> Any:
     """Run a comprehensive security scan on the specified path.
 
@@ -581,6 +870,8 @@ def run_security_scan(
         categories: Restrict scan to these category names. ``None`` scans all.
         files: Explicit file list to scan. ``None`` discovers files from *path*.
         git_history_depth: Number of git commits to scan for secrets (default 100).
+        jobs: Pattern-scan processes. ``None`` fans large scans out across
+            one process per CPU; ``1`` always scans in-process.
 
     Returns:
         A :class:`~mahabharatha.security.SecurityResult` with structured findings.
@@ -602,10 +893,8 @@ def run_security_scan(
         [c for c in categories if c in PATTERN_REGISTRY] if categories is not None else list(PATTERN_REGISTRY.keys())
     )
 
-    # 2. Pattern scan — iterate files and apply registry patterns
-    for filepath in collected_files:
-        file_findings = _scan_file_with_patterns(filepath, cats_to_scan, PATTERN_REGISTRY)
-        all_findings.extend(file_findings)
+    # 2. Pattern scan — apply registry patterns to every file, in file order
+    all_findings.extend(_scan_files(collected_files, cats_to_scan, jobs))
 
     # 3. CVE / dependency scan
     cve_category = "cve"
@@ -0,0 +1,218 @@
+"""State backend selection — builds the PersistenceLayer configured for a project.
+
+Every process touching a feature's state (orchestrator, workers, CLI commands)
+must agree on the backend, so the choice lives in ``.mahabharatha/config.yaml``
+under ``state.backend`` and is resolved here.  The config is read next to the
+state directory rather than from the current directory, and the orchestrator
+pins the backend it resolved in ``<state_dir>/<feature>.backend``: workers run
+in worktrees (or containers) whose committed config may differ from the live
+one, and the pin wins over any config they can see.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from mahabharatha.constants import STATE_DIR
+from mahabharatha.logging import get_logger
+from mahabharatha.state.journal import DEFAULT_COMPACT_THRESHOLD, JournaledPersistenceLayer
+from mahabharatha.state.persistence import PersistenceLayer
+from mahabharatha.state.sqlite_store import SQLitePersistenceLayer
+
+if TYPE_CHECKING:
+    from mahabharatha.config import StateConfig
+
+logger = get_logger("state.backends")
+
+STATE_BACKENDS = ("json", "journal", "sqlite")
+CONFIG_FILE_NAME = "config.yaml"
+BACKEND_PIN_SUFFIX = ".backend"
+
+# Suffixes of the files a feature's state may occupy under any backend:
+# JSON snapshot and its backup, journal WAL, SQLite database and its sidecars
+STATE_FILE_SUFFIXES = (".json", ".json.bak", ".wal", ".db", ".db-wal", ".db-shm")
+
+# Suffixes that mark a feature as having state (sidecars alone do not)
+_PRIMARY_SUFFIXES = (".json", ".wal", ".db")
+
+# Shared caches (e.g. ``parse-cache.db``) also live in the state directory as
+# SQLite files; a ``.db`` is only a feature's state if it has this table
+_STATE_DB_TABLE = "sync"
+
+
+def _config_file(state_dir: str | Path | None) -> Path:
+    """Project config that governs *state_dir* (``.mahabharatha/config.yaml`` beside it)."""
+    return Path(state_dir or STATE_DIR).parent / CONFIG_FILE_NAME
+
+
+def _load_state_config(state_dir: str | Path | None = None) -> StateConfig | None:
+    """Load the state section of the project config, falling back to defaults.
+
+    Short-lived CLI processes (``mahabharatha status``, ``logs``) only need
+    ``state.backend``, so unless the full config is already imported this
+    reads just the ``state`` section and skips building the Pydantic models.
+
+    Args:
+        state_dir: State directory whose project config applies
+
+    Returns:
+        The configured StateConfig, or None when no state section is set
+        (the default JSON backend)
+    """
+    config_file = _config_file(state_dir)
+    if "mahabharatha.config" not in sys.modules:
+        try:
+            section = _read_state_section(config_file)
+        except Exception:  # noqa: BLE001 — intentional: unreadable config falls back to defaults like the full load
+            logger.debug("Failed to read state section of %s; using defaults", config_file, exc_info=True)
+            return None
+        if not section:
+            return None
+
+    from mahabharatha.config import MahabharathaConfig, StateConfig
+
+    try:
+        return MahabharathaConfig.load(config_file).state
+    except Exception:  # noqa: BLE001 — intentional: config load spans I/O, YAML, Pydantic; safe fallback to defaults
+        logger.debug("Failed to load MahabharathaConfig for state backend; using defaults", exc_info=True)
+        return StateConfig()
+
+
+def _read_state_section(config_path: Path) -> dict[str, Any] | None:
+    """Return the raw ``state`` mapping of a config file, if any."""
+    if not config_path.exists():
+        return None
+    import yaml
+
+    with open(config_path) as f:
+        data = yaml.safe_load(f) or {}
+    return data.get("state") if isinstance(data, dict) else None
+
+
+def _pin_file(feature: str, state_dir: str | Path | None) -> Path:
+    return Path(state_dir or STATE_DIR) / f"{feature}{BACKEND_PIN_SUFFIX}"
+
+
+def pin_backend(feature: str, state_dir: str | Path | None, backend: str) -> None:
+    """Record the backend every process must use for *feature*'s state.
+
+    Args:
+        feature: Feature name
+        state_dir: Directory for state files (defaults to .mahabharatha/state)
+        backend: One of STATE_BACKENDS
+
+    Raises:
+        ValueError: If *backend* is not a known state backend
+    """
+    if backend not in STATE_BACKENDS:
+        raise ValueError(f"Unknown state backend: {backend!r}")
+    pin = _pin_file(feature, state_dir)
+    pin.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=pin.parent, prefix=f".{pin.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(backend)
+        os.replace(tmp, pin)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def pinned_backend(feature: str, state_dir: str | Path | None = None) -> str | None:
+    """Backend pinned for *feature* by the orchestrator, or None if unpinned."""
+    try:
+        backend = _pin_file(feature, state_dir).read_text().strip()
+    except OSError:
+        return None
+    if backend not in STATE_BACKENDS:
+        logger.warning("Ignoring unknown state backend %r pinned for %s", backend, feature)
+        return None
+    return backend
+
+
+def feature_state_files(feature: str, state_dir: str | Path | None = None) -> list[Path]:
+    """Existing files holding *feature*'s state under any backend, plus its backend pin."""
+    base = Path(state_dir or STATE_DIR)
+    candidates = [base / f"{feature}{suffix}" for suffix in (*STATE_FILE_SUFFIXES, BACKEND_PIN_SUFFIX)]
+    return [path for path in candidates if path.exists()]
+
+
+def _is_state_db(path: Path, feature: str) -> bool:
+    """True if the SQLite file *path* holds *feature*'s state rather than a shared cache."""
+    if _pin_file(feature, path.parent).exists():
+        return True
+    try:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (_STATE_DB_TABLE,)
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+    return row is not None
+
+
+def discover_state_features(state_dir: str | Path | None = None) -> list[str]:
+    """Features with state in *state_dir* under any backend, most recently written first."""
+    base = Path(state_dir or STATE_DIR)
+    newest: dict[str, float] = {}
+    try:
+        entries = list(os.scandir(base))
+    except OSError:
+        return []
+    for entry in entries:
+        suffix = next((s for s in _PRIMARY_SUFFIXES if entry.name.endswith(s)), None)
+        if suffix is None or not entry.is_file():
+            continue
+        feature = entry.name[: -len(suffix)]
+        if not feature or (suffix == ".db" and not _is_state_db(Path(entry.path), feature)):
+            continue
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        newest[feature] = max(mtime, newest.get(feature, mtime))
+    return sorted(newest, key=lambda f: newest[f], reverse=True)
+
+
+def create_persistence(
+    feature: str,
+    state_dir: str | Path | None = None,
+    config: StateConfig | None = None,
+) -> PersistenceLayer:
+    """Create the persistence layer for the configured state backend.
+
+    Without an explicit *config*, the backend pinned for the feature (see
+    ``pin_backend``) takes precedence over the project config.
+
+    Args:
+        feature: Feature name for state isolation
+        state_dir: Directory for state files (defaults to .mahabharatha/state)
+        config: State configuration (loads the project config beside
+            *state_dir* if not provided)
+
+    Returns:
+        PersistenceLayer instance for the selected backend
+    """
+    compact_threshold = DEFAULT_COMPACT_THRESHOLD
+    if config is not None:
+        backend = config.backend
+        compact_threshold = config.journal_compact_threshold
+    else:
+        loaded = _load_state_config(state_dir)
+        if loaded is not None:
+            compact_threshold = loaded.journal_compact_threshold
+        backend = pinned_backend(feature, state_dir) or (loaded.backend if loaded is not None else "json")
+
+    if backend == "journal":
+        return JournaledPersistenceLayer(feature, state_dir, compact_threshold=compact_threshold)
+    if backend == "sqlite":
+        return SQLitePersistenceLayer(feature, state_dir)
+    return PersistenceLayer(feature, state_dir)
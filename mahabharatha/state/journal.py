@@ -0,0 +1,288 @@
+"""Journaled persistence backend — append-only write-ahead log plus snapshots.
+
+The default PersistenceLayer rewrites the whole ``{feature}.json`` file on every
+``atomic_update()``, so the cost of each task claim or event append grows with
+the size of the state. JournaledPersistenceLayer instead appends the *delta*
+produced by each update to ``{feature}.wal`` and only rewrites the snapshot
+when the log is compacted, keeping per-update I/O independent of task count.
+
+Deltas are the record-level ops collected by TrackedPersistenceLayer (see
+``mahabharatha/state/tracking.py``), so the repos keep mutating
+``persistence.state`` exactly as they do with the JSON backend.
+
+WAL line format (one JSON object per line)::
+
+    {"seq": 42, "ops": [["set", ["tasks", "T1"], {...}], ["append", ["execution_log"], {...}]]}
+
+The snapshot stores the sequence number it covers under ``JOURNAL_SEQ_KEY`` so a
+crash between writing a snapshot and truncating the log never replays a delta
+twice.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from mahabharatha.exceptions import StateError
+from mahabharatha.logging import get_logger
+from mahabharatha.state.tracking import TrackedPersistenceLayer
+
+logger = get_logger("state.journal")
+
+JOURNAL_SEQ_KEY = "journal_seq"
+DEFAULT_COMPACT_THRESHOLD = 500
+
+
+class JournaledPersistenceLayer(TrackedPersistenceLayer):
+    """PersistenceLayer that appends per-update deltas to a write-ahead log.
+
+    Exposes the same interface as PersistenceLayer so every repo
+    (TaskStateRepo, WorkerStateRepo, ExecutionLog, ...) works unchanged.
+    Each ``atomic_update()`` replays only the log records written by other
+    processes since this instance last looked, then appends one line with its
+    own changes. Once the log holds ``compact_threshold`` records it is folded
+    into the ``{feature}.json`` snapshot and truncated.
+    """
+
+    def __init__(
+        self,
+        feature: str,
+        state_dir: str | Path | None = None,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+    ) -> None:
+        """Initialize journaled persistence layer.
+
+        Args:
+            feature: Feature name for state isolation
+            state_dir: Directory for state files (defaults to .mahabharatha/state)
+            compact_threshold: Number of WAL records that triggers compaction
+        """
+        super().__init__(feature, state_dir)
+        self._wal_file = self.state_dir / f"{feature}.wal"
+        self._compact_threshold = max(1, compact_threshold)
+        self._seq = 0  # Last sequence number applied to the in-memory state
+        self._wal_offset = 0  # Byte offset of the first unread WAL record
+        self._wal_records = 0  # Records currently in the WAL
+        self._snapshot_id: tuple[int, int, int] | None = None
+
+    @property
+    def wal_file(self) -> Path:
+        """Path to the write-ahead log file."""
+        return self._wal_file
+
+    # === Disk synchronisation ===
+
+    def _snapshot_identity(self) -> tuple[int, int, int] | None:
+        try:
+            st = self._state_file.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _wal_size(self) -> int:
+        try:
+            return self._wal_file.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _sync(self, strict: bool = False) -> None:
+        """Bring the in-memory state up to date with snapshot + WAL.
+
+        Caller must hold the state file lock (shared or exclusive).
+
+        Args:
+            strict: Raise StateError on a corrupt snapshot instead of falling back
+        """
+        snapshot_id = self._snapshot_identity()
+        if self._stale or snapshot_id != self._snapshot_id or self._wal_size() < self._wal_offset:
+            self._full_reload(snapshot_id, strict)
+        else:
+            self._replay_wal()
+
+    def _full_reload(self, snapshot_id: tuple[int, int, int] | None, strict: bool) -> None:
+        data: dict[str, Any] | None = None
+        if snapshot_id is not None:
+            try:
+                with open(self._state_file) as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                if strict:
+                    raise StateError(f"Failed to parse state file: {e}") from e
+                logger.warning(f"Corrupt state snapshot for {self.feature}, rebuilding: {e}")
+                data = dict(self._state) if self._state else None
+                self._full_rewrite = True
+        if data is None:
+            data = self._create_initial_state()
+            self._full_rewrite = True
+
+        self._seq = int(data.pop(JOURNAL_SEQ_KEY, 0) or 0)
+        self._replace_state(data)
+        self._snapshot_id = snapshot_id
+        self._wal_offset = 0
+        self._wal_records = 0
+        self._stale = False
+        self._replay_wal()
+
+    def _replay_wal(self) -> None:
+        """Apply WAL records appended since ``self._wal_offset``."""
+        try:
+            with open(self._wal_file, "rb") as f:
+                f.seek(self._wal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        if not data:
+            return
+
+        # A crash mid-append can leave a torn final line; stop before it.
+        end = data.rfind(b"\n") + 1
+        self._replaying = True
+        try:
+            for line in data[:end].splitlines():
+                if not line.strip():
+                    continue
+                self._wal_records += 1
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Skipping corrupt WAL record for {self.feature}: {e}")
+                    continue
+                seq = int(record.get("seq", 0))
+                if seq <= self._seq:
+                    continue
+                for op in record.get("ops", []):
+                    self._apply_op(op)
+                self._seq = seq
+        finally:
+            self._replaying = False
+        self._wal_offset += end
+
+    def _commit(self) -> None:
+        """Persist changes recorded during the current atomic_update."""
+        try:
+            if self._full_rewrite:
+                self._compact()
+                return
+            ops = self._collect_changes()
+            if not ops:
+                return
+
+            record = {"seq": self._seq + 1, "ops": ops}
+            payload = (json.dumps(record, default=str, separators=(",", ":")) + "\n").encode()
+            with open(self._wal_file, "ab") as f:
+                if f.tell() > self._wal_offset:
+                    # Drop a torn record left behind by a crashed writer.
+                    f.truncate(self._wal_offset)
+                f.write(payload)
+            self._bytes_written += len(payload)
+            self._seq += 1
+            self._wal_offset += len(payload)
+            self._wal_records += 1
+            logger.debug(f"Journaled {len(ops)} op(s) for feature {self.feature} (seq {self._seq})")
+
+            if self._wal_records >= self._compact_threshold:
+                self._compact()
+        finally:
+            self._reset_changes()
+
+    def _snapshot_payload(self) -> dict[str, Any]:
+        return {**self._state, JOURNAL_SEQ_KEY: self._seq}
+
+    def _compact(self) -> None:
+        """Fold the WAL into a fresh snapshot. Called under the file lock."""
+        self._raw_save()
+        with open(self._wal_file, "wb"):
+            pass  # Truncate
+        self._snapshot_id = self._snapshot_identity()
+        self._wal_offset = 0
+        self._wal_records = 0
+        logger.debug(f"Compacted state journal for feature {self.feature} at seq {self._seq}")
+
+    # === PersistenceLayer interface ===
+
+    @contextlib.contextmanager
+    def atomic_update(self) -> Iterator[None]:
+        """Cross-process atomic read-modify-write backed by the WAL.
+
+        Acquires the exclusive file lock, replays records written by other
+        processes, yields for the caller to mutate ``self.state``, then appends
+        the resulting delta as a single WAL record. Nested calls are reentrant
+        and fold into the outermost record.
+        """
+        with self._lock:
+            if self._file_lock_depth > 0:
+                self._file_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._file_lock_depth -= 1
+                return
+
+            with self._profiled_lock(self._file_lock(fcntl.LOCK_EX)):
+                self._file_lock_depth = 1
+                try:
+                    self._sync()
+                    self._begin_changes()
+                    try:
+                        yield
+                    except BaseException:
+                        # Partial in-memory mutations were never journaled.
+                        self._discard_changes()
+                        raise
+                    finally:
+                        self._end_changes()
+                    self._commit()
+                finally:
+                    self._file_lock_depth = 0
+
+    def load(self) -> dict[str, Any]:
+        """Load state from snapshot + WAL.
+
+        Returns:
+            State dictionary
+        """
+        with self._file_lock(fcntl.LOCK_SH), self._lock:
+            if not self.exists():
+                self._stale = True
+                self._replace_state(self._create_initial_state())
+                self._snapshot_id = None
+                self._wal_offset = 0
+                self._wal_records = 0
+                self._seq = 0
+            else:
+                self._sync(strict=True)
+            logger.debug(f"Loaded state for feature {self.feature}")
+            return self._state.copy()
+
+    def save(self) -> None:
+        """Write the in-memory state as a new snapshot and truncate the WAL."""
+        with self._file_lock(fcntl.LOCK_EX), self._lock:
+            self._compact()
+            self._stale = False
+
+    def delete(self) -> None:
+        """Delete snapshot and WAL files."""
+        with self._lock:
+            for path in (self._wal_file, self._state_file):
+                if path.exists():
+                    path.unlink()
+            self._stale = True
+            self._snapshot_id = None
+            self._wal_offset = 0
+            self._wal_records = 0
+            self._seq = 0
+        logger.info(f"Deleted state for feature {self.feature}")
+
+    def exists(self) -> bool:
+        """Check if a snapshot or WAL exists.
+
+        Returns:
+            True if state has been persisted
+        """
+        return self._state_file.exists() or (self._wal_file.exists() and os.path.getsize(self._wal_file) > 0)
@@ -0,0 +1,263 @@
+"""State-lock contention profiling.
+
+Every outermost ``atomic_update`` records how long its caller waited for the
+exclusive state lock, how long it held it, and how many bytes the backend
+wrote, keyed by the repo method that opened the update (``claim_task``,
+``append_event``, ``set_worker_state``, ...). Values go into DDSketch
+histograms so the profiles of the orchestrator and every worker can be
+merged: each process periodically rewrites its own
+``<state_dir>/lock-profile/<feature>-<pid>.json`` and summarize_lock_profile()
+merges them for ``mahabharatha status --json`` and ``mahabharatha debug``.
+The orchestrator resets a feature's profiles when a run starts and
+``mahabharatha cleanup`` removes them with the rest of the feature's state.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mahabharatha.logging import get_logger
+from mahabharatha.quantile_sketch import DDSketch
+
+logger = get_logger("state.lock_profile")
+
+PROFILE_SUBDIR = "lock-profile"
+FLUSH_INTERVAL_SECONDS = 5.0
+
+# Frames skipped when attributing an update to its call site
+_WRAPPER_FUNCS = frozenset({"atomic_update", "_profiled_lock"})
+
+
+def lock_profile_dir(state_dir: str | Path) -> Path:
+    """Directory holding the per-process lock profiles."""
+    return Path(state_dir) / PROFILE_SUBDIR
+
+
+def lock_profile_files(state_dir: str | Path, feature: str) -> list[Path]:
+    """Profile files written for a feature, one per process."""
+    directory = lock_profile_dir(state_dir)
+    if not directory.is_dir():
+        return []
+    # Another feature's name may extend this one ("auth" vs "auth-v2"), so match the pid exactly
+    pattern = re.compile(rf"{re.escape(feature)}-\d+\.json")
+    return sorted(p for p in directory.glob(f"{feature}-*.json") if pattern.fullmatch(p.name))
+
+
+def reset_lock_profile(state_dir: str | Path, feature: str) -> None:
+    """Delete a feature's profile files so a new run starts from empty histograms."""
+    for path in lock_profile_files(state_dir, feature):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Failed to remove lock profile {path}: {e}")
+
+
+def call_site() -> str:
+    """Name of the function that opened the current ``atomic_update``."""
+    frame = sys._getframe(1)
+    while frame is not None and (
+        frame.f_code.co_filename == contextlib.__file__ or frame.f_code.co_name in _WRAPPER_FUNCS
+    ):
+        frame = frame.f_back  # type: ignore[assignment]
+    return frame.f_code.co_name if frame is not None else "unknown"
+
+
+@dataclass
+class SiteStats:
+    """Lock wait/hold time (ms) and bytes written for one call site."""
+
+    wait_ms: DDSketch = field(default_factory=DDSketch)
+    hold_ms: DDSketch = field(default_factory=DDSketch)
+    bytes_written: DDSketch = field(default_factory=DDSketch)
+
+    @property
+    def count(self) -> int:
+        """Number of recorded updates."""
+        return self.hold_ms.count
+
+    def merge(self, other: SiteStats) -> None:
+        """Fold another site's histograms into this one."""
+        self.wait_ms.merge(other.wait_ms)
+        self.hold_ms.merge(other.hold_ms)
+        self.bytes_written.merge(other.bytes_written)
+
+    def summary(self) -> dict[str, Any]:
+        """Totals and percentiles for display."""
+
+        def hist(sketch: DDSketch, digits: int) -> dict[str, float]:
+            return {
+                "total": round(sketch.sum, digits),
+                "p50": round(sketch.quantile(0.5), digits),
+                "p90": round(sketch.quantile(0.9), digits),
+                "p99": round(sketch.quantile(0.99), digits),
+                "max": round(sketch.quantile(1.0), digits),
+            }
+
+        return {
+            "count": self.count,
+            "wait_ms": hist(self.wait_ms, 2),
+            "hold_ms": hist(self.hold_ms, 2),
+            "bytes_written": hist(self.bytes_written, 0),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "wait_ms": self.wait_ms.to_dict(),
+            "hold_ms": self.hold_ms.to_dict(),
+            "bytes_written": self.bytes_written.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SiteStats:
+        """Restore stats serialized with to_dict()."""
+        return cls(
+            wait_ms=DDSketch.from_dict(data.get("wait_ms", {})),
+            hold_ms=DDSketch.from_dict(data.get("hold_ms", {})),
+            bytes_written=DDSketch.from_dict(data.get("bytes_written", {})),
+        )
+
+
+class LockProfiler:
+    """Per-process, per-feature lock contention recorder."""
+
+    def __init__(self, state_dir: str | Path, feature: str) -> None:
+        """Initialize the profiler.
+
+        Args:
+            state_dir: State directory; profiles go to ``<state_dir>/lock-profile/``
+            feature: Feature name
+        """
+        self.directory = lock_profile_dir(Path(state_dir).resolve())  # Immune to later chdir
+        self.feature = feature
+        self.sites: dict[str, SiteStats] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    @property
+    def path(self) -> Path:
+        """Profile file of the current process."""
+        return self.directory / f"{self.feature}-{os.getpid()}.json"
+
+    def record(self, site: str, wait_seconds: float, hold_seconds: float, bytes_written: int) -> None:
+        """Record one ``atomic_update``; call after the lock is released.
+
+        Args:
+            site: Call site from call_site()
+            wait_seconds: Time spent acquiring the lock
+            hold_seconds: Time the lock was held
+            bytes_written: Bytes the backend wrote during the update
+        """
+        with self._lock:
+            if os.getpid() != self._pid:
+                # Forked child: start a fresh profile rather than re-reporting the parent's
+                self.sites = {}
+                self._pid = os.getpid()
+            stats = self.sites.get(site)
+            if stats is None:
+                stats = self.sites[site] = SiteStats()
+            stats.wait_ms.add(wait_seconds * 1000)
+            stats.hold_ms.add(hold_seconds * 1000)
+            stats.bytes_written.add(bytes_written)
+            self._dirty = True
+            due = time.monotonic() - self._last_flush >= FLUSH_INTERVAL_SECONDS
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Rewrite this process's profile file."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"feature": self.feature, "pid": os.getpid(), "sites": {}}
+            payload["sites"] = {site: stats.to_dict() for site, stats in self.sites.items()}
+            self._dirty = False
+            self._last_flush = time.monotonic()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", prefix=f"{self.feature}_", dir=self.directory)
+            with open(fd, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.debug(f"Failed to write lock profile {self.path}: {e}")
+
+
+_profilers: dict[tuple[Path, str], LockProfiler] = {}
+_profilers_lock = threading.Lock()
+
+
+def shared_profiler(state_dir: str | Path, feature: str) -> LockProfiler:
+    """Return the process-wide profiler for a state directory and feature.
+
+    Every PersistenceLayer of a feature in one process shares the profiler,
+    so they all report into one profile file.
+    """
+    key = (Path(state_dir).resolve(), feature)
+    with _profilers_lock:
+        profiler = _profilers.get(key)
+        if profiler is None:
+            profiler = _profilers[key] = LockProfiler(state_dir, feature)
+        return profiler
+
+
+@atexit.register
+def _flush_all() -> None:
+    for profiler in list(_profilers.values()):
+        profiler.flush()
+
+
+def load_lock_profile(state_dir: str | Path, feature: str) -> dict[str, SiteStats]:
+    """Merge the profiles every process wrote for a feature.
+
+    Args:
+        state_dir: State directory
+        feature: Feature name
+
+    Returns:
+        Stats per call site
+    """
+    merged: dict[str, SiteStats] = {}
+    for path in lock_profile_files(state_dir, feature):
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Skipping lock profile {path}: {e}")
+            continue
+        if data.get("feature") != feature:
+            continue  # Another feature whose name shares this prefix
+        for site, raw in data.get("sites", {}).items():
+            stats = SiteStats.from_dict(raw)
+            if site in merged:
+                merged[site].merge(stats)
+            else:
+                merged[site] = stats
+    return merged
+
+
+def summarize_lock_profile(state_dir: str | Path, feature: str) -> dict[str, dict[str, Any]]:
+    """Per-site lock contention summary, most total wait time first.
+
+    Args:
+        state_dir: State directory
+        feature: Feature name
+
+    Returns:
+        Mapping of call site to SiteStats.summary()
+    """
+    sites = load_lock_profile(state_dir, feature)
+    ranked = sorted(sites.items(), key=lambda item: item[1].wait_ms.sum, reverse=True)
+    return {site: stats.summary() for site, stats in ranked}
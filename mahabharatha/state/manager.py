@@ -11,17 +11,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from mahabharatha.state.backends import create_persistence
 from mahabharatha.state.execution import ExecutionLog
 from mahabharatha.state.level_repo import LevelStateRepo
 from mahabharatha.state.metrics_store import MetricsStore
-from mahabharatha.state.persistence import PersistenceLayer
 from mahabharatha.state.renderer import StateRenderer
 from mahabharatha.state.resource_repo import ResourceRepo
 from mahabharatha.state.retry_repo import RetryRepo
+from mahabharatha.state.sqlite_store import SQLitePersistenceLayer, SQLiteTaskStateRepo
 from mahabharatha.state.task_repo import TaskStateRepo
 from mahabharatha.state.worker_repo import WorkerStateRepo
 
 if TYPE_CHECKING:
+    from mahabharatha.config import StateConfig
     from mahabharatha.constants import LevelMergeStatus, TaskStatus
     from mahabharatha.dependency_checker import DependencyChecker
     from mahabharatha.types import ExecutionEvent, FeatureMetrics, WorkerState
@@ -35,20 +37,31 @@ class StateManager:
 
     Uses fcntl.flock for cross-process file locking to prevent race conditions
     when multiple container workers share the same state file via bind mounts.
+    The persistence backend (whole-file JSON, journaled WAL or SQLite) is selected by
+    ``state.backend`` in the project config.
     """
 
-    def __init__(self, feature: str, state_dir: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        feature: str,
+        state_dir: str | Path | None = None,
+        config: StateConfig | None = None,
+    ) -> None:
         """Initialize state manager.
 
         Args:
             feature: Feature name for state isolation
             state_dir: Directory for state files (defaults to .mahabharatha/state)
+            config: State backend configuration (loads from MahabharathaConfig if not provided)
         """
         # Core persistence layer (file I/O, locking, serialization)
-        self._persistence = PersistenceLayer(feature, state_dir)
+        self._persistence = create_persistence(feature, state_dir, config)
 
         # Specialized repositories
-        self._tasks = TaskStateRepo(self._persistence)
+        if isinstance(self._persistence, SQLitePersistenceLayer):
+            self._tasks: TaskStateRepo = SQLiteTaskStateRepo(self._persistence)
+        else:
+            self._tasks = TaskStateRepo(self._persistence)
         self._retries = RetryRepo(self._persistence)
         self._workers = WorkerStateRepo(self._persistence)
         self._levels = LevelStateRepo(self._persistence)
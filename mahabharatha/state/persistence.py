@@ -11,17 +11,23 @@ import fcntl
 import json
 import tempfile
 import threading
+import time
 from collections.abc import Iterator
+from contextlib import AbstractContextManager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from mahabharatha.constants import STATE_DIR
 from mahabharatha.exceptions import StateError
 from mahabharatha.logging import get_logger
+from mahabharatha.state.lock_profile import call_site, shared_profiler
+from mahabharatha.tracing import CAT_LOCK, span
 
 logger = get_logger("state.persistence")
 
+T = TypeVar("T")
+
 
 class PersistenceLayer:
     """Low-level state persistence with cross-process file locking.
@@ -43,7 +49,9 @@ class PersistenceLayer:
         self._lock = threading.RLock()  # In-process thread safety
         self._file_lock_depth = 0  # Reentrant counter for cross-process file lock
         self._state: dict[str, Any] = {}
+        self._bytes_written = 0  # Running total, sampled per atomic_update by the lock profiler
         self._ensure_dir()
+        self._lock_profiler = shared_profiler(self.state_dir, feature)
 
     @property
     def state(self) -> dict[str, Any]:
@@ -72,6 +80,43 @@ class PersistenceLayer:
         """Ensure state directory exists."""
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
+    @contextlib.contextmanager
+    def _file_lock(self, mode: int) -> Iterator[None]:
+        lock_fd = open(self._state_file.with_suffix(".lock"), "w")  # noqa: SIM115
+        try:
+            fcntl.flock(lock_fd, mode)
+            yield
+        finally:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            except OSError as e:
+                logger.debug(f"Lock release failed: {e}")
+            lock_fd.close()
+
+    @contextlib.contextmanager
+    def _profiled_lock(self, lock: AbstractContextManager[T]) -> Iterator[T]:
+        """Hold the backend's exclusive lock, recording contention for the caller.
+
+        Wait time, hold time and bytes written are reported to the lock
+        profiler after the lock is released, tagged with the repo method that
+        opened the ``atomic_update``.
+        """
+        site = call_site()
+        start = time.monotonic()
+        acquired: float | None = None
+        bytes_before = self._bytes_written
+        try:
+            with contextlib.ExitStack() as stack:
+                with span("state.lock_wait", CAT_LOCK, feature=self.feature, site=site):
+                    value = stack.enter_context(lock)
+                acquired = time.monotonic()
+                yield value
+        finally:
+            if acquired is not None:
+                self._lock_profiler.record(
+                    site, acquired - start, time.monotonic() - acquired, self._bytes_written - bytes_before
+                )
+
     @contextlib.contextmanager
     def atomic_update(self) -> Iterator[None]:
         """Cross-process atomic read-modify-write.
@@ -98,34 +143,26 @@ class PersistenceLayer:
                     self._file_lock_depth -= 1
                 return
 
-            lock_path = self._state_file.with_suffix(".lock")
-            lock_fd = open(lock_path, "w")  # noqa: SIM115
-            try:
-                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            with self._profiled_lock(self._file_lock(fcntl.LOCK_EX)):
                 self._file_lock_depth = 1
+                try:
+                    # Reload latest state from disk under lock
+                    if self._state_file.exists():
+                        try:
+                            with open(self._state_file) as f:
+                                self._state = json.load(f)
+                        except json.JSONDecodeError:
+                            if not self._state:
+                                self._state = self._create_initial_state()
+                    elif not self._state:
+                        self._state = self._create_initial_state()
 
-                # Reload latest state from disk under lock
-                if self._state_file.exists():
-                    try:
-                        with open(self._state_file) as f:
-                            self._state = json.load(f)
-                    except json.JSONDecodeError:
-                        if not self._state:
-                            self._state = self._create_initial_state()
-                elif not self._state:
-                    self._state = self._create_initial_state()
-
-                yield
+                    yield
 
-                # Save to disk under lock
-                self._raw_save()
-            finally:
-                self._file_lock_depth = 0
-                try:
-                    fcntl.flock(lock_fd, fcntl.LOCK_UN)
-                except OSError as e:
-                    logger.debug(f"Lock release failed: {e}")
-                lock_fd.close()
+                    # Save to disk under lock
+                    self._raw_save()
+                finally:
+                    self._file_lock_depth = 0
 
     def _raw_save(self) -> None:
         """Write state to disk. Called under atomic_update file lock."""
@@ -135,6 +172,7 @@ class PersistenceLayer:
                 backup_path = self._state_file.with_suffix(".json.bak")
                 existing_content = self._state_file.read_text()
                 backup_path.write_text(existing_content)
+                self._bytes_written += len(existing_content)
 
             # Atomic write: write to temp file, then rename
             temp_fd, temp_path = tempfile.mkstemp(
@@ -145,9 +183,10 @@ class PersistenceLayer:
             temp_file = Path(temp_path)
             try:
                 with open(temp_fd, "w") as f:
-                    json.dump(self._state, f, indent=2, default=str)
+                    json.dump(self._snapshot_payload(), f, indent=2, default=str)
                 # Atomic rename (on POSIX systems)
                 temp_file.replace(self._state_file)
+                self._bytes_written += self._state_file.stat().st_size
             except Exception:
                 # Clean up temp file on failure
                 if temp_file.exists():
@@ -156,6 +195,13 @@ class PersistenceLayer:
 
             logger.debug(f"Saved state for feature {self.feature}")
 
+    def _snapshot_payload(self) -> dict[str, Any]:
+        """Return the dict written to the state file by _raw_save().
+
+        Subclasses override this to attach backend bookkeeping to the snapshot.
+        """
+        return self._state
+
     def load(self) -> dict[str, Any]:
         """Load state from file.
 
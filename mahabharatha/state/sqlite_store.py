@@ -0,0 +1,579 @@
+"""SQLite state backend — WAL-mode database with one table per state section.
+
+Stores each task, worker, level and resource as its own row (JSON payload plus
+indexed columns) and execution events in an append-only table, in
+``{feature}.db``. Writers serialize on SQLite's ``BEGIN IMMEDIATE`` lock;
+readers (dashboard, ``mahabharatha status``) use WAL snapshots and never block
+or get blocked by workers.
+
+The in-memory ``state`` dict is kept as a cache for the repos. Every row
+carries the sequence number of the transaction that last wrote it, so bringing
+the cache up to date is an indexed ``WHERE seq > ?`` scan over rows changed
+since the last sync rather than a full reload. Hot read paths
+(``get_tasks_by_status``, ``get_stale_in_progress_tasks``) bypass the cache
+entirely and run as indexed queries via SQLiteTaskStateRepo.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from mahabharatha.constants import TaskStatus
+from mahabharatha.exceptions import StateError
+from mahabharatha.logging import get_logger
+from mahabharatha.state.task_repo import TaskStateRepo
+from mahabharatha.state.tracking import TrackedPersistenceLayer
+
+if TYPE_CHECKING:
+    from mahabharatha.dependency_checker import DependencyChecker
+
+logger = get_logger("state.sqlite_store")
+
+# Dict sections stored one row per entry: section -> (table, key column)
+TABLE_SECTIONS: dict[str, tuple[str, str]] = {
+    "tasks": ("tasks", "task_id"),
+    "workers": ("workers", "worker_id"),
+    "levels": ("levels", "level"),
+    "resources": ("resources", "resource_id"),
+}
+EVENTS_SECTION = "execution_log"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    status TEXT,
+    worker_id INTEGER,
+    level INTEGER,
+    started_at TEXT,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    next_retry_at TEXT,
+    data TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, started_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_retry ON tasks(next_retry_at) WHERE next_retry_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_tasks_seq ON tasks(seq);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    status TEXT,
+    data TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_workers_status ON workers(status);
+CREATE INDEX IF NOT EXISTS idx_workers_seq ON workers(seq);
+CREATE TABLE IF NOT EXISTS levels (
+    level TEXT PRIMARY KEY,
+    status TEXT,
+    merge_status TEXT,
+    data TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_levels_seq ON levels(seq);
+CREATE TABLE IF NOT EXISTS resources (
+    resource_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_resources_seq ON resources(seq);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT,
+    event TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_event ON events(event);
+CREATE TABLE IF NOT EXISTS tombstones (
+    section TEXT NOT NULL,
+    key TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (section, key)
+);
+CREATE INDEX IF NOT EXISTS idx_tombstones_seq ON tombstones(seq);
+CREATE TABLE IF NOT EXISTS sync (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    seq INTEGER NOT NULL,
+    reset_seq INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO sync (id, seq, reset_seq) VALUES (0, 0, 0);
+"""
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str, separators=(",", ":"))
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class SQLitePersistenceLayer(TrackedPersistenceLayer):
+    """PersistenceLayer backed by a WAL-mode SQLite database.
+
+    Exposes the same interface as PersistenceLayer so every repo works
+    unchanged; each ``atomic_update()`` becomes one IMMEDIATE transaction that
+    writes only the rows the caller touched.
+    """
+
+    def __init__(self, feature: str, state_dir: str | Path | None = None) -> None:
+        """Initialize SQLite persistence layer.
+
+        Args:
+            feature: Feature name for state isolation
+            state_dir: Directory for state files (defaults to .mahabharatha/state)
+        """
+        super().__init__(feature, state_dir)
+        self._state_file = self.state_dir / f"{feature}.db"
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._seq = 0  # Last transaction sequence applied to the in-memory cache
+        self._event_id = 0  # Highest events.id applied to the in-memory cache
+
+    # === Connection management ===
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Per-process SQLite connection (WAL mode, autocommit)."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(
+                self._state_file,
+                timeout=30.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Schema setup takes the write lock; skip it when the database is
+            # already initialised so readers never wait on a busy writer.
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sync'").fetchone() is None:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._conn_pid = os.getpid()
+            self._stale = True
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    @contextlib.contextmanager
+    def _transaction(self, immediate: bool) -> Iterator[sqlite3.Connection]:
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # === Cache synchronisation ===
+
+    def _sync(self, conn: sqlite3.Connection) -> None:
+        """Bring the in-memory cache up to date. Caller holds a transaction."""
+        seq, reset_seq = conn.execute("SELECT seq, reset_seq FROM sync WHERE id = 0").fetchone()
+        if self._stale or reset_seq > self._seq or seq < self._seq:
+            self._full_reload(conn, seq)
+            return
+        if seq == self._seq:
+            return
+
+        self._replaying = True
+        try:
+            for key, value in conn.execute("SELECT key, value FROM meta WHERE seq > ?", (self._seq,)):
+                self._state[key] = json.loads(value)
+            for section, (table, key_col) in TABLE_SECTIONS.items():
+                rows = conn.execute(
+                    f"SELECT {key_col}, data FROM {table} WHERE seq > ?",  # noqa: S608 — table names are constants
+                    (self._seq,),
+                ).fetchall()
+                if rows:
+                    if not isinstance(self._state.get(section), dict):
+                        self._state[section] = {}
+                    for key, data in rows:
+                        self._state[section][key] = json.loads(data)
+            for section, key in conn.execute("SELECT section, key FROM tombstones WHERE seq > ?", (self._seq,)):
+                if isinstance(self._state.get(section), dict):
+                    self._state[section].pop(key, None)
+        finally:
+            self._replaying = False
+        self._sync_events(conn)
+        self._seq = seq
+
+    def _sync_events(self, conn: sqlite3.Connection) -> None:
+        rows = conn.execute(
+            "SELECT id, timestamp, event, data FROM events WHERE id > ? ORDER BY id",
+            (self._event_id,),
+        ).fetchall()
+        if not rows:
+            return
+        self._replaying = True
+        try:
+            if not isinstance(self._state.get(EVENTS_SECTION), list):
+                self._state[EVENTS_SECTION] = []
+            for event_id, _ts, _event, data in rows:
+                self._state[EVENTS_SECTION].append(json.loads(data))
+                self._event_id = event_id
+        finally:
+            self._replaying = False
+
+    def _full_reload(self, conn: sqlite3.Connection, seq: int) -> None:
+        data: dict[str, Any] = {}
+        try:
+            for key, value in conn.execute("SELECT key, value FROM meta"):
+                data[key] = json.loads(value)
+            for section, (table, key_col) in TABLE_SECTIONS.items():
+                data[section] = {
+                    key: json.loads(payload)
+                    for key, payload in conn.execute(f"SELECT {key_col}, data FROM {table}")  # noqa: S608
+                }
+            events = conn.execute("SELECT id, data FROM events ORDER BY id").fetchall()
+        except json.JSONDecodeError as e:
+            raise StateError(f"Failed to parse state database: {e}") from e
+
+        data[EVENTS_SECTION] = [json.loads(payload) for _id, payload in events]
+        self._event_id = events[-1][0] if events else 0
+        if "feature" not in data:
+            data = {**self._create_initial_state(), **{k: v for k, v in data.items() if v}}
+            self._full_rewrite = True
+        self._replace_state(data)
+        self._seq = seq
+        self._stale = False
+
+    # === Writes ===
+
+    def _upsert_row(self, conn: sqlite3.Connection, section: str, key: str, value: Any, seq: int) -> None:
+        payload = _dumps(value)
+        self._bytes_written += len(payload)
+        record = value if isinstance(value, dict) else {}
+        if section == "tasks":
+            conn.execute(
+                "INSERT OR REPLACE INTO tasks "
+                "(task_id, status, worker_id, level, started_at, retry_count, next_retry_at, data, seq) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    record.get("status"),
+                    _int_or_none(record.get("worker_id")),
+                    _int_or_none(record.get("level")),
+                    record.get("started_at"),
+                    _int_or_none(record.get("retry_count")) or 0,
+                    record.get("next_retry_at") or None,
+                    payload,
+                    seq,
+                ),
+            )
+        elif section == "workers":
+            conn.execute(
+                "INSERT OR REPLACE INTO workers (worker_id, status, data, seq) VALUES (?, ?, ?, ?)",
+                (key, record.get("status"), payload, seq),
+            )
+        elif section == "levels":
+            conn.execute(
+                "INSERT OR REPLACE INTO levels (level, status, merge_status, data, seq) VALUES (?, ?, ?, ?, ?)",
+                (key, record.get("status"), record.get("merge_status"), payload, seq),
+            )
+        else:
+            conn.execute(
+                "INSERT OR REPLACE INTO resources (resource_id, data, seq) VALUES (?, ?, ?)",
+                (key, payload, seq),
+            )
+        conn.execute("DELETE FROM tombstones WHERE section = ? AND key = ?", (section, key))
+
+    def _insert_event(self, conn: sqlite3.Connection, event: Any) -> None:
+        record = event if isinstance(event, dict) else {}
+        payload = _dumps(event)
+        self._bytes_written += len(payload)
+        cursor = conn.execute(
+            "INSERT INTO events (timestamp, event, data) VALUES (?, ?, ?)",
+            (record.get("timestamp"), record.get("event"), payload),
+        )
+        self._event_id = cursor.lastrowid or self._event_id
+
+    def _write_section(self, conn: sqlite3.Connection, section: str, value: Any, seq: int) -> None:
+        """Rewrite a whole top-level section."""
+        if section in TABLE_SECTIONS:
+            table = TABLE_SECTIONS[section][0]
+            conn.execute(f"DELETE FROM {table}")  # noqa: S608
+            conn.execute("DELETE FROM tombstones WHERE section = ?", (section,))
+            for key, record in (value or {}).items():
+                self._upsert_row(conn, section, key, record, seq)
+        elif section == EVENTS_SECTION:
+            conn.execute("DELETE FROM events")
+            self._event_id = 0
+            for event in value or []:
+                self._insert_event(conn, event)
+        elif value is None and section not in self._state:
+            conn.execute("DELETE FROM meta WHERE key = ?", (section,))
+        else:
+            payload = _dumps(value)
+            self._bytes_written += len(payload)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value, seq) VALUES (?, ?, ?)",
+                (section, payload, seq),
+            )
+
+    def _write_all(self, conn: sqlite3.Connection, seq: int) -> None:
+        conn.execute("DELETE FROM meta")
+        sections = set(self._state) | set(TABLE_SECTIONS) | {EVENTS_SECTION}
+        for section in sections:
+            self._write_section(conn, section, self._state.get(section), seq)
+        conn.execute("UPDATE sync SET seq = ?, reset_seq = ? WHERE id = 0", (seq, seq))
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Write changes recorded during the current atomic_update."""
+        try:
+            seq = self._seq + 1
+            if self._full_rewrite:
+                self._write_all(conn, seq)
+                self._seq = seq
+                return
+
+            ops = self._collect_changes()
+            if not ops:
+                return
+            reset = False
+            for op in ops:
+                kind, path = op[0], op[1]
+                section = path[0]
+                if len(path) == 1:
+                    if kind == "append" and section == EVENTS_SECTION:
+                        self._insert_event(conn, op[2])
+                        continue
+                    if section in TABLE_SECTIONS or section == EVENTS_SECTION or kind == "del":
+                        reset = True
+                    self._write_section(conn, section, self._state.get(section), seq)
+                elif section in TABLE_SECTIONS:
+                    if kind == "set":
+                        self._upsert_row(conn, section, path[1], op[2], seq)
+                    else:
+                        table, key_col = TABLE_SECTIONS[section]
+                        conn.execute(f"DELETE FROM {table} WHERE {key_col} = ?", (path[1],))  # noqa: S608
+                        conn.execute(
+                            "INSERT OR REPLACE INTO tombstones (section, key, seq) VALUES (?, ?, ?)",
+                            (section, path[1], seq),
+                        )
+                else:
+                    # Sections without their own table are stored whole in meta.
+                    self._write_section(conn, section, self._state.get(section), seq)
+
+            if reset:
+                conn.execute("UPDATE sync SET seq = ?, reset_seq = ? WHERE id = 0", (seq, seq))
+            else:
+                conn.execute("UPDATE sync SET seq = ? WHERE id = 0", (seq,))
+            self._seq = seq
+            logger.debug(f"Committed {len(ops)} op(s) for feature {self.feature} (seq {seq})")
+        finally:
+            self._reset_changes()
+
+    # === PersistenceLayer interface ===
+
+    @contextlib.contextmanager
+    def atomic_update(self) -> Iterator[None]:
+        """Cross-process atomic read-modify-write in one IMMEDIATE transaction.
+
+        Syncs the cache with rows changed by other processes, yields for the
+        caller to mutate ``self.state``, then writes only the touched rows.
+        Nested calls are reentrant and fold into the outermost transaction.
+        """
+        with self._lock:
+            if self._file_lock_depth > 0:
+                self._file_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._file_lock_depth -= 1
+                return
+
+            self._file_lock_depth = 1
+            try:
+                with self._profiled_lock(self._transaction(immediate=True)) as conn:
+                    self._sync(conn)
+                    self._begin_changes()
+                    try:
+                        yield
+                    except BaseException:
+                        self._discard_changes()
+                        raise
+                    finally:
+                        self._end_changes()
+                    self._commit(conn)
+            finally:
+                self._file_lock_depth = 0
+
+    def load(self) -> dict[str, Any]:
+        """Load state from the database without blocking writers.
+
+        Returns:
+            State dictionary
+        """
+        with self._lock:
+            if self._file_lock_depth > 0:
+                # Inside our own atomic_update: the cache is already current.
+                return self._state.copy()
+            with self._transaction(immediate=False) as conn:
+                self._sync(conn)
+            logger.debug(f"Loaded state for feature {self.feature}")
+            return self._state.copy()
+
+    def save(self) -> None:
+        """Write the whole in-memory state to the database."""
+        with self._lock, self._transaction(immediate=True) as conn:
+            seq = max(self._seq, conn.execute("SELECT seq FROM sync WHERE id = 0").fetchone()[0]) + 1
+            self._write_all(conn, seq)
+            self._seq = seq
+            self._stale = False
+            self._reset_changes()
+
+    def delete(self) -> None:
+        """Delete the state database."""
+        with self._lock:
+            self.close()
+            for suffix in ("", "-wal", "-shm"):
+                path = Path(f"{self._state_file}{suffix}")
+                if path.exists():
+                    path.unlink()
+            self._stale = True
+            self._seq = 0
+            self._event_id = 0
+        logger.info(f"Deleted state for feature {self.feature}")
+
+    def exists(self) -> bool:
+        """Check if the state database holds a feature.
+
+        Returns:
+            True if state has been persisted
+        """
+        if not self._state_file.exists():
+            return False
+        with self._lock:
+            row = self.conn.execute("SELECT 1 FROM meta WHERE key = 'feature'").fetchone()
+        return row is not None
+
+    # === Indexed queries ===
+
+    def query_task_claim(self, task_id: str) -> tuple[str | None, int | None] | None:
+        """Return (status, worker_id) for *task_id* via the primary key, or None if absent."""
+        with self._lock:
+            row = self.conn.execute("SELECT status, worker_id FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+            return (row[0], row[1]) if row else None
+
+    def query_task_ids_by_status(self, status: str) -> list[str]:
+        """Return task IDs with *status* via the status index."""
+        with self._lock:
+            rows = self.conn.execute("SELECT task_id FROM tasks WHERE status = ? ORDER BY task_id", (status,))
+            return [row[0] for row in rows]
+
+    def query_tasks_started_before(self, status: str, cutoff_iso: str) -> list[tuple[str, int | None, str]]:
+        """Return (task_id, worker_id, started_at) for tasks in *status* started at or before *cutoff_iso*."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT task_id, worker_id, started_at FROM tasks "
+                "WHERE status = ? AND started_at IS NOT NULL AND started_at <= ? ORDER BY started_at",
+                (status, cutoff_iso),
+            )
+            return [(row[0], row[1], row[2]) for row in rows]
+
+
+class SQLiteTaskStateRepo(TaskStateRepo):
+    """TaskStateRepo whose hot read paths run as indexed SQLite queries.
+
+    Reads hit the database directly (a WAL snapshot, never blocked by
+    writers), so they reflect other workers' changes without a cache sync.
+    """
+
+    def __init__(self, persistence: SQLitePersistenceLayer) -> None:
+        """Initialize SQLite-backed task state repository.
+
+        Args:
+            persistence: SQLitePersistenceLayer instance for data access
+        """
+        super().__init__(persistence)
+        self._db = persistence
+
+    def claim_task(
+        self,
+        task_id: str,
+        worker_id: int,
+        current_level: int | None = None,
+        dependency_checker: DependencyChecker | None = None,
+    ) -> bool:
+        """Attempt to claim a task for a worker.
+
+        Rejects tasks that are already claimed or not pending with a single
+        primary-key read, so losing claimers never take the write lock. The
+        remaining checks and the claim itself run in an IMMEDIATE transaction.
+
+        Args:
+            task_id: Task to claim
+            worker_id: Worker claiming the task
+            current_level: If provided, verify task is at this level
+            dependency_checker: If provided, verify all dependencies are complete
+
+        Returns:
+            True if claim succeeded
+        """
+        row = self._db.query_task_claim(task_id)
+        if row is not None:
+            status, owner = row
+            if status not in (None, TaskStatus.TODO.value, TaskStatus.PENDING.value):
+                return False
+            if owner is not None and owner != worker_id:
+                return False
+        return super().claim_task(
+            task_id, worker_id, current_level=current_level, dependency_checker=dependency_checker
+        )
+
+    def get_tasks_by_status(self, status: TaskStatus | str) -> list[str]:
+        """Get task IDs with a specific status.
+
+        Args:
+            status: Status to filter by
+
+        Returns:
+            List of task IDs
+        """
+        status_str = status.value if isinstance(status, TaskStatus) else status
+        return self._db.query_task_ids_by_status(status_str)
+
+    def get_stale_in_progress_tasks(self, timeout_seconds: int) -> list[dict[str, Any]]:
+        """Get tasks that have been in_progress longer than the timeout.
+
+        Args:
+            timeout_seconds: Maximum seconds a task can be in_progress before
+                considered stale
+
+        Returns:
+            List of dicts with task_id, worker_id, started_at, elapsed_seconds
+        """
+        now = datetime.now()
+        cutoff_iso = (now - timedelta(seconds=timeout_seconds)).isoformat()
+        return [
+            {
+                "task_id": task_id,
+                "worker_id": worker_id,
+                "started_at": started_at,
+                "elapsed_seconds": round((now - datetime.fromisoformat(started_at)).total_seconds()),
+            }
+            for task_id, worker_id, started_at in self._db.query_tasks_started_before(
+                TaskStatus.IN_PROGRESS.value, cutoff_iso
+            )
+        ]
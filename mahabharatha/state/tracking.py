@@ -0,0 +1,343 @@
+"""Change tracking for incremental state backends.
+
+The repos (TaskStateRepo, WorkerStateRepo, ExecutionLog, ...) mutate
+``persistence.state`` in place. Incremental backends need to know *which*
+records those mutations touched so they can persist a delta instead of the
+whole dict. ``wrap_state`` converts the state into dict/list subclasses that
+report every mutation to their owning TrackedPersistenceLayer at "record"
+granularity:
+
+- a top-level key (``current_level``, ``paused``, ``metrics``)
+- one entry of a top-level dict (``tasks/TASK-001``, ``workers/3``)
+- an item appended to a top-level list (``execution_log``)
+
+Anything nested deeper marks its enclosing record dirty.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, SupportsIndex
+
+from mahabharatha.state.persistence import PersistenceLayer
+
+_MISSING = object()
+
+
+def wrap_state(value: Any, owner: TrackedPersistenceLayer, path: tuple[str, ...], section: bool = False) -> Any:
+    """Recursively convert dicts/lists into tracked containers bound to *owner*."""
+    if isinstance(value, dict):
+        tracked_dict = _TrackedDict(owner, path, section)
+        for key, item in value.items():
+            dict.__setitem__(tracked_dict, key, wrap_state(item, owner, tracked_dict._child_path(key), path == ()))
+        return tracked_dict
+    if isinstance(value, list):
+        tracked_list = _TrackedList(owner, path, section)
+        list.extend(tracked_list, (wrap_state(item, owner, path) for item in value))
+        return tracked_list
+    return value
+
+
+class _TrackedDict(dict[str, Any]):
+    """Dict that reports mutations to its owner at record granularity."""
+
+    __slots__ = ("_owner", "_path", "_section")
+
+    def __init__(self, owner: TrackedPersistenceLayer, path: tuple[str, ...], section: bool) -> None:
+        super().__init__()
+        self._owner = owner
+        self._path = path
+        self._section = section
+
+    def _child_path(self, key: str) -> tuple[str, ...]:
+        if self._path == ():
+            return (key,)
+        if self._section:
+            return (self._path[0], key)
+        return self._path
+
+    def _touch(self, key: str) -> None:
+        self._owner._touch(self._child_path(key))
+
+    def _store(self, key: str, value: Any) -> None:
+        dict.__setitem__(self, key, wrap_state(value, self._owner, self._child_path(key), self._path == ()))
+        self._touch(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        dict.__delitem__(self, key)
+        self._touch(key)
+
+    def __ior__(self, other: Any) -> _TrackedDict:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def pop(self, key: str, *default: Any) -> Any:
+        present = key in self
+        value = dict.pop(self, key, *default)
+        if present:
+            self._touch(key)
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = dict.popitem(self)
+        self._touch(key)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self._store(key, default)
+        return dict.__getitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self._store(key, value)
+
+    def clear(self) -> None:
+        keys = list(self)
+        dict.clear(self)
+        if self._path == ():
+            self._owner._touch(())
+        for key in keys:
+            self._touch(key)
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        return (dict, (dict(self),))
+
+
+class _TrackedList(list[Any]):
+    """List that reports mutations to its owner.
+
+    Appends to a top-level list are ownered as ``append`` ops; any other
+    mutation marks the owning record dirty so it is rewritten in full.
+    """
+
+    __slots__ = ("_owner", "_path", "_section")
+
+    def __init__(self, owner: TrackedPersistenceLayer, path: tuple[str, ...], section: bool) -> None:
+        super().__init__()
+        self._owner = owner
+        self._path = path
+        self._section = section
+
+    def _touch(self) -> None:
+        self._owner._touch(self._path)
+
+    def append(self, item: Any) -> None:
+        wrapped = wrap_state(item, self._owner, self._path)
+        list.append(self, wrapped)
+        if self._section:
+            self._owner._record_append(self._path[0], wrapped)
+        else:
+            self._touch()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items: Iterable[Any]) -> _TrackedList:  # type: ignore[misc]
+        self.extend(items)
+        return self
+
+    def insert(self, index: SupportsIndex, item: Any) -> None:
+        list.insert(self, index, wrap_state(item, self._owner, self._path))
+        self._touch()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            list.__setitem__(self, index, [wrap_state(v, self._owner, self._path) for v in value])
+        else:
+            list.__setitem__(self, index, wrap_state(value, self._owner, self._path))
+        self._touch()
+
+    def __delitem__(self, index: Any) -> None:
+        list.__delitem__(self, index)
+        self._touch()
+
+    def __imul__(self, count: SupportsIndex) -> _TrackedList:
+        list.__imul__(self, count)
+        self._touch()
+        return self
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        value = list.pop(self, index)
+        self._touch()
+        return value
+
+    def remove(self, value: Any) -> None:
+        list.remove(self, value)
+        self._touch()
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._touch()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        list.sort(self, *args, **kwargs)
+        self._touch()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._touch()
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        return (list, (list(self),))
+
+
+class TrackedPersistenceLayer(PersistenceLayer):
+    """PersistenceLayer base for backends that persist per-record deltas.
+
+    Subclasses call ``_begin_changes()`` once the state is in sync with disk,
+    let the caller mutate ``self.state``, then turn ``_collect_changes()`` into
+    backend writes. ``_stale`` is raised whenever the in-memory state may have
+    diverged from disk (mutation outside an update, failed update, replaced
+    state) and tells the subclass to reload everything on the next sync.
+    """
+
+    def __init__(self, feature: str, state_dir: str | Path | None = None) -> None:
+        """Initialize tracked persistence layer.
+
+        Args:
+            feature: Feature name for state isolation
+            state_dir: Directory for state files (defaults to .mahabharatha/state)
+        """
+        super().__init__(feature, state_dir)
+        self._stale = True  # Force a full reload on the next sync
+        self._recording = False
+        self._replaying = False
+        self._full_rewrite = False
+        self._dirty: dict[tuple[str, ...], None] = {}
+        self._appends: list[tuple[str, Any]] = []
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Access the in-memory (tracked) state dict."""
+        return self._state
+
+    @state.setter
+    def state(self, value: dict[str, Any]) -> None:
+        """Replace the in-memory state; the next sync reloads from disk."""
+        with self._lock:
+            self._state = wrap_state(value, self, ())
+            self._stale = True
+
+    def _replace_state(self, data: dict[str, Any]) -> None:
+        """Install *data* as the in-memory state without recording changes."""
+        self._replaying = True
+        try:
+            self._state = wrap_state(data, self, ())
+        finally:
+            self._replaying = False
+
+    # === Change tracking (called by tracked containers) ===
+
+    def _touch(self, path: tuple[str, ...]) -> None:
+        """Record that the record at *path* changed."""
+        if self._replaying:
+            return
+        if not self._recording:
+            # Mutation outside atomic_update is never persisted; like the JSON
+            # backend, the next update starts from what is on disk.
+            self._stale = True
+            return
+        if path == ():
+            self._full_rewrite = True
+            return
+        self._dirty[path] = None
+
+    def _record_append(self, section: str, item: Any) -> None:
+        """Record an item appended to a top-level list."""
+        if self._replaying:
+            return
+        if not self._recording:
+            self._stale = True
+            return
+        self._appends.append((section, item))
+
+    def _begin_changes(self) -> None:
+        """Start recording mutations for the current update."""
+        self._dirty.clear()
+        self._appends.clear()
+        self._recording = True
+
+    def _end_changes(self) -> None:
+        """Stop recording mutations."""
+        self._recording = False
+
+    def _reset_changes(self) -> None:
+        """Forget recorded mutations after they were persisted."""
+        self._dirty.clear()
+        self._appends.clear()
+        self._full_rewrite = False
+
+    def _discard_changes(self) -> None:
+        """Drop recorded mutations of a failed update and force a reload."""
+        self._stale = True
+        self._reset_changes()
+
+    def _resolve(self, path: tuple[str, ...]) -> Any:
+        value = self._state.get(path[0], _MISSING)
+        if len(path) == 2:
+            value = value.get(path[1], _MISSING) if isinstance(value, dict) else _MISSING
+        return value
+
+    def _collect_changes(self) -> list[list[Any]]:
+        """Turn recorded mutations into ``set``/``del``/``append`` ops.
+
+        Returns:
+            Ops of the form ``["set", path, value]``, ``["del", path]`` or
+            ``["append", [section], item]`` where path has one or two elements
+        """
+        ops: list[list[Any]] = []
+        for path in self._dirty:
+            if len(path) == 2 and (path[0],) in self._dirty:
+                continue  # Whole section is rewritten by its own op
+            value = self._resolve(path)
+            if value is _MISSING:
+                ops.append(["del", list(path)])
+            else:
+                ops.append(["set", list(path), value])
+        for section, item in self._appends:
+            if (section,) not in self._dirty:
+                ops.append(["append", [section], item])
+        return ops
+
+    def _apply_op(self, op: list[Any]) -> None:
+        """Apply an op produced by ``_collect_changes()`` to the in-memory state."""
+        kind, path = op[0], op[1]
+        state = self._state
+        if len(path) == 1:
+            section = path[0]
+            if kind == "set":
+                state[section] = op[2]
+            elif kind == "del":
+                state.pop(section, None)
+            elif kind == "append":
+                if not isinstance(state.get(section), list):
+                    state[section] = []
+                state[section].append(op[2])
+            return
+
+        section, key = path[0], path[1]
+        if kind == "set":
+            if not isinstance(state.get(section), dict):
+                state[section] = {}
+            state[section][key] = op[2]
+        elif kind == "del" and isinstance(state.get(section), dict):
+            state[section].pop(key, None)
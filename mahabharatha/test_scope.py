@@ -7,12 +7,12 @@ modified modules.
 
 from __future__ import annotations
 
-import ast
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from mahabharatha.fs_utils import collect_files
+from mahabharatha.parse_cache import get_parse_cache
 
 if TYPE_CHECKING:
     from mahabharatha.types import Task, TaskGraph
@@ -75,7 +75,7 @@ def get_modified_modules(task_graph: TaskGraph) -> list[str]:
 def _extract_imports_from_file(file_path: Path) -> set[str]:
     """Extract module names imported by a Python file.
 
-    Uses AST parsing to find import statements.
+    Reads import statements from the file's cached parse summary.
 
     Args:
         file_path: Path to Python file.
@@ -86,21 +86,20 @@ def _extract_imports_from_file(file_path: Path) -> set[str]:
     imports: set[str] = set()
 
     try:
-        content = file_path.read_text()
-        tree = ast.parse(content)
-    except (OSError, SyntaxError):
+        summary = get_parse_cache().summary(file_path)
+    except OSError:
+        return imports
+    if summary.error:
         return imports
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.add(alias.name)
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.add(node.module)
-                # Also add full paths for specific imports
-                for alias in node.names:
-                    imports.add(f"{node.module}.{alias.name}")
+    for imp in summary.imports:
+        if not imp.is_from:
+            imports.update(name for name, _ in imp.names)
+        elif imp.module:
+            imports.add(imp.module)
+            # Also add full paths for specific imports
+            for name, _ in imp.names:
+                imports.add(f"{imp.module}.{name}")
 
     return imports
 
@@ -0,0 +1,379 @@
+"""Low-overhead span tracing across workers and the orchestrator.
+
+Spans are timed with the system-wide monotonic clock, so spans recorded by
+different processes on one host line up on a single timeline. Finished spans
+go into a per-process ring buffer that is appended to
+``<log_dir>/traces/<feature>/<process>-<pid>.jsonl`` as Chrome trace events
+whenever it fills, on flush() and at interpreter exit.
+
+export_chrome_trace() merges every process file into one Chrome-trace JSON
+document (open it in Perfetto or chrome://tracing), and summarize_trace()
+totals span time per level and category to show how much of a level went to
+the LLM, verification, git and lock waiting.
+
+Tracing is off until configure_tracing() is called (``logging.tracing`` in
+the config); span() is then a single global check returning a shared no-op
+context manager.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TypeVar
+
+from mahabharatha import json_utils
+from mahabharatha.logging import get_logger
+
+logger = get_logger("tracing")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACES_SUBDIR = "traces"
+DEFAULT_BUFFER_SIZE = 4096
+
+# Span categories
+CAT_TASK = "task"
+CAT_LLM = "llm"
+CAT_VERIFY = "verification"
+CAT_GIT = "git"
+CAT_LOCK = "lock"
+CAT_MERGE = "merge"
+CAT_GATE = "gate"
+
+
+def trace_dir(log_dir: str | Path, feature: str) -> Path:
+    """Directory holding the per-process trace files of a feature."""
+    return Path(log_dir) / TRACES_SUBDIR / feature
+
+
+class _NullSpan:
+    """Shared span used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        """Ignore span attributes."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """A timed region; records a Chrome "complete" event when it exits."""
+
+    __slots__ = ("_tracer", "name", "cat", "args", "_start_ns")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self._start_ns = 0
+
+    def set(self, **args: Any) -> None:
+        """Attach attributes discovered while the span is open."""
+        self.args.update(args)
+
+    def __enter__(self) -> Span:
+        stack = self._tracer._stack()
+        if stack and "level" not in self.args and "level" in stack[-1].args:
+            self.args["level"] = stack[-1].args["level"]
+        stack.append(self)
+        self._start_ns = time.monotonic_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        end_ns = time.monotonic_ns()
+        stack = self._tracer._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._tracer._record(self, self._start_ns, end_ns)
+
+
+class Tracer:
+    """Per-process span recorder with a ring buffer flushed to a trace file."""
+
+    def __init__(self, path: Path, process_name: str, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """Initialize the tracer.
+
+        Args:
+            path: JSONL file the buffered events are appended to
+            process_name: Timeline label for this process (e.g. "worker-1")
+            buffer_size: Events held in memory before a flush; the oldest are
+                dropped if flushing keeps failing
+        """
+        self.path = path
+        self.process_name = process_name
+        self.buffer_size = max(1, buffer_size)
+        self.pid = os.getpid()
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=self.buffer_size)
+        self._local = threading.local()
+        self._flush_lock = threading.Lock()
+        self._wrote_metadata = False
+
+    def _stack(self) -> list[Span]:
+        stack: list[Span] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str, cat: str, **args: Any) -> Span:
+        """Create a span; use it as a context manager."""
+        return Span(self, name, cat, args)
+
+    def _record(self, span: Span, start_ns: int, end_ns: int) -> None:
+        self._buffer.append(
+            {
+                "name": span.name,
+                "cat": span.cat,
+                "ph": "X",
+                "ts": start_ns / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+                "args": span.args,
+            }
+        )
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered events to the trace file."""
+        with self._flush_lock:
+            events: list[dict[str, Any]] = []
+            while self._buffer:
+                try:
+                    events.append(self._buffer.popleft())
+                except IndexError:
+                    break
+            if not events:
+                return
+            if not self._wrote_metadata:
+                events.insert(
+                    0,
+                    {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": self.process_name}},
+                )
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a") as f:
+                    f.write("".join(json_utils.dumps(e) + "\n" for e in events))
+                self._wrote_metadata = True
+            except OSError as e:
+                logger.debug(f"Trace flush to {self.path} failed: {e}")
+
+
+_tracer: Tracer | None = None
+
+
+def configure_tracing(
+    log_dir: str | Path,
+    feature: str,
+    process_name: str,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Tracer:
+    """Enable tracing for this process.
+
+    Args:
+        log_dir: Log directory; traces go to ``<log_dir>/traces/<feature>/``
+        feature: Feature name
+        process_name: Timeline label ("orchestrator", "worker-3", ...)
+        buffer_size: Ring buffer size in events
+
+    Returns:
+        The process tracer
+    """
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+    safe_name = process_name.replace("/", "_")
+    path = trace_dir(log_dir, feature) / f"{safe_name}-{os.getpid()}.jsonl"
+    _tracer = Tracer(path, process_name, buffer_size=buffer_size)
+    return _tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Return the process tracer, or None if tracing is disabled."""
+    return _tracer
+
+
+def shutdown_tracing() -> None:
+    """Flush and disable tracing for this process."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+        _tracer = None
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    if _tracer is not None:
+        _tracer.flush()
+
+
+def span(name: str, cat: str, **args: Any) -> Span | _NullSpan:
+    """Open a span on the process tracer (no-op when tracing is disabled).
+
+    Spans nest per thread and inherit the ``level`` attribute of the
+    enclosing span.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, cat, **args)
+
+
+def traced(
+    cat: str,
+    name: str | None = None,
+    record: tuple[str, ...] = (),
+    attrs: Callable[..., dict[str, Any]] | None = None,
+) -> Callable[[F], F]:
+    """Decorator wrapping every call of a function in a span.
+
+    Args:
+        cat: Span category
+        name: Span name (defaults to the function's qualified name)
+        record: Parameter names whose arguments become span attributes
+        attrs: Optional callable receiving the call's arguments and
+            returning extra span attributes
+
+    Attributes are only computed while tracing is enabled.
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func) if record else None
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            span_args: dict[str, Any] = {}
+            if signature is not None:
+                try:
+                    bound = signature.bind_partial(*args, **kwargs).arguments
+                    span_args = {n: bound[n] for n in record if n in bound}
+                except TypeError:
+                    pass
+            if attrs is not None:
+                span_args.update(attrs(*args, **kwargs))
+            with tracer.span(span_name, cat, **span_args):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# === Export and analysis ===
+
+
+def load_trace_events(directory: str | Path) -> list[dict[str, Any]]:
+    """Read every process trace file in a feature trace directory.
+
+    Args:
+        directory: Directory returned by trace_dir()
+
+    Returns:
+        Events from all processes (unparseable lines are skipped)
+    """
+    events: list[dict[str, Any]] = []
+    for path in sorted(Path(directory).glob("*.jsonl")):
+        try:
+            with open(path) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        events.append(json_utils.loads(line))
+                    except ValueError:
+                        continue  # Torn final line of a crashed process
+        except OSError as e:
+            logger.debug(f"Skipping trace file {path}: {e}")
+    return events
+
+
+def export_chrome_trace(directory: str | Path, output: str | Path) -> int:
+    """Merge a feature's trace files into one Chrome-trace JSON document.
+
+    Args:
+        directory: Directory returned by trace_dir()
+        output: Path of the JSON file to write
+
+    Returns:
+        Number of span events exported
+    """
+    events = load_trace_events(directory)
+    spans = sorted((e for e in events if e.get("ph") == "X"), key=lambda e: e["ts"])
+    metadata = [e for e in events if e.get("ph") == "M"]
+    Path(output).write_text(json_utils.dumps({"traceEvents": metadata + spans, "displayTimeUnit": "ms"}))
+    return len(spans)
+
+
+def summarize_trace(events: Iterable[dict[str, Any]]) -> dict[int | None, dict[str, float]]:
+    """Total span time (seconds) per level and category.
+
+    A span nested inside another span of the same category (on the same
+    thread) is not counted again. Spans without a ``level`` attribute, such
+    as gates run on pool threads, are attributed to the level whose span
+    encloses them in time within the same process; the rest go under None.
+
+    Args:
+        events: Events from load_trace_events()
+
+    Returns:
+        Mapping of level -> category -> seconds
+    """
+    by_thread: dict[tuple[Any, Any], list[dict[str, Any]]] = defaultdict(list)
+    level_windows: dict[Any, list[tuple[float, float, int]]] = defaultdict(list)
+    for e in events:
+        if e.get("ph") != "X":
+            continue
+        by_thread[(e.get("pid"), e.get("tid"))].append(e)
+        level = e.get("args", {}).get("level")
+        if level is not None:
+            level_windows[e.get("pid")].append((e["ts"], e["ts"] + e["dur"], level))
+
+    totals: dict[int | None, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for (pid, _tid), thread_events in by_thread.items():
+        thread_events.sort(key=lambda e: (e["ts"], -e["dur"]))
+        open_spans: list[dict[str, Any]] = []
+        for e in thread_events:
+            while open_spans and open_spans[-1]["ts"] + open_spans[-1]["dur"] <= e["ts"]:
+                open_spans.pop()
+            counted = all(parent["cat"] != e["cat"] for parent in open_spans)
+            open_spans.append(e)
+            if not counted:
+                continue
+            level = e.get("args", {}).get("level")
+            if level is None:
+                level = next(
+                    (lvl for start, end, lvl in level_windows[pid] if start <= e["ts"] < end),
+                    None,
+                )
+            totals[level][e["cat"]] += e["dur"] / 1_000_000
+    return {level: dict(cats) for level, cats in totals.items()}
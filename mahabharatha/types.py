@@ -258,6 +258,9 @@ class WorkerMetricsSummaryDict(TypedDict, total=False):
     failed_tasks: int
     success_rate: float
     total_task_duration_seconds: float
+    p50_task_duration_seconds: float
+    p90_task_duration_seconds: float
+    p99_task_duration_seconds: float
     total_idle_seconds: float
     avg_worker_utilization: float
     avg_context_usage: float
@@ -675,6 +678,10 @@ class WorkerMetrics:
     tasks_failed: int = 0
     total_task_duration_ms: int = 0
     avg_task_duration_ms: float = 0.0
+    p50_duration_ms: int = 0
+    p90_duration_ms: int = 0
+    p99_duration_ms: int = 0
+    duration_sketch: dict[str, Any] | None = None  # DDSketch.to_dict(), mergeable
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -686,6 +693,10 @@ class WorkerMetrics:
             "tasks_failed": self.tasks_failed,
             "total_task_duration_ms": self.total_task_duration_ms,
             "avg_task_duration_ms": self.avg_task_duration_ms,
+            "p50_duration_ms": self.p50_duration_ms,
+            "p90_duration_ms": self.p90_duration_ms,
+            "p99_duration_ms": self.p99_duration_ms,
+            "duration_sketch": self.duration_sketch,
         }
 
     @classmethod
@@ -699,6 +710,10 @@ class WorkerMetrics:
             tasks_failed=data.get("tasks_failed", 0),
             total_task_duration_ms=data.get("total_task_duration_ms", 0),
             avg_task_duration_ms=data.get("avg_task_duration_ms", 0.0),
+            p50_duration_ms=data.get("p50_duration_ms", 0),
+            p90_duration_ms=data.get("p90_duration_ms", 0),
+            p99_duration_ms=data.get("p99_duration_ms", 0),
+            duration_sketch=data.get("duration_sketch"),
         )
 
 
@@ -745,7 +760,10 @@ class LevelMetrics:
     failed_count: int = 0
     avg_task_duration_ms: float = 0.0
     p50_duration_ms: int = 0
+    p90_duration_ms: int = 0
     p95_duration_ms: int = 0
+    p99_duration_ms: int = 0
+    duration_sketch: dict[str, Any] | None = None  # DDSketch.to_dict(), mergeable
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -757,7 +775,10 @@ class LevelMetrics:
             "failed_count": self.failed_count,
             "avg_task_duration_ms": self.avg_task_duration_ms,
             "p50_duration_ms": self.p50_duration_ms,
+            "p90_duration_ms": self.p90_duration_ms,
             "p95_duration_ms": self.p95_duration_ms,
+            "p99_duration_ms": self.p99_duration_ms,
+            "duration_sketch": self.duration_sketch,
         }
 
     @classmethod
@@ -771,7 +792,10 @@ class LevelMetrics:
             failed_count=data.get("failed_count", 0),
             avg_task_duration_ms=data.get("avg_task_duration_ms", 0.0),
             p50_duration_ms=data.get("p50_duration_ms", 0),
+            p90_duration_ms=data.get("p90_duration_ms", 0),
             p95_duration_ms=data.get("p95_duration_ms", 0),
+            p99_duration_ms=data.get("p99_duration_ms", 0),
+            duration_sketch=data.get("duration_sketch"),
         )
 
 
@@ -788,6 +812,10 @@ class FeatureMetrics:
     levels_completed: int = 0
     worker_metrics: list[WorkerMetrics] = field(default_factory=list)
     level_metrics: list[LevelMetrics] = field(default_factory=list)
+    p50_duration_ms: int = 0
+    p90_duration_ms: int = 0
+    p99_duration_ms: int = 0
+    duration_sketch: dict[str, Any] | None = None  # DDSketch.to_dict(), mergeable
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -801,6 +829,10 @@ class FeatureMetrics:
             "levels_completed": self.levels_completed,
             "worker_metrics": [wm.to_dict() for wm in self.worker_metrics],
             "level_metrics": [lm.to_dict() for lm in self.level_metrics],
+            "p50_duration_ms": self.p50_duration_ms,
+            "p90_duration_ms": self.p90_duration_ms,
+            "p99_duration_ms": self.p99_duration_ms,
+            "duration_sketch": self.duration_sketch,
         }
 
     @classmethod
@@ -816,4 +848,8 @@ class FeatureMetrics:
             levels_completed=data.get("levels_completed", 0),
             worker_metrics=[WorkerMetrics.from_dict(wm) for wm in data.get("worker_metrics", [])],
             level_metrics=[LevelMetrics.from_dict(lm) for lm in data.get("level_metrics", [])],
+            p50_duration_ms=data.get("p50_duration_ms", 0),
+            p90_duration_ms=data.get("p90_duration_ms", 0),
+            p99_duration_ms=data.get("p99_duration_ms", 0),
+            duration_sketch=data.get("duration_sketch"),
         )
@@ -482,6 +482,11 @@ def validate_module_wiring(
     is imported by at least one other production (non-test) module. Modules that
     are only imported by tests — or not imported at all — are flagged.
 
+    Lazy-import registries count as imports: a dict value naming the module's
+    full dotted path, optionally with an ``:attribute`` suffix (for example
+    ``"mahabharatha.worker_metrics"`` in ``_LAZY_EXPORTS`` or
+    ``"mahabharatha.commands.status:status"`` in the CLI's ``COMMANDS``).
+
     Args:
         package_dir: Path to the package directory. Defaults to mahabharatha/ (this package).
         tests_dir: Path to the tests directory. Defaults to tests/ at project root.
@@ -561,11 +566,14 @@ def validate_module_wiring(
             f"from .{module_name} import",
         ]
 
+        # Lazy registry entry: "name": "mahabharatha.foo.bar" or "mahabharatha.foo.bar:attr"
+        lazy_entry = re.compile(rf""":\s*["']{re.escape(full_dotted)}(?::\w+)?["']""")
+
         found = False
         for other_file, other_content in production_contents:
             if other_file.resolve() == candidate.resolve():
                 continue
-            if any(pattern in other_content for pattern in patterns):
+            if any(pattern in other_content for pattern in patterns) or lazy_entry.search(other_content):
                 found = True
                 break
 
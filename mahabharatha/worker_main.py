@@ -179,6 +179,7 @@ def main() -> int:
             "MAHABHARATHA_STATE_DIR",
             "MAHABHARATHA_LOG_DIR",
             "MAHABHARATHA_PORT",
+            "MAHABHARATHA_HEARTBEAT_TABLE",
         )
     }
     if capability_vars:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections.abc import Callable
 from datetime import datetime
@@ -16,6 +17,7 @@ from mahabharatha.constants import (
     TaskStatus,
     WorkerStatus,
 )
+from mahabharatha.launcher_types import SpawnResult
 from mahabharatha.launchers import WorkerLauncher
 from mahabharatha.levels import LevelController
 from mahabharatha.log_writer import StructuredLogWriter
@@ -27,7 +29,7 @@ from mahabharatha.ports import PortAllocator
 from mahabharatha.state import StateManager
 from mahabharatha.types import WorkerState
 from mahabharatha.worker_registry import WorkerRegistry
-from mahabharatha.worktree import WorktreeManager
+from mahabharatha.worktree import WorktreeInfo, WorktreeManager
 
 if TYPE_CHECKING:
     from mahabharatha.circuit_breaker import CircuitBreaker
@@ -35,6 +37,10 @@ if TYPE_CHECKING:
 logger = get_logger("worker_manager")
 
 
+# Statuses a worker is in when the orchestrator hands it to exit handling
+_EXITED_STATUSES = (WorkerStatus.STALLED, WorkerStatus.CRASHED, WorkerStatus.CHECKPOINTING, WorkerStatus.STOPPED)
+
+
 def _register_worker(workers: dict[int, WorkerState] | WorkerRegistry, worker_id: int, worker: WorkerState) -> None:
     """Register a worker using the appropriate method for the container type."""
     if isinstance(workers, WorkerRegistry):
@@ -116,6 +122,9 @@ class WorkerManager:
         self._circuit_breaker = circuit_breaker
         self._capabilities = capabilities
         self._running = False
+        # Serializes async spawns: exit handling, level respawns and auto-respawns
+        # run as separate tasks and must not pick the same free worker ID
+        self._spawn_lock = asyncio.Lock()
 
     def spawn_worker(self, worker_id: int) -> WorkerState:
         """Spawn a single worker.
@@ -132,6 +141,55 @@ class WorkerManager:
         Raises:
             RuntimeError: If the worker fails to spawn or circuit is open
         """
+        port, wt_info, env = self._prepare_spawn(worker_id)
+
+        # Use the unified launcher interface (works for both subprocess and container)
+        result = self.launcher.spawn(
+            worker_id=worker_id,
+            feature=self.feature,
+            worktree_path=wt_info.path,
+            branch=wt_info.branch,
+            env=env,
+        )
+        return self._register_spawned(worker_id, port, wt_info, result)
+
+    async def spawn_worker_async(self, worker_id: int) -> WorkerState:
+        """Spawn a single worker without blocking the event loop.
+
+        Same as :meth:`spawn_worker`, but the worktree is prepared in a thread
+        and the process is started with ``launcher.spawn_async``. Holds the
+        manager's spawn lock, so it never races another async spawn.
+
+        Args:
+            worker_id: Worker identifier
+
+        Returns:
+            WorkerState for the spawned worker
+
+        Raises:
+            RuntimeError: If the worker fails to spawn, circuit is open, or
+                the ID is already taken by a live worker
+        """
+        async with self._spawn_lock:
+            worker = self._workers.get(worker_id)
+            if worker is not None and worker.status not in (WorkerStatus.STOPPED, WorkerStatus.CRASHED):
+                raise RuntimeError(f"Worker {worker_id} is already running")
+            return await self._spawn_worker_async(worker_id)
+
+    async def _spawn_worker_async(self, worker_id: int) -> WorkerState:
+        """Body of :meth:`spawn_worker_async`; caller holds ``_spawn_lock``."""
+        port, wt_info, env = await asyncio.to_thread(self._prepare_spawn, worker_id)
+        result = await self.launcher.spawn_async(
+            worker_id=worker_id,
+            feature=self.feature,
+            worktree_path=wt_info.path,
+            branch=wt_info.branch,
+            env=env,
+        )
+        return self._register_spawned(worker_id, port, wt_info, result)
+
+    def _prepare_spawn(self, worker_id: int) -> tuple[int, WorktreeInfo, dict[str, str]]:
+        """Check the circuit breaker, allocate a port and create the worktree."""
         # Check circuit breaker before spawning
         if self._circuit_breaker is not None and not self._circuit_breaker.can_accept_task(worker_id):
             logger.warning(f"Worker {worker_id} circuit is open, skipping spawn")
@@ -162,15 +220,10 @@ class WorkerManager:
         except Exception:  # noqa: BLE001 — intentional: charter injection is best-effort
             logger.debug("Failed to inject charter principles", exc_info=True)
 
-        # Use the unified launcher interface (works for both subprocess and container)
-        result = self.launcher.spawn(
-            worker_id=worker_id,
-            feature=self.feature,
-            worktree_path=wt_info.path,
-            branch=wt_info.branch,
-            env=capability_env,
-        )
+        return port, wt_info, capability_env
 
+    def _register_spawned(self, worker_id: int, port: int, wt_info: WorktreeInfo, result: SpawnResult) -> WorkerState:
+        """Record a launched worker in the registry and state, and emit events."""
         if not result.success:
             raise RuntimeError(f"Failed to spawn worker: {result.error}")
 
@@ -263,19 +316,7 @@ class WorkerManager:
                 status = self.launcher.monitor(worker_id)
 
                 if status in (WorkerStatus.RUNNING, WorkerStatus.READY, WorkerStatus.IDLE):
-                    # Worker is ready - record ready_at if not already recorded
-                    if worker.ready_at is None:
-                        worker.ready_at = datetime.now()
-                        self.state.set_worker_ready(worker_id)
-                        self.state.append_event(
-                            "worker_ready",
-                            {
-                                "worker_id": worker_id,
-                                "worktree": worker.worktree_path,
-                                "branch": worker.branch,
-                            },
-                        )
-                    worker.status = status
+                    self.mark_ready(worker_id, worker, status)
                     continue
                 elif status in (WorkerStatus.CRASHED, WorkerStatus.STOPPED):
                     # Worker failed during init
@@ -304,6 +345,27 @@ class WorkerManager:
         logger.warning(f"Initialization timeout after {timeout}s")
         return len(self._workers) > 0  # Continue if any workers are ready
 
+    def mark_ready(self, worker_id: int, worker: WorkerState, status: WorkerStatus) -> None:
+        """Record a worker as ready the first time it reports a live status.
+
+        Args:
+            worker_id: Worker identifier
+            worker: Worker state to update
+            status: Live status reported by the launcher
+        """
+        if worker.ready_at is None:
+            worker.ready_at = datetime.now()
+            self.state.set_worker_ready(worker_id)
+            self.state.append_event(
+                "worker_ready",
+                {
+                    "worker_id": worker_id,
+                    "worktree": worker.worktree_path,
+                    "branch": worker.branch,
+                },
+            )
+        worker.status = status
+
     def terminate_worker(self, worker_id: int, force: bool = False) -> None:
         """Terminate a worker.
 
@@ -322,14 +384,37 @@ class WorkerManager:
 
         # Stop via unified launcher interface
         self.launcher.terminate(worker_id, force=force)
+        self._release_terminated(worker_id, worker)
 
-        # Delete worktree
+    async def terminate_worker_async(self, worker_id: int, force: bool = False) -> None:
+        """Terminate a worker with ``launcher.terminate_async``.
+
+        Args:
+            worker_id: Worker identifier
+            force: Force termination
+        """
+        worker = self._workers.get(worker_id)
+        if not worker:
+            return
+
+        logger.info(f"Terminating worker {worker_id}")
+        await self.launcher.terminate_async(worker_id, force=force)
+        await asyncio.to_thread(self._delete_worktree, worker_id)
+        self._release_terminated(worker_id, worker, delete_worktree=False)
+
+    def _delete_worktree(self, worker_id: int) -> None:
         try:
             wt_path = self.worktrees.get_worktree_path(self.feature, worker_id)
             self.worktrees.delete(wt_path, force=True)
         except Exception as e:  # noqa: BLE001 — intentional: worktree deletion spans git/OS errors; must not block termination
             logger.warning(f"Failed to delete worktree for worker {worker_id}: {e}")
 
+    def _release_terminated(self, worker_id: int, worker: WorkerState, delete_worktree: bool = True) -> None:
+        """Delete the worktree, release the port and unregister a stopped worker."""
+        # Delete worktree
+        if delete_worktree:
+            self._delete_worktree(worker_id)
+
         # Release port
         if worker.port:
             self.ports.release(worker.port)
@@ -351,9 +436,53 @@ class WorkerManager:
         Args:
             worker_id: Worker that exited
         """
+        old_worktree = self._record_exit(worker_id)
+        if old_worktree is None or not self._should_respawn():
+            return
+        try:
+            self.spawn_worker(worker_id)
+        except (RuntimeError, OSError) as e:
+            self._respawn_failed(worker_id, old_worktree, e)
+            return
+        # Reset circuit breaker on successful respawn
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.reset(worker_id)
+
+    async def handle_worker_exit_async(self, worker_id: int) -> None:
+        """Handle worker exit, respawning with ``launcher.spawn_async``.
+
+        Runs under the spawn lock: the ID freed by the exit stays reserved
+        until the replacement is registered. If a concurrent level respawn
+        already replaced the worker, there is nothing left to handle.
+
+        Args:
+            worker_id: Worker that exited
+        """
+        async with self._spawn_lock:
+            worker = self._workers.get(worker_id)
+            if worker is not None and worker.status not in _EXITED_STATUSES:
+                return
+            old_worktree = self._record_exit(worker_id)
+            if old_worktree is None or not self._should_respawn():
+                return
+            try:
+                await self._spawn_worker_async(worker_id)
+            except (RuntimeError, OSError) as e:
+                self._respawn_failed(worker_id, old_worktree, e)
+                return
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.reset(worker_id)
+
+    def _record_exit(self, worker_id: int) -> str | None:
+        """Record an exited worker's task outcome and release its resources.
+
+        Returns:
+            The worker's old worktree path ("" if it had none), or None if
+            the worker is not tracked
+        """
         worker = self._workers.get(worker_id)
         if not worker:
-            return
+            return None
 
         # Emit plugin lifecycle event
         try:
@@ -409,22 +538,20 @@ class WorkerManager:
         if old_port:
             self.ports.release(old_port)
 
-        # Restart worker for more tasks (with new state)
-        remaining = self._get_remaining_tasks_for_level(self.levels.current_level)
-        if remaining and self._running:
+        return old_worktree or ""
+
+    def _should_respawn(self) -> bool:
+        """Restart an exited worker only while its level still has tasks."""
+        return bool(self._get_remaining_tasks_for_level(self.levels.current_level)) and self._running
+
+    def _respawn_failed(self, worker_id: int, old_worktree: str, error: Exception) -> None:
+        logger.error(f"Failed to restart worker {worker_id}: {error}")
+        # Clean up worktree if spawn failed
+        if old_worktree:
             try:
-                self.spawn_worker(worker_id)
-                # Reset circuit breaker on successful respawn
-                if self._circuit_breaker is not None:
-                    self._circuit_breaker.reset(worker_id)
-            except (RuntimeError, OSError) as e:
-                logger.error(f"Failed to restart worker {worker_id}: {e}")
-                # Clean up worktree if spawn failed
-                if old_worktree:
-                    try:
-                        self.worktrees.delete(Path(old_worktree), force=True)
-                    except Exception as cleanup_err:  # noqa: BLE001 — intentional: cleanup must not propagate; worktree errors are diverse
-                        logger.warning(f"Failed to clean up worktree: {cleanup_err}")
+                self.worktrees.delete(Path(old_worktree), force=True)
+            except Exception as cleanup_err:  # noqa: BLE001 — intentional: cleanup must not propagate; worktree errors are diverse
+                logger.warning(f"Failed to clean up worktree: {cleanup_err}")
 
     def respawn_workers_for_level(self, level: int) -> int:
         """Respawn workers for a new level.
@@ -439,10 +566,81 @@ class WorkerManager:
         Returns:
             Number of workers successfully spawned
         """
+        spawned = 0
+        for worker_id in self._respawn_ids(level):
+            try:
+                self.spawn_worker(worker_id)
+                spawned += 1
+            except (RuntimeError, OSError) as e:
+                logger.error(f"Failed to respawn worker {worker_id}: {e}")
+
+        if spawned > 0:
+            # Wait for new workers to initialize
+            self.wait_for_initialization(timeout=300)
+
+        return spawned
+
+    async def respawn_workers_for_level_async(self, level: int) -> int:
+        """Respawn workers for a new level concurrently.
+
+        Worktrees are created one at a time (they share the repository's
+        refs), then all workers are started together with
+        ``launcher.spawn_async``. Readiness is left to the caller's
+        monitoring instead of blocking in :meth:`wait_for_initialization`.
+        Holds the spawn lock from picking IDs until they are registered.
+
+        Args:
+            level: Level number that needs workers
+
+        Returns:
+            Number of workers successfully spawned
+        """
+        async with self._spawn_lock:
+            return await self._respawn_level_locked(level)
+
+    async def _respawn_level_locked(self, level: int) -> int:
+        prepared = []
+        for worker_id in self._respawn_ids(level):
+            try:
+                prepared.append((worker_id, *await asyncio.to_thread(self._prepare_spawn, worker_id)))
+            except (RuntimeError, OSError) as e:
+                logger.error(f"Failed to respawn worker {worker_id}: {e}")
+
+        results = await asyncio.gather(
+            *(
+                self.launcher.spawn_async(
+                    worker_id=worker_id,
+                    feature=self.feature,
+                    worktree_path=wt_info.path,
+                    branch=wt_info.branch,
+                    env=env,
+                )
+                for worker_id, _port, wt_info, env in prepared
+            ),
+            return_exceptions=True,
+        )
+
+        # One launcher raising must not drop the workers that did start
+        spawned = 0
+        for (worker_id, port, wt_info, _env), result in zip(prepared, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.error(f"Failed to respawn worker {worker_id}: {result}")
+                continue
+            try:
+                self._register_spawned(worker_id, port, wt_info, result)
+                spawned += 1
+            except RuntimeError as e:
+                logger.error(f"Failed to respawn worker {worker_id}: {e}")
+        return spawned
+
+    def _respawn_ids(self, level: int) -> list[int]:
+        """Pick worker IDs to spawn for a level, clearing out stopped workers."""
         # Determine how many workers we need
         remaining = self._get_remaining_tasks_for_level(level)
         if not remaining:
-            return 0
+            return []
 
         # Count still-active workers
         active = [
@@ -454,11 +652,10 @@ class WorkerManager:
         need = min(target_count - len(active), len(remaining))
 
         if need <= 0:
-            return 0
+            return []
 
         logger.info(f"Respawning {need} workers for level {level} ({len(remaining)} tasks remaining)")
 
-        spawned = 0
         # Find available worker IDs (prefer reusing IDs from stopped workers)
         used_ids = set(self._workers.keys())
         available_ids = [i for i in range(target_count) if i not in used_ids]
@@ -471,20 +668,7 @@ class WorkerManager:
             _unregister_worker(self._workers, wid)
             available_ids.append(wid)
 
-        available_ids = sorted(set(available_ids))[:need]
-
-        for worker_id in available_ids:
-            try:
-                self.spawn_worker(worker_id)
-                spawned += 1
-            except (RuntimeError, OSError) as e:
-                logger.error(f"Failed to respawn worker {worker_id}: {e}")
-
-        if spawned > 0:
-            # Wait for new workers to initialize
-            self.wait_for_initialization(timeout=300)
-
-        return spawned
+        return sorted(set(available_ids))[:need]
 
     @property
     def running(self) -> bool:
@@ -3,6 +3,10 @@
 Provides comprehensive metrics collection and tracking for worker instances,
 including task execution timing, context usage, resource consumption, and
 aggregated statistics.
+
+Task durations are summarized in mergeable DDSketch histograms per worker
+and per level, and only the most recent task records are kept, so memory
+stays bounded however many tasks a run executes.
 """
 
 from __future__ import annotations
@@ -13,10 +17,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from mahabharatha.quantile_sketch import DDSketch
+
 if TYPE_CHECKING:
     from mahabharatha.types import WorkerMetricsSummaryDict
 
 
+# Finished task records kept per worker; durations live on in the sketch
+TASK_HISTORY_LIMIT = 100
+
+
 @dataclass
 class TaskExecutionMetrics:
     """Metrics for a single task execution."""
@@ -116,8 +126,10 @@ class WorkerMetrics:
     last_health_check_at: datetime | None = None
     last_health_check_ok: bool = True
 
-    # Task execution history
+    # Recent task executions (bounded by TASK_HISTORY_LIMIT)
     task_history: list[TaskExecutionMetrics] = field(default_factory=list)
+    # Durations (seconds) of every finished task
+    duration_sketch: DDSketch = field(default_factory=DDSketch)
 
     @property
     def total_tasks(self) -> int:
@@ -175,8 +187,19 @@ class WorkerMetrics:
             context_usage_before=context_usage or self.context_usage,
         )
         self.task_history.append(metrics)
+        self._trim_history()
         return metrics
 
+    def _trim_history(self) -> None:
+        """Drop the oldest finished records beyond TASK_HISTORY_LIMIT."""
+        excess = len(self.task_history) - TASK_HISTORY_LIMIT
+        if excess > 0:
+            self.task_history = [t for i, t in enumerate(self.task_history) if i >= excess or t.status == "running"]
+
+    def duration_percentile(self, percentile: float) -> float:
+        """Estimated task duration percentile (0-100) in seconds."""
+        return self.duration_sketch.quantile(percentile / 100)
+
     def complete_task(
         self,
         task_id: str,
@@ -220,6 +243,7 @@ class WorkerMetrics:
         for metrics in reversed(self.task_history):
             if metrics.task_id == task_id and metrics.duration_seconds:
                 self.total_task_duration_seconds += metrics.duration_seconds
+                self.duration_sketch.add(metrics.duration_seconds)
                 break
 
         self.current_task = None
@@ -271,6 +295,10 @@ class WorkerMetrics:
             "uptime_seconds": round(self.uptime_seconds, 2),
             "utilization": round(self.utilization, 3),
             "avg_task_duration": round(self.avg_task_duration, 2),
+            "p50_task_duration": round(self.duration_percentile(50), 2),
+            "p90_task_duration": round(self.duration_percentile(90), 2),
+            "p99_task_duration": round(self.duration_percentile(99), 2),
+            "duration_sketch": self.duration_sketch.to_dict(),
             "health_check_failures": self.health_check_failures,
             "last_health_check_at": (self.last_health_check_at.isoformat() if self.last_health_check_at else None),
             "last_health_check_ok": self.last_health_check_ok,
@@ -309,6 +337,8 @@ class WorkerMetrics:
             metrics.last_task_completed_at = datetime.fromisoformat(data["last_task_completed_at"])
         if data.get("last_health_check_at"):
             metrics.last_health_check_at = datetime.fromisoformat(data["last_health_check_at"])
+        if data.get("duration_sketch"):
+            metrics.duration_sketch = DDSketch.from_dict(data["duration_sketch"])
 
         return metrics
 
@@ -325,6 +355,8 @@ class LevelMetrics:
     failed_tasks: int = 0
     total_duration_seconds: float = 0.0
     worker_count: int = 0
+    # Durations (seconds) of the level's tasks, fed by WorkerMetricsCollector.complete_task()
+    duration_sketch: DDSketch = field(default_factory=DDSketch)
 
     @property
     def duration_seconds(self) -> float:
@@ -362,6 +394,10 @@ class LevelMetrics:
             "total_duration_seconds": round(self.total_duration_seconds, 2),
             "worker_count": self.worker_count,
             "is_complete": self.is_complete,
+            "p50_task_duration": round(self.duration_sketch.quantile(0.5), 2),
+            "p90_task_duration": round(self.duration_sketch.quantile(0.9), 2),
+            "p99_task_duration": round(self.duration_sketch.quantile(0.99), 2),
+            "duration_sketch": self.duration_sketch.to_dict(),
         }
 
 
@@ -396,6 +432,8 @@ class WorkerMetricsCollector:
 
         # Level metrics
         self._levels: dict[int, LevelMetrics] = {}
+        # Sum of worker task durations when each level started
+        self._level_baselines: dict[int, float] = {}
 
         # Ensure directory exists
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
@@ -438,6 +476,10 @@ class WorkerMetricsCollector:
             total_tasks=total_tasks,
             worker_count=worker_count,
         )
+        self._level_baselines[level] = self._total_task_duration()
+
+    def _total_task_duration(self) -> float:
+        return sum(w.total_task_duration_seconds for w in self._workers.values())
 
     def complete_level(self, level: int) -> None:
         """Record level completion.
@@ -449,18 +491,16 @@ class WorkerMetricsCollector:
             lvl = self._levels[level]
             lvl.completed_at = datetime.now()
 
-            # Calculate aggregate task duration
-            for worker in self._workers.values():
-                for task in worker.task_history:
-                    if task.duration_seconds:
-                        lvl.total_duration_seconds += task.duration_seconds
+            # Task time spent by all workers since the level started
+            lvl.total_duration_seconds += self._total_task_duration() - self._level_baselines.get(level, 0.0)
 
-    def record_task_completion(self, level: int, success: bool) -> None:
+    def record_task_completion(self, level: int, success: bool, duration_seconds: float | None = None) -> None:
         """Record task completion at level.
 
         Args:
             level: Level number
             success: Whether task succeeded
+            duration_seconds: Task duration, added to the level's duration sketch
         """
         if level not in self._levels:
             self._levels[level] = LevelMetrics(level=level)
@@ -469,6 +509,42 @@ class WorkerMetricsCollector:
             self._levels[level].completed_tasks += 1
         else:
             self._levels[level].failed_tasks += 1
+        if duration_seconds is not None:
+            self._levels[level].duration_sketch.add(duration_seconds)
+
+    def complete_task(
+        self,
+        worker_id: int,
+        task_id: str,
+        level: int,
+        status: str = "completed",
+        context_usage: float | None = None,
+    ) -> None:
+        """Record a worker's task completion and count it toward its level.
+
+        The task's measured duration goes into both the worker's and the
+        level's duration sketch.
+
+        Args:
+            worker_id: Worker that ran the task
+            task_id: Task identifier
+            level: Level the task belongs to
+            status: Final status (completed, failed or skipped)
+            context_usage: Context usage after completion
+        """
+        worker = self.register_worker(worker_id)
+        worker.complete_task(task_id, status=status, context_usage=context_usage)
+        if status not in ("completed", "failed"):
+            return
+        duration = next((t.duration_seconds for t in reversed(worker.task_history) if t.task_id == task_id), None)
+        self.record_task_completion(level, success=status == "completed", duration_seconds=duration)
+
+    def duration_sketch(self) -> DDSketch:
+        """Merge every worker's duration sketch into a feature-wide one."""
+        merged = DDSketch()
+        for worker in self._workers.values():
+            merged.merge(worker.duration_sketch)
+        return merged
 
     def get_summary(self) -> WorkerMetricsSummaryDict:
         """Get execution summary across all workers.
@@ -491,6 +567,7 @@ class WorkerMetricsCollector:
 
         # Calculate overall duration
         duration = ((self.completed_at or datetime.now()) - self.started_at).total_seconds()
+        durations = self.duration_sketch()
 
         return {
             "execution_id": self.execution_id,
@@ -506,6 +583,9 @@ class WorkerMetricsCollector:
             "failed_tasks": failed_tasks,
             "success_rate": (round(completed_tasks / total_tasks, 3) if total_tasks > 0 else 0.0),
             "total_task_duration_seconds": round(total_task_duration, 2),
+            "p50_task_duration_seconds": round(durations.quantile(0.5), 2),
+            "p90_task_duration_seconds": round(durations.quantile(0.9), 2),
+            "p99_task_duration_seconds": round(durations.quantile(0.99), 2),
             "total_idle_seconds": round(total_idle, 2),
             "avg_worker_utilization": round(avg_utilization, 3),
             "avg_context_usage": round(avg_context, 3),
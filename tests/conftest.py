@@ -10,6 +10,8 @@ from unittest.mock import MagicMock
 import pytest
 
 from mahabharatha.config import MahabharathaConfig, QualityGate
+from mahabharatha.fs_utils import clear_listing_cache
+from mahabharatha.parse_cache import reset_parse_cache
 from mahabharatha.repo_map import invalidate_cache as invalidate_repo_map_cache
 from mahabharatha.types import Task, TaskGraph
 
@@ -24,14 +26,20 @@ def reset_caches() -> Generator[None, None, None]:
     Caches reset:
     - MahabharathaConfig singleton (TASK-001)
     - RepoMap TTL cache (TASK-004)
+    - Shared parse cache
+    - Directory listing cache
     """
     # Clear caches before test
     MahabharathaConfig.invalidate_cache()
     invalidate_repo_map_cache()
+    reset_parse_cache()
+    clear_listing_cache()
     yield
     # Clear caches after test
     MahabharathaConfig.invalidate_cache()
     invalidate_repo_map_cache()
+    reset_parse_cache()
+    clear_listing_cache()
 
 
 def _run_git(*args: str, cwd: Path | None = None) -> None:
@@ -4,6 +4,7 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from mahabharatha.cli import cli
@@ -133,11 +134,11 @@ class TestStatusCommandMetrics:
         # Patch StateManager in the status command module so the CLI reads
         # from the same tmp_path state directory the test populated above.
         # NOTE: ``import mahabharatha.commands.status`` resolves to the Click command
-        # object (due to re-export in __init__.py), so we grab the real module
-        # from sys.modules.
-        import sys
+        # object (due to re-export in __init__.py), and subcommand modules load
+        # lazily, so import the real module explicitly.
+        import importlib
 
-        status_mod = sys.modules["mahabharatha.commands.status"]
+        status_mod = importlib.import_module("mahabharatha.commands.status")
 
         _OrigStateManager = StateManager
 
@@ -211,7 +212,7 @@ class TestMetricsAccuracy:
         # Verify
         assert level_metrics.task_count == 5
         assert level_metrics.completed_count == 5
-        assert level_metrics.p50_duration_ms == 30000  # Median
+        assert level_metrics.p50_duration_ms == pytest.approx(30000, rel=0.01)  # Median, within sketch accuracy
         assert level_metrics.avg_task_duration_ms == 30000.0  # Average
 
     def test_worker_uptime_calculation(self, tmp_path: Path) -> None:
@@ -0,0 +1,76 @@
+"""Tests for the benchmark harness.
+
+Tests cover:
+1. Parameter grids and quick grids
+2. Self-timed runs
+3. Results round trip and baseline comparison
+4. `python -m benchmarks compare` exit status
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks import harness
+from benchmarks.__main__ import main
+from benchmarks.harness import Benchmark, Case, Result, compare, load_results, measure, run_case, write_results
+
+
+def _result(median: float, name: str = "state.claim", **params: object) -> Result:
+    return Result(name, dict(params), 3, median, median, median, median)
+
+
+def test_cases_cover_grid() -> None:
+    bench = Benchmark("x", lambda case: lambda: None, {"tasks": [10, 100], "workers": [5, 50]}, {"tasks": [10]})
+    assert len(list(bench.cases())) == 4
+    assert list(bench.cases(quick=True)) == [{"tasks": 10, "workers": 5}, {"tasks": 10, "workers": 50}]
+
+
+def test_self_timed_runs_and_extra() -> None:
+    assert measure(lambda: 0.5, repeat=3, warmup=1) == [0.5, 0.5, 0.5]
+
+    def setup(case: Case) -> object:
+        case.extra["size"] = case["n"] * 2
+        assert case.workdir.is_dir()
+        return lambda: None
+
+    result = run_case(Benchmark("x", setup, {"n": [4]}, {}), {"n": 4}, repeat=2)
+    assert result.runs == 2
+    assert result.extra == {"size": 8}
+    assert result.key == "x[n=4]"
+
+
+def test_results_round_trip_and_compare(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    write_results([_result(0.010, tasks=10), _result(0.020, tasks=100)], path)
+    baseline = load_results(path)
+    assert set(baseline) == {"state.claim[tasks=10]", "state.claim[tasks=100]"}
+
+    current = {"state.claim[tasks=10]": {"median_s": 0.014}, "state.claim[tasks=100]": {"median_s": 0.021}}
+    comparisons = {c.key: c for c in compare(current, baseline)}
+    assert comparisons["state.claim[tasks=10]"].is_regression(0.25)
+    assert not comparisons["state.claim[tasks=100]"].is_regression(0.25)
+
+    (tmp_path / "bad.json").write_text(json.dumps({"results": []}))
+    with pytest.raises(ValueError):
+        load_results(tmp_path / "bad.json")
+
+
+def test_compare_command_exit_status(tmp_path: Path) -> None:
+    write_results([_result(0.010)], tmp_path / "base.json")
+    write_results([_result(0.011)], tmp_path / "ok.json")
+    write_results([_result(0.050)], tmp_path / "slow.json")
+    runner = CliRunner()
+
+    ok = runner.invoke(main, ["compare", str(tmp_path / "base.json"), str(tmp_path / "ok.json")])
+    assert ok.exit_code == 0, ok.output
+    slow = runner.invoke(main, ["compare", str(tmp_path / "base.json"), str(tmp_path / "slow.json")])
+    assert slow.exit_code == 1
+    assert "REGRESSION" in slow.output
+
+
+def test_every_benchmark_registered() -> None:
+    prefixes = {name.split(".")[0] for name in harness.REGISTRY}
+    assert prefixes == {"cli", "state", "repo_map", "security", "logs", "metrics"}
@@ -1,6 +1,7 @@
 """Unit tests for MAHABHARATHA cleanup command - thinned per TSR2-L3-002."""
 
 import os
+import sqlite3
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,11 +10,15 @@ from click.testing import CliRunner
 
 from mahabharatha.cli import cli
 from mahabharatha.commands.cleanup import (
+    cleanup_structured_logs,
     create_cleanup_plan,
     discover_features,
     execute_cleanup,
     show_cleanup_plan,
 )
+from mahabharatha.config import StateConfig
+from mahabharatha.state import StateManager
+from mahabharatha.state.backends import create_persistence, pin_backend
 
 
 @pytest.fixture
@@ -46,6 +51,22 @@ class TestDiscoverFeatures:
         assert "user-auth" in features
         assert "api-feature" in features
 
+    def test_discover_from_sqlite_and_journal_state(self, tmp_path: Path, monkeypatch) -> None:
+        """Test discover finds features whose state is a database or a WAL."""
+        monkeypatch.chdir(tmp_path)
+        state_dir = tmp_path / ".mahabharatha" / "state"
+        state_dir.mkdir(parents=True)
+        StateManager("stored", state_dir=state_dir, config=StateConfig(backend="sqlite")).set_current_level(1)
+        (state_dir / "journaled.wal").write_text("")
+        # A shared SQLite cache in the state dir is not a feature
+        conn = sqlite3.connect(state_dir / "parse-cache.db")
+        conn.execute("CREATE TABLE summaries (path TEXT)")
+        conn.close()
+
+        features = set(discover_features())
+        assert {"stored", "journaled"} <= features
+        assert "parse-cache" not in features
+
     @patch("mahabharatha.commands.cleanup.GitOps")
     def test_discover_from_branches(self, mock_git_cls: MagicMock, tmp_path: Path, monkeypatch) -> None:
         """Test discover finds features from git branches."""
@@ -277,6 +298,35 @@ class TestExecuteCleanup:
         execute_cleanup(plan, mock_config)
         assert not state_file.exists()
 
+    @patch("mahabharatha.commands.cleanup.GitOps")
+    @patch("mahabharatha.commands.cleanup.WorktreeManager")
+    @patch("mahabharatha.commands.cleanup.ContainerManager")
+    def test_journaled_state_does_not_survive_cleanup(
+        self,
+        mock_container_cls: MagicMock,
+        mock_worktree_cls: MagicMock,
+        mock_git_cls: MagicMock,
+        tmp_path: Path,
+        monkeypatch,
+        mock_config,
+    ) -> None:
+        """Test the journal WAL and backend pin are removed along with the snapshot."""
+        monkeypatch.chdir(tmp_path)
+        mock_git_cls.return_value.list_branches.return_value = []
+        state_dir = Path(".mahabharatha/state")
+        pin_backend("feat", state_dir, "journal")
+        manager = StateManager("feat", state_dir=state_dir)
+        manager.load()
+        manager.save()
+        manager.claim_task("T1", worker_id=3)
+
+        plan = create_cleanup_plan(["feat"], True, True, mock_config)
+        assert any(f.endswith("feat.wal") for f in plan["state_files"])
+        execute_cleanup(plan, mock_config)
+
+        assert not create_persistence("feat", state_dir).exists()
+        assert StateManager("feat", state_dir=state_dir).get_task_status("T1") is None
+
     @patch("mahabharatha.commands.cleanup.WorktreeManager")
     @patch("mahabharatha.commands.cleanup.ContainerManager")
     def test_execute_clears_current_feature(
@@ -367,3 +417,26 @@ class TestCleanupCLI:
         runner = CliRunner()
         result = runner.invoke(cli, ["cleanup", "--all"])
         assert result.exit_code == 1
+
+
+class TestCleanupStructuredLogs:
+    """Tests for cleanup_structured_logs worker log retention."""
+
+    def test_index_sidecars_follow_their_log(self, tmp_path: Path) -> None:
+        """Test .idx sidecars are never treated as logs and go away with their log."""
+        workers_dir = tmp_path / "logs" / "workers"
+        workers_dir.mkdir(parents=True)
+        config = MagicMock()
+        config.logging.directory = str(tmp_path / "logs")
+        config.logging.retain_days = 7
+
+        old = 0  # Epoch: far beyond any retention window
+        for name in ("worker-0.jsonl", "worker-0.jsonl.1", "worker-1.jsonl.idx", "worker-2.jsonl.idx"):
+            (workers_dir / name).write_text("{}\n")
+            os.utime(workers_dir / name, (old, old))
+        (workers_dir / "worker-0.jsonl.idx").write_text("{}\n")  # Fresh sidecar of an old log
+        (workers_dir / "worker-1.jsonl").write_text("{}\n")  # Fresh log with an old sidecar
+
+        cleanup_structured_logs(config)
+
+        assert sorted(p.name for p in workers_dir.iterdir()) == ["worker-1.jsonl", "worker-1.jsonl.idx"]
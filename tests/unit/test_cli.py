@@ -1,9 +1,15 @@
 """Unit tests for MAHABHARATHA CLI module."""
 
+import subprocess
+import sys
+from pathlib import Path
+
+import click
 import pytest
 from click.testing import CliRunner
 
-from mahabharatha.cli import cli
+import mahabharatha
+from mahabharatha.cli import COMMANDS, cli
 
 
 class TestCliGroup:
@@ -108,3 +114,59 @@ class TestCliContext:
         runner = CliRunner()
         result = runner.invoke(cli, ["--quiet", "--help"])
         assert result.exit_code == 2
+
+
+class TestLazyLoading:
+    """Tests for on-demand subcommand imports."""
+
+    def _run(self, code: str, cwd: Path) -> str:
+        """Run code in a fresh interpreter and return its stdout."""
+        repo_root = Path(mahabharatha.__file__).resolve().parent.parent
+        script = f"import sys\nsys.path.insert(0, {str(repo_root)!r})\n{code}"
+        proc = subprocess.run([sys.executable, "-c", script], cwd=cwd, capture_output=True, text=True, check=True)
+        return proc.stdout
+
+    def _modules_after(self, code: str, cwd: Path) -> set[str]:
+        return set(self._run(f"{code}\nprint(' '.join(sys.modules))", cwd).split())
+
+    def test_import_loads_no_commands(self, tmp_path: Path) -> None:
+        """Importing the CLI imports no command module or the Pydantic config."""
+        modules = self._modules_after("import mahabharatha.cli", tmp_path)
+        assert not {m for m in modules if m.startswith("mahabharatha.commands.")}
+        assert "mahabharatha.config" not in modules
+
+    def test_status_loads_only_status(self, tmp_path: Path) -> None:
+        """Running status imports neither other commands nor the full config."""
+        code = (
+            "from mahabharatha.cli import cli\n"
+            "try:\n"
+            "    cli(['status', '--feature', 'x'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        modules = self._modules_after(code, tmp_path)
+        assert "mahabharatha.commands.status" in modules
+        assert "mahabharatha.commands.debug" not in modules
+        assert "mahabharatha.commands.analyze" not in modules
+        assert "mahabharatha.config" not in modules
+
+    def test_lazy_commands_resolve(self) -> None:
+        """Every lazy entry resolves to a click command of the same name."""
+        ctx = click.Context(cli)
+        assert cli.list_commands(ctx) == sorted(COMMANDS)
+        for name in COMMANDS:
+            command = cli.get_command(ctx, name)
+            assert isinstance(command, click.Command)
+            assert command.name == name
+        assert cli.get_command(ctx, "nope") is None
+
+    def test_package_reexports(self, tmp_path: Path) -> None:
+        """``from mahabharatha.commands import x`` and top-level re-exports still work."""
+        code = (
+            "import click\n"
+            "import mahabharatha\n"
+            "from mahabharatha.commands import logs, security_rules_group\n"
+            "print(isinstance(logs, click.Command), isinstance(security_rules_group, click.Group))\n"
+            "print(mahabharatha.WorkerMetrics.__name__)"
+        )
+        assert self._run(code, tmp_path).split() == ["True", "True", "WorkerMetrics"]
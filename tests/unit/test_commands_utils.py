@@ -94,6 +94,22 @@ class TestDetectFeature:
         result = detect_feature()
         assert result == "new-feature"
 
+    def test_sqlite_state_detected(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Features stored by the SQLite backend have no JSON file but are still detected."""
+        monkeypatch.chdir(tmp_path)
+        state_dir = tmp_path / ".mahabharatha" / "state"
+        state_dir.mkdir(parents=True)
+        (state_dir / "stored.db").write_bytes(b"")
+        from mahabharatha.state.backends import pin_backend
+
+        pin_backend("stored", state_dir, "sqlite")
+        # A newer shared SQLite cache is not a feature
+        (state_dir / "parse-cache.db").write_bytes(b"")
+
+        from mahabharatha.commands._utils import detect_feature
+
+        assert detect_feature() == "stored"
+
     def test_detect_feature_mahabharatha_feature_env_var_priority(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
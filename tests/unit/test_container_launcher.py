@@ -300,6 +300,28 @@ class TestSpawn:
         assert not result.success
         assert result.error == "Failed to start container"
 
+    @patch("subprocess.run")
+    def test_spawn_resets_slot_in_repo_state_dir(self, mock_run: MagicMock, tmp_path: Path) -> None:
+        """The stale table slot is cleared in the main repo's state dir, not the cwd's."""
+        wt = _fake_worktree(tmp_path)
+        launcher = _launcher()
+        mock_run.side_effect = [MagicMock(returncode=0), MagicMock(returncode=1, stdout="", stderr="")]
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("mahabharatha.launchers.container_launcher.reset_worker_slot") as reset,
+        ):
+            launcher.spawn(0, "feat", wt, "branch-x")
+
+            async def _spawn_async():
+                with patch("asyncio.create_subprocess_exec", side_effect=RuntimeError("stop")):
+                    return await launcher.spawn_async(1, "feat", wt, "branch-x")
+
+            asyncio.run(_spawn_async())
+
+        state_dir = tmp_path / "repo" / ".mahabharatha" / "state"
+        assert [c.args for c in reset.call_args_list] == [(0, state_dir), (1, state_dir)]
+
     @patch("subprocess.run")
     def test_spawn_wait_ready_failure(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Spawn returns failure when container doesn't become ready."""
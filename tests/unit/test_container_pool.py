@@ -0,0 +1,175 @@
+"""Tests for the warm container pool.
+
+Tests cover:
+1. WarmContainerPool filling, acquiring and draining
+2. Warm container docker run command layout
+3. ContainerLauncher.spawn and spawn_async using a warm container, falling back to a cold start
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mahabharatha.launchers.container_launcher import ContainerLauncher
+from mahabharatha.launchers.container_pool import POOL_STATE_DIR, POOL_WORKTREE_ROOT, WarmContainerPool
+
+RUN = "mahabharatha.launchers.container_pool.subprocess.run"
+
+
+def _ok(stdout: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess([], 0, stdout, "")
+
+
+def _filled_pool(tmp_path: Path, size: int = 2) -> WarmContainerPool:
+    pool = WarmContainerPool(size, lambda name, root: ["docker", "run", name], "mahabharatha-worker")
+    ids = iter(f"cid{i}" for i in range(100))
+    with patch(RUN, side_effect=lambda *a, **k: _ok(next(ids))):
+        pool.fill(tmp_path)
+        assert pool._filler is not None
+        pool._filler.join(timeout=5)
+    return pool
+
+
+class TestWarmContainerPool:
+    """Tests for WarmContainerPool."""
+
+    def test_fill_starts_size_containers(self, tmp_path: Path) -> None:
+        assert len(_filled_pool(tmp_path, size=3)) == 3
+
+    def test_acquire_is_fifo_and_root_scoped(self, tmp_path: Path) -> None:
+        pool = _filled_pool(tmp_path)
+        assert pool.acquire(tmp_path / "other") is None
+        assert pool.acquire(tmp_path) == "cid0"
+        assert len(pool) == 1
+
+    def test_empty_pool_returns_none(self, tmp_path: Path) -> None:
+        pool = WarmContainerPool(1, lambda name, root: [], "p")
+        assert pool.acquire(tmp_path) is None
+
+    def test_failed_start_stops_filling(self, tmp_path: Path) -> None:
+        pool = WarmContainerPool(3, lambda name, root: ["docker", "run", name], "p")
+        with patch(RUN, return_value=subprocess.CompletedProcess([], 125, "", "no image")) as run:
+            pool.fill(tmp_path)
+            assert pool._filler is not None
+            pool._filler.join(timeout=5)
+        assert run.call_count == 1
+        assert len(pool) == 0
+
+    def test_drain_removes_idle_and_stops_refill(self, tmp_path: Path) -> None:
+        pool = _filled_pool(tmp_path)
+        with patch(RUN, return_value=_ok()) as run:
+            pool.drain()
+            pool.fill(tmp_path)
+        run.assert_called_once()
+        assert run.call_args.args[0] == ["docker", "rm", "-f", "cid0", "cid1"]
+        assert len(pool) == 0
+
+    def test_new_root_drains_old_containers(self, tmp_path: Path) -> None:
+        pool = _filled_pool(tmp_path, size=1)
+        with patch(RUN, side_effect=[_ok(), _ok("fresh")]) as run:
+            pool.fill(tmp_path / "feature-b")
+            assert pool._filler is not None
+            pool._filler.join(timeout=5)
+        assert ["docker", "rm", "-f", "cid0"] in [c.args[0] for c in run.call_args_list]
+        assert pool.acquire(tmp_path / "feature-b") == "fresh"
+
+
+class TestWarmSpawn:
+    """Tests for ContainerLauncher with warm_pool_size > 0."""
+
+    def _worktree(self, tmp_path: Path) -> Path:
+        worktree = tmp_path / ".mahabharatha-worktrees" / "feat" / "worker-1"
+        worktree.mkdir(parents=True)
+        return worktree
+
+    def test_warm_container_command(self, tmp_path: Path) -> None:
+        launcher = ContainerLauncher(warm_pool_size=1)
+        root = self._worktree(tmp_path).parent
+        cmd = launcher._build_warm_container_cmd("w", root)
+        assert f"{root.absolute()}:{POOL_WORKTREE_ROOT}" in cmd
+        assert f"{(tmp_path / '.mahabharatha' / 'state').absolute()}:{POOL_STATE_DIR}" in cmd
+        assert cmd[-2:] == ["sleep", "infinity"]
+        assert "mahabharatha.worker=warm" in cmd
+
+    def test_start_from_pool_execs_entry_in_worktree(self, tmp_path: Path) -> None:
+        launcher = ContainerLauncher(warm_pool_size=1)
+        assert launcher._pool is not None
+        launcher._pool = MagicMock()
+        launcher._pool.acquire.return_value = "warmcid"
+        worktree = self._worktree(tmp_path)
+        env = {"MAHABHARATHA_WORKTREE": "/workspace", "MAHABHARATHA_SPEC_DIR": "/workspace/.gsd/specs/feat"}
+
+        with patch("mahabharatha.launchers.container_launcher.subprocess.run", return_value=_ok()) as run:
+            cid = launcher._start_from_pool("mahabharatha-worker-1", worktree, env)
+
+        assert cid == "warmcid"
+        rename, exec_cmd = (c.args[0] for c in run.call_args_list)
+        assert rename == ["docker", "rename", "warmcid", "mahabharatha-worker-1"]
+        assert exec_cmd[:5] == ["docker", "exec", "-d", "-w", f"{POOL_WORKTREE_ROOT}/worker-1"]
+        assert f"MAHABHARATHA_WORKTREE={POOL_WORKTREE_ROOT}/worker-1" in exec_cmd
+        assert f"MAHABHARATHA_SPEC_DIR={POOL_WORKTREE_ROOT}/worker-1/.gsd/specs/feat" in exec_cmd
+        assert f"MAHABHARATHA_STATE_DIR={POOL_STATE_DIR}" in exec_cmd
+
+    def test_failed_exec_falls_back_to_cold_start(self, tmp_path: Path) -> None:
+        launcher = ContainerLauncher(warm_pool_size=1)
+        launcher._pool = MagicMock()
+        launcher._pool.acquire.return_value = "warmcid"
+        failed = subprocess.CompletedProcess([], 1, "", "boom")
+
+        with patch(
+            "mahabharatha.launchers.container_launcher.subprocess.run", side_effect=[_ok(), failed, _ok()]
+        ) as run:
+            cid = launcher._start_from_pool("mahabharatha-worker-1", self._worktree(tmp_path), {})
+
+        assert cid is None
+        assert run.call_args.args[0] == ["docker", "rm", "-f", "warmcid"]
+
+    def test_spawn_uses_pool_and_refills(self, tmp_path: Path) -> None:
+        launcher = ContainerLauncher(warm_pool_size=1)
+        launcher._pool = MagicMock()
+        worktree = self._worktree(tmp_path)
+
+        with (
+            patch("mahabharatha.launchers.container_launcher.subprocess.run", return_value=_ok()),
+            patch.object(launcher, "_start_from_pool", return_value="warmcid"),
+            patch.object(launcher, "_start_container") as cold,
+            patch.object(launcher, "_wait_ready", return_value=True),
+            patch.object(launcher, "_verify_worker_process", return_value=True),
+        ):
+            result = launcher.spawn(1, "feat", worktree, "mahabharatha/feat/worker-1")
+
+        assert result.success is True
+        assert result.handle is not None
+        assert result.handle.container_id == "warmcid"
+        cold.assert_not_called()
+        launcher._pool.fill.assert_called_once_with(worktree.parent)
+
+    async def test_spawn_async_uses_pool_and_refills(self, tmp_path: Path) -> None:
+        launcher = ContainerLauncher(warm_pool_size=1)
+        launcher._pool = MagicMock()
+        launcher._pool.acquire.return_value = "warmcid"
+        worktree = self._worktree(tmp_path)
+        rm_proc = MagicMock()
+        rm_proc.communicate = AsyncMock(return_value=(b"", b""))
+
+        with (
+            patch("mahabharatha.launchers.container_launcher.subprocess.run", return_value=_ok()),
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value=rm_proc)),
+            patch.object(launcher, "_start_container_async") as cold,
+            patch.object(launcher, "_wait_ready", return_value=True),
+            patch.object(launcher, "_verify_worker_process", return_value=True),
+        ):
+            result = await launcher.spawn_async(1, "feat", worktree, "mahabharatha/feat/worker-1")
+
+        assert result.success is True
+        assert result.handle is not None
+        assert result.handle.container_id == "warmcid"
+        launcher._pool.acquire.assert_called_once_with(worktree.parent)
+        cold.assert_not_called()
+        launcher._pool.fill.assert_called_once_with(worktree.parent)
+
+    def test_close_drains_pool(self) -> None:
+        launcher = ContainerLauncher(warm_pool_size=1)
+        launcher._pool = MagicMock()
+        launcher.close()
+        launcher._pool.drain.assert_called_once()
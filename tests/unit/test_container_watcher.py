@@ -0,0 +1,173 @@
+"""Tests for batched container status monitoring.
+
+Tests cover:
+1. ContainerWatcher applying docker events to the status table
+2. Batched docker inspect refresh, throttling and missing containers
+3. Falling back to inspect-only when docker events cannot start
+4. ContainerLauncher.monitor reading the shared table
+"""
+
+import io
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mahabharatha.constants import WorkerStatus
+from mahabharatha.launcher_types import WorkerHandle
+from mahabharatha.launchers.container_launcher import ContainerLauncher
+from mahabharatha.launchers.container_watcher import WORKER_LABEL, ContainerState, ContainerWatcher
+
+CID_A = "a" * 64
+CID_B = "b" * 64
+
+
+@pytest.fixture
+def watcher():
+    w = ContainerWatcher(refresh_interval=60)
+    with patch("mahabharatha.launchers.container_watcher.subprocess.Popen", side_effect=OSError("no docker")):
+        w.track(CID_A)
+        w.track(CID_B)
+    yield w
+    w.stop()
+
+
+def _inspect(stdout: str, returncode: int = 0) -> MagicMock:
+    return MagicMock(returncode=returncode, stdout=stdout, stderr="")
+
+
+def _event(action: str, cid: str = CID_A, **attributes: str) -> dict:
+    return {"Type": "container", "Action": action, "Actor": {"ID": cid, "Attributes": attributes}}
+
+
+class TestEvents:
+    """Tests for ContainerWatcher.apply_event."""
+
+    def test_die_records_exit_code(self, watcher: ContainerWatcher) -> None:
+        watcher.apply_event(_event("die", exitCode="3"))
+        state = watcher.get(CID_A)
+        assert state is not None
+        assert state.running is False
+        assert state.exit_code == 3
+
+    def test_health_status(self, watcher: ContainerWatcher) -> None:
+        watcher.apply_event(_event("health_status: unhealthy"))
+        state = watcher.get(CID_A)
+        assert state is not None
+        assert state.health == "unhealthy"
+
+    def test_destroy_marks_removed(self, watcher: ContainerWatcher) -> None:
+        watcher.apply_event(_event("destroy"))
+        state = watcher.get(CID_A)
+        assert state is not None
+        assert state.removed is True
+
+    def test_untracked_container_ignored(self, watcher: ContainerWatcher) -> None:
+        watcher.apply_event(_event("die", cid="c" * 64, exitCode="1"))
+        assert watcher.get("c" * 64) is None
+
+
+class TestRefresh:
+    """Tests for batched docker inspect."""
+
+    def test_single_inspect_for_all_containers(self, watcher: ContainerWatcher) -> None:
+        out = f"{CID_A} true 0 healthy\n{CID_B} false 2 \n"
+        with patch("mahabharatha.launchers.container_watcher.subprocess.run", return_value=_inspect(out)) as run:
+            watcher.refresh(force=True)
+
+        run.assert_called_once()
+        cmd = run.call_args.args[0]
+        assert cmd[:2] == ["docker", "inspect"]
+        assert set(cmd[-2:]) == {CID_A, CID_B}
+        assert watcher.get(CID_A) == ContainerState(running=True, exit_code=0, health="healthy")
+        assert watcher.get(CID_B) == ContainerState(running=False, exit_code=2)
+
+    def test_missing_container_marked_removed(self, watcher: ContainerWatcher) -> None:
+        with patch(
+            "mahabharatha.launchers.container_watcher.subprocess.run",
+            return_value=_inspect(f"{CID_A} true 0 \n", returncode=1),
+        ):
+            watcher.refresh(force=True)
+        state = watcher.get(CID_B)
+        assert state is not None
+        assert state.removed is True
+
+    def test_refresh_is_throttled(self, watcher: ContainerWatcher) -> None:
+        with patch("mahabharatha.launchers.container_watcher.subprocess.run", return_value=_inspect("")) as run:
+            watcher.refresh()
+            watcher.refresh()
+        assert run.call_count == 1
+
+    def test_events_not_retried_when_unavailable(self, watcher: ContainerWatcher) -> None:
+        with (
+            patch("mahabharatha.launchers.container_watcher.subprocess.Popen") as popen,
+            patch("mahabharatha.launchers.container_watcher.subprocess.run", return_value=_inspect("")),
+        ):
+            watcher.refresh(force=True)
+        popen.assert_not_called()
+        assert watcher.following is False
+
+    def test_untracking_last_container_stops_stream(self) -> None:
+        w = ContainerWatcher()
+        proc = MagicMock()
+        proc.poll.return_value = None
+        proc.stdout = io.StringIO("")
+        with patch("mahabharatha.launchers.container_watcher.subprocess.Popen", return_value=proc) as popen:
+            w.track(CID_A)
+        assert "label=" + WORKER_LABEL in popen.call_args.args[0]
+        w.untrack(CID_A)
+        proc.terminate.assert_called_once()
+
+
+class TestLauncherMonitor:
+    """Tests for ContainerLauncher.monitor with watch_events enabled."""
+
+    def _launcher(self, state: ContainerState | None, age: float = 120) -> ContainerLauncher:
+        launcher = ContainerLauncher(watch_events=True)
+        launcher._watcher = MagicMock()
+        launcher._watcher.get.return_value = state
+        started = datetime.now() - timedelta(seconds=age)
+        launcher._workers[0] = WorkerHandle(worker_id=0, container_id=CID_A, started_at=started)
+        launcher._container_ids[0] = CID_A
+        return launcher
+
+    def test_running_container_promotes_to_running(self) -> None:
+        launcher = self._launcher(ContainerState(running=True, health="starting"))
+        with patch("mahabharatha.launchers.container_launcher.subprocess.run") as run:
+            assert launcher.monitor(0) == WorkerStatus.RUNNING
+        run.assert_not_called()
+
+    def test_unhealthy_container_is_stopped(self) -> None:
+        launcher = self._launcher(ContainerState(running=True, health="unhealthy"))
+        assert launcher.monitor(0) == WorkerStatus.STOPPED
+
+    def test_unhealthy_within_grace_is_not_stopped(self) -> None:
+        launcher = self._launcher(ContainerState(running=True, health="unhealthy"), age=1)
+        assert launcher.monitor(0) == WorkerStatus.RUNNING
+
+    def test_exit_code_maps_to_status(self) -> None:
+        launcher = self._launcher(ContainerState(running=False, exit_code=137))
+        assert launcher.monitor(0) == WorkerStatus.CRASHED
+        assert launcher._workers[0].exit_code == 137
+
+    def test_removed_container_is_stopped(self) -> None:
+        launcher = self._launcher(None)
+        assert launcher.monitor(0) == WorkerStatus.STOPPED
+
+    def test_terminate_untracks(self) -> None:
+        launcher = self._launcher(ContainerState(running=True))
+        watcher = launcher._watcher
+        with patch(
+            "mahabharatha.launchers.container_launcher.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, "", ""),
+        ):
+            assert launcher.terminate(0) is True
+        watcher.untrack.assert_called_once_with(CID_A)
+
+    def test_run_command_sets_label_and_healthcheck(self, tmp_path: Path) -> None:
+        launcher = ContainerLauncher()
+        cmd = launcher._build_container_cmd("w0", tmp_path / "a" / "b" / "worker-0", {"MAHABHARATHA_WORKER_ID": "0"})
+        assert cmd[cmd.index("--label") + 1] == f"{WORKER_LABEL}=0"
+        assert cmd[cmd.index("--health-cmd") + 1].startswith("test -f ")
@@ -254,10 +254,13 @@ class TestUnifiedMainLoop:
         ids=["escalation", "progress", "stale-tasks", "stalled", "crashed"],
     )
     def test_poll_workers_contains_feature(self, keyword: str) -> None:
-        """_poll_workers must include all required features."""
+        """_poll_workers (and the helpers it shares with the event loop) must include all required features."""
         from mahabharatha.orchestrator import Orchestrator
 
-        source = inspect.getsource(Orchestrator._poll_workers)
+        source = "".join(
+            inspect.getsource(getattr(Orchestrator, name))
+            for name in ("_poll_workers", "_check_worker_health", "_apply_worker_status")
+        )
         assert keyword in source or keyword.lower() in source.lower()
 
     def test_main_loop_injectable_sleep(self) -> None:
@@ -5,7 +5,10 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from mahabharatha.constants import TaskStatus
 from mahabharatha.diagnostics.state_introspector import MahabharathaHealthReport, MahabharathaStateIntrospector
+from mahabharatha.state import StateManager
+from mahabharatha.state.backends import pin_backend
 
 
 class TestMahabharathaHealthReport:
@@ -114,6 +117,16 @@ class TestMahabharathaStateIntrospector:
         assert "line2" in logs["stdout"]
         assert "err1" in logs["stderr"]
 
+    def test_health_report_reads_journaled_state(self, tmp_path: Path) -> None:
+        pin_backend("feat", tmp_path, "journal")
+        manager = StateManager("feat", state_dir=tmp_path)
+        manager.set_task_status("T1", TaskStatus.FAILED)
+        introspector = MahabharathaStateIntrospector(state_dir=tmp_path)
+        assert introspector.find_latest_feature() == "feat"
+        report = introspector.get_health_report("feat")
+        assert report.state_exists
+        assert report.task_summary == {"failed": 1}
+
     def test_detect_state_corruption_corrupt_json(self, tmp_path: Path) -> None:
         (tmp_path / "bad.json").write_text("{{bad")
         introspector = MahabharathaStateIntrospector(state_dir=tmp_path)
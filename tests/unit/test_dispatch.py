@@ -0,0 +1,193 @@
+"""Tests for event-driven task dispatch.
+
+Tests cover:
+1. DispatchQueue ordering, dedup, worker affinity and reconciliation
+2. DispatchServer/DispatchClient round trip over a Unix socket
+3. WorkerProtocol claiming dispatched tasks and falling back to polling
+4. Orchestrator publishing PENDING tasks on level start
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from mahabharatha.config import MahabharathaConfig
+from mahabharatha.constants import TaskStatus
+from mahabharatha.dispatch import DispatchClient, DispatchQueue, DispatchServer, dispatch_socket_path
+from mahabharatha.protocol_state import WorkerProtocol
+from mahabharatha.state import StateManager
+
+
+@pytest.fixture
+def server(tmp_path: Path):
+    srv = DispatchServer("feat", state_dir=tmp_path)
+    assert srv.start() is True
+    yield srv
+    srv.stop()
+
+
+def _protocol(state: MagicMock, dispatch: DispatchClient | None) -> WorkerProtocol:
+    protocol = WorkerProtocol.__new__(WorkerProtocol)
+    protocol.worker_id = 1
+    protocol.state = state
+    protocol.dependency_checker = None
+    protocol.task_parser = None
+    protocol.current_task = None
+    protocol._dispatch = dispatch
+    return protocol
+
+
+class TestDispatchQueue:
+    """Tests for the in-memory ready queue."""
+
+    def test_fifo_and_dedup(self) -> None:
+        queue = DispatchQueue()
+        assert queue.put_many([("T1", None), ("T2", None), ("T1", None)]) == 2
+        assert queue.get(worker_id=0, timeout=0) == "T1"
+        assert queue.get(worker_id=0, timeout=0) == "T2"
+        assert queue.get(worker_id=0, timeout=0) is None
+
+    def test_worker_affinity(self) -> None:
+        queue = DispatchQueue()
+        queue.put_many([("T1", 2), ("T2", None)])
+        assert queue.get(worker_id=1, timeout=0) == "T2"
+        assert queue.get(worker_id=1, timeout=0) is None
+        assert queue.get(worker_id=2, timeout=0) == "T1"
+
+    def test_get_wakes_on_put(self) -> None:
+        queue = DispatchQueue()
+        threading.Timer(0.05, queue.put_many, args=([("T1", None)],)).start()
+        start = time.monotonic()
+        assert queue.get(worker_id=0, timeout=5) == "T1"
+        assert time.monotonic() - start < 1.0
+
+    def test_close_releases_waiters(self) -> None:
+        queue = DispatchQueue()
+        threading.Timer(0.05, queue.close).start()
+        assert queue.get(worker_id=0, timeout=5) is None
+
+    def test_reconcile_drops_tasks_no_longer_pending(self, tmp_path: Path) -> None:
+        srv = DispatchServer("feat", state_dir=tmp_path)
+        srv.publish([("T1", None), ("T2", None)])
+        assert srv.reconcile([("T2", None), ("T3", None)]) == 1
+        assert "T1" not in srv.queue
+        assert len(srv.queue) == 2
+
+
+class TestSocketRoundTrip:
+    """Tests for serving the queue over a Unix domain socket."""
+
+    def test_socket_path_lives_in_state_dir(self, tmp_path: Path) -> None:
+        assert dispatch_socket_path("feat", tmp_path) == tmp_path / "feat.dispatch.sock"
+
+    def test_client_receives_published_task(self, server: DispatchServer) -> None:
+        server.publish([("T1", 3)])
+        client = DispatchClient(server.socket_path, worker_id=3)
+        assert asyncio.run(client.next_task(timeout=2)) == "T1"
+
+    def test_client_wakes_within_milliseconds(self, server: DispatchServer) -> None:
+        client = DispatchClient(server.socket_path, worker_id=0)
+        threading.Timer(0.1, server.publish, args=([("T1", None)],)).start()
+        start = time.monotonic()
+        assert asyncio.run(client.next_task(timeout=5)) == "T1"
+        assert time.monotonic() - start < 1.0
+
+    def test_client_times_out_with_none(self, server: DispatchServer) -> None:
+        client = DispatchClient(server.socket_path, worker_id=0)
+        assert asyncio.run(client.next_task(timeout=0.1)) is None
+
+    def test_missing_socket_raises_oserror(self, tmp_path: Path) -> None:
+        client = DispatchClient(tmp_path / "absent.sock", worker_id=0)
+        with pytest.raises(OSError):
+            asyncio.run(client.next_task(timeout=0.1))
+
+    def test_stop_removes_socket(self, tmp_path: Path) -> None:
+        srv = DispatchServer("feat", state_dir=tmp_path)
+        srv.start()
+        srv.stop()
+        assert not srv.socket_path.exists()
+        assert srv.running is False
+
+
+class TestWorkerClaim:
+    """Tests for WorkerProtocol.claim_next_task_async with dispatch."""
+
+    def test_claims_dispatched_task_without_rescanning(self, server: DispatchServer) -> None:
+        state = MagicMock()
+        state.get_tasks_by_status.return_value = []
+        state.claim_task.return_value = True
+        protocol = _protocol(state, DispatchClient(server.socket_path, worker_id=1))
+        threading.Timer(0.05, server.publish, args=([("T1", 1)],)).start()
+
+        task = asyncio.run(protocol.claim_next_task_async(max_wait=5))
+
+        assert task is not None
+        assert task["id"] == "T1"
+        assert state.get_tasks_by_status.call_count == 1  # Only the initial scan
+        assert state.claim_task.call_args.args[:2] == ("T1", 1)
+
+    def test_hint_after_level_advance_is_claimed(self, server: DispatchServer, tmp_path: Path) -> None:
+        tasks = {"T1": {"status": "pending", "level": 1}, "T2": {"status": "pending", "level": 2}}
+        (tmp_path / "feat.json").write_text(json.dumps({"feature": "feat", "current_level": 1, "tasks": tasks}))
+        orchestrator_state = StateManager("feat", state_dir=tmp_path)
+        orchestrator_state.load()
+        worker_state = StateManager("feat", state_dir=tmp_path)
+        protocol = _protocol(worker_state, DispatchClient(server.socket_path, worker_id=1))
+        scans = MagicMock(wraps=worker_state.get_tasks_by_status)
+        worker_state.get_tasks_by_status = scans  # type: ignore[method-assign]
+
+        threading.Timer(0.05, server.publish, args=([("T1", 1)],)).start()
+        assert asyncio.run(protocol.claim_next_task_async(max_wait=5))["id"] == "T1"
+
+        def advance() -> None:
+            orchestrator_state.set_task_status("T1", TaskStatus.COMPLETE)
+            orchestrator_state.set_current_level(2)
+            server.publish([("T2", 1)])
+
+        threading.Timer(0.05, advance).start()
+        assert asyncio.run(protocol.claim_next_task_async(max_wait=5))["id"] == "T2"
+        assert scans.call_count == 2  # One initial scan per claim; both hints claimed directly
+
+    def test_falls_back_to_polling_without_socket(self, tmp_path: Path) -> None:
+        state = MagicMock()
+        state.get_tasks_by_status.side_effect = [[], ["T1"]]
+        state.claim_task.return_value = True
+        protocol = _protocol(state, DispatchClient(tmp_path / "absent.sock", worker_id=1))
+
+        task = asyncio.run(protocol.claim_next_task_async(max_wait=5, poll_interval=0.01))
+
+        assert task is not None
+        assert task["id"] == "T1"
+        assert state.get_tasks_by_status.call_args.args == (TaskStatus.PENDING,)
+
+
+class TestOrchestratorPublish:
+    """Tests for the orchestrator feeding the dispatch queue."""
+
+    def test_publish_ready_tasks_queues_pending(self, tmp_path: Path) -> None:
+        from mahabharatha.orchestrator import Orchestrator
+
+        orch = Orchestrator.__new__(Orchestrator)
+        orch.state = MagicMock()
+        orch.state._state = {
+            "tasks": {
+                "T1": {"status": "pending", "worker_id": 0},
+                "T2": {"status": "complete", "worker_id": 1},
+            }
+        }
+        orch._dispatch = DispatchServer("feat", state_dir=tmp_path)
+        orch._dispatch.start()
+        try:
+            orch._publish_ready_tasks()
+            assert orch._dispatch.queue.get(worker_id=0, timeout=0) == "T1"
+            assert len(orch._dispatch.queue) == 0
+        finally:
+            orch._dispatch.stop()
+
+    def test_config_enables_dispatch_by_default(self) -> None:
+        assert MahabharathaConfig().workers.task_dispatch is True
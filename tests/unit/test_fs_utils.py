@@ -0,0 +1,111 @@
+"""Tests for the pruning directory walker in fs_utils."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from mahabharatha import fs_utils
+from mahabharatha.fs_utils import collect_files
+
+
+def _names(grouped: dict[str, list[Path]], root: Path) -> list[str]:
+    return sorted(p.relative_to(root).as_posix() for paths in grouped.values() for p in paths)
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path*'s mtime past the listing cache's racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in ["a.py", "b.log", "src/c.py", "src/gen/d.py", "src/keep.log", "out/e.py", ".hidden/f.py", ".env.py"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    return tmp_path
+
+
+class TestCollectFiles:
+    def test_groups_by_suffix_and_sorts(self, tree: Path) -> None:
+        grouped = collect_files(tree)
+        assert sorted(grouped) == [".log", ".py"]
+        assert grouped[".py"] == sorted(grouped[".py"])
+        # Hidden directories are pruned; hidden files are kept
+        assert ".hidden/f.py" not in _names(grouped, tree)
+        assert ".env.py" in _names(grouped, tree)
+
+    def test_by_name_bucket_includes_suffixless_files(self, tmp_path: Path) -> None:
+        (tmp_path / "Dockerfile").write_text("FROM x")
+        (tmp_path / "Dockerfile.dev").write_text("FROM x")
+        grouped = collect_files(tmp_path, names={"Dockerfile"})
+        assert [p.name for p in grouped["_by_name"]] == ["Dockerfile", "Dockerfile.dev"]
+        assert list(grouped) == ["_by_name", ".dev"]
+
+    def test_missing_root_returns_empty(self, tmp_path: Path) -> None:
+        assert collect_files(tmp_path / "missing") == {}
+
+    def test_symlinked_directories_not_followed(self, tree: Path) -> None:
+        try:
+            (tree / "loop").symlink_to(tree, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlinks not supported on this platform")
+        assert "loop/a.py" not in _names(collect_files(tree), tree)
+
+
+class TestGitignore:
+    def test_patterns_negation_and_directory_rules(self, tree: Path) -> None:
+        (tree / ".gitignore").write_text("# comment\n*.log\n!keep.log\nout/\n/src/gen\n")
+        assert _names(collect_files(tree), tree) == [".env.py", "a.py", "src/c.py", "src/keep.log"]
+
+    def test_nested_gitignore_applies_below_its_directory(self, tree: Path) -> None:
+        (tree / "src" / ".gitignore").write_text("*.py\n")
+        names = _names(collect_files(tree, extensions={".py"}), tree)
+        assert names == [".env.py", "a.py", "out/e.py"]
+
+    def test_double_star_patterns(self, tree: Path) -> None:
+        (tree / ".gitignore").write_text("**/gen/**\nsrc/**/*.log\n")
+        names = _names(collect_files(tree), tree)
+        assert "src/gen/d.py" not in names
+        assert "src/keep.log" not in names
+        assert "b.log" in names
+
+    def test_ignored_directory_is_not_listed(self, tree: Path) -> None:
+        (tree / ".gitignore").write_text("out/\n")
+        with mock.patch.object(fs_utils, "_list_dir", wraps=fs_utils._list_dir) as list_dir:
+            collect_files(tree)
+        assert str(tree / "out") not in [c.args[0] for c in list_dir.call_args_list]
+
+    def test_rules_above_root_apply_inside_repository(self, tree: Path) -> None:
+        (tree / ".git" / "info").mkdir(parents=True)
+        (tree / ".git" / "info" / "exclude").write_text("gen/\n")
+        (tree / ".gitignore").write_text("src/c.py\n")
+        assert _names(collect_files(tree / "src"), tree / "src") == ["keep.log"]
+
+    def test_can_be_disabled(self, tree: Path) -> None:
+        (tree / ".gitignore").write_text("*\n")
+        assert collect_files(tree) == {}
+        assert "src/gen/d.py" in _names(collect_files(tree, respect_gitignore=False), tree)
+
+
+class TestListingCache:
+    def test_unchanged_directory_served_from_cache(self, tree: Path) -> None:
+        for d in (tree, tree / "src", tree / "src" / "gen", tree / "out"):
+            _age(d)
+        first = collect_files(tree, cache_listings=True)
+
+        with mock.patch.object(os, "scandir", side_effect=AssertionError("listed again")):
+            assert collect_files(tree, cache_listings=True) == first
+
+    def test_added_file_invalidates_directory(self, tree: Path) -> None:
+        _age(tree / "src")
+        collect_files(tree, cache_listings=True)
+        (tree / "src" / "new.py").write_text("x")
+        assert "src/new.py" in _names(collect_files(tree, cache_listings=True), tree)
+
+    def test_recently_modified_directories_not_cached(self, tree: Path) -> None:
+        collect_files(tree, cache_listings=True)
+        assert str(tree) not in fs_utils._listing_cache
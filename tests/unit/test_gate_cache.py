@@ -0,0 +1,170 @@
+"""Tests for the content-addressed gate result cache.
+
+Tests cover:
+1. Tree SHA detection for clean and dirty working trees
+2. Key derivation from tree, command and gate config
+3. Hit/miss, pass-only storage and LRU eviction
+4. GatePipeline reusing results across levels
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from mahabharatha.config import MahabharathaConfig, QualityGate
+from mahabharatha.constants import GateResult
+from mahabharatha.gate_cache import GATE_CACHE_DIRNAME, GateResultCache, clean_tree_sha
+from mahabharatha.gates import GateRunner
+from mahabharatha.level_coordinator import GatePipeline
+from mahabharatha.types import GateRunResult
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    path = tmp_path / "repo"
+    path.mkdir()
+    for args in (
+        ["init", "-q"],
+        ["config", "user.email", "t@example.com"],
+        ["config", "user.name", "t"],
+    ):
+        subprocess.run(["git", *args], cwd=path, check=True)
+    (path / "a.py").write_text("x = 1\n")
+    subprocess.run(["git", "add", "."], cwd=path, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=path, check=True)
+    return path
+
+
+def _gate(**overrides: object) -> QualityGate:
+    fields: dict[str, object] = {"name": "lint", "command": "ruff check ."}
+    fields.update(overrides)
+    return QualityGate(**fields)  # type: ignore[arg-type]
+
+
+def _result(result: GateResult = GateResult.PASS) -> GateRunResult:
+    return GateRunResult(gate_name="lint", result=result, command="ruff check .", exit_code=0, stdout="ok")
+
+
+class TestCleanTreeSha:
+    """Tests for clean_tree_sha."""
+
+    def test_clean_tree_returns_sha(self, repo: Path) -> None:
+        sha = clean_tree_sha(repo)
+        assert sha is not None
+        assert len(sha) == 40
+
+    def test_dirty_tree_returns_none(self, repo: Path) -> None:
+        (repo / "a.py").write_text("x = 2\n")
+        assert clean_tree_sha(repo) is None
+
+    def test_mahabharatha_dir_is_ignored(self, repo: Path) -> None:
+        (repo / ".mahabharatha").mkdir()
+        (repo / ".mahabharatha" / "state.json").write_text("{}")
+        assert clean_tree_sha(repo) is not None
+
+    def test_not_a_repository(self, tmp_path: Path) -> None:
+        assert clean_tree_sha(tmp_path) is None
+
+
+class TestGateResultCache:
+    """Tests for GateResultCache storage."""
+
+    def test_key_depends_on_tree_command_and_config(self) -> None:
+        base = GateResultCache.key("t1", _gate())
+        assert base == GateResultCache.key("t1", _gate())
+        assert base != GateResultCache.key("t2", _gate())
+        assert base != GateResultCache.key("t1", _gate(command="ruff check src"))
+        assert base != GateResultCache.key("t1", _gate(timeout=10))
+
+    def test_hit_after_put(self, tmp_path: Path) -> None:
+        cache = GateResultCache(tmp_path)
+        assert cache.get("t1", _gate()) is None
+        cache.put("t1", _gate(), _result())
+
+        hit = cache.get("t1", _gate())
+        assert hit is not None
+        assert hit.result == GateResult.PASS
+        assert hit.stdout == "ok"
+
+    def test_failures_are_not_cached(self, tmp_path: Path) -> None:
+        cache = GateResultCache(tmp_path)
+        cache.put("t1", _gate(), _result(GateResult.FAIL))
+        assert cache.get("t1", _gate()) is None
+
+    def test_corrupt_entry_is_discarded(self, tmp_path: Path) -> None:
+        cache = GateResultCache(tmp_path)
+        cache.put("t1", _gate(), _result())
+        path = tmp_path / f"{GateResultCache.key('t1', _gate())}.json"
+        path.write_text("{not json")
+
+        assert cache.get("t1", _gate()) is None
+        assert not path.exists()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache = GateResultCache(tmp_path, max_entries=2)
+        cache.put("t1", _gate(), _result())
+        cache.put("t2", _gate(), _result())
+        # Age both entries, then touch t1 so t2 becomes least recently used
+        for path in tmp_path.glob("*.json"):
+            os.utime(path, (1, 1))
+        assert cache.get("t1", _gate()) is not None
+
+        cache.put("t3", _gate(), _result())
+
+        assert len(list(tmp_path.glob("*.json"))) == 2
+        assert cache.get("t2", _gate()) is None
+        assert cache.get("t1", _gate()) is not None
+
+    def test_from_config(self, tmp_path: Path) -> None:
+        config = MahabharathaConfig()
+        config.verification.artifact_dir = str(tmp_path)
+        cache = GateResultCache.from_config(config)
+        assert cache is not None
+        assert cache.cache_dir == tmp_path / GATE_CACHE_DIRNAME
+
+        config.verification.gate_cache_enabled = False
+        assert GateResultCache.from_config(config) is None
+
+
+def _runner() -> GateRunner:
+    runner = GateRunner(MahabharathaConfig())
+    runner.run_gate = MagicMock(return_value=_result())  # type: ignore[method-assign]
+    return runner
+
+
+class TestGatePipelineReuse:
+    """Tests for GatePipeline consulting the result cache."""
+
+    def test_result_reused_across_levels(self, repo: Path, tmp_path: Path) -> None:
+        runner = _runner()
+        pipeline = GatePipeline(
+            runner,
+            artifacts_dir=tmp_path / "artifacts",
+            staleness_threshold_seconds=0,
+            result_cache=GateResultCache(tmp_path / "cache"),
+        )
+
+        pipeline.run_gates_for_level(1, [_gate()], cwd=repo)
+        results = pipeline.run_gates_for_level(2, [_gate()], cwd=repo)
+
+        assert runner.run_gate.call_count == 1
+        assert results[0].result == GateResult.PASS
+
+    def test_dirty_tree_bypasses_cache(self, repo: Path, tmp_path: Path) -> None:
+        runner = _runner()
+        pipeline = GatePipeline(
+            runner,
+            artifacts_dir=tmp_path / "artifacts",
+            staleness_threshold_seconds=0,
+            result_cache=GateResultCache(tmp_path / "cache"),
+        )
+        (repo / "a.py").write_text("x = 2\n")
+
+        pipeline.run_gates_for_level(1, [_gate()], cwd=repo)
+        pipeline.run_gates_for_level(2, [_gate()], cwd=repo)
+
+        assert runner.run_gate.call_count == 2
+        assert not (tmp_path / "cache").exists()
@@ -0,0 +1,135 @@
+"""Tests for parallel quality-gate execution in mahabharatha.gates.
+
+Tests cover:
+1. Dependency ordering and cycle detection
+2. Concurrent execution of independent gates
+3. Dependencies, resource groups and blocked dependents (in both modes)
+4. Cancelling running gates when a required gate fails
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from mahabharatha.config import MahabharathaConfig, QualityGate
+from mahabharatha.constants import GateResult
+from mahabharatha.gates import GateRunner, order_gates
+from mahabharatha.types import GateRunResult
+
+
+def _runner(max_parallel: int = 4) -> GateRunner:
+    config = MahabharathaConfig()
+    config.verification.max_parallel_gates = max_parallel
+    return GateRunner(config)
+
+
+def _sleep(seconds: int) -> str:
+    return f'python -c "import time; time.sleep({seconds})"'
+
+
+class TestOrderGates:
+    """Tests for dependency ordering."""
+
+    def test_dependencies_come_first(self) -> None:
+        gates = [
+            QualityGate(name="test", command="echo test", depends_on=["build"]),
+            QualityGate(name="build", command="echo build"),
+            QualityGate(name="lint", command="echo lint"),
+        ]
+        assert [g.name for g in order_gates(gates)] == ["build", "lint", "test"]
+
+    def test_unknown_dependency_is_ignored(self) -> None:
+        gates = [QualityGate(name="test", command="echo test", depends_on=["filtered-out"])]
+        assert [g.name for g in order_gates(gates)] == ["test"]
+
+    def test_cycle_raises(self) -> None:
+        gates = [
+            QualityGate(name="a", command="echo a", depends_on=["b"]),
+            QualityGate(name="b", command="echo b", depends_on=["a"]),
+        ]
+        with pytest.raises(ValueError, match="cycle"):
+            order_gates(gates)
+
+
+class TestParallelGates:
+    """Tests for GateRunner.run_all_gates with max_parallel_gates > 1."""
+
+    def test_independent_gates_overlap(self, tmp_path: Path) -> None:
+        runner = _runner()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_run_gate(gate: QualityGate, **_kwargs: object) -> GateRunResult:
+            barrier.wait()  # Only returns once all three gates are running at once
+            return GateRunResult(gate_name=gate.name, result=GateResult.PASS, command=gate.command, exit_code=0)
+
+        runner.run_gate = fake_run_gate  # type: ignore[method-assign]
+        gates = [QualityGate(name=f"g{i}", command="echo g", required=True) for i in range(3)]
+
+        all_passed, results = runner.run_all_gates(gates=gates, cwd=tmp_path)
+
+        assert all_passed is True
+        assert [r.gate_name for r in results] == ["g0", "g1", "g2"]
+
+    def test_sequential_by_default(self) -> None:
+        assert MahabharathaConfig().verification.max_parallel_gates == 1
+
+    @pytest.mark.parametrize("max_parallel", [1, 4])
+    def test_dependent_waits_and_is_blocked_by_failure(self, tmp_path: Path, max_parallel: int) -> None:
+        gates = [
+            QualityGate(name="build", command="false", required=False),
+            QualityGate(name="test", command="echo test", required=True, depends_on=["build"]),
+            QualityGate(name="lint", command="echo lint", required=True),
+        ]
+
+        all_passed, results = _runner(max_parallel).run_all_gates(gates=gates, cwd=tmp_path, stop_on_failure=False)
+
+        by_name = {r.gate_name: r for r in results}
+        assert by_name["build"].result == GateResult.FAIL
+        assert by_name["test"].result == GateResult.ERROR
+        assert "dependency build" in by_name["test"].stderr
+        assert by_name["lint"].result == GateResult.PASS
+        assert all_passed is False
+
+    def test_resource_group_serializes(self, tmp_path: Path) -> None:
+        runner = _runner()
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_run_gate(gate: QualityGate, **_kwargs: object) -> GateRunResult:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return GateRunResult(gate_name=gate.name, result=GateResult.PASS, command=gate.command, exit_code=0)
+
+        runner.run_gate = fake_run_gate  # type: ignore[method-assign]
+        gates = [QualityGate(name=f"db{i}", command="echo db", resource_group="database") for i in range(3)]
+
+        all_passed, results = runner.run_all_gates(gates=gates, cwd=tmp_path)
+
+        assert all_passed is True
+        assert len(results) == 3
+        assert peak == 1
+
+    def test_required_failure_cancels_running_gates(self, tmp_path: Path) -> None:
+        gates = [
+            QualityGate(name="slow", command=_sleep(30), required=True),
+            QualityGate(name="lint", command="false", required=True),
+            QualityGate(name="after", command="echo after", required=True, depends_on=["slow"]),
+        ]
+
+        start = time.monotonic()
+        all_passed, results = _runner().run_all_gates(gates=gates, cwd=tmp_path)
+
+        assert time.monotonic() - start < 10
+        assert all_passed is False
+        by_name = {r.gate_name: r for r in results}
+        assert by_name["lint"].result == GateResult.FAIL
+        assert by_name["slow"].result == GateResult.SKIP
+        assert "after" not in by_name  # Never started
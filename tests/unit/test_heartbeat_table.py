@@ -0,0 +1,214 @@
+"""Tests for the memory-mapped heartbeat and progress table.
+
+Tests cover:
+1. Round-tripping heartbeats and progress through table slots
+2. Writers and readers switching to the table via MAHABHARATHA_HEARTBEAT_TABLE
+3. Merging table slots with files, newest record per worker
+4. Slot reset at spawn and rejection of invalid table files
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mahabharatha.heartbeat import Heartbeat, HeartbeatMonitor, HeartbeatWriter
+from mahabharatha.heartbeat_table import (
+    HEARTBEAT_TABLE_ENV,
+    HeartbeatTable,
+    heartbeat_table_path,
+    reset_worker_slot,
+)
+from mahabharatha.progress_reporter import ProgressReporter, TierProgress, WorkerProgress
+
+
+@pytest.fixture
+def table(tmp_path: Path):  # type: ignore[no-untyped-def]
+    t = HeartbeatTable(heartbeat_table_path(tmp_path), create=True, slots=4)
+    yield t
+    t.close()
+
+
+class TestHeartbeatTable:
+    """Tests for HeartbeatTable slots."""
+
+    def test_heartbeat_round_trip(self, table: HeartbeatTable) -> None:
+        hb = Heartbeat(
+            worker_id=2,
+            timestamp="2026-02-02T10:00:00.123456+00:00",
+            task_id="TASK-007",
+            step="verifying_tier1",
+            progress_pct=40,
+            activity_narrative="Running unit tests",
+            persona_name="Arjuna",
+            current_step=2,
+            total_steps=3,
+            step_states=["completed", "in_progress", "pending"],
+        )
+        table.write_heartbeat(hb)
+        assert table.read_heartbeat(2) == hb
+        assert table.read_heartbeat(1) is None
+
+    def test_optional_fields_stay_none(self, table: HeartbeatTable) -> None:
+        hb = Heartbeat(worker_id=0, timestamp="2026-02-02T10:00:00+00:00", task_id=None, step="idle", progress_pct=0)
+        table.write_heartbeat(hb)
+        assert table.read_heartbeat(0) == hb
+
+    def test_long_strings_truncated_on_character_boundary(self, table: HeartbeatTable) -> None:
+        hb = Heartbeat(
+            worker_id=0,
+            timestamp="2026-02-02T10:00:00+00:00",
+            task_id="T",
+            step="idle",
+            progress_pct=0,
+            activity_narrative="é" * 300,
+        )
+        with (
+            patch("mahabharatha.heartbeat_table._truncated_fields", set()),
+            patch("mahabharatha.heartbeat_table.logger") as logger,
+        ):
+            table.write_heartbeat(hb)
+            table.write_heartbeat(hb)
+        narrative = table.read_heartbeat(0).activity_narrative  # type: ignore[union-attr]
+        assert narrative == "é" * 128
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args[1:3] == ("activity_narrative", 256)
+
+    def test_progress_round_trip(self, table: HeartbeatTable) -> None:
+        wp = WorkerProgress(
+            worker_id=3,
+            tasks_completed=2,
+            tasks_total=5,
+            current_task="TASK-002",
+            current_step="verifying",
+            tier_results=[TierProgress(tier=1, name="syntax", success=True), TierProgress(2, "tests", False, 1)],
+        )
+        table.write_progress(wp)
+        assert table.read_progress(3) == wp
+
+    def test_sections_are_independent(self, table: HeartbeatTable) -> None:
+        table.write_progress(WorkerProgress(worker_id=1, tasks_total=3))
+        assert table.read_heartbeat(1) is None
+        table.write_heartbeat(Heartbeat(1, "2026-02-02T10:00:00+00:00", None, "idle", 0))
+        table.clear_progress(1)
+        assert table.read_progress(1) is None
+        assert table.read_heartbeat(1) is not None
+
+    def test_read_all(self, table: HeartbeatTable) -> None:
+        for wid in (0, 3):
+            table.write_heartbeat(Heartbeat(wid, "2026-02-02T10:00:00+00:00", None, "idle", 0))
+        assert sorted(table.read_all_heartbeats()) == [0, 3]
+
+    def test_writes_visible_to_other_mapping(self, tmp_path: Path, table: HeartbeatTable) -> None:
+        reader = HeartbeatTable(heartbeat_table_path(tmp_path))
+        try:
+            table.write_progress(WorkerProgress(worker_id=0, tasks_completed=1))
+            assert reader.read_progress(0).tasks_completed == 1  # type: ignore[union-attr]
+            assert reader.slots == 4
+        finally:
+            reader.close()
+
+    def test_rejects_foreign_file(self, tmp_path: Path) -> None:
+        path = heartbeat_table_path(tmp_path)
+        path.write_bytes(b"not a table" * 100)
+        with pytest.raises(OSError):
+            HeartbeatTable(path)
+        assert HeartbeatTable.open_existing(tmp_path) is None
+
+    def test_reset_worker_slot(self, tmp_path: Path, table: HeartbeatTable) -> None:
+        table.write_heartbeat(Heartbeat(1, "2026-02-02T10:00:00+00:00", None, "idle", 0))
+        table.write_progress(WorkerProgress(worker_id=1))
+        reset_worker_slot(1, tmp_path)
+        assert table.read_heartbeat(1) is None
+        assert table.read_progress(1) is None
+        reset_worker_slot(1, tmp_path / "missing")  # No table: no-op
+
+
+class TestTableIntegration:
+    """Tests for HeartbeatWriter/Monitor and ProgressReporter over the table."""
+
+    def test_writer_uses_table_from_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(HEARTBEAT_TABLE_ENV, str(heartbeat_table_path(tmp_path)))
+        writer = HeartbeatWriter(worker_id=1, state_dir=tmp_path)
+        writer.write(task_id="TASK-001", step="implementing", progress_pct=30)
+
+        assert not writer.heartbeat_path.exists()
+        monitor = HeartbeatMonitor(state_dir=tmp_path)
+        assert monitor.read(1).task_id == "TASK-001"  # type: ignore[union-attr]
+        assert list(monitor.read_all()) == [1]
+
+        writer.cleanup()
+        assert monitor.read(1) is None
+
+    def test_monitor_falls_back_to_files(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(HEARTBEAT_TABLE_ENV, str(heartbeat_table_path(tmp_path)))
+        HeartbeatWriter(worker_id=0, state_dir=tmp_path).write(step="idle")
+        monkeypatch.delenv(HEARTBEAT_TABLE_ENV)
+        HeartbeatWriter(worker_id=5, state_dir=tmp_path).write(step="container")
+
+        monitor = HeartbeatMonitor(state_dir=tmp_path)
+        assert monitor.read(5).step == "container"  # type: ignore[union-attr]
+        assert sorted(monitor.read_all()) == [0, 5]
+
+    def test_newer_file_beats_stale_slot(self, tmp_path: Path) -> None:
+        stale = Heartbeat(worker_id=0, timestamp="2020-01-01T00:00:00+00:00", task_id=None, step="old", progress_pct=0)
+        t = HeartbeatTable(heartbeat_table_path(tmp_path), create=True, slots=4)
+        t.write_heartbeat(stale)  # Left by an earlier subprocess run
+        t.close()
+        HeartbeatWriter(worker_id=0, state_dir=tmp_path).write(step="container")  # Container worker 0
+        HeartbeatWriter(worker_id=64, state_dir=tmp_path).write(step="beyond")  # No slot for this ID
+
+        monitor = HeartbeatMonitor(state_dir=tmp_path)
+        assert monitor.read(0).step == "container"  # type: ignore[union-attr]
+        heartbeats = monitor.read_all()
+        assert {wid: hb.step for wid, hb in heartbeats.items()} == {0: "container", 64: "beyond"}
+
+    def test_newer_slot_beats_old_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        old = Heartbeat(worker_id=1, timestamp="2020-01-01T00:00:00", task_id=None, step="old", progress_pct=0)
+        (tmp_path / "heartbeat-1.json").write_text(json.dumps(old.to_dict()))
+        monkeypatch.setenv(HEARTBEAT_TABLE_ENV, str(heartbeat_table_path(tmp_path)))
+        HeartbeatWriter(worker_id=1, state_dir=tmp_path).write(step="fresh")
+
+        monitor = HeartbeatMonitor(state_dir=tmp_path)
+        assert monitor.read(1).step == "fresh"  # type: ignore[union-attr]
+        assert monitor.read_all()[1].step == "fresh"
+
+    def test_worker_without_slot_writes_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(HEARTBEAT_TABLE_ENV, str(heartbeat_table_path(tmp_path)))
+        writer = HeartbeatWriter(worker_id=1000, state_dir=tmp_path)
+        writer.write(step="idle")
+        assert writer.heartbeat_path.exists()
+
+    def test_progress_reporter_uses_table(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(HEARTBEAT_TABLE_ENV, str(heartbeat_table_path(tmp_path)))
+        reporter = ProgressReporter(worker_id=2, state_dir=tmp_path)
+        reporter.update(current_task="TASK-003", tasks_total=4)
+        reporter.add_tier_result(1, "lint", True)
+
+        assert not reporter.progress_path.exists()
+        wp = ProgressReporter.read(2, state_dir=tmp_path)
+        assert wp is not None
+        assert wp.current_task == "TASK-003"
+        assert wp.tier_results[0].name == "lint"
+        assert list(ProgressReporter.read_all(state_dir=tmp_path)) == [2]
+
+        reporter.cleanup()
+        assert ProgressReporter.read(2, state_dir=tmp_path) is None
+
+    def test_progress_merges_slots_and_files(self, tmp_path: Path) -> None:
+        t = HeartbeatTable(heartbeat_table_path(tmp_path), create=True, slots=4)
+        t.write_progress(WorkerProgress(worker_id=0, current_step="old"))
+        t.write_progress(WorkerProgress(worker_id=1, current_step="slot"))
+        t.close()
+        stale = tmp_path / "progress-1.json"
+        stale.write_text(json.dumps(WorkerProgress(worker_id=1, current_step="file").to_dict()))
+        os.utime(stale, (0, 0))
+        ProgressReporter(worker_id=0, state_dir=tmp_path).update(current_step="container")
+        ProgressReporter(worker_id=64, state_dir=tmp_path).update(current_step="beyond")
+
+        assert ProgressReporter.read(0, state_dir=tmp_path).current_step == "container"  # type: ignore[union-attr]
+        assert ProgressReporter.read(1, state_dir=tmp_path).current_step == "slot"  # type: ignore[union-attr]
+        progress = ProgressReporter.read_all(state_dir=tmp_path)
+        assert {wid: wp.current_step for wid, wp in progress.items()} == {0: "container", 1: "slot", 64: "beyond"}
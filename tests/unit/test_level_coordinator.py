@@ -1,6 +1,7 @@
 """Tests for LevelCoordinator and GatePipeline components."""
 
 import json
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -554,7 +555,9 @@ class TestGatePipeline:
 
     @pytest.fixture
     def gate_runner(self):
-        return MagicMock(spec=GateRunner)
+        runner = GateRunner(MahabharathaConfig())
+        runner.run_gate = MagicMock()
+        return runner
 
     @pytest.fixture
     def pipeline(self, gate_runner, tmp_path):
@@ -645,6 +648,41 @@ class TestGatePipeline:
         pipeline.run_gates_for_level(1, [sample_gate])
         assert gate_runner.run_gate.call_count == 2
 
+    def test_misses_run_as_parallel_dag(self, tmp_path):
+        """Gates not served from artifacts run concurrently through GateRunner.run_gates."""
+        config = MahabharathaConfig()
+        config.verification.max_parallel_gates = 4
+        runner = GateRunner(config)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_run_gate(gate, **_kwargs):
+            barrier.wait()  # Only returns once both gates are running at once
+            return GateRunResult(gate_name=gate.name, result=GateResult.PASS, command=gate.command, exit_code=0)
+
+        runner.run_gate = fake_run_gate
+        pipeline = GatePipeline(gate_runner=runner, artifacts_dir=tmp_path / "artifacts")
+        gates = [QualityGate(name="lint", command="ruff check ."), QualityGate(name="types", command="mypy .")]
+
+        results = pipeline.run_gates_for_level(1, gates)
+
+        assert [r.gate_name for r in results] == ["lint", "types"]
+        assert all(r.result == GateResult.PASS for r in results)
+
+    def test_cached_failed_dependency_blocks_dependent(self, pipeline, gate_runner):
+        """A fresh failing artifact blocks its dependents just as a live failure would."""
+        build = QualityGate(name="build", command="make")
+        test = QualityGate(name="test", command="pytest", depends_on=["build"])
+        gate_runner.run_gate.return_value = GateRunResult(
+            gate_name="build", result=GateResult.FAIL, command="make", exit_code=2
+        )
+        pipeline.run_gates_for_level(1, [build])
+
+        results = pipeline.run_gates_for_level(1, [build, test])
+
+        assert [r.result for r in results] == [GateResult.FAIL, GateResult.ERROR]
+        assert "dependency build" in results[1].stderr
+        assert gate_runner.run_gate.call_count == 1
+
     def test_load_cached_result_returns_none_when_missing(self, pipeline, tmp_path):
         """_load_cached_result returns None when artifact does not exist."""
         level_dir = tmp_path / "artifacts" / "1"
@@ -0,0 +1,135 @@
+"""Tests for state-lock contention profiling.
+
+Tests cover:
+1. Wait/hold/bytes recorded per call site for every state backend
+2. Profile files merged across processes
+3. Exposure in `status --json` and the debug health report
+4. Per-run reset and removal by cleanup
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mahabharatha.commands.cleanup import create_cleanup_plan
+from mahabharatha.commands.debug import _lock_contention_lines
+from mahabharatha.config import StateConfig
+from mahabharatha.constants import STATE_DIR
+from mahabharatha.diagnostics.state_introspector import MahabharathaStateIntrospector
+from mahabharatha.rendering.status_renderer import get_lock_contention_dict
+from mahabharatha.state import StateManager
+from mahabharatha.state.lock_profile import (
+    LockProfiler,
+    SiteStats,
+    load_lock_profile,
+    lock_profile_dir,
+    lock_profile_files,
+    reset_lock_profile,
+    shared_profiler,
+    summarize_lock_profile,
+)
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def test_records_call_sites(tmp_path: Path, backend: str) -> None:
+    manager = StateManager("feat", state_dir=tmp_path, config=StateConfig(backend=backend))
+    manager.append_event("started", {"n": 1})
+    manager.append_event("again", {"n": 2})
+    manager.set_current_level(1)
+
+    profiler = shared_profiler(tmp_path, "feat")
+    assert profiler.sites["append_event"].count == 2
+    assert profiler.sites["set_current_level"].count == 1
+    assert profiler.sites["append_event"].bytes_written.sum > 0
+    assert profiler.sites["append_event"].hold_ms.sum > 0
+
+    profiler.flush()
+    summary = summarize_lock_profile(tmp_path, "feat")
+    assert summary["append_event"]["count"] == 2
+    assert set(summary["append_event"]) == {"count", "wait_ms", "hold_ms", "bytes_written"}
+
+
+def test_profiles_merge_across_processes(tmp_path: Path) -> None:
+    for pid, waits in ((100, [1.0, 2.0]), (200, [30.0])):
+        stats = SiteStats()
+        for w in waits:
+            stats.wait_ms.add(w)
+            stats.hold_ms.add(1.0)
+            stats.bytes_written.add(512)
+        directory = lock_profile_dir(tmp_path)
+        directory.mkdir(exist_ok=True)
+        payload = {"feature": "feat", "pid": pid, "sites": {"claim_task": stats.to_dict()}}
+        (directory / f"feat-{pid}.json").write_text(json.dumps(payload))
+    # Same prefix, different feature
+    (lock_profile_dir(tmp_path) / "feat-x-1.json").write_text(json.dumps({"feature": "feat-x", "sites": {}}))
+
+    merged = load_lock_profile(tmp_path, "feat")
+    assert merged["claim_task"].count == 3
+    assert merged["claim_task"].wait_ms.quantile(1.0) == pytest.approx(30.0, rel=0.01)
+    assert summarize_lock_profile(tmp_path / "missing", "feat") == {}
+
+
+def test_flush_is_periodic(tmp_path: Path) -> None:
+    profiler = LockProfiler(tmp_path, "feat")
+    profiler.record("claim_task", 0.001, 0.002, 10)
+    assert not profiler.path.exists()  # Within the flush interval
+    profiler.flush()
+    data = json.loads(profiler.path.read_text())
+    assert list(data["sites"]) == ["claim_task"]
+
+
+def test_flush_after_chdir_stays_in_state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    profiler = LockProfiler(".mahabharatha/state", "feat")
+    profiler.record("claim_task", 0.001, 0.002, 10)
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path / "elsewhere")  # e.g. a test or command moving on before atexit
+    profiler.flush()
+
+    assert (lock_profile_dir(tmp_path / ".mahabharatha" / "state") / f"feat-{os.getpid()}.json").exists()
+    assert not (tmp_path / "elsewhere" / ".mahabharatha").exists()
+
+
+def test_reset_removes_only_the_features_profiles(tmp_path: Path) -> None:
+    directory = lock_profile_dir(tmp_path)
+    directory.mkdir()
+    for name in ("feat-100.json", "feat-200.json", "feat-x-1.json", "other-1.json"):
+        (directory / name).write_text("{}")
+
+    assert [p.name for p in lock_profile_files(tmp_path, "feat")] == ["feat-100.json", "feat-200.json"]
+    reset_lock_profile(tmp_path, "feat")
+    assert sorted(p.name for p in directory.iterdir()) == ["feat-x-1.json", "other-1.json"]
+    reset_lock_profile(tmp_path / "missing", "feat")
+
+
+def test_cleanup_removes_profiles(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    profiler = LockProfiler(STATE_DIR, "feat")
+    profiler.record("claim_task", 0.001, 0.002, 10)
+    profiler.flush()
+
+    with patch("mahabharatha.commands.cleanup.GitOps"):
+        plan = create_cleanup_plan(["feat"], keep_logs=True, keep_branches=True, config=MagicMock())
+    assert str(profiler.path.relative_to(tmp_path)) in plan["state_files"]
+
+
+def test_exposed_in_status_and_debug(tmp_path: Path) -> None:
+    manager = StateManager("feat", state_dir=tmp_path)
+    manager.append_event("started")
+    shared_profiler(tmp_path, "feat").flush()
+
+    assert "append_event" in get_lock_contention_dict(manager)
+    report = MahabharathaStateIntrospector(state_dir=tmp_path).get_health_report("feat")
+    assert report.to_dict()["lock_contention"]["append_event"]["count"] >= 1
+
+
+def test_debug_lines() -> None:
+    stats = SiteStats()
+    stats.wait_ms.add(5.0)
+    stats.hold_ms.add(2.0)
+    stats.bytes_written.add(300)
+    (line,) = _lock_contention_lines({"claim_task": stats.summary()})
+    assert line.startswith("claim_task: 1 updates, wait p50/p99 5.0/5.0ms")
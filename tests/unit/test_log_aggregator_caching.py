@@ -1,4 +1,4 @@
-"""Tests for LogAggregator per-file caching functionality."""
+"""Tests for LogAggregator per-file index caching."""
 
 import json
 import os
@@ -35,16 +35,17 @@ class TestLogAggregatorCaching:
             # Verify cache is populated
             cache_key = str(log_file)
             assert cache_key in la._file_cache
-            cached_mtime = la._file_cache[cache_key]["mtime"]
+            index = la._file_cache[cache_key]
+            indexed_bytes = index.indexed_bytes
 
-            # Second query - should use cache (mtime unchanged)
+            # Second query - should use cache (file unchanged)
             result2 = la.query()
             assert len(result2) == 1
             assert result2[0]["message"] == "test"
 
-            # Verify cache entry unchanged (same mtime means cache hit)
-            assert cache_key in la._file_cache
-            assert la._file_cache[cache_key]["mtime"] == cached_mtime
+            # Verify cache entry unchanged
+            assert la._file_cache[cache_key] is index
+            assert index.indexed_bytes == indexed_bytes == log_file.stat().st_size
 
     def test_cache_miss_on_modification(self) -> None:
         """Test that modifying a file causes cache miss on next query."""
@@ -66,7 +67,8 @@ class TestLogAggregatorCaching:
             assert result1[0]["message"] == "first"
 
             cache_key = str(log_file)
-            original_mtime = la._file_cache[cache_key]["mtime"]
+            original_size = la._file_cache[cache_key].indexed_bytes
+            original_mtime = log_file.stat().st_mtime
 
             # Modify file - add new entry and update mtime
             time.sleep(0.1)  # Ensure mtime will be different
@@ -85,8 +87,9 @@ class TestLogAggregatorCaching:
             assert "first" in messages
             assert "second" in messages
 
-            # Cache should have updated mtime
-            assert la._file_cache[cache_key]["mtime"] == new_mtime
+            # Index should have been extended past the appended entry
+            assert la._file_cache[cache_key].indexed_bytes > original_size
+            assert len(la._file_cache[cache_key]) == 2
 
     def test_lru_eviction_at_100(self) -> None:
         """Test that cache evicts oldest entry when exceeding MAX_CACHED_FILES (100)."""
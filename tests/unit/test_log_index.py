@@ -0,0 +1,184 @@
+"""Tests for the sidecar JSONL log index.
+
+Tests cover:
+1. Incremental indexing by byte offset, including partially written lines
+2. Posting-list and timestamp-range selection
+3. Sidecar persistence, torn writes and re-indexing rotated logs
+4. LogAggregator queries served from the index
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mahabharatha import log_index
+from mahabharatha.log_aggregator import LogAggregator
+from mahabharatha.log_index import INDEX_SUFFIX, LogIndex
+
+
+def _entry(i: int, **fields: object) -> dict[str, object]:
+    base: dict[str, object] = {
+        "ts": f"2026-02-05T10:00:{i:02d}",
+        "worker_id": i % 3,
+        "task_id": f"T{i % 4}",
+        "level": "info",
+        "message": f"msg {i}",
+    }
+    base.update(fields)
+    return base
+
+
+def _write(path: Path, entries: list[dict[str, object]], mode: str = "a") -> None:
+    with open(path, mode) as f:
+        for e in entries:
+            f.write(json.dumps(e) + "\n")
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    path = tmp_path / "worker-0.jsonl"
+    _write(path, [_entry(i) for i in range(12)], mode="w")
+    return path
+
+
+class TestLogIndex:
+    """Tests for LogIndex."""
+
+    def test_indexes_all_records(self, log_file: Path) -> None:
+        index = LogIndex(log_file)
+        assert index.refresh()
+        assert len(index) == 12
+        assert index.indexed_bytes == log_file.stat().st_size
+        assert [e["message"] for _, e in index.read([0, 11])] == ["msg 0", "msg 11"]
+
+    def test_extends_from_last_offset(self, log_file: Path) -> None:
+        index = LogIndex(log_file)
+        index.refresh()
+        offset = index.indexed_bytes
+        _write(log_file, [_entry(12)])
+        index.refresh()
+        assert len(index) == 13
+        assert index.offsets[12] == offset
+
+    def test_partial_line_left_for_next_refresh(self, log_file: Path) -> None:
+        index = LogIndex(log_file)
+        line = json.dumps(_entry(12))
+        with open(log_file, "a") as f:
+            f.write(line[:10])
+        index.refresh()
+        assert len(index) == 12
+        with open(log_file, "a") as f:
+            f.write(line[10:] + "\n")
+        index.refresh()
+        assert len(index) == 13
+
+    def test_blocks_smaller_than_a_line(self, log_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        expected = LogIndex(log_file, persist=False)
+        expected.refresh()
+        with open(log_file, "a") as f:
+            f.write(json.dumps(_entry(12))[:10])  # Partial last line
+        monkeypatch.setattr(log_index, "_READ_BLOCK", 37)
+
+        index = LogIndex(log_file)
+        index.refresh()
+
+        assert list(index.offsets) == list(expected.offsets)
+        assert list(index.lengths) == list(expected.lengths)
+        assert index.indexed_bytes == expected.indexed_bytes
+        reloaded = LogIndex(log_file)
+        reloaded.refresh()
+        assert reloaded.select({"task_id": "T2"}) == [2, 6, 10]
+
+    def test_select_intersects_fields(self, log_file: Path) -> None:
+        index = LogIndex(log_file)
+        index.refresh()
+        rows = index.select({"worker_id": 1, "task_id": "T1"})
+        assert rows == [1]
+        assert index.select({"worker_id": 1, "task_id": "missing"}) == []
+
+    def test_select_time_range(self, log_file: Path) -> None:
+        index = LogIndex(log_file)
+        index.refresh()
+        assert index.select({}, since="2026-02-05T10:00:03", until="2026-02-05T10:00:05") == [3, 4, 5]
+        assert index.select({"worker_id": 0}, since="2026-02-05T10:00:04") == [6, 9]
+
+    def test_select_time_range_unsorted(self, tmp_path: Path) -> None:
+        path = tmp_path / "w.jsonl"
+        _write(path, [_entry(5), _entry(1), _entry(3)], mode="w")
+        index = LogIndex(path)
+        index.refresh()
+        assert not index.ts_sorted
+        assert index.select({}, since="2026-02-05T10:00:02") == [0, 2]
+
+    def test_sidecar_reused_without_reparsing(self, log_file: Path) -> None:
+        LogIndex(log_file).refresh()
+        assert log_file.with_name(log_file.name + INDEX_SUFFIX).exists()
+
+        reloaded = LogIndex(log_file)
+        reloaded._index_tail = None  # type: ignore[assignment,method-assign]
+        reloaded.refresh()
+        assert len(reloaded) == 12
+        assert reloaded.select({"task_id": "T2"}) == [2, 6, 10]
+
+    def test_torn_sidecar_batch_ignored(self, log_file: Path) -> None:
+        LogIndex(log_file).refresh()
+        _write(log_file, [_entry(12)])
+        sidecar = log_file.with_name(log_file.name + INDEX_SUFFIX)
+        with open(sidecar, "a") as f:
+            f.write('[999, 10, "2026", 0, "T0"')  # Interrupted write
+
+        index = LogIndex(log_file)
+        index.refresh()
+        assert len(index) == 13
+        assert [e["message"] for _, e in index.read([12])] == ["msg 12"]
+
+    def test_rewritten_file_is_reindexed(self, log_file: Path) -> None:
+        index = LogIndex(log_file)
+        index.refresh()
+        _write(log_file, [_entry(i, message=f"new {i}", ts=f"2027-01-01T00:00:{i:02d}") for i in range(20)], "w")
+        index.refresh()
+        assert len(index) == 20
+        assert [e["message"] for _, e in index.read([0])] == ["new 0"]
+
+    def test_readonly_sidecar_kept_in_memory(self, log_file: Path) -> None:
+        index = LogIndex(log_file)
+        index.index_path = log_file.parent / "missing" / "x.idx"
+        index.refresh()
+        assert len(index) == 12
+        assert index.persist is False
+
+
+class TestIndexedQuery:
+    """LogAggregator.query served from the index."""
+
+    def test_filters_sort_and_limit(self, tmp_path: Path) -> None:
+        workers = tmp_path / "workers"
+        workers.mkdir()
+        _write(workers / "worker-0.jsonl", [_entry(i, worker_id=0) for i in range(0, 20, 2)], "w")
+        _write(workers / "worker-1.jsonl", [_entry(i, worker_id=1) for i in range(1, 20, 2)], "w")
+
+        la = LogAggregator(tmp_path)
+        assert [e["ts"][-2:] for e in la.query(limit=4)] == ["00", "01", "02", "03"]
+        assert [e["message"] for e in la.query(worker_id=1, task_id="T3")] == [
+            "msg 3",
+            "msg 7",
+            "msg 11",
+            "msg 15",
+            "msg 19",
+        ]
+        assert [e["message"] for e in la.query(search="MSG 1", limit=2)] == ["msg 1", "msg 10"]
+
+    def test_level_filter_uses_data_level(self, tmp_path: Path) -> None:
+        (tmp_path / "workers").mkdir()
+        _write(
+            tmp_path / "workers" / "worker-0.jsonl",
+            [_entry(0, data={"level": 2}), _entry(1, data={"level": 1}), _entry(2, data="x")],
+            "w",
+        )
+        assert [e["message"] for e in LogAggregator(tmp_path).query(level_filter=2)] == ["msg 0"]
+
+    def test_list_tasks_from_index(self, log_file: Path) -> None:
+        (log_file.parent / "workers").mkdir()
+        log_file.rename(log_file.parent / "workers" / log_file.name)
+        assert LogAggregator(log_file.parent).list_tasks() == ["T0", "T1", "T2", "T3"]
@@ -0,0 +1,117 @@
+"""Tests for reverse-seek tail and log following.
+
+Tests cover:
+1. tail_lines matching readlines()[-n:] while reading only the file's end
+2. LogFollower returning appended lines, partial lines and rotations
+3. inotify wakeups and the polling fallback
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mahabharatha.log_tail import InotifyWatcher, LogFollower, PollingWatcher, create_watcher, tail_lines
+
+
+class TestTailLines:
+    """Tests for tail_lines."""
+
+    @pytest.mark.parametrize("content", ["a\nb\nc\n", "a\nb\nc", "\n\na\n", "", "single"])
+    @pytest.mark.parametrize("n", [0, 1, 2, 5])
+    def test_matches_readlines(self, tmp_path: Path, content: str, n: int) -> None:
+        path = tmp_path / "f.log"
+        path.write_text(content)
+        expected = [line.rstrip("\n") for line in path.open().readlines()[-n:]]
+        assert tail_lines(path, n, block_size=2) == expected
+
+    def test_reads_only_the_end(self, tmp_path: Path) -> None:
+        path = tmp_path / "big.log"
+        path.write_text("".join(f"line {i}\n" for i in range(100_000)))
+        reads: list[int] = []
+        real_open = open
+
+        def tracking_open(*args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+            f = real_open(*args, **kwargs)  # type: ignore[call-overload]
+            real_read = f.read
+            f.read = lambda size=-1: reads.append(size) or real_read(size)
+            return f
+
+        with patch("builtins.open", tracking_open):
+            lines = tail_lines(path, 3, block_size=64)
+
+        assert lines == ["line 99997", "line 99998", "line 99999"]
+        assert sum(reads) <= 128
+
+
+class TestLogFollower:
+    """Tests for LogFollower."""
+
+    def test_returns_only_appended_complete_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "worker-0.log"
+        path.write_text("old\n")
+        with LogFollower([path]) as follower:
+            assert follower.read_new() == {}
+            with open(path, "a") as f:
+                f.write("new 1\nnew 2\npart")
+            assert follower.read_new() == {path: ["new 1", "new 2"]}
+            with open(path, "a") as f:
+                f.write("ial\n")
+            assert follower.read_new() == {path: ["partial"]}
+
+    def test_truncated_file_read_from_start(self, tmp_path: Path) -> None:
+        path = tmp_path / "worker-0.log"
+        path.write_text("a long first line\n")
+        with LogFollower([path]) as follower:
+            path.write_text("rotated\n")
+            assert follower.read_new() == {path: ["rotated"]}
+
+    def test_file_created_later(self, tmp_path: Path) -> None:
+        path = tmp_path / "worker-1.log"
+        with LogFollower([path]) as follower:
+            path.write_text("hello\n")
+            assert follower.read_new() == {path: ["hello"]}
+
+
+def _inotify_available() -> bool:
+    watcher = create_watcher([])
+    watcher.close()
+    return isinstance(watcher, InotifyWatcher)
+
+
+@pytest.mark.skipif(not _inotify_available(), reason="inotify unavailable")
+class TestInotifyWatcher:
+    """Tests for InotifyWatcher."""
+
+    def test_wakes_on_write(self, tmp_path: Path) -> None:
+        watcher = InotifyWatcher([tmp_path], timeout=10)
+        timer = threading.Timer(0.1, (tmp_path / "w.log").write_text, args=("x\n",))
+        start = time.monotonic()
+        timer.start()
+        try:
+            watcher.wait()
+        finally:
+            watcher.close()
+            timer.join()
+        assert time.monotonic() - start < 5
+
+    def test_times_out_without_events(self, tmp_path: Path) -> None:
+        watcher = InotifyWatcher([tmp_path], timeout=0.05)
+        try:
+            watcher.wait()
+        finally:
+            watcher.close()
+
+
+class TestCreateWatcher:
+    """Tests for the polling fallback."""
+
+    def test_falls_back_to_polling(self, tmp_path: Path) -> None:
+        with patch("mahabharatha.log_tail.InotifyWatcher", side_effect=OSError("unsupported")):
+            watcher = create_watcher([tmp_path])
+        assert isinstance(watcher, PollingWatcher)
+        with patch("time.sleep") as sleep:
+            watcher.wait()
+        sleep.assert_called_once_with(watcher.poll_interval)
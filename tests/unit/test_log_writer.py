@@ -2,7 +2,9 @@
 
 import json
 import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 from mahabharatha.constants import LogEvent, LogPhase
 from mahabharatha.log_writer import StructuredLogWriter, TaskArtifactCapture
@@ -142,6 +144,125 @@ class TestStructuredLogWriter:
         assert entry["event"] == "custom_event"
 
 
+class TestBufferedStructuredLogWriter:
+    """Tests for StructuredLogWriter in buffered mode."""
+
+    def _lines(self, tmp_path: Path) -> list[str]:
+        path = tmp_path / "workers" / "worker-0.jsonl"
+        return [line for line in path.read_text().split("\n") if line]
+
+    def test_entries_held_until_interval(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", buffered=True, flush_interval_ms=10000)
+        writer.emit("info", "buffered")
+        assert self._lines(tmp_path) == []
+        writer.close()
+        assert json.loads(self._lines(tmp_path)[0])["message"] == "buffered"
+
+    def test_background_flush_after_interval(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", buffered=True, flush_interval_ms=20)
+        writer.emit("info", "later")
+        deadline = time.monotonic() + 5
+        while not self._lines(tmp_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(self._lines(tmp_path)) == 1
+        writer.close()
+
+    def test_batch_size_triggers_single_write(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(
+            tmp_path, worker_id=0, feature="test", buffered=True, flush_interval_ms=10000, flush_batch_size=50
+        )
+        with patch.object(writer, "_write", wraps=writer._write) as write:
+            for i in range(50):
+                writer.emit("debug", f"entry {i}")
+            deadline = time.monotonic() + 5
+            while not write.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            writer.close()
+        assert len(write.call_args_list[0].args[0]) == 50
+        assert len(self._lines(tmp_path)) == 50
+
+    def test_error_entries_written_immediately(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", buffered=True, flush_interval_ms=10000)
+        writer.emit("info", "context")
+        writer.emit("error", "boom")
+        assert [json.loads(line)["message"] for line in self._lines(tmp_path)] == ["context", "boom"]
+        writer.close()
+
+    def test_error_emit_during_background_flush_keeps_order(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(
+            tmp_path, worker_id=0, feature="test", buffered=True, flush_interval_ms=10000, flush_batch_size=2
+        )
+        reached, resume = threading.Event(), threading.Event()
+        file_lock = writer._lock
+
+        class PausingLock:
+            """Stalls the background flusher at the file lock until the error emit is done."""
+
+            def __enter__(self) -> None:
+                if threading.current_thread() is writer._flusher and not reached.is_set():
+                    reached.set()
+                    resume.wait(5)
+                file_lock.acquire()
+
+            def __exit__(self, *exc: object) -> None:
+                file_lock.release()
+
+        writer._lock = PausingLock()  # type: ignore[assignment]
+        writer.emit("info", "first")
+        writer.emit("info", "second")  # Batch full: wakes the background flush
+        assert reached.wait(5)
+        writer.emit("error", "boom")
+        resume.set()
+        writer.close()
+
+        assert [json.loads(line)["message"] for line in self._lines(tmp_path)] == ["first", "second", "boom"]
+
+    def test_full_buffer_flushes_inline(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(
+            tmp_path,
+            worker_id=0,
+            feature="test",
+            buffered=True,
+            flush_interval_ms=10000,
+            flush_batch_size=1000,
+            buffer_capacity=1000,
+        )
+        writer.flush_batch_size = 2000  # Keep the background thread asleep
+        for i in range(1000):
+            writer.emit("debug", f"entry {i}")
+        assert len(self._lines(tmp_path)) == 1000
+        writer.close()
+
+    def test_thread_safety(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", buffered=True, flush_batch_size=16)
+        threads = [
+            threading.Thread(target=lambda t=t: [writer.emit("info", f"t{t} {i}") for i in range(200)])
+            for t in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+        lines = self._lines(tmp_path)
+        assert len(lines) == 1000
+        assert len({json.loads(line)["message"] for line in lines}) == 1000
+
+    def test_close_is_idempotent_and_late_emit_is_dropped(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test", buffered=True)
+        writer.emit("info", "one")
+        writer.close()
+        writer.close()
+        writer.emit("info", "after close")
+        assert len(self._lines(tmp_path)) == 1
+
+    def test_non_str_keys_fall_back_to_stdlib(self, tmp_path: Path) -> None:
+        writer = StructuredLogWriter(tmp_path, worker_id=0, feature="test")
+        writer.emit("info", "keys", data={1: "one"})
+        writer.close()
+        assert json.loads(self._lines(tmp_path)[0])["data"] == {"1": "one"}
+
+
 class TestTaskArtifactCapture:
     """Tests for TaskArtifactCapture."""
 
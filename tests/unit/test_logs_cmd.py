@@ -23,6 +23,9 @@ from mahabharatha.commands.logs import (
     stream_logs,
 )
 
+# Force the stat-polling follow path so time.sleep drives the stream loop
+NO_INOTIFY = patch("mahabharatha.log_tail.InotifyWatcher", side_effect=OSError("no inotify"))
+
 
 class TestDetectFeature:
     """Tests for feature auto-detection from state files."""
@@ -215,7 +218,7 @@ class TestStreamLogs:
             if call_count > 1:
                 raise KeyboardInterrupt()
 
-        with patch("time.sleep", side_effect=mock_sleep):
+        with patch("time.sleep", side_effect=mock_sleep), NO_INOTIFY:
             with patch("mahabharatha.commands.logs.console") as mock_console:
                 with contextlib.suppress(KeyboardInterrupt):
                     stream_logs([log_file], level_priority=0, json_output=False)
@@ -241,7 +244,7 @@ class TestStreamLogs:
             elif iteration > 2:
                 raise KeyboardInterrupt()
 
-        with patch("time.sleep", side_effect=mock_sleep):
+        with patch("time.sleep", side_effect=mock_sleep), NO_INOTIFY:
             with patch("mahabharatha.commands.logs.console") as mock_console:
                 with contextlib.suppress(KeyboardInterrupt):
                     stream_logs([log_file], level_priority=0, json_output=False)
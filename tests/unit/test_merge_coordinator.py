@@ -41,6 +41,7 @@ def mock_config() -> MahabharathaConfig:
         QualityGate(name="lint", command="ruff check .", required=True),
         QualityGate(name="test", command="pytest", required=True),
     ]
+    cfg.git.merge.strategy = "sequential"
     return cfg
 
 
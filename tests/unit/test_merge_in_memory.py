@@ -0,0 +1,142 @@
+"""Tests for in-memory merging of worker branches.
+
+Tests cover:
+1. GitOps.merge_tree / commit_tree / update_branch primitives
+2. MergeCoordinator merging clean branches without per-branch checkouts
+3. Sequential fallback for conflicting branches only
+4. Fallback when merge-tree is unavailable
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mahabharatha.config import MahabharathaConfig
+from mahabharatha.constants import MergeStatus
+from mahabharatha.exceptions import MergeConflictError
+from mahabharatha.git_ops import GitOps
+from mahabharatha.merge import MergeCoordinator
+
+STAGING = "mahabharatha/feat/staging"
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _worker(repo: Path, name: str, path: str, content: str) -> str:
+    branch = f"mahabharatha/feat/{name}"
+    _git(repo, "checkout", "-q", "-b", branch, "main")
+    (repo / path).write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", f"{name} work")
+    _git(repo, "checkout", "-q", "main")
+    return branch
+
+
+def _coordinator(repo: Path, strategy: str = "in_memory") -> MergeCoordinator:
+    config = MahabharathaConfig()
+    config.git.merge.strategy = strategy
+    return MergeCoordinator("feat", config=config, repo_path=repo)
+
+
+class TestMergeTree:
+    """Tests for the GitOps in-memory merge primitives."""
+
+    def test_clean_merge_writes_tree(self, tmp_repo: Path) -> None:
+        branch = _worker(tmp_repo, "worker-0", "a.txt", "a\n")
+        merged = GitOps(tmp_repo).merge_tree("main", branch)
+        assert merged is not None
+        assert merged.clean
+        assert "a.txt" in _git(tmp_repo, "ls-tree", "--name-only", merged.tree)
+
+    def test_conflict_lists_files(self, tmp_repo: Path) -> None:
+        one = _worker(tmp_repo, "worker-0", "README.md", "one\n")
+        two = _worker(tmp_repo, "worker-1", "README.md", "two\n")
+        merged = GitOps(tmp_repo).merge_tree(one, two)
+        assert merged is not None
+        assert merged.conflicting_files == ["README.md"]
+
+    def test_commit_tree_and_update_branch(self, tmp_repo: Path) -> None:
+        ops = GitOps(tmp_repo)
+        base = ops.current_commit()
+        commit = ops.commit_tree(ops.current_tree(), [base], "empty")
+        ops.create_branch("target")
+        ops.update_branch("target", commit, expected=base)
+        assert ops.get_commit("target") == commit
+        assert _git(tmp_repo, "rev-parse", f"{commit}^") == base
+
+
+class TestInMemoryMerge:
+    """Tests for MergeCoordinator.execute_merge with the in_memory strategy."""
+
+    def test_merges_without_per_branch_checkout(self, tmp_repo: Path) -> None:
+        branches = [_worker(tmp_repo, f"worker-{i}", f"f{i}.txt", f"{i}\n") for i in range(3)]
+        coordinator = _coordinator(tmp_repo)
+        staging = coordinator.prepare_merge(level=1, target_branch="main")
+
+        with patch.object(coordinator.git, "merge", wraps=coordinator.git.merge) as merge:
+            results = coordinator.execute_merge(branches, staging)
+
+        merge.assert_not_called()
+        assert [r.status for r in results] == [MergeStatus.MERGED] * 3
+        assert coordinator.git.get_commit(staging) == results[-1].commit_sha
+        assert coordinator.git.current_branch() == staging
+        assert all((tmp_repo / f"f{i}.txt").exists() for i in range(3))
+        # One merge commit per branch, each with the worker branch as second parent
+        assert _git(tmp_repo, "rev-parse", f"{staging}^2") == coordinator.git.get_commit(branches[-1])
+
+    def test_only_conflicting_branch_falls_back(self, tmp_repo: Path) -> None:
+        first = _worker(tmp_repo, "worker-0", "README.md", "one\n")
+        second = _worker(tmp_repo, "worker-1", "README.md", "two\n")
+        third = _worker(tmp_repo, "worker-2", "c.txt", "c\n")
+        coordinator = _coordinator(tmp_repo)
+        staging = coordinator.prepare_merge(level=1, target_branch="main")
+
+        with (
+            patch.object(coordinator.git, "merge", wraps=coordinator.git.merge) as merge,
+            pytest.raises(MergeConflictError) as exc_info,
+        ):
+            coordinator.execute_merge([first, second, third], staging)
+
+        assert [c.args[0] for c in merge.call_args_list] == [second]
+        assert exc_info.value.conflicting_files == ["README.md"]
+        assert (tmp_repo / "c.txt").exists()  # Clean branches merged before the fallback
+
+    def test_staging_checked_out_uses_sequential(self, tmp_repo: Path) -> None:
+        branch = _worker(tmp_repo, "worker-0", "a.txt", "a\n")
+        coordinator = _coordinator(tmp_repo)
+        staging = coordinator.prepare_merge(level=1, target_branch="main")
+        coordinator.git.checkout(staging)
+
+        with patch.object(coordinator.git, "merge_tree") as merge_tree:
+            results = coordinator.execute_merge([branch], staging)
+
+        merge_tree.assert_not_called()
+        assert results[0].status == MergeStatus.MERGED
+
+    def test_unsupported_git_falls_back(self, tmp_repo: Path) -> None:
+        coordinator = _coordinator(tmp_repo)
+        coordinator.git = MagicMock()
+        coordinator.git.current_branch.return_value = "main"
+        coordinator.git.merge_tree.return_value = None
+        coordinator.git.merge.return_value = "sha1111"
+
+        results = coordinator.execute_merge(["worker-0", "worker-1"], STAGING)
+
+        coordinator.git.checkout.assert_called_once_with(STAGING)
+        assert coordinator.git.merge.call_count == 2
+        coordinator.git.update_branch.assert_not_called()
+        assert [r.commit_sha for r in results] == ["sha1111", "sha1111"]
+
+    def test_sequential_strategy_skips_merge_tree(self, tmp_repo: Path) -> None:
+        branch = _worker(tmp_repo, "worker-0", "a.txt", "a\n")
+        coordinator = _coordinator(tmp_repo, strategy="sequential")
+        staging = coordinator.prepare_merge(level=1, target_branch="main")
+
+        with patch.object(coordinator.git, "merge_tree") as merge_tree:
+            coordinator.execute_merge([branch], staging)
+
+        merge_tree.assert_not_called()
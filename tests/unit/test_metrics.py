@@ -10,6 +10,7 @@ import pytest
 
 from mahabharatha.constants import TaskStatus, WorkerStatus
 from mahabharatha.metrics import (
+    MetricsAggregator,
     MetricsCollector,
     calculate_percentile,
     duration_ms,
@@ -247,6 +248,61 @@ class TestComputeFeatureMetrics(TestMetricsCollector):
         assert len(restored.worker_metrics) == len(original.worker_metrics)
 
 
+class TestIncrementalMetrics(TestMetricsCollector):
+    """Tests for MetricsAggregator folding through MetricsCollector."""
+
+    def test_collectors_share_aggregator(self, populated_state: StateManager) -> None:
+        """Collectors for the same StateManager reuse the folded counters."""
+        MetricsCollector(populated_state).compute_feature_metrics()
+        populated_state.set_task_status("TASK-003", TaskStatus.COMPLETE, worker_id=0)
+        populated_state.record_task_duration("TASK-003", 60000)
+
+        metrics = MetricsCollector(populated_state).compute_feature_metrics()
+        assert metrics.tasks_completed == 3
+        assert metrics.tasks_failed == 0
+        level2 = next(lm for lm in metrics.level_metrics if lm.level == 2)
+        assert level2.completed_count == 1
+        assert level2.p50_duration_ms == pytest.approx(60000, rel=0.01)
+        worker0 = next(wm for wm in metrics.worker_metrics if wm.worker_id == 0)
+        assert worker0.total_task_duration_ms == 300000
+
+    def test_feature_metrics_load_state_once(self, populated_state: StateManager) -> None:
+        """compute_feature_metrics loads state once, not once per worker and level."""
+        collector = MetricsCollector(populated_state)
+        calls = 0
+        original_load = populated_state.load
+
+        def counting_load() -> dict:
+            nonlocal calls
+            calls += 1
+            return original_load()
+
+        populated_state.load = counting_load  # type: ignore[method-assign]
+        collector.compute_feature_metrics()
+        assert calls == 1
+
+    def test_fold_applies_changes_and_removals(self) -> None:
+        """Folding reverses a task's old contribution before adding the new one."""
+        agg = MetricsAggregator()
+        tasks = {
+            "A": {"status": TaskStatus.COMPLETE.value, "worker_id": 0, "level": 1, "duration_ms": 100},
+            "B": {"status": TaskStatus.COMPLETE.value, "worker_id": 1, "level": 1, "duration_ms": 300},
+        }
+        agg.fold(tasks)
+        assert agg.level(1).durations.count == 2
+
+        tasks["A"] = {"status": TaskStatus.FAILED.value, "worker_id": 0, "level": 1}
+        del tasks["B"]
+        agg.fold(tasks)
+        assert agg.tasks_total == 1
+        assert agg.tasks_completed == 0
+        assert agg.tasks_failed == 1
+        assert agg.level(1).durations.count == 0
+        assert agg.durations.count == 0
+        assert agg.worker(0).failed == 1
+        assert agg.worker(1).completed == 0
+
+
 class TestExportJson(TestMetricsCollector):
     """Tests for export_json method."""
 
@@ -18,6 +18,7 @@ import pytest
 from mahabharatha.config import MahabharathaConfig
 from mahabharatha.constants import LevelMergeStatus, TaskStatus, WorkerStatus
 from mahabharatha.orchestrator import Orchestrator
+from mahabharatha.types import WorkerState
 
 
 @pytest.fixture
@@ -239,7 +240,7 @@ class TestStartMethod:
         mock_orchestrator_deps["parser"].get_all_tasks.return_value = [{"id": "TASK-001", "level": 1}]
 
         orch = Orchestrator("test-feature")
-        with patch.object(orch, "_main_loop"):
+        with patch.object(orch, "_run_main_loop"):
             with patch.object(orch, "_spawn_workers", return_value=3):
                 with patch.object(orch, "_start_level"):
                     orch.start(task_graph_path, worker_count=3)
@@ -367,6 +368,32 @@ class TestMainLoop:
 
         assert orch._running is False
 
+    def test_main_loop_complete_stops_idle_workers(self, mock_orchestrator_deps, tmp_path: Path, monkeypatch) -> None:
+        """Test persistent workers still idling are terminated once the feature is done."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".mahabharatha").mkdir()
+
+        levels = mock_orchestrator_deps["levels"]
+        levels.is_level_resolved.return_value = True
+        levels.can_advance.return_value = False
+        levels.get_status.return_value = {**levels.get_status.return_value, "is_complete": True}
+
+        orch = Orchestrator("test-feature")
+        orch._running = True
+        orch._poll_interval = 0
+        orch.registry.register(0, WorkerState(worker_id=0, status=WorkerStatus.IDLE))
+        orch.registry.register(1, WorkerState(worker_id=1, status=WorkerStatus.STOPPED))
+
+        with (
+            patch.object(orch, "_poll_workers"),
+            patch.object(orch, "_on_level_complete_handler"),
+            patch.object(orch._worker_manager, "terminate_worker") as terminate,
+            patch("time.sleep"),
+        ):
+            orch._main_loop()
+
+        terminate.assert_called_once_with(0)
+
     def test_main_loop_keyboard_interrupt(self, mock_orchestrator_deps, tmp_path: Path, monkeypatch) -> None:
         """Test main loop handles keyboard interrupt."""
         monkeypatch.chdir(tmp_path)
@@ -571,7 +598,7 @@ class TestStartSpawnValidation:
         orch = Orchestrator("test-feature")
 
         with patch.object(orch, "_spawn_workers", return_value=2):
-            with patch.object(orch, "_main_loop"):
+            with patch.object(orch, "_run_main_loop"):
                 with patch.object(orch, "_start_level"):
                     with patch.object(orch, "_wait_for_initialization"):
                         orch.start(task_graph_path, worker_count=3)
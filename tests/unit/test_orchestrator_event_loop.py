@@ -0,0 +1,279 @@
+"""Tests for the asyncio orchestrator main loop.
+
+Tests cover:
+1. Waking the loop on state file writes instead of the poll interval
+2. Level advance respawning workers with spawn_async, and stopping idle workers at the end
+3. Concurrent worker monitoring and async exit handling
+4. Falling back to the polling loop when workers.event_loop is off
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mahabharatha.constants import WorkerStatus
+from mahabharatha.orchestrator import STATE_WATCH_INTERVAL, Orchestrator
+from mahabharatha.types import WorkerState
+from tests.fixtures.orchestrator_fixtures import mock_orchestrator_deps  # noqa: F401
+
+
+@pytest.fixture
+def orch(mock_orchestrator_deps, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Orchestrator:  # noqa: F811
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".mahabharatha" / "state").mkdir(parents=True)
+    o = Orchestrator("test-feature")
+    o._running = True
+    o._monitor_interval = 0.01
+    return o
+
+
+async def _run_until(orch: Orchestrator, condition, timeout: float = 2.0) -> float:
+    """Run the event loop until ``condition()`` holds; returns the elapsed time."""
+    loop_task = asyncio.create_task(orch._run_event_loop())
+    start = time.monotonic()
+    try:
+        while not condition():
+            assert time.monotonic() - start < timeout, "condition not reached"
+            await asyncio.sleep(0.01)
+        return time.monotonic() - start
+    finally:
+        orch._running = False
+        orch._wake.set()
+        await asyncio.wait_for(loop_task, timeout=2)
+
+
+class TestWakeOnStateWrite:
+    """The loop reacts to worker state writes well before the poll interval."""
+
+    def test_state_write_wakes_loop(self, orch: Orchestrator, tmp_path: Path) -> None:
+        refreshes: list[float] = []
+        state_file = tmp_path / ".mahabharatha" / "state" / "test-feature.json"
+
+        async def scenario() -> float:
+            loop_task = asyncio.create_task(orch._run_event_loop())
+            try:
+                while not refreshes:
+                    await asyncio.sleep(0.01)
+                written = time.monotonic()
+                state_file.write_text('{"tasks": {"T1": {"status": "complete"}}}')  # A worker finishing T1
+                while len(refreshes) < 2:
+                    assert time.monotonic() - written < 2.0, "loop not woken"
+                    await asyncio.sleep(0.01)
+                return refreshes[1] - written
+            finally:
+                orch._running = False
+                orch._wake.set()
+                await asyncio.wait_for(loop_task, timeout=2)
+
+        with patch.object(orch, "_refresh_state", side_effect=lambda: refreshes.append(time.monotonic())):
+            latency = asyncio.run(scenario())
+
+        assert orch._poll_interval == 15
+        assert latency < STATE_WATCH_INTERVAL * 4
+
+    def test_own_writes_do_not_wake_loop(self, orch: Orchestrator, tmp_path: Path) -> None:
+        state_file = tmp_path / ".mahabharatha" / "state" / "test-feature.json"
+        refreshes: list[float] = []
+
+        def refresh() -> None:
+            refreshes.append(time.monotonic())
+            state_file.write_text(str(len(refreshes)))  # The orchestrator saving state itself
+
+        async def scenario() -> None:
+            await _run_until(orch, lambda: False, timeout=STATE_WATCH_INTERVAL * 4)
+
+        with patch.object(orch, "_refresh_state", side_effect=refresh), pytest.raises(AssertionError):
+            asyncio.run(scenario())
+        assert len(refreshes) == 1
+
+    def test_reads_and_other_features_do_not_wake_loop(self, orch: Orchestrator, tmp_path: Path) -> None:
+        state_dir = tmp_path / ".mahabharatha" / "state"
+        (state_dir / "test-feature.json").write_text("{}")
+        before = orch._read_state_signature()
+
+        (state_dir / "test-feature.lock").write_text("")  # Opened by every StateManager.load()
+        (state_dir / "test-feature-2.json").write_text("{}")  # Another feature sharing the prefix
+        assert orch._read_state_signature() == before
+
+        (state_dir / "test-feature.db-wal").write_bytes(b"wal")
+        assert orch._read_state_signature() != before
+
+
+class TestLevelAdvance:
+    """Level transitions inside the event loop."""
+
+    def test_resolved_level_respawns_with_spawn_async(self, orch: Orchestrator, mock_orchestrator_deps) -> None:  # noqa: F811
+        levels = mock_orchestrator_deps["levels"]
+        levels.is_level_resolved.side_effect = lambda lvl: lvl == 1
+        levels.can_advance.return_value = True
+        levels.advance_level.return_value = 2
+
+        respawn = AsyncMock(return_value=2)
+        with (
+            patch.object(orch, "_on_level_complete_handler", return_value=True),
+            patch.object(orch, "_start_level") as start_level,
+            patch.object(orch._worker_manager, "respawn_workers_for_level_async", respawn),
+            patch.object(orch._worker_manager, "respawn_workers_for_level") as sync_respawn,
+        ):
+            asyncio.run(_run_until(orch, lambda: respawn.await_count == 1))
+
+        start_level.assert_called_once_with(2)
+        respawn.assert_awaited_once_with(2)
+        sync_respawn.assert_not_called()
+
+    def test_level_merge_runs_off_the_event_loop(self, orch: Orchestrator, mock_orchestrator_deps) -> None:  # noqa: F811
+        levels = mock_orchestrator_deps["levels"]
+        levels.is_level_resolved.side_effect = lambda lvl: lvl == 1
+        levels.can_advance.return_value = False
+        ticks: list[float] = []
+        merged = threading.Event()
+
+        def slow_merge(level: int) -> bool:
+            time.sleep(0.2)  # Merge and gates block for a while
+            merged.set()
+            return True
+
+        async def ticker() -> None:
+            while not merged.is_set():
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def scenario() -> None:
+            tick = asyncio.create_task(ticker())
+            await _run_until(orch, merged.is_set)
+            await tick
+
+        with patch.object(orch, "_on_level_complete_handler", side_effect=slow_merge):
+            asyncio.run(scenario())
+
+        assert len(ticks) > 5  # The loop kept running other tasks during the merge
+
+    def test_complete_feature_ends_loop(self, orch: Orchestrator, mock_orchestrator_deps) -> None:  # noqa: F811
+        levels = mock_orchestrator_deps["levels"]
+        levels.is_level_resolved.return_value = True
+        levels.can_advance.return_value = False
+        levels.get_status.return_value = {**levels.get_status.return_value, "is_complete": True}
+
+        with patch.object(orch, "_on_level_complete_handler", return_value=True):
+            asyncio.run(asyncio.wait_for(orch._run_event_loop(), timeout=2))
+
+        assert orch._running is False
+
+    def test_complete_feature_stops_idle_workers(self, orch: Orchestrator, mock_orchestrator_deps) -> None:  # noqa: F811
+        levels = mock_orchestrator_deps["levels"]
+        levels.is_level_resolved.return_value = True
+        levels.can_advance.return_value = False
+        levels.get_status.return_value = {**levels.get_status.return_value, "is_complete": True}
+        orch.registry.register(0, WorkerState(worker_id=0, status=WorkerStatus.IDLE))
+        orch.registry.register(1, WorkerState(worker_id=1, status=WorkerStatus.STOPPED))
+
+        terminate = AsyncMock()
+        with (
+            patch.object(orch, "_on_level_complete_handler", return_value=True),
+            patch.object(orch._worker_manager, "terminate_worker_async", terminate),
+        ):
+            asyncio.run(asyncio.wait_for(orch._run_event_loop(), timeout=2))
+
+        terminate.assert_awaited_once_with(0)
+
+
+class TestWatchWorkers:
+    """Worker monitoring task."""
+
+    def test_exited_worker_handled_async(self, orch: Orchestrator) -> None:
+        orch.registry.register(0, WorkerState(worker_id=0, status=WorkerStatus.RUNNING))
+        orch.registry.register(1, WorkerState(worker_id=1, status=WorkerStatus.RUNNING))
+        orch.launcher.monitor.side_effect = lambda wid: WorkerStatus.STOPPED if wid == 1 else WorkerStatus.RUNNING
+
+        exit_async = AsyncMock()
+        with (
+            patch.object(orch._worker_manager, "handle_worker_exit_async", exit_async),
+            patch.object(orch._worker_manager, "mark_ready") as mark_ready,
+        ):
+            asyncio.run(_run_until(orch, lambda: exit_async.await_count >= 1))
+
+        exit_async.assert_awaited_with(1)
+        mark_ready.assert_any_call(0, orch.registry.get(0), WorkerStatus.RUNNING)
+
+
+class TestRunMainLoop:
+    """Selecting the loop implementation."""
+
+    def test_polling_loop_when_disabled(self, orch: Orchestrator) -> None:
+        orch.config.workers.event_loop = False
+        with patch.object(orch, "_main_loop") as main_loop, patch.object(orch, "_run_event_loop") as event_loop:
+            orch._run_main_loop()
+        main_loop.assert_called_once()
+        event_loop.assert_not_called()
+
+    def test_keyboard_interrupt_stops(self, orch: Orchestrator) -> None:
+        with (
+            patch.object(orch, "_run_event_loop", new=MagicMock(side_effect=KeyboardInterrupt)),
+            patch("mahabharatha.orchestrator.asyncio.run", side_effect=KeyboardInterrupt),
+            patch.object(orch, "stop") as stop,
+        ):
+            orch._run_main_loop()
+        stop.assert_called_once()
+
+
+class TestRespawnAsync:
+    """WorkerManager.respawn_workers_for_level_async."""
+
+    def test_spawns_concurrently_with_spawn_async(self, orch: Orchestrator, mock_orchestrator_deps) -> None:  # noqa: F811
+        mock_orchestrator_deps["levels"].get_pending_tasks_for_level.return_value = ["T1", "T2", "T3"]
+        manager = orch._worker_manager
+        manager.assigner = MagicMock(worker_count=3)
+        result = orch.launcher.spawn.return_value
+        orch.launcher.spawn_async = AsyncMock(return_value=result)
+
+        spawned = asyncio.run(manager.respawn_workers_for_level_async(2))
+
+        assert spawned == 3
+        assert orch.launcher.spawn_async.await_count == 3
+        orch.launcher.spawn.assert_not_called()
+        assert sorted(wid for wid, _ in orch.registry.items()) == [0, 1, 2]
+
+    def test_one_spawn_raising_keeps_the_others(self, orch: Orchestrator, mock_orchestrator_deps) -> None:  # noqa: F811
+        mock_orchestrator_deps["levels"].get_pending_tasks_for_level.return_value = ["T1", "T2", "T3"]
+        manager = orch._worker_manager
+        manager.assigner = MagicMock(worker_count=3)
+        result = orch.launcher.spawn.return_value
+
+        async def spawn_async(**kwargs):
+            if kwargs["worker_id"] == 1:
+                raise OSError("docker daemon went away")
+            return result
+
+        orch.launcher.spawn_async = AsyncMock(side_effect=spawn_async)
+
+        spawned = asyncio.run(manager.respawn_workers_for_level_async(2))
+
+        assert spawned == 2
+        assert sorted(wid for wid, _ in orch.registry.items()) == [0, 2]
+
+    def test_exit_and_level_respawn_do_not_double_spawn(self, orch: Orchestrator, mock_orchestrator_deps) -> None:  # noqa: F811
+        mock_orchestrator_deps["levels"].get_pending_tasks_for_level.return_value = ["T1", "T2"]
+        manager = orch._worker_manager
+        manager.assigner = MagicMock(worker_count=2)
+        manager.running = True
+        orch.registry.register(0, WorkerState(worker_id=0, status=WorkerStatus.RUNNING))
+        orch.registry.register(1, WorkerState(worker_id=1, status=WorkerStatus.STOPPED))
+        result = orch.launcher.spawn.return_value
+
+        async def spawn_async(**kwargs):
+            await asyncio.sleep(0.01)
+            return result
+
+        orch.launcher.spawn_async = AsyncMock(side_effect=spawn_async)
+
+        async def scenario() -> None:
+            await asyncio.gather(manager.handle_worker_exit_async(1), manager.respawn_workers_for_level_async(1))
+
+        asyncio.run(scenario())
+
+        assert [c.kwargs["worker_id"] for c in orch.launcher.spawn_async.call_args_list] == [1]
+        assert orch.registry.get(1).status == WorkerStatus.RUNNING
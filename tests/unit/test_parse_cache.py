@@ -0,0 +1,198 @@
+"""Tests for the shared two-tier parse cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mahabharatha.ast_cache import ASTCache, collect_exports, collect_imports
+from mahabharatha.parse_cache import FileSummary, ParseCache
+
+SOURCE = '''"""Module doc."""
+
+import os
+from pkg import helper as h
+
+LIMIT: int = 3
+NAME = "x"
+
+
+@dataclass
+class Widget(Base):
+    """A widget."""
+
+    async def run(self, a: int, /, b, *args: str, c=1, **kw) -> None:
+        import json
+
+
+def _private() -> str:
+    return ""
+'''
+
+
+@pytest.fixture
+def module(tmp_path: Path) -> Path:
+    path = tmp_path / "mod.py"
+    path.write_text(SOURCE)
+    return path
+
+
+def _touch(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestSummary:
+    def test_fields(self, module: Path) -> None:
+        summary = ParseCache().summary(module)
+
+        assert summary.docstring == "Module doc."
+        assert summary.error is None
+        assert summary.statements == 5
+        assert [(i.module, i.names, i.top_level) for i in summary.imports] == [
+            (None, [("os", None)], True),
+            ("pkg", [("helper", "h")], True),
+            (None, [("json", None)], False),
+        ]
+        assert [(a.name, a.annotation) for a in summary.assigns] == [("LIMIT", "int"), ("NAME", None)]
+
+        widget, private = summary.defs
+        assert (widget.kind, widget.bases, widget.decorators) == ("class", ["Base"], ["dataclass"])
+        run = widget.methods[0]
+        assert run.is_async
+        assert run.returns == "None"
+        assert [(p.name, p.kind, p.annotation) for p in run.params] == [
+            ("self", "posonly", None),
+            ("a", "posonly", "int"),
+            ("b", "arg", None),
+            ("args", "vararg", "str"),
+            ("c", "kwonly", None),
+            ("kw", "kwarg", None),
+        ]
+        assert private.name == "_private"
+
+    def test_exports_and_import_pairs_match_ast_collectors(self, module: Path) -> None:
+        cache = ParseCache()
+        summary = cache.summary(module)
+        tree = cache.tree(module)
+        assert summary.exports() == collect_exports(tree) == ["Widget"]
+        assert summary.import_pairs() == collect_imports(tree)
+
+    def test_round_trips_through_dict(self, module: Path) -> None:
+        summary = ParseCache().summary(module)
+        assert FileSummary.from_dict(summary.to_dict()) == summary
+
+    def test_syntax_error_recorded(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.py"
+        path.write_text("def broken(:\n")
+        summary = ParseCache().summary(path)
+        assert summary.error is not None
+        assert summary.defs == []
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            ParseCache().summary(tmp_path / "missing.py")
+
+
+class TestInvalidation:
+    def test_repeat_served_from_memory(self, module: Path) -> None:
+        cache = ParseCache()
+        first = cache.summary(module)
+        assert cache.summary(module) is first
+        assert cache.stats()["parses"] == 1
+        assert cache.stats()["memory_hits"] == 1
+
+    def test_touch_without_change_is_not_reparsed(self, module: Path) -> None:
+        cache = ParseCache()
+        cache.summary(module)
+        _touch(module)
+        cache.summary(module)
+        assert cache.stats()["parses"] == 1
+
+    def test_change_is_reparsed(self, module: Path) -> None:
+        cache = ParseCache()
+        cache.summary(module)
+        module.write_text("def other() -> None:\n    pass\n")
+        assert [d.name for d in cache.summary(module).defs] == ["other"]
+        assert cache.stats()["parses"] == 2
+
+    def test_summary_lru_is_bounded(self, tmp_path: Path) -> None:
+        cache = ParseCache(max_summaries=2)
+        for i in range(4):
+            path = tmp_path / f"m{i}.py"
+            path.write_text(f"X{i} = {i}\n")
+            cache.summary(path)
+        assert cache.stats()["summaries"] == 2
+
+
+class TestPersistence:
+    def test_new_instance_served_from_disk(self, module: Path, tmp_path: Path) -> None:
+        state = tmp_path / "state"
+        state.mkdir()
+        first = ParseCache(state)
+        expected = first.summary(module)
+        first.close()
+
+        second = ParseCache(state)
+        assert second.summary(module) == expected
+        assert second.stats()["parses"] == 0
+        assert second.stats()["disk_hits"] == 1
+
+    def test_touched_file_reuses_disk_row_by_hash(self, module: Path, tmp_path: Path) -> None:
+        state = tmp_path / "state"
+        state.mkdir()
+        first = ParseCache(state)
+        first.summary(module)
+        first.close()
+        _touch(module)
+
+        second = ParseCache(state)
+        second.summary(module)
+        assert second.stats()["parses"] == 0
+
+    def test_unwritable_state_falls_back_to_memory(self, module: Path, tmp_path: Path) -> None:
+        cache = ParseCache(tmp_path / "missing" / "state")
+        assert cache.summary(module).docstring == "Module doc."
+        cache.flush()
+
+
+class TestTrees:
+    def test_tree_raises_syntax_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.py"
+        path.write_text("def broken(:\n")
+        with pytest.raises(SyntaxError):
+            ParseCache().tree(path)
+
+    def test_tree_parse_also_fills_summary(self, module: Path) -> None:
+        cache = ParseCache()
+        cache.tree(module)
+        cache.summary(module)
+        assert cache.stats()["parses"] == 1
+
+    def test_ast_cache_shares_parses(self, module: Path) -> None:
+        shared = ParseCache()
+        shared.summary(module)
+        tree = ASTCache(parse_cache=shared).parse(module)
+        assert ASTCache(parse_cache=shared).parse(module) is tree
+        assert shared.stats()["trees"] == 1
+
+    def test_ast_cache_outlives_tree_lru(self, tmp_path: Path) -> None:
+        shared = ParseCache(max_trees=2)
+        cache = ASTCache(parse_cache=shared)
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"m{i}.py"
+            path.write_text(f"X{i} = {i}\n")
+            paths.append(path)
+        trees = [cache.parse(path) for path in paths]
+        assert [cache.parse(path) for path in paths] == trees
+        assert shared.stats()["parses"] == 4
+
+    def test_ast_cache_clear_keeps_shared_cache(self, module: Path) -> None:
+        shared = ParseCache()
+        cache = ASTCache(parse_cache=shared)
+        tree = cache.parse(module)
+        cache.clear()
+        assert shared.stats()["trees"] == 1
+        assert cache.parse(module) is tree
+        assert shared.stats()["parses"] == 1
@@ -0,0 +1,163 @@
+"""Tests for persistent workers that survive level boundaries.
+
+Tests cover:
+1. WorkerProtocol waiting for the next level instead of exiting
+2. LevelCoordinator rebasing live worktrees in place after a merge
+3. Recycling workers whose worktree cannot be rebased
+"""
+
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mahabharatha.config import MahabharathaConfig
+from mahabharatha.constants import ExitCode, TaskStatus, WorkerStatus
+from mahabharatha.level_coordinator import LevelCoordinator
+from mahabharatha.merge import MergeFlowResult
+from mahabharatha.protocol_state import WorkerProtocol
+from mahabharatha.types import WorkerState
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True).stdout.strip()
+
+
+@pytest.fixture
+def protocol(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> WorkerProtocol:
+    monkeypatch.setenv("MAHABHARATHA_WORKTREE", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    config = MahabharathaConfig()
+    config.workers.persistent = True
+    state = MagicMock()
+    state.get_worker_state.return_value = None
+    with (
+        patch("mahabharatha.protocol_state.StateManager", return_value=state),
+        patch("mahabharatha.protocol_state.GitOps"),
+        patch("mahabharatha.protocol_state.VerificationExecutor"),
+    ):
+        p = WorkerProtocol(worker_id=0, feature="test-feature", config=config)
+    p._started_at = datetime.now()
+    p.task_parser = MagicMock()
+    p.task_parser.get_all_tasks.return_value = [{"id": "T1"}, {"id": "T2"}]
+    return p
+
+
+class TestWaitForNextLevel:
+    """Tests for WorkerProtocol.wait_for_next_level."""
+
+    def test_claims_task_of_next_level(self, protocol: WorkerProtocol) -> None:
+        protocol.state.get_tasks_by_status.return_value = ["T1"]
+        with patch.object(protocol, "claim_next_task", side_effect=[None, {"id": "T2"}]):
+            task = protocol.wait_for_next_level()
+
+        assert task == {"id": "T2"}
+        statuses = [c.args[0].status for c in protocol.state.set_worker_state.call_args_list]
+        assert statuses == [WorkerStatus.IDLE, WorkerStatus.RUNNING]
+
+    def test_exits_when_all_tasks_complete(self, protocol: WorkerProtocol) -> None:
+        protocol.state.get_tasks_by_status.return_value = ["T1", "T2"]
+        with patch.object(protocol, "claim_next_task") as claim:
+            assert protocol.wait_for_next_level() is None
+        claim.assert_not_called()
+        protocol.state.get_tasks_by_status.assert_any_call(TaskStatus.COMPLETE)
+
+    def test_exits_when_remaining_tasks_failed(self, protocol: WorkerProtocol) -> None:
+        by_status = {TaskStatus.COMPLETE: ["T1"], TaskStatus.FAILED: ["T2"]}
+        protocol.state.get_tasks_by_status.side_effect = lambda status: by_status.get(status, [])
+        with patch.object(protocol, "claim_next_task") as claim:
+            assert protocol.wait_for_next_level() is None
+        claim.assert_not_called()
+
+    def test_exits_after_idle_timeout(self, protocol: WorkerProtocol) -> None:
+        protocol.state.get_tasks_by_status.return_value = []
+        with (
+            patch("mahabharatha.protocol_state.time.monotonic", side_effect=[0.0, 0.0, 1800.0, 3600.0]),
+            patch.object(protocol, "claim_next_task", return_value=None) as claim,
+        ):
+            assert protocol.wait_for_next_level() is None
+        assert claim.call_count == 2
+
+    def test_start_keeps_running_across_levels(self, protocol: WorkerProtocol) -> None:
+        protocol._handler = MagicMock()
+        protocol._handler.execute_task.return_value = True
+        with (
+            patch.object(protocol, "claim_next_task", side_effect=[{"id": "T1"}, None, None]),
+            patch.object(protocol, "wait_for_next_level", side_effect=[{"id": "T2"}, None]) as wait,
+            patch.object(protocol, "report_complete") as complete,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            protocol.start()
+
+        assert exc_info.value.code == ExitCode.SUCCESS
+        assert [c.args[0] for c in complete.call_args_list] == ["T1", "T2"]
+        assert wait.call_count == 2
+
+
+class TestRebaseInPlace:
+    """Tests for LevelCoordinator.rebase_all_workers with persistent workers."""
+
+    def _coordinator(self, worker: WorkerState, recycle: MagicMock) -> LevelCoordinator:
+        config = MahabharathaConfig()
+        config.workers.persistent = True
+        coord = LevelCoordinator(
+            feature="feat",
+            config=config,
+            state=MagicMock(),
+            levels=MagicMock(),
+            parser=MagicMock(),
+            merger=MagicMock(),
+            task_sync=MagicMock(),
+            plugin_registry=MagicMock(),
+            workers={0: worker},  # type: ignore[arg-type]
+            on_level_complete_callbacks=[],
+            recycle_worker=recycle,
+        )
+        coord.last_merge_result = MergeFlowResult(success=True, level=1, source_branches=[], target_branch="main")
+        return coord
+
+    def _worktree(self, repo: Path) -> tuple[Path, WorkerState]:
+        path = repo / ".mahabharatha-worktrees" / "feat" / "worker-0"
+        _git(repo, "worktree", "add", "-q", "-b", "mahabharatha/feat/worker-0", str(path))
+        worker = WorkerState(
+            worker_id=0,
+            status=WorkerStatus.IDLE,
+            branch="mahabharatha/feat/worker-0",
+            worktree_path=str(path),
+        )
+        return path, worker
+
+    def test_worktree_rebased_onto_merge_target(self, tmp_repo: Path) -> None:
+        path, worker = self._worktree(tmp_repo)
+        (tmp_repo / "merged.txt").write_text("from another worker")
+        _git(tmp_repo, "add", "merged.txt")
+        _git(tmp_repo, "commit", "-q", "-m", "level 1 merge")
+        recycle = MagicMock()
+
+        self._coordinator(worker, recycle).rebase_all_workers(1)
+
+        assert (path / "merged.txt").exists()
+        assert _git(path, "rev-parse", "HEAD") == _git(tmp_repo, "rev-parse", "main")
+        recycle.assert_not_called()
+
+    def test_failed_rebase_recycles_worker(self, tmp_repo: Path) -> None:
+        path, worker = self._worktree(tmp_repo)
+        (tmp_repo / "README.md").write_text("changed on main")
+        _git(tmp_repo, "commit", "-q", "-am", "level 1 merge")
+        (path / "README.md").write_text("uncommitted edit")
+        recycle = MagicMock()
+
+        coord = self._coordinator(worker, recycle)
+        coord.rebase_all_workers(1)
+
+        recycle.assert_called_once_with(0)
+        coord.state.append_event.assert_called_once_with("worker_rebase_failed", {"worker_id": 0, "level": 1})
+
+    def test_stopped_worker_not_rebased(self, tmp_repo: Path) -> None:
+        _path, worker = self._worktree(tmp_repo)
+        worker.status = WorkerStatus.STOPPED
+        with patch("mahabharatha.level_coordinator.GitOps") as git_ops:
+            self._coordinator(worker, MagicMock()).rebase_all_workers(1)
+        git_ops.assert_not_called()
@@ -0,0 +1,44 @@
+"""Tests for shared process-pool sizing and start-method selection."""
+
+import multiprocessing
+from unittest.mock import patch
+
+from mahabharatha import pool_utils
+from mahabharatha.pool_utils import pool_context, pool_size
+
+
+class TestPoolSize:
+    def test_serial_below_threshold(self) -> None:
+        assert pool_size(299, None, min_files=300, files_per_process=100) == 1
+
+    def test_auto_uses_cpus_above_threshold(self) -> None:
+        with patch.object(pool_utils.os, "cpu_count", return_value=4):
+            assert pool_size(10_000, None, min_files=300, files_per_process=100) == 4
+
+    def test_capped_by_files_per_process(self) -> None:
+        assert pool_size(101, 16, min_files=300, files_per_process=100) == 2
+
+    def test_explicit_serial(self) -> None:
+        assert pool_size(10_000, 1, min_files=300, files_per_process=100) == 1
+
+
+class TestPoolContext:
+    def test_forkserver_by_default(self) -> None:
+        with patch.object(multiprocessing.context.ForkServerContext, "set_forkserver_preload") as preload:
+            ctx = pool_context("mahabharatha.repo_map")
+        assert ctx.get_start_method() == "forkserver"
+        assert ctx is not multiprocessing.get_context("forkserver")  # Dedicated, not the global context
+        assert "mahabharatha.repo_map" in preload.call_args.args[0]
+
+    def test_preloads_accumulate_across_callers(self) -> None:
+        with patch.object(multiprocessing.context.ForkServerContext, "set_forkserver_preload") as preload:
+            pool_context("mahabharatha.repo_map")
+            pool_context("mahabharatha.security.scanner")
+        assert {"mahabharatha.repo_map", "mahabharatha.security.scanner"} <= set(preload.call_args.args[0])
+
+    def test_fork_only_when_allowed(self) -> None:
+        assert pool_context(__name__, allow_fork=True).get_start_method() == "fork"
+
+    def test_spawn_without_forkserver(self) -> None:
+        with patch.object(pool_utils.multiprocessing, "get_all_start_methods", return_value=["spawn"]):
+            assert pool_context(__name__).get_start_method() == "spawn"
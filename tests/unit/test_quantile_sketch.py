@@ -0,0 +1,102 @@
+"""Tests for the DDSketch quantile sketch.
+
+Tests cover:
+1. Quantile estimates within the configured relative accuracy
+2. Merging, removal and JSON round-trips
+3. Bounded bucket count
+"""
+
+import json
+import random
+
+import pytest
+
+from mahabharatha.metrics import calculate_percentile
+from mahabharatha.quantile_sketch import DDSketch
+
+
+@pytest.fixture
+def values() -> list[float]:
+    rng = random.Random(42)
+    return [rng.lognormvariate(10, 1.5) for _ in range(5000)]
+
+
+class TestDDSketch:
+    """Tests for DDSketch."""
+
+    def test_empty(self) -> None:
+        sketch = DDSketch()
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.mean == 0.0
+        assert len(sketch) == 0
+
+    @pytest.mark.parametrize("q", [0.0, 0.5, 0.9, 0.99, 1.0])
+    def test_relative_accuracy(self, values: list[float], q: float) -> None:
+        sketch = DDSketch()
+        for v in values:
+            sketch.add(v)
+        exact = sorted(values)[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+
+    def test_percentile_matches_calculate_percentile(self) -> None:
+        durations = [100, 200, 300, 400, 500]
+        sketch = DDSketch()
+        for d in durations:
+            sketch.add(d)
+        for p in (0, 50, 100):
+            assert sketch.percentile(p) == pytest.approx(calculate_percentile(durations, p), rel=0.01)
+
+    def test_zeros(self) -> None:
+        sketch = DDSketch()
+        for v in (0, 0, 0, 5):
+            sketch.add(v)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(5, rel=0.01)
+
+    def test_merge_equals_single_sketch(self, values: list[float]) -> None:
+        whole, left, right = DDSketch(), DDSketch(), DDSketch()
+        for i, v in enumerate(values):
+            whole.add(v)
+            (left if i % 2 else right).add(v)
+        left.merge(right)
+        assert left.count == whole.count
+        assert left.quantile(0.9) == whole.quantile(0.9)
+        assert left.mean == pytest.approx(whole.mean)
+
+    def test_merge_rejects_different_accuracy(self) -> None:
+        with pytest.raises(ValueError, match="relative accuracy"):
+            DDSketch(0.01).merge(DDSketch(0.05))
+
+    def test_invalid_accuracy(self) -> None:
+        with pytest.raises(ValueError):
+            DDSketch(relative_accuracy=1.5)
+
+    def test_remove(self) -> None:
+        sketch = DDSketch()
+        for v in (10, 20, 1000):
+            sketch.add(v)
+        sketch.remove(1000)
+        sketch.remove(5000)  # Never added: no-op
+        assert sketch.count == 2
+        assert sketch.quantile(1.0) == pytest.approx(20, rel=0.01)
+        sketch.remove(10)
+        sketch.remove(20)
+        assert sketch == DDSketch()
+
+    def test_round_trip(self, values: list[float]) -> None:
+        sketch = DDSketch()
+        for v in values[:100]:
+            sketch.add(v)
+        restored = DDSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored == sketch
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+
+    def test_bucket_count_bounded(self) -> None:
+        sketch = DDSketch(max_buckets=50)
+        for exp in range(-6, 10):
+            for mantissa in range(1, 10):
+                sketch.add(mantissa * 10.0**exp)
+        assert len(sketch.to_dict()["bins"]) <= 50
+        assert sketch.quantile(1.0) == pytest.approx(9e9, rel=0.01)
+        sketch.remove(1e-6)  # Collapsed into the floor bucket
+        assert sketch.count == 16 * 9 - 1
@@ -0,0 +1,121 @@
+"""Tests for IncrementalIndex: per-file record persistence and graph patching."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mahabharatha import repo_map
+from mahabharatha.repo_map import IncrementalIndex, build_map, invalidate_cache
+
+
+def _graph_snapshot(graph: repo_map.SymbolGraph) -> tuple[dict, list]:
+    """Order-insensitive view of a graph for equality checks."""
+    modules = {mod: sorted((s.name, s.kind, s.signature, s.line) for s in syms) for mod, syms in graph.modules.items()}
+    edges = sorted((e.source, e.target, e.kind) for e in graph.edges)
+    return modules, edges
+
+
+@pytest.fixture(autouse=True)
+def clean_cache() -> None:
+    invalidate_cache()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "base.py").write_text('class Base:\n    """Root."""\n\n    def run(self) -> None:\n        pass\n')
+    (root / "pkg" / "child.py").write_text("from pkg.base import Base\n\n\nclass Child(Base):\n    pass\n")
+    (root / "web.ts").write_text("export function render(x: number): string { return '' }\n")
+    return root
+
+
+class TestIncrementalIndex:
+    def test_graph_matches_full_build(self, repo: Path, tmp_path: Path) -> None:
+        graph = IncrementalIndex(tmp_path / "state").update_incremental(repo)
+        invalidate_cache()
+        assert _graph_snapshot(graph) == _graph_snapshot(build_map(repo))
+
+    def test_unchanged_files_not_reparsed_or_hashed(self, repo: Path, tmp_path: Path) -> None:
+        index = IncrementalIndex(tmp_path / "state")
+        first = index.update_incremental(repo)
+
+        with (
+            patch.object(repo_map, "_extract_file") as extract,
+            patch.object(repo_map, "_md5_file") as md5,
+        ):
+            second = index.update_incremental(repo)
+
+        extract.assert_not_called()
+        md5.assert_not_called()
+        assert second is first
+        assert index.get_stats()["stale_files"] == 0
+
+    def test_touch_without_change_hashes_but_skips_extraction(self, repo: Path, tmp_path: Path) -> None:
+        index = IncrementalIndex(tmp_path / "state")
+        index.update_incremental(repo)
+        target = repo / "pkg" / "base.py"
+        st = target.stat()
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        with patch.object(repo_map, "_extract_file") as extract:
+            index.update_incremental(repo)
+        extract.assert_not_called()
+
+        # The refreshed stat means the next update does not even hash the file
+        with patch.object(repo_map, "_md5_file") as md5:
+            index.update_incremental(repo)
+        md5.assert_not_called()
+
+    def test_only_changed_file_is_reextracted(self, repo: Path, tmp_path: Path) -> None:
+        index = IncrementalIndex(tmp_path / "state")
+        index.update_incremental(repo)
+        (repo / "pkg" / "child.py").write_text("import os\n\n\ndef helper() -> int:\n    return 1\n")
+
+        with patch.object(repo_map, "_extract_file", wraps=repo_map._extract_file) as extract:
+            graph = index.update_incremental(repo)
+
+        assert [c.args[0].name for c in extract.call_args_list] == ["child.py"]
+        assert [s.name for s in graph.modules["pkg.child"]] == ["os", "helper"]
+        assert not any(e.source == "pkg.child.Child" for e in graph.edges)
+        invalidate_cache()
+        assert _graph_snapshot(graph) == _graph_snapshot(build_map(repo))
+
+    def test_deleted_file_removed_from_graph_and_index(self, repo: Path, tmp_path: Path) -> None:
+        index = IncrementalIndex(tmp_path / "state")
+        index.update_incremental(repo)
+        (repo / "pkg" / "child.py").unlink()
+
+        graph = index.update_incremental(repo)
+
+        assert "pkg.child" not in graph.modules
+        assert all(not e.source.startswith("pkg.child") for e in graph.edges)
+        assert index.get_stats()["total_files"] == 2
+
+    def test_fresh_instance_restores_graph_from_disk_without_parsing(self, repo: Path, tmp_path: Path) -> None:
+        expected = _graph_snapshot(IncrementalIndex(tmp_path / "state").update_incremental(repo))
+
+        with patch.object(repo_map, "_extract_file") as extract:
+            graph = IncrementalIndex(tmp_path / "state").update_incremental(repo)
+
+        extract.assert_not_called()
+        assert _graph_snapshot(graph) == expected
+
+    def test_outdated_index_format_is_rebuilt(self, repo: Path, tmp_path: Path) -> None:
+        state = tmp_path / "state"
+        state.mkdir()
+        legacy = {"_meta": {"last_updated": "x"}, "files": {str(repo / "web.ts"): {"hash": "0", "symbols": ["render"]}}}
+        (state / "repo-index.json").write_text(json.dumps(legacy))
+
+        index = IncrementalIndex(state)
+        graph = index.update_incremental(repo)
+
+        assert index.get_stats()["stale_files"] == 3
+        assert [s.name for s in graph.modules["web"]] == ["render"]
+
+    def test_update_publishes_graph_to_build_map_cache(self, repo: Path, tmp_path: Path) -> None:
+        graph = IncrementalIndex(tmp_path / "state").update_incremental(repo, languages=["python"])
+        assert build_map(repo, languages=["python"]) is graph
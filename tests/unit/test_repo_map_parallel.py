@@ -0,0 +1,66 @@
+"""Tests for process-pool symbol extraction in build_map."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mahabharatha import repo_map
+from mahabharatha.repo_map import IncrementalIndex, _build_map_impl, invalidate_cache
+
+LANGUAGES = ["python", "javascript", "typescript"]
+
+
+@pytest.fixture(autouse=True)
+def clean_cache() -> None:
+    invalidate_cache()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    for i in range(12):
+        pkg = root / f"pkg{i % 3}"
+        pkg.mkdir(parents=True, exist_ok=True)
+        (pkg / f"mod{i}.py").write_text(
+            f'import os\nfrom pkg0 import mod0\n\n\nclass C{i}(Base):\n    """Doc {i}."""\n\n'
+            f"    def m(self, x: int) -> str:\n        return str(x)\n\n\nLIMIT_{i} = {i}\n"
+        )
+    (root / "web").mkdir()
+    (root / "web" / "app.ts").write_text("export function render(x: number): string { return '' }\n")
+    (root / "web" / "util.js").write_text("export const answer = 42\n")
+    (root / "broken.py").write_text("def broken(:\n")
+    return root
+
+
+class TestParallelExtraction:
+    def test_parallel_graph_identical_to_serial(self, repo: Path) -> None:
+        root = repo.resolve()
+        serial = _build_map_impl(root, LANGUAGES, jobs=1)
+        with patch.object(repo_map, "_FILES_PER_PROCESS", 2):
+            parallel = _build_map_impl(root, LANGUAGES, jobs=2)
+
+        assert list(parallel.modules) == list(serial.modules)
+        assert parallel.modules == serial.modules
+        assert parallel.edges == serial.edges
+        assert "broken" not in parallel.modules
+
+    def test_serial_below_threshold_starts_no_pool(self, repo: Path) -> None:
+        with patch.object(repo_map, "ProcessPoolExecutor") as pool:
+            graph = _build_map_impl(repo.resolve(), LANGUAGES)
+        pool.assert_not_called()
+        assert "pkg0.mod0" in graph.modules
+
+    def test_falls_back_to_serial_when_pool_unavailable(self, repo: Path) -> None:
+        root = repo.resolve()
+        with (
+            patch.object(repo_map, "_FILES_PER_PROCESS", 2),
+            patch.object(repo_map, "ProcessPoolExecutor", side_effect=OSError("no semaphores")),
+        ):
+            graph = _build_map_impl(root, LANGUAGES, jobs=4)
+        assert graph == _build_map_impl(root, LANGUAGES, jobs=1)
+
+    def test_incremental_index_extracts_stale_files_in_parallel(self, repo: Path, tmp_path: Path) -> None:
+        with patch.object(repo_map, "_FILES_PER_PROCESS", 2):
+            graph = IncrementalIndex(tmp_path / "state").update_incremental(repo, jobs=2)
+        assert graph == _build_map_impl(repo.resolve(), LANGUAGES, jobs=1)
@@ -1,13 +1,15 @@
 """Unit tests for single-pass directory traversal optimization.
 
-Verifies that detect_project_stack() and _collect_files() use single rglob('*')
-traversal pattern instead of multiple separate traversals.
+Verifies that detect_project_stack() uses a single rglob('*') traversal and
+that _collect_files() walks each directory once, pruning skipped directories
+instead of listing them.
 
 Related: FR-3 from performance-core requirements.
 """
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from unittest import mock
 
@@ -116,23 +118,27 @@ class TestCollectFilesSingleTraversal:
         assert "utils.ts" in file_names
         assert "data.txt" not in file_names
 
-    def test_collect_files_single_rglob_call(self, tmp_path: Path) -> None:
-        """_collect_files uses only one rglob call with '*' pattern."""
+    def test_collect_files_prunes_skipped_directories(self, tmp_path: Path) -> None:
+        """_collect_files never lists skipped directories and makes no rglob call."""
         (tmp_path / "test.py").write_text("# Python")
+        (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+        (tmp_path / "node_modules" / "dep" / "index.js").write_text("// JS")
 
-        original_rglob = Path.rglob
-        rglob_calls: list[str] = []
+        original_scandir = os.scandir
+        scanned: list[str] = []
 
-        def tracking_rglob(self: Path, pattern: str):
-            rglob_calls.append(pattern)
-            return original_rglob(self, pattern)
+        def tracking_scandir(path):
+            scanned.append(os.fspath(path))
+            return original_scandir(path)
 
-        with mock.patch.object(Path, "rglob", tracking_rglob):
-            _collect_files(tmp_path, ["python", "javascript"])
+        with (
+            mock.patch.object(Path, "rglob", side_effect=AssertionError("rglob called")),
+            mock.patch.object(os, "scandir", tracking_scandir),
+        ):
+            files = _collect_files(tmp_path, ["python", "javascript"])
 
-        # Verify single rglob call with '*' pattern
-        assert len(rglob_calls) == 1, f"Expected 1 rglob call, got {len(rglob_calls)}: {rglob_calls}"
-        assert rglob_calls[0] == "*", f"Expected pattern '*', got '{rglob_calls[0]}'"
+        assert [f.name for f in files] == ["test.py"]
+        assert scanned == [str(tmp_path)]
 
     def test_collect_files_skips_directories(self, tmp_path: Path) -> None:
         """_collect_files skips configured directories."""
@@ -270,19 +276,19 @@ class TestTraversalPerformance:
             for j in range(10):
                 (subdir / f"mod_{j}.py").write_text(f"# Module {i}.{j}")
 
-        original_rglob = Path.rglob
-        rglob_count = [0]
+        original_scandir = os.scandir
+        scanned: list[str] = []
 
-        def counting_rglob(self: Path, pattern: str):
-            rglob_count[0] += 1
-            return original_rglob(self, pattern)
+        def tracking_scandir(path):
+            scanned.append(os.fspath(path))
+            return original_scandir(path)
 
-        with mock.patch.object(Path, "rglob", counting_rglob):
+        with mock.patch.object(os, "scandir", tracking_scandir):
             files = _collect_files(tmp_path, ["python"])
 
-        # Should find all 100 files with single rglob call
+        # Should find all 100 files listing each of the 11 directories once
         assert len(files) == 100
-        assert rglob_count[0] == 1
+        assert sorted(scanned) == sorted({str(tmp_path), *(str(tmp_path / f"pkg_{i}") for i in range(10))})
 
 
 class TestEdgeCases:
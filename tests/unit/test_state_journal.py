@@ -0,0 +1,254 @@
+"""Tests for the journaled (WAL + snapshot) state backend.
+
+Tests cover:
+1. Backend selection via StateConfig and the orchestrator's backend pin
+2. Deltas appended per update instead of whole-file rewrites
+3. Cross-instance visibility of journaled changes
+4. Compaction, torn-record recovery, and replay idempotency
+5. Repo API parity (claims, events, resources, workers)
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mahabharatha.config import MahabharathaConfig, StateConfig
+from mahabharatha.constants import TaskStatus, WorkerStatus
+from mahabharatha.exceptions import StateError
+from mahabharatha.parse_cache import ParseCache
+from mahabharatha.state import StateManager
+from mahabharatha.state.backends import (
+    create_persistence,
+    discover_state_features,
+    feature_state_files,
+    pin_backend,
+    pinned_backend,
+)
+from mahabharatha.state.journal import JOURNAL_SEQ_KEY, JournaledPersistenceLayer
+from mahabharatha.state.persistence import PersistenceLayer
+from mahabharatha.types import WorkerState
+
+
+def _config(threshold: int = 500) -> StateConfig:
+    return StateConfig(backend="journal", journal_compact_threshold=threshold)
+
+
+def _wal_records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+class TestBackendSelection:
+    """Tests for choosing the persistence backend."""
+
+    def test_default_backend_is_json(self, tmp_path: Path) -> None:
+        persistence = create_persistence("feat", tmp_path, StateConfig())
+        assert type(persistence) is PersistenceLayer
+
+    def test_journal_backend(self, tmp_path: Path) -> None:
+        persistence = create_persistence("feat", tmp_path, _config(threshold=42))
+        assert isinstance(persistence, JournaledPersistenceLayer)
+        assert persistence._compact_threshold == 42
+
+    def test_config_rejects_unknown_backend(self) -> None:
+        with pytest.raises(ValueError):
+            StateConfig(backend="mongo")
+
+    def test_config_section_defaults(self) -> None:
+        assert MahabharathaConfig().state.backend == "json"
+
+    def test_config_resolved_beside_state_dir_not_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        project = tmp_path / "project" / ".mahabharatha"
+        (project / "state").mkdir(parents=True)
+        (project / "config.yaml").write_text("state:\n  backend: journal\n")
+        monkeypatch.chdir(tmp_path)  # no config here, as in a worker's worktree
+        assert isinstance(create_persistence("feat", project / "state"), JournaledPersistenceLayer)
+
+    def test_pinned_backend_wins_over_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        pin_backend("feat", tmp_path, "journal")
+        assert isinstance(create_persistence("feat", tmp_path), JournaledPersistenceLayer)
+        # Other features are unaffected; an explicit config still overrides the pin
+        assert type(create_persistence("other", tmp_path)) is PersistenceLayer
+        assert type(create_persistence("feat", tmp_path, StateConfig())) is PersistenceLayer
+
+    def test_pin_rejects_unknown_backend(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            pin_backend("feat", tmp_path, "mongo")
+        (tmp_path / "feat.backend").write_text("mongo")
+        assert pinned_backend("feat", tmp_path) is None
+
+    def test_feature_state_files_and_discovery_span_backends(self, tmp_path: Path) -> None:
+        manager = StateManager("journaled", state_dir=tmp_path, config=_config())
+        manager.set_task_status("T1", TaskStatus.PENDING)
+        (tmp_path / "stored.db").write_bytes(b"")
+        pin_backend("stored", tmp_path, "sqlite")
+        pin_backend("journaled", tmp_path, "journal")
+        StateManager("unpinned", state_dir=tmp_path, config=StateConfig(backend="sqlite")).set_current_level(1)
+        parse_cache = ParseCache(tmp_path)
+        (tmp_path / "mod.py").write_text("X = 1\n")
+        parse_cache.summary(tmp_path / "mod.py")
+        parse_cache.close()
+
+        names = {p.name for p in feature_state_files("journaled", tmp_path)}
+        assert {"journaled.wal", "journaled.backend"} <= names
+        assert (tmp_path / "parse-cache.db").exists()
+        assert set(discover_state_features(tmp_path)) == {"journaled", "stored", "unpinned"}
+
+
+class TestJournaling:
+    """Tests for delta journaling and cross-instance visibility."""
+
+    def test_update_appends_single_record_delta(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        manager.load()
+        manager.set_task_status("T1", TaskStatus.PENDING)
+        snapshot_before = (tmp_path / "feat.json").read_text()
+
+        manager.set_task_status("T2", TaskStatus.PENDING)
+
+        records = _wal_records(tmp_path / "feat.wal")
+        assert records[-1]["ops"] == [["set", ["tasks", "T2"], manager._state["tasks"]["T2"]]]
+        # Snapshot untouched by the incremental update
+        assert (tmp_path / "feat.json").read_text() == snapshot_before
+
+    def test_event_append_journals_only_new_event(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        manager.append_event("first", {"n": 1})
+        manager.append_event("second", {"n": 2})
+
+        ops = _wal_records(tmp_path / "feat.wal")[-1]["ops"]
+        assert len(ops) == 1
+        assert ops[0][0] == "append"
+        assert ops[0][2]["event"] == "second"
+
+    def test_changes_visible_to_other_instance(self, tmp_path: Path) -> None:
+        writer = StateManager("feat", state_dir=tmp_path, config=_config())
+        reader = StateManager("feat", state_dir=tmp_path, config=_config())
+        writer.set_task_status("T1", TaskStatus.PENDING)
+        writer.set_current_level(2)
+        writer.append_event("level_started", {"level": 2})
+
+        state = reader.load()
+        assert state["tasks"]["T1"]["status"] == "pending"
+        assert state["current_level"] == 2
+        assert reader.get_events()[-1]["event"] == "level_started"
+
+    def test_claim_is_exclusive_across_instances(self, tmp_path: Path) -> None:
+        first = StateManager("feat", state_dir=tmp_path, config=_config())
+        second = StateManager("feat", state_dir=tmp_path, config=_config())
+        first.set_task_status("T1", TaskStatus.PENDING)
+
+        assert second.claim_task("T1", worker_id=1) is True
+        assert first.claim_task("T1", worker_id=2) is False
+        assert first.get_task_status("T1") == TaskStatus.CLAIMED.value
+
+    def test_nested_mutation_and_deletion_are_journaled(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        manager.acquire_resource_slot("ollama", max_slots=2, worker_id=1, timeout=1)
+        manager.increment_task_retry("T1")
+        manager.reset_task_retry("T1")
+        manager.release_resource_slot("ollama", worker_id=1)
+
+        state = StateManager("feat", state_dir=tmp_path, config=_config()).load()
+        assert state["resources"]["ollama"]["active"] == []
+        assert state["tasks"]["T1"]["retry_count"] == 0
+        assert "last_retry_at" not in state["tasks"]["T1"]
+
+    def test_worker_state_round_trip(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        manager.set_worker_state(WorkerState(worker_id=3, status=WorkerStatus.RUNNING, branch="b"))
+
+        other = StateManager("feat", state_dir=tmp_path, config=_config())
+        other.load()
+        worker = other.get_worker_state(3)
+        assert worker is not None
+        assert worker.status == WorkerStatus.RUNNING
+        assert worker.branch == "b"
+
+    def test_exception_in_update_discards_partial_changes(self, tmp_path: Path) -> None:
+        persistence = JournaledPersistenceLayer("feat", tmp_path)
+        with persistence.atomic_update():
+            persistence.state["current_level"] = 1
+
+        with pytest.raises(RuntimeError), persistence.atomic_update():
+            persistence.state["current_level"] = 99
+            raise RuntimeError("boom")
+
+        assert persistence.load()["current_level"] == 1
+
+    def test_mutation_outside_update_is_not_persisted(self, tmp_path: Path) -> None:
+        persistence = JournaledPersistenceLayer("feat", tmp_path)
+        persistence.load()
+        with persistence.atomic_update():
+            persistence.state["paused"] = False
+        persistence.state["paused"] = True
+
+        with persistence.atomic_update():
+            assert persistence.state["paused"] is False
+
+
+class TestCompaction:
+    """Tests for snapshot compaction and recovery."""
+
+    def test_compaction_folds_wal_into_snapshot(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config(threshold=10))
+        # First update writes the initial snapshot; the next 10 hit the WAL
+        for i in range(11):
+            manager.append_event("tick", {"i": i})
+
+        assert (tmp_path / "feat.wal").read_text() == ""
+        snapshot = json.loads((tmp_path / "feat.json").read_text())
+        assert len(snapshot["execution_log"]) == 11
+        assert snapshot[JOURNAL_SEQ_KEY] == 10
+
+    def test_instance_reloads_after_foreign_compaction(self, tmp_path: Path) -> None:
+        writer = StateManager("feat", state_dir=tmp_path, config=_config(threshold=10))
+        reader = StateManager("feat", state_dir=tmp_path, config=_config(threshold=10))
+        reader.load()
+        for i in range(25):
+            writer.set_task_status(f"T{i}", TaskStatus.PENDING)
+
+        assert len(reader.load()["tasks"]) == 25
+        assert JOURNAL_SEQ_KEY not in reader.load()
+
+    def test_replay_skips_records_covered_by_snapshot(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        manager.set_current_level(1)
+        manager.append_event("once")
+        wal = (tmp_path / "feat.wal").read_text()
+        manager.save()
+        # Simulate a crash between snapshot write and WAL truncation
+        (tmp_path / "feat.wal").write_text(wal)
+
+        state = StateManager("feat", state_dir=tmp_path, config=_config()).load()
+        assert [e["event"] for e in state["execution_log"]] == ["once"]
+
+    def test_torn_record_is_ignored_and_overwritten(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        manager.set_current_level(1)
+        with open(tmp_path / "feat.wal", "a") as f:
+            f.write('{"seq": 99, "ops": [["set", ["current_le')
+
+        other = StateManager("feat", state_dir=tmp_path, config=_config())
+        assert other.load()["current_level"] == 1
+        other.set_current_level(2)
+
+        for record in _wal_records(tmp_path / "feat.wal"):
+            assert "seq" in record
+        assert StateManager("feat", state_dir=tmp_path, config=_config()).load()["current_level"] == 2
+
+    def test_load_raises_on_corrupt_snapshot(self, tmp_path: Path) -> None:
+        (tmp_path / "feat.json").write_text("{ not json")
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        with pytest.raises(StateError, match="Failed to parse state file"):
+            manager.load()
+
+    def test_delete_removes_snapshot_and_wal(self, tmp_path: Path) -> None:
+        manager = StateManager("feat", state_dir=tmp_path, config=_config())
+        manager.set_current_level(1)
+        assert manager.exists()
+
+        manager.delete()
+        assert not manager.exists()
+        assert not (tmp_path / "feat.wal").exists()
@@ -0,0 +1,224 @@
+"""Tests for the SQLite (WAL mode) state backend.
+
+Tests cover:
+1. Backend selection and schema creation
+2. Row-level writes and incremental cache sync across instances
+3. Indexed task queries (status, stale in-progress, claim pre-check)
+4. Concurrent claims and non-blocking readers
+5. Save/delete/exists lifecycle
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from mahabharatha.config import StateConfig
+from mahabharatha.constants import TaskStatus, WorkerStatus
+from mahabharatha.state import StateManager
+from mahabharatha.state.backends import create_persistence
+from mahabharatha.state.sqlite_store import SQLitePersistenceLayer, SQLiteTaskStateRepo
+from mahabharatha.types import WorkerState
+
+
+def _manager(tmp_path: Path) -> StateManager:
+    return StateManager("feat", state_dir=tmp_path, config=StateConfig(backend="sqlite"))
+
+
+class TestBackendSelection:
+    """Tests for wiring the SQLite backend into StateManager."""
+
+    def test_create_persistence_returns_sqlite_layer(self, tmp_path: Path) -> None:
+        persistence = create_persistence("feat", tmp_path, StateConfig(backend="sqlite"))
+        assert isinstance(persistence, SQLitePersistenceLayer)
+        assert persistence.state_file == tmp_path / "feat.db"
+
+    def test_manager_uses_indexed_task_repo(self, tmp_path: Path) -> None:
+        assert isinstance(_manager(tmp_path)._tasks, SQLiteTaskStateRepo)
+
+    def test_database_uses_wal_journal(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.set_current_level(1)
+        mode = sqlite3.connect(tmp_path / "feat.db").execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+
+class TestRowStorage:
+    """Tests for per-row persistence and incremental sync."""
+
+    def test_task_row_has_indexed_columns(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.set_task_status("T1", TaskStatus.IN_PROGRESS, worker_id=2)
+        row = (
+            sqlite3.connect(tmp_path / "feat.db")
+            .execute("SELECT status, worker_id, started_at FROM tasks WHERE task_id = 'T1'")
+            .fetchone()
+        )
+        assert row[0] == "in_progress"
+        assert row[1] == 2
+        assert row[2] is not None
+
+    def test_update_writes_only_touched_rows(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.set_task_status("T1", TaskStatus.PENDING)
+        manager.set_task_status("T2", TaskStatus.PENDING)
+        conn = sqlite3.connect(tmp_path / "feat.db")
+        t1_seq = conn.execute("SELECT seq FROM tasks WHERE task_id = 'T1'").fetchone()[0]
+
+        manager.set_task_status("T2", TaskStatus.CLAIMED)
+
+        assert conn.execute("SELECT seq FROM tasks WHERE task_id = 'T1'").fetchone()[0] == t1_seq
+        assert conn.execute("SELECT seq FROM tasks WHERE task_id = 'T2'").fetchone()[0] > t1_seq
+
+    def test_changes_visible_to_other_instance(self, tmp_path: Path) -> None:
+        writer = _manager(tmp_path)
+        reader = _manager(tmp_path)
+        reader.load()
+        writer.set_task_status("T1", TaskStatus.PENDING)
+        writer.set_current_level(3)
+        writer.append_event("level_started", {"level": 3})
+        writer.set_worker_state(WorkerState(worker_id=1, status=WorkerStatus.RUNNING))
+
+        state = reader.load()
+        assert state["tasks"]["T1"]["status"] == "pending"
+        assert state["current_level"] == 3
+        assert state["execution_log"][-1]["event"] == "level_started"
+        worker = reader.get_worker_state(1)
+        assert worker is not None
+        assert worker.status == WorkerStatus.RUNNING
+
+    def test_events_are_appended_not_rewritten(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        for i in range(3):
+            manager.append_event("tick", {"i": i})
+        rows = sqlite3.connect(tmp_path / "feat.db").execute("SELECT id, event FROM events ORDER BY id").fetchall()
+        assert [event for _id, event in rows] == ["tick", "tick", "tick"]
+        assert len(manager.get_events()) == 3
+
+    def test_record_deletion_propagates(self, tmp_path: Path) -> None:
+        writer = _manager(tmp_path)
+        reader = _manager(tmp_path)
+        writer.set_task_status("T1", TaskStatus.PENDING)
+        reader.load()
+
+        with writer._persistence.atomic_update():
+            del writer._persistence.state["tasks"]["T1"]
+
+        assert "T1" not in reader.load()["tasks"]
+
+    def test_section_replacement_forces_full_reload(self, tmp_path: Path) -> None:
+        writer = _manager(tmp_path)
+        reader = _manager(tmp_path)
+        writer.set_task_status("T1", TaskStatus.PENDING)
+        reader.load()
+
+        with writer._persistence.atomic_update():
+            writer._persistence.state["tasks"] = {"T9": {"status": "pending"}}
+
+        assert list(reader.load()["tasks"]) == ["T9"]
+
+    def test_failed_update_is_rolled_back(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.set_current_level(1)
+
+        with pytest.raises(RuntimeError), manager._persistence.atomic_update():
+            manager._persistence.state["current_level"] = 7
+            raise RuntimeError("boom")
+
+        assert manager.load()["current_level"] == 1
+        assert _manager(tmp_path).load()["current_level"] == 1
+
+
+class TestIndexedQueries:
+    """Tests for SQLiteTaskStateRepo query overrides."""
+
+    def test_get_tasks_by_status_reads_database(self, tmp_path: Path) -> None:
+        writer = _manager(tmp_path)
+        reader = _manager(tmp_path)
+        reader.load()
+        writer.set_task_status("T1", TaskStatus.PENDING)
+        writer.set_task_status("T2", TaskStatus.COMPLETE)
+
+        # No reload needed: the query hits the database directly
+        assert reader.get_tasks_by_status(TaskStatus.PENDING) == ["T1"]
+        assert reader.get_tasks_by_status("complete") == ["T2"]
+
+    def test_get_stale_in_progress_tasks(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.set_task_status("T1", TaskStatus.IN_PROGRESS, worker_id=1)
+        manager.set_task_status("T2", TaskStatus.IN_PROGRESS, worker_id=2)
+        old = (datetime.now() - timedelta(seconds=900)).isoformat()
+        with manager._persistence.atomic_update():
+            manager._persistence.state["tasks"]["T1"]["started_at"] = old
+
+        stale = manager.get_stale_in_progress_tasks(600)
+        assert [s["task_id"] for s in stale] == ["T1"]
+        assert stale[0]["worker_id"] == 1
+        assert stale[0]["elapsed_seconds"] >= 900
+
+    def test_claim_rejected_without_write_lock(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.set_task_status("T1", TaskStatus.PENDING)
+        assert manager.claim_task("T1", worker_id=1) is True
+
+        other = _manager(tmp_path)
+        blocker = sqlite3.connect(tmp_path / "feat.db", timeout=0)
+        blocker.execute("BEGIN IMMEDIATE")
+        try:
+            # Pre-check answers from a read snapshot while the write lock is held
+            assert other.claim_task("T1", worker_id=2) is False
+        finally:
+            blocker.execute("ROLLBACK")
+
+    def test_concurrent_claims_have_single_winner(self, tmp_path: Path) -> None:
+        _manager(tmp_path).set_task_status("T1", TaskStatus.PENDING)
+        results: list[bool] = []
+
+        def claim(worker_id: int) -> None:
+            results.append(_manager(tmp_path).claim_task("T1", worker_id=worker_id))
+
+        threads = [threading.Thread(target=claim, args=(wid,)) for wid in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 1
+
+    def test_reader_not_blocked_by_writer(self, tmp_path: Path) -> None:
+        writer = _manager(tmp_path)
+        writer.set_task_status("T1", TaskStatus.PENDING)
+        reader = _manager(tmp_path)
+
+        with writer._persistence.atomic_update():
+            writer._persistence.state["current_level"] = 5
+            # Reader sees the last committed snapshot while the write is open
+            assert reader.load()["current_level"] == 0
+
+        assert reader.load()["current_level"] == 5
+
+
+class TestLifecycle:
+    """Tests for save, delete and exists."""
+
+    def test_exists_after_first_write(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        assert manager.exists() is False
+        manager.set_current_level(1)
+        assert manager.exists() is True
+
+    def test_save_writes_in_memory_state(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.load()
+        manager._state["paused"] = True
+        manager.save()
+        assert _manager(tmp_path).load()["paused"] is True
+
+    def test_delete_removes_database(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.set_current_level(1)
+        manager.delete()
+        assert not (tmp_path / "feat.db").exists()
+        assert manager.exists() is False
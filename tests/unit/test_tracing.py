@@ -0,0 +1,180 @@
+"""Tests for span tracing.
+
+Tests cover:
+1. No-op spans while tracing is disabled
+2. Nesting, level inheritance and error tagging
+3. Ring buffer flushing to the per-process trace file
+4. Chrome trace export and per-level summaries
+5. `mahabharatha logs --trace`
+"""
+
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from mahabharatha import tracing
+from mahabharatha.cli import cli
+from mahabharatha.tracing import (
+    CAT_GIT,
+    CAT_LLM,
+    CAT_LOCK,
+    CAT_TASK,
+    configure_tracing,
+    export_chrome_trace,
+    load_trace_events,
+    shutdown_tracing,
+    span,
+    summarize_trace,
+    trace_dir,
+    traced,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_tracer() -> Iterator[None]:
+    yield
+    shutdown_tracing()
+
+
+def _spans(path: Path) -> list[dict]:
+    return [e for e in load_trace_events(path) if e["ph"] == "X"]
+
+
+def _event(cat: str, ts: float, dur: float, tid: int = 1, pid: int = 1, **args: object) -> dict:
+    return {"name": cat, "cat": cat, "ph": "X", "ts": ts, "dur": dur, "pid": pid, "tid": tid, "args": args}
+
+
+class TestSpans:
+    """Tests for recording spans."""
+
+    def test_disabled_is_noop(self) -> None:
+        assert tracing.get_tracer() is None
+        with span("x", CAT_GIT) as s:
+            s.set(anything=1)
+
+        @traced(CAT_GIT)
+        def work(value: int) -> int:
+            return value * 2
+
+        assert work(21) == 42
+
+    def test_nesting_inherits_level(self, tmp_path: Path) -> None:
+        tracer = configure_tracing(tmp_path, "feat", "worker-1")
+        with span("task", CAT_TASK, level=2):
+            with span("llm", CAT_LLM) as inner:
+                inner.set(tokens=10)
+        tracer.flush()
+
+        events = load_trace_events(trace_dir(tmp_path, "feat"))
+        assert events[0] == {"name": "process_name", "ph": "M", "pid": tracer.pid, "args": {"name": "worker-1"}}
+        llm, task = events[1], events[2]
+        assert llm["args"] == {"tokens": 10, "level": 2}
+        assert task["ts"] <= llm["ts"]
+        assert task["ts"] + task["dur"] >= llm["ts"] + llm["dur"]
+
+    def test_exception_tagged(self, tmp_path: Path) -> None:
+        tracer = configure_tracing(tmp_path, "feat", "orchestrator")
+        with pytest.raises(RuntimeError), span("boom", CAT_GIT):
+            raise RuntimeError("x")
+        tracer.flush()
+        assert _spans(trace_dir(tmp_path, "feat"))[0]["args"] == {"error": "RuntimeError"}
+
+    def test_traced_records_arguments(self, tmp_path: Path) -> None:
+        tracer = configure_tracing(tmp_path, "feat", "orchestrator")
+
+        @traced(CAT_GIT, "merge", record=("level",), attrs=lambda level, branch="x": {"branch": branch})
+        def merge(level: int, branch: str = "x") -> str:
+            return branch
+
+        assert merge(3, branch="main") == "main"
+        tracer.flush()
+        event = _spans(trace_dir(tmp_path, "feat"))[0]
+        assert event["name"] == "merge"
+        assert event["args"] == {"level": 3, "branch": "main"}
+
+    def test_buffer_flushes_when_full(self, tmp_path: Path) -> None:
+        tracer = configure_tracing(tmp_path, "feat", "worker-0", buffer_size=3)
+        for _ in range(4):
+            with span("s", CAT_LOCK):
+                pass
+        assert len(_spans(trace_dir(tmp_path, "feat"))) == 3
+        tracer.flush()
+        assert len(_spans(trace_dir(tmp_path, "feat"))) == 4
+
+    def test_threads_nest_independently(self, tmp_path: Path) -> None:
+        tracer = configure_tracing(tmp_path, "feat", "orchestrator")
+
+        def gate() -> None:
+            with span("gate", CAT_GIT):
+                pass
+
+        with span("merge", CAT_TASK, level=1):
+            t = threading.Thread(target=gate)
+            t.start()
+            t.join()
+        tracer.flush()
+        gate_event = next(e for e in _spans(trace_dir(tmp_path, "feat")) if e["name"] == "gate")
+        assert "level" not in gate_event["args"]
+
+
+class TestExport:
+    """Tests for exporting and summarizing traces."""
+
+    def test_export_merges_processes(self, tmp_path: Path) -> None:
+        directory = trace_dir(tmp_path, "feat")
+        directory.mkdir(parents=True)
+        (directory / "worker-0-1.jsonl").write_text(json.dumps(_event(CAT_LLM, 20, 5)) + "\n{torn")
+        (directory / "orchestrator-2.jsonl").write_text(
+            json.dumps({"name": "process_name", "ph": "M", "pid": 2, "args": {"name": "orchestrator"}})
+            + "\n"
+            + json.dumps(_event(CAT_GIT, 10, 5, pid=2))
+            + "\n"
+        )
+        out = tmp_path / "trace.json"
+        assert export_chrome_trace(directory, out) == 2
+
+        doc = json.loads(out.read_text())
+        assert doc["displayTimeUnit"] == "ms"
+        assert [e["ph"] for e in doc["traceEvents"]] == ["M", "X", "X"]
+        assert [e["ts"] for e in doc["traceEvents"][1:]] == [10, 20]
+
+    def test_summary_per_level_and_category(self) -> None:
+        events = [
+            _event(CAT_TASK, 0, 10_000_000, level=1),
+            _event(CAT_LLM, 0, 6_000_000, level=1),
+            _event(CAT_LLM, 1_000_000, 1_000_000, level=1),  # Nested same category: not recounted
+            _event(CAT_GIT, 7_000_000, 2_000_000, level=1),
+            _event(CAT_LOCK, 3_000_000, 500_000, tid=2),  # Other thread: level from enclosing window
+            _event(CAT_LOCK, 50_000_000, 1_000_000, tid=2),
+        ]
+        summary = summarize_trace(events)
+        assert summary[1] == {"task": 10.0, "llm": 6.0, "git": 2.0, "lock": 0.5}
+        assert summary[None] == {"lock": 1.0}
+
+
+class TestLogsTrace:
+    """Tests for `mahabharatha logs --trace`."""
+
+    def test_export_and_breakdown(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        tracer = configure_tracing(tmp_path / ".mahabharatha" / "logs", "feat", "worker-0")
+        with span("execute_task", CAT_TASK, level=1), span("invoke_llm", CAT_LLM):
+            pass
+        tracer.flush()
+
+        result = CliRunner().invoke(cli, ["logs", "--feature", "feat", "--trace", "out.json"])
+        assert result.exit_code == 0, result.output
+        assert "Exported 2 spans" in result.output
+        assert "llm" in result.output
+        assert len(json.loads((tmp_path / "out.json").read_text())["traceEvents"]) == 3
+
+    def test_no_spans(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["logs", "--feature", "feat", "--trace", "out.json"])
+        assert result.exit_code == 0
+        assert "No trace spans found" in result.output
+        assert not (tmp_path / "out.json").exists()
@@ -259,6 +259,30 @@ class TestValidateModuleWiring:
         passed, messages = validate_module_wiring(pkg, tests_dir)
         assert "orphan.py" in " ".join(messages)
 
+    def test_lazy_registry_entries_count_as_imports(self, tmp_path: Path) -> None:
+        """Modules named in lazy-import registries are wired; look-alike strings are not."""
+        pkg = self._create_package(
+            tmp_path,
+            {
+                "metrics.py": "class Metrics: pass\n",
+                "commands/status.py": "def status(): pass\n",
+                "commands/stop.py": "def stop(): pass\n",
+                "registry.py": (
+                    'LAZY = {"Metrics": "mypkg.metrics"}\n'
+                    'COMMANDS = {"status": "mypkg.commands.status:status"}\n'
+                    'HELP = "see mypkg.commands.stop"\n'
+                ),
+                "main.py": "from mypkg.registry import LAZY\n",
+            },
+        )
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        passed, messages = validate_module_wiring(pkg, tests_dir)
+        flagged_names = [m.split(":")[0] for m in messages]
+        assert "metrics.py" not in flagged_names
+        assert "commands/status.py" not in flagged_names
+        assert "commands/stop.py" in flagged_names
+
     @pytest.mark.parametrize(
         "strict,expect_pass",
         [(False, True), (True, False)],
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from mahabharatha.worker_metrics import (
+    TASK_HISTORY_LIMIT,
     LevelMetrics,
     TaskExecutionMetrics,
     WorkerMetrics,
@@ -112,6 +113,22 @@ class TestWorkerMetrics:
         assert restored.worker_id == 1
         assert restored.tasks_completed == 5
 
+    def test_history_bounded_and_durations_sketched(self):
+        """Test old task records are dropped while durations stay in the sketch."""
+        metrics = WorkerMetrics(worker_id=0)
+        for i in range(TASK_HISTORY_LIMIT + 20):
+            task = metrics.start_task(f"T{i}")
+            task.started_at -= timedelta(seconds=i + 1)
+            metrics.complete_task(f"T{i}")
+
+        assert len(metrics.task_history) == TASK_HISTORY_LIMIT
+        assert metrics.task_history[-1].task_id == f"T{TASK_HISTORY_LIMIT + 19}"
+        assert metrics.duration_sketch.count == TASK_HISTORY_LIMIT + 20
+        assert metrics.duration_percentile(50) == pytest.approx(60.5, rel=0.02)
+
+        restored = WorkerMetrics.from_dict(metrics.to_dict())
+        assert restored.duration_sketch == metrics.duration_sketch
+
     def test_stop_and_health_check(self):
         """Test stop and health check recording."""
         metrics = WorkerMetrics(worker_id=0)
@@ -167,6 +184,38 @@ class TestWorkerMetricsCollector:
         assert summary["completed_tasks"] == 1
         assert summary["failed_tasks"] == 1
 
+    def test_complete_task_feeds_level_sketch(self, tmp_path: Path):
+        """Test a worker completion records its duration on the task's level."""
+        collector = WorkerMetricsCollector(feature="test", metrics_dir=tmp_path / "metrics")
+        collector.start_level(level=1, total_tasks=2, worker_count=1)
+        worker = collector.register_worker(0)
+        worker.start_task("T1").started_at -= timedelta(seconds=12)
+        collector.complete_task(0, "T1", level=1)
+        worker.start_task("T2")
+        collector.complete_task(0, "T2", level=1, status="failed")
+
+        level = collector._levels[1]
+        assert (level.completed_tasks, level.failed_tasks) == (1, 1)
+        assert len(level.duration_sketch) == 2
+        assert level.duration_sketch.quantile(1.0) == pytest.approx(12.0, rel=0.01)
+        assert worker.tasks_completed == 1
+
+    def test_level_duration_sketch_and_total(self, tmp_path: Path):
+        """Test level durations come from recorded completions and worker totals."""
+        collector = WorkerMetricsCollector(feature="test", metrics_dir=tmp_path / "metrics")
+        worker = collector.register_worker(0)
+        worker.total_task_duration_seconds = 100.0  # Earlier level
+        collector.start_level(level=2, total_tasks=2, worker_count=1)
+        worker.total_task_duration_seconds += 30.0
+        collector.record_task_completion(level=2, success=True, duration_seconds=10.0)
+        collector.record_task_completion(level=2, success=True, duration_seconds=20.0)
+        collector.complete_level(2)
+
+        summary = collector.get_level_summary(2)
+        assert summary["total_duration_seconds"] == pytest.approx(30.0)
+        assert summary["p50_task_duration"] == pytest.approx(10.0, rel=0.01)
+        assert summary["duration_sketch"]["count"] == 2
+
     def test_get_summary(self, tmp_path: Path):
         """Test getting execution summary."""
         collector = WorkerMetricsCollector(feature="test", metrics_dir=tmp_path / "metrics")
@@ -181,6 +230,8 @@ class TestWorkerMetricsCollector:
         assert summary["worker_count"] == 2
         assert summary["completed_tasks"] == 1
         assert summary["failed_tasks"] == 1
+        assert collector.duration_sketch().count == 2
+        assert summary["p50_task_duration_seconds"] >= 0.0
 
     def test_export(self, tmp_path: Path):
         """Test exporting metrics to JSON."""